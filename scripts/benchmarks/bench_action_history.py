@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark action-path storage: list copies vs a shared ActionHistory.
+
+Runs the same depth-first search twice over a synthetic game tree shaped
+like the engine's IDLE nodes (every node branches into N actions and
+records a PASS terminal after its children) until --paths nodes have been
+explored:
+
+    list      action_history + [action] per child; each terminal keeps
+              its own list (the old handlers)
+    history   ActionHistory.push(action) per child; terminals keep the
+              shared chain (the current handlers)
+
+Memory is measured with tracemalloc: the peak during the search and what
+is still held by the recorded terminals afterwards. Actions come from a
+pool built before tracing starts, and no engine is needed, so the numbers
+isolate the path bookkeeping from Action objects and duel costs.
+
+Usage:
+    python scripts/benchmarks/bench_action_history.py
+    python scripts/benchmarks/bench_action_history.py --paths 5000 --branching 4 -o bench.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.types import Action, ActionHistory  # noqa: E402
+
+
+def make_action(depth, index):
+    return Action(
+        action_type="ACTIVATE",
+        message_type=11,
+        response_value=index,
+        response_bytes=index.to_bytes(4, "little"),
+        description=f"Activate card {index} at depth {depth}",
+        card_code=1000 + index,
+    )
+
+
+PASS = Action("PASS", 11, 3, b"\x03\x00\x00\x00", "Pass (End Phase)")
+
+
+def action_pool(branching, max_depth):
+    return [[make_action(depth, i) for i in range(branching)] for depth in range(max_depth)]
+
+
+def run(mode, paths, pool):
+    """DFS to paths nodes; returns (terminals, nodes explored)."""
+    max_depth = len(pool)
+    terminals = []
+    explored = 0
+
+    def visit(history):
+        nonlocal explored
+        if explored >= paths:
+            return
+        explored += 1
+        depth = len(history)
+        if depth < max_depth:
+            for action in pool[depth]:
+                visit(history + [action] if mode == "list" else history.push(action))
+        terminals.append(history + [PASS] if mode == "list" else history.push(PASS))
+
+    visit([] if mode == "list" else ActionHistory.EMPTY)
+    return terminals, explored
+
+
+def measure(mode, paths, branching, max_depth):
+    pool = action_pool(branching, max_depth)
+    tracemalloc.start()
+    start = time.perf_counter()
+    terminals, explored = run(mode, paths, pool)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Time without tracing overhead
+    start = time.perf_counter()
+    run(mode, paths, pool)
+    untraced = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "paths": explored,
+        "terminals": len(terminals),
+        "avg_depth": sum(len(t) for t in terminals) / len(terminals),
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "seconds": untraced,
+        "traced_seconds": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list vs ActionHistory action paths")
+    parser.add_argument("--paths", type=int, default=5000, help="Nodes to explore")
+    parser.add_argument("--branching", type=int, default=3, help="Actions per node")
+    parser.add_argument("--max-depth", type=int, default=25, help="Depth limit")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.max_depth + 100))
+    results = [measure(mode, args.paths, args.branching, args.max_depth)
+               for mode in ("list", "history")]
+
+    print("\n" + "=" * 72)
+    print(f"{'mode':<10}{'paths':>8}{'terminals':>11}{'avg depth':>11}"
+          f"{'retained KB':>13}{'peak KB':>10}{'ms':>9}")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['mode']:<10}{r['paths']:>8}{r['terminals']:>11}{r['avg_depth']:>11.1f}"
+              f"{r['retained_bytes'] / 1024:>13,.0f}{r['peak_bytes'] / 1024:>10,.0f}"
+              f"{r['seconds'] * 1000:>9.1f}")
+    print("=" * 72)
+    old, new = results
+    print(f"retained memory: {old['retained_bytes'] / new['retained_bytes']:.2f}x less, "
+          f"peak: {old['peak_bytes'] / new['peak_bytes']:.2f}x less")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"args": vars(args), "results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark py_card_reader: SQLite per card vs the in-memory card data cache.
+
+Two measurements per mode:
+    reader  py_card_reader calls/sec over the locked library's cards
+            (no engine needed)
+    duels   create_duel() + OCG_DestroyDuel duels/sec; every duel asks the
+            card reader for ~100 cards (needs libygo)
+
+Modes:
+    sql     init_card_database(preload=False): one query per callback
+    cached  init_card_database(): rows prebuilt as OCG_CardData at startup
+
+Usage:
+    python scripts/benchmarks/bench_card_reader.py
+    python scripts/benchmarks/bench_card_reader.py --duels 500 --calls 200000
+    python scripts/benchmarks/bench_card_reader.py --reader-only -o bench.json
+
+Requires cards.cdb; the duel measurement also needs the built engine
+(libygo) and YGOPRO_SCRIPTS_PATH.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.engine.interface import (  # noqa: E402
+    card_data_cache_size, close_card_database, ffi, init_card_database,
+    load_library, py_card_reader, set_lib,
+)
+from ygo_combo.engine.duel_factory import (  # noqa: E402
+    HOLACTIE, create_duel, get_deck_lists, load_locked_library,
+)
+from ygo_combo.engine.paths import CDB_PATH  # noqa: E402
+
+MODES = ("sql", "cached")
+
+
+def time_reader(codes, calls):
+    """Seconds for calls py_card_reader invocations cycling over codes."""
+    data = ffi.new("OCG_CardData*")
+    sequence = [codes[i % len(codes)] for i in range(calls)]
+    start = time.perf_counter()
+    for code in sequence:
+        py_card_reader(ffi.NULL, code, data)
+    return time.perf_counter() - start
+
+
+def time_duels(lib, main_deck, extra_deck, duels):
+    """Seconds to create and destroy duels fresh duels."""
+    start = time.perf_counter()
+    for _ in range(duels):
+        lib.OCG_DestroyDuel(create_duel(lib, main_deck, extra_deck))
+    return time.perf_counter() - start
+
+
+def run_mode(mode, cdb_path, codes, calls, lib, main_deck, extra_deck, duels):
+    start = time.perf_counter()
+    if not init_card_database(cdb_path, preload=(mode == "cached")):
+        raise FileNotFoundError(f"Card database not found at {cdb_path}")
+    load_s = time.perf_counter() - start
+
+    result = {
+        "mode": mode,
+        "load_s": load_s,
+        "cached_cards": card_data_cache_size(),
+        "reader_calls_per_sec": calls / time_reader(codes, calls),
+        "duels_per_sec": None,
+    }
+    if lib is not None:
+        result["duels_per_sec"] = duels / time_duels(lib, main_deck, extra_deck, duels)
+    close_card_database()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SQLite vs cached card reader")
+    parser.add_argument("--cdb", type=str, default=str(CDB_PATH), help="Path to cards.cdb")
+    parser.add_argument("--calls", type=int, default=100_000, help="Card reader calls per mode")
+    parser.add_argument("--duels", type=int, default=200, help="Duels created per mode")
+    parser.add_argument("--reader-only", action="store_true",
+                        help="Skip the duel measurement (no engine needed)")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    main_deck, extra_deck = get_deck_lists(load_locked_library())
+    codes = sorted(set(main_deck) | set(extra_deck) | {HOLACTIE})
+
+    lib = None
+    if not args.reader_only:
+        lib = load_library()
+        set_lib(lib)
+
+    results = []
+    for mode in MODES:
+        print(f"Running {mode}...", flush=True)
+        results.append(run_mode(mode, Path(args.cdb), codes, args.calls,
+                                lib, main_deck, extra_deck, args.duels))
+
+    print("\n" + "=" * 64)
+    print(f"{'mode':<10}{'cards':>10}{'load s':>10}{'reader calls/s':>18}{'duels/s':>16}")
+    print("-" * 64)
+    for r in results:
+        duels = f"{r['duels_per_sec']:,.1f}" if r["duels_per_sec"] is not None else "-"
+        print(f"{r['mode']:<10}{r['cached_cards']:>10,}{r['load_s']:>10.3f}"
+              f"{r['reader_calls_per_sec']:>18,.0f}{duels:>16}")
+    print("=" * 64)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark duel setup: create_duel() per call vs a reused DuelFactory.
+
+Each mode creates and destroys N duels for the same deck and hand:
+
+    create_duel   Rebuilds the options struct, the padded deck lists and one
+                  OCG_NewCardInfo per card on every call (the old path)
+    factory       DuelFactory.new_duel() with the prebuilt structs
+
+Usage:
+    python scripts/benchmarks/bench_duel_factory.py
+    python scripts/benchmarks/bench_duel_factory.py --duels 2000 --repeats 5
+    python scripts/benchmarks/bench_duel_factory.py --hand 60764609,14558127 -o bench.json
+
+Requires the built engine (libygo), cards.cdb and YGOPRO_SCRIPTS_PATH (or
+YGOPRO_SCRIPTS_PACK).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.engine.interface import init_card_database, load_library, set_lib  # noqa: E402
+from ygo_combo.engine.duel_factory import (  # noqa: E402
+    ENGRAVER, HOLACTIE, DuelFactory, create_duel, get_deck_lists, load_locked_library,
+)
+
+
+def time_mode(mode, lib, main_deck, extra_deck, hand, duels):
+    """Seconds to create and destroy duels duels with the given mode."""
+    factory = DuelFactory(lib, main_deck, extra_deck, starting_hand=hand)
+    start = time.perf_counter()
+    if mode == "factory":
+        for _ in range(duels):
+            lib.OCG_DestroyDuel(factory.new_duel())
+    else:
+        for _ in range(duels):
+            lib.OCG_DestroyDuel(create_duel(lib, main_deck, extra_deck, starting_hand=hand))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark create_duel vs DuelFactory")
+    parser.add_argument("--hand", type=str, default="",
+                        help="Comma-separated passcodes (default: Engraver + 4 Holactie)")
+    parser.add_argument("--duels", type=int, default=500, help="Duels per repeat")
+    parser.add_argument("--repeats", type=int, default=3, help="Best of this many repeats")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    if args.hand:
+        hand = [int(x) for x in args.hand.split(",") if x.strip()]
+    else:
+        hand = [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
+
+    init_card_database()
+    lib = load_library()
+    set_lib(lib)
+    main_deck, extra_deck = get_deck_lists(load_locked_library())
+
+    # Warm the card data cache and script store before timing
+    time_mode("factory", lib, main_deck, extra_deck, hand, 5)
+
+    results = []
+    for mode in ("create_duel", "factory"):
+        best = min(time_mode(mode, lib, main_deck, extra_deck, hand, args.duels)
+                   for _ in range(args.repeats))
+        results.append({
+            "mode": mode,
+            "duels": args.duels,
+            "best_s": best,
+            "duels_per_sec": args.duels / best,
+            "us_per_duel": best / args.duels * 1e6,
+        })
+
+    print("\n" + "=" * 56)
+    print(f"{'mode':<14}{'duels':>10}{'duels/sec':>16}{'us/duel':>16}")
+    print("-" * 56)
+    for r in results:
+        print(f"{r['mode']:<14}{r['duels']:>10}{r['duels_per_sec']:>16,.1f}{r['us_per_duel']:>16,.1f}")
+    print("=" * 56)
+    speedup = results[0]["best_s"] / results[1]["best_s"]
+    print(f"factory speedup: {speedup:.2f}x")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"hand": hand, "results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Benchmark message decoding: byte-stream parsers vs the zero-copy decoder.
+
+Decodes the same corpus of OCG_DuelGetMessage batches with:
+
+    stream    copy to bytes, wrap in BytesIO, read_u8/read_u32 + parse_*
+              if/elif chain, SELECT_SUM raw hex on every message (the old
+              EnumerationEngine._get_messages)
+    decoder   decode_messages() on a memoryview (the current one)
+
+and reports batches/sec and messages/sec. Both decoders must agree on
+every batch; a mismatch aborts the run.
+
+Corpora:
+    - default: a synthetic corpus shaped like an enumeration run (mostly
+      informational messages around IDLE / SELECT_CARD / SELECT_SUM)
+    - --corpus FILE: batches recorded from a real run
+    - --record FILE: run a hand through EnumerationEngine with message_log
+      enabled and save the batches (requires libygo and
+      YGOPRO_SCRIPTS_PATH)
+
+Corpus file format: repeated [u32 LE length][batch bytes].
+
+Usage:
+    python scripts/benchmarks/bench_message_decoding.py
+    python scripts/benchmarks/bench_message_decoding.py --record corpus.bin --max-paths 200
+    python scripts/benchmarks/bench_message_decoding.py --corpus corpus.bin --repeat 20 -o bench.json
+"""
+
+import argparse
+import io
+import json
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.engine.bindings import (  # noqa: E402
+    MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_CHAIN, MSG_SELECT_PLACE,
+    MSG_SELECT_UNSELECT_CARD, MSG_SELECT_OPTION, MSG_SELECT_SUM,
+    MSG_SELECT_TRIBUTE, MSG_HINT, MSG_MOVE, MSG_CHAINING, MSG_CHAIN_SOLVED,
+    MSG_SPSUMMONING, MSG_SPSUMMONED, MSG_NEW_PHASE,
+)
+from ygo_combo.enumeration import (  # noqa: E402
+    read_u8, read_u32,
+    parse_idle, parse_select_card, parse_select_chain, parse_select_place,
+    parse_select_unselect_card, parse_select_option, parse_select_tribute,
+    parse_select_sum,
+)
+from ygo_combo.enumeration.decoder import decode_messages  # noqa: E402
+
+
+# =============================================================================
+# CORPUS I/O
+# =============================================================================
+
+def write_corpus(path, batches):
+    with open(path, "wb") as f:
+        for batch in batches:
+            f.write(struct.pack("<I", len(batch)))
+            f.write(batch)
+
+
+def read_corpus(path):
+    data = Path(path).read_bytes()
+    batches = []
+    pos = 0
+    while pos + 4 <= len(data):
+        (length,) = struct.unpack_from("<I", data, pos)
+        batches.append(data[pos + 4:pos + 4 + length])
+        pos += 4 + length
+    return batches
+
+
+def record_corpus(args):
+    import ygo_combo.combo_enumeration as ce
+    from ygo_combo.combo_enumeration import EnumerationEngine
+    from ygo_combo.engine.interface import init_card_database, load_library, set_lib
+    from ygo_combo.engine.duel_factory import (
+        ENGRAVER, HOLACTIE, load_locked_library, get_deck_lists,
+    )
+
+    if args.hand:
+        hand = [int(x) for x in args.hand.split(",") if x.strip()]
+    else:
+        hand = [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
+    ce.MAX_DEPTH = args.max_depth
+    ce.MAX_PATHS = args.max_paths
+
+    init_card_database()
+    lib = load_library()
+    set_lib(lib)
+    main_deck, extra_deck = get_deck_lists(load_locked_library())
+
+    engine = EnumerationEngine(lib, main_deck, extra_deck, verbose=False)
+    engine.message_log = []
+    engine.enumerate_from_hand(hand)
+    return engine.message_log
+
+
+# =============================================================================
+# SYNTHETIC CORPUS
+# =============================================================================
+
+def _frame(msg_type, body):
+    return struct.pack("<IB", len(body) + 1, msg_type) + body
+
+
+def _idle(rng):
+    def cards(n):
+        return struct.pack("<I", n) + b"".join(
+            struct.pack("<IBBI", rng.randrange(10**7, 10**8), 0, 2, i) for i in range(n))
+    body = b"\x00" + cards(rng.randrange(3)) + cards(rng.randrange(5))
+    body += struct.pack("<I", 0) + cards(0) + cards(rng.randrange(3))
+    n = rng.randrange(1, 8)
+    body += struct.pack("<I", n) + b"".join(
+        struct.pack("<IBBIQB", 1000 + i, 0, 2, i, (1000 + i) << 20, 0) for i in range(n))
+    return body + b"\x01\x01\x00"
+
+
+def _select_card(rng):
+    n = rng.randrange(1, 10)
+    return struct.pack("<BBIII", 0, 0, 1, 1, n) + b"".join(
+        struct.pack("<IBBII", 2000 + i, 0, 1, i, 5) for i in range(n))
+
+
+def _select_sum(rng):
+    n = rng.randrange(2, 6)
+    body = struct.pack("<BBIBBB", 0, 0, 8, 2, 2, 0) + struct.pack("<B", n)
+    return body + b"".join(struct.pack("<IBBBI", 3000 + i, 0, 4, i, 4) for i in range(n))
+
+
+def _select_chain(rng):
+    return struct.pack("<BBBB", 0, 0, 0, 0)
+
+
+def _informational(rng):
+    msg_type = rng.choice([MSG_HINT, MSG_MOVE, MSG_CHAINING, MSG_CHAIN_SOLVED,
+                           MSG_SPSUMMONING, MSG_SPSUMMONED, MSG_NEW_PHASE])
+    return msg_type, bytes(rng.randrange(256) for _ in range(rng.randrange(4, 40)))
+
+
+def synthetic_corpus(n_batches, seed):
+    rng = random.Random(seed)
+    decisions = [
+        (MSG_IDLE, _idle, 6),
+        (MSG_SELECT_CARD, _select_card, 3),
+        (MSG_SELECT_CHAIN, _select_chain, 3),
+        (MSG_SELECT_SUM, _select_sum, 1),
+    ]
+    weights = [w for _, _, w in decisions]
+    batches = []
+    for _ in range(n_batches):
+        batch = b"".join(_frame(*_informational(rng)) for _ in range(rng.randrange(2, 15)))
+        msg_type, build, _ = rng.choices(decisions, weights)[0]
+        batches.append(batch + _frame(msg_type, build(rng)))
+    return batches
+
+
+# =============================================================================
+# DECODERS
+# =============================================================================
+
+STREAM_PARSERS = {
+    MSG_IDLE: parse_idle,
+    MSG_SELECT_CARD: parse_select_card,
+    MSG_SELECT_CHAIN: parse_select_chain,
+    MSG_SELECT_PLACE: parse_select_place,
+    MSG_SELECT_UNSELECT_CARD: parse_select_unselect_card,
+    MSG_SELECT_OPTION: parse_select_option,
+    MSG_SELECT_TRIBUTE: parse_select_tribute,
+}
+
+
+def stream_decode(buffer):
+    """The pre-decoder _get_messages loop."""
+    data = bytes(buffer)
+    stream = io.BytesIO(data)
+    messages = []
+    while stream.tell() < len(data):
+        if stream.tell() + 4 > len(data):
+            break
+        msg_len = read_u32(stream)
+        if msg_len == 0:
+            break
+        msg_type = read_u8(stream)
+        msg_body = stream.read(msg_len - 1)
+        if msg_type == MSG_SELECT_SUM:
+            msg_data = parse_select_sum(msg_body, debug=True)
+            msg_data["_raw"] = msg_body.hex()
+            messages.append((msg_type, msg_data))
+        elif msg_type == 12:
+            messages.append((12, {"raw": msg_body}))
+        elif msg_type in STREAM_PARSERS:
+            messages.append((msg_type, STREAM_PARSERS[msg_type](msg_body)))
+        else:
+            messages.append((msg_type, None))
+    return messages
+
+
+def _comparable(messages):
+    return [(t, None if d is None else {k: v for k, v in d.items() if not k.startswith("_")})
+            for t, d in messages]
+
+
+def check_agreement(batches):
+    for i, batch in enumerate(batches):
+        if _comparable(stream_decode(batch)) != _comparable(decode_messages(batch)):
+            raise SystemExit(f"Decoders disagree on batch {i}: {batch.hex()}")
+
+
+def run(label, decode, batches, repeat):
+    # Engine buffers arrive as cffi buffers, not bytes; bytearray is the
+    # closest stand-in that still forces the stream decoder's copy.
+    buffers = [bytearray(b) for b in batches]
+    n_messages = sum(len(decode_messages(b)) for b in buffers)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for buffer in buffers:
+            decode(buffer)
+    elapsed = time.perf_counter() - start
+    total_batches = len(buffers) * repeat
+    return {
+        "decoder": label,
+        "elapsed_s": elapsed,
+        "batches": total_batches,
+        "messages": n_messages * repeat,
+        "batches_per_sec": total_batches / elapsed if elapsed > 0 else 0.0,
+        "messages_per_sec": n_messages * repeat / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark byte-stream vs zero-copy message decoding")
+    parser.add_argument("--corpus", type=str, default=None, help="Recorded corpus file to decode")
+    parser.add_argument("--record", type=str, default=None,
+                        help="Record a corpus from a live enumeration run into this file")
+    parser.add_argument("--hand", type=str, default="",
+                        help="Comma-separated passcodes for --record (default: Engraver + 4 Holactie)")
+    parser.add_argument("--max-depth", type=int, default=25)
+    parser.add_argument("--max-paths", type=int, default=500)
+    parser.add_argument("--batches", type=int, default=5000, help="Synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the corpus per decoder")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    if args.record:
+        batches = record_corpus(args)
+        write_corpus(args.record, batches)
+        print(f"Recorded {len(batches)} batches to {args.record}")
+        source = args.record
+    elif args.corpus:
+        batches = read_corpus(args.corpus)
+        source = args.corpus
+    else:
+        batches = synthetic_corpus(args.batches, args.seed)
+        source = f"synthetic(batches={args.batches}, seed={args.seed})"
+
+    check_agreement(batches)
+    results = [
+        run("stream", stream_decode, batches, args.repeat),
+        run("decoder", decode_messages, batches, args.repeat),
+    ]
+
+    print("\n" + "=" * 72)
+    print(f"corpus: {source} ({len(batches)} batches, {sum(map(len, batches)):,} bytes)")
+    print(f"{'decoder':<12}{'batches':>12}{'messages':>12}{'seconds':>10}{'msgs/sec':>14}{'speedup':>10}")
+    print("-" * 72)
+    base = results[0]["elapsed_s"]
+    for r in results:
+        speedup = base / r["elapsed_s"] if r["elapsed_s"] > 0 else 0.0
+        print(f"{r['decoder']:<12}{r['batches']:>12}{r['messages']:>12}{r['elapsed_s']:>10.2f}"
+              f"{r['messages_per_sec']:>14.0f}{speedup:>9.2f}x")
+    print("=" * 72)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"corpus": source, "results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
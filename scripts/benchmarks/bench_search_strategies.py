@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark search strategies: paths needed to reach the gold standard board.
+
+Runs the gold standard starting hand (config/gold_standard_combo.json)
+under plain DFS, best-first search, beam search at each --beam-widths
+width and MCTS (--mcts-iterations rollouts) with identical limits. For each one it reports how many paths had
+been explored when it first recorded an S-tier terminal and a terminal
+with the gold endboard's field (A Bao A Qu + Caesar). Best-first stops as
+soon as it reaches the target tier. Beam and MCTS runs also print their
+quality vs paths-spent curve.
+
+Usage:
+    python scripts/benchmarks/bench_search_strategies.py
+    python scripts/benchmarks/bench_search_strategies.py --max-paths 50000 --depth-penalty 0.5
+    python scripts/benchmarks/bench_search_strategies.py --target-tier A --output bench.json
+    python scripts/benchmarks/bench_search_strategies.py --beam-widths 1,8,64 --scorer roles
+    python scripts/benchmarks/bench_search_strategies.py --mcts-iterations 5000 --rollout-policy roles
+
+Requires the built engine (libygo) and YGOPRO_SCRIPTS_PATH.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.combo_enumeration import EnumerationEngine  # noqa: E402
+from ygo_combo.best_first import BestFirstEngine  # noqa: E402
+from ygo_combo.beam_search import BeamSearchEngine  # noqa: E402
+from ygo_combo.mcts import ROLLOUT_POLICIES, MCTSEngine  # noqa: E402
+from ygo_combo.engine.evaluator import get_evaluator  # noqa: E402
+from ygo_combo.engine.interface import init_card_database, load_library, set_lib  # noqa: E402
+from ygo_combo.engine.duel_factory import HOLACTIE, load_locked_library, get_deck_lists  # noqa: E402
+from ygo_combo.search.iddfs import TargetTierReached  # noqa: E402
+from ygo_combo.search.scorers import SCORERS, make_scorer  # noqa: E402
+
+GOLD_STANDARD = Path(__file__).parents[2] / "config" / "gold_standard_combo.json"
+TIER_ORDER = TargetTierReached.TIER_ORDER
+
+
+def milestone_engine(engine_cls, gold_field, target_tier):
+    """engine_cls that notes paths_explored at the first target-tier and gold terminals."""
+
+    class MilestoneEngine(engine_cls):
+        paths_to_tier = None
+        paths_to_gold = None
+
+        def _record_terminal(self, action_history, reason, duel=None):
+            recorded = len(self.terminals)
+            super()._record_terminal(action_history, reason, duel=duel)
+            for terminal in self.terminals[recorded:]:
+                if not terminal.board_state:
+                    continue
+                field = {c.code for c in terminal.board_state.player0.monsters}
+                if self.paths_to_gold is None and gold_field <= field:
+                    self.paths_to_gold = self.paths_explored
+                tier = get_evaluator().evaluate_board(terminal.board_state, terminal.board_hash)["tier"]
+                if self.paths_to_tier is None and TIER_ORDER[tier] <= TIER_ORDER[target_tier]:
+                    self.paths_to_tier = self.paths_explored
+
+    return MilestoneEngine
+
+
+def run_strategy(label, engine_cls, kwargs, lib, main_deck, extra_deck, hand):
+    engine = engine_cls(lib, main_deck, extra_deck, verbose=False, **kwargs)
+    start = time.perf_counter()
+    terminals = engine.enumerate_from_hand(list(hand))
+    elapsed = time.perf_counter() - start
+    return {
+        "strategy": label,
+        "elapsed_s": elapsed,
+        "paths_explored": engine.paths_explored,
+        "terminals": len(terminals),
+        "paths_to_target_tier": engine.paths_to_tier,
+        "paths_to_gold_board": engine.paths_to_gold,
+        "quality_curve": getattr(engine, "curve", None),
+        **engine.replay_stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DFS, best-first, beam and MCTS on the gold standard hand")
+    parser.add_argument("--max-depth", type=int, default=30)
+    parser.add_argument("--max-paths", type=int, default=20000)
+    parser.add_argument("--depth-penalty", type=float, default=1.0)
+    parser.add_argument("--target-tier", type=str, default="S")
+    parser.add_argument("--scorer", choices=SCORERS, default="board",
+                        help="Node scorer for best-first and beam")
+    parser.add_argument("--beam-widths", type=str, default="4,16,64",
+                        help="Comma-separated beam widths to run (empty = no beam runs)")
+    parser.add_argument("--mcts-iterations", type=int, default=2000,
+                        help="Rollouts for the MCTS run (0 = no MCTS run)")
+    parser.add_argument("--rollout-policy", choices=ROLLOUT_POLICIES, default="random")
+    parser.add_argument("--rollout-workers", type=int, default=1)
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    gold = json.loads(GOLD_STANDARD.read_text())
+    hand = list(gold["starting_hand"]["required"])
+    hand += [HOLACTIE] * (5 - len(hand))
+    gold_field = {card["id"] for card in gold["endboard"]["field"]}
+
+    limits = {"max_depth": args.max_depth, "max_paths": args.max_paths}
+
+    init_card_database()
+    lib = load_library()
+    set_lib(lib)
+    main_deck, extra_deck = get_deck_lists(load_locked_library())
+
+    strategies = [
+        ("dfs", EnumerationEngine, {}),
+        ("best-first", BestFirstEngine, {
+            "depth_penalty": args.depth_penalty,
+            "scorer": make_scorer(args.scorer),
+            "stopping_conditions": [TargetTierReached(args.target_tier)],
+        }),
+    ]
+    for width in (int(w) for w in args.beam_widths.split(",") if w.strip()):
+        strategies.append((f"beam/{width}", BeamSearchEngine, {
+            "beam_width": width,
+            "depth_penalty": args.depth_penalty,
+            "scorer": make_scorer(args.scorer),
+        }))
+    if args.mcts_iterations:
+        strategies.append(("mcts", MCTSEngine, {
+            "iterations": args.mcts_iterations,
+            "rollout_policy": args.rollout_policy,
+            "rollout_workers": args.rollout_workers,
+            "scorer": make_scorer(args.scorer),
+        }))
+    results = [
+        run_strategy(label, milestone_engine(cls, gold_field, args.target_tier), {**limits, **kwargs},
+                     lib, main_deck, extra_deck, hand)
+        for label, cls, kwargs in strategies
+    ]
+
+    print("\n" + "=" * 80)
+    print(f"{'strategy':<14}{'paths':>10}{'to ' + args.target_tier + '-tier':>14}"
+          f"{'to gold':>12}{'terminals':>12}{'seconds':>12}")
+    print("-" * 80)
+    for r in results:
+        print(f"{r['strategy']:<14}{r['paths_explored']:>10}{str(r['paths_to_target_tier']):>14}"
+              f"{str(r['paths_to_gold_board']):>12}{r['terminals']:>12}{r['elapsed_s']:>12.2f}")
+    print("=" * 80)
+
+    for r in results:
+        if r["quality_curve"]:
+            print(f"\n{r['strategy']} quality vs paths:")
+            for point in r["quality_curve"]:
+                step = f"level {point['level']:>3}" if "level" in point else f"iter {point['iteration']:>6}"
+                print(f"  {step}: {point['paths']:>8} paths, "
+                      f"best {point['best_tier']} ({point['best_score']:.0f})")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"hand": hand, "results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
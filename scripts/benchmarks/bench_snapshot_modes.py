@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark enumeration backends: nodes/sec for replay vs fork snapshots.
+
+Runs the same hand under each backend with identical limits and reports
+paths explored, unique boards, duels created and nodes per second.
+
+Usage:
+    python scripts/benchmarks/bench_snapshot_modes.py
+    python scripts/benchmarks/bench_snapshot_modes.py --max-paths 5000 --max-forks 8
+    python scripts/benchmarks/bench_snapshot_modes.py --hand 60764609,14558127 --output bench.json
+
+Requires the built engine (libygo) and YGOPRO_SCRIPTS_PATH.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+import ygo_combo.combo_enumeration as ce  # noqa: E402
+from ygo_combo.combo_enumeration import EnumerationEngine  # noqa: E402
+from ygo_combo.fork_enumeration import ForkEnumerationEngine  # noqa: E402
+from ygo_combo.engine.interface import init_card_database, load_library, set_lib  # noqa: E402
+from ygo_combo.engine.duel_factory import (  # noqa: E402
+    ENGRAVER, HOLACTIE, load_locked_library, get_deck_lists,
+)
+
+# (label, engine class, extra kwargs)
+BACKENDS = [
+    ("replay/path", EnumerationEngine, {"replay_mode": "path"}),
+    ("replay/prefix", EnumerationEngine, {"replay_mode": "prefix"}),
+    ("fork", ForkEnumerationEngine, {}),
+]
+
+
+def run_backend(label, engine_cls, kwargs, lib, main_deck, extra_deck, hand):
+    engine = engine_cls(lib, main_deck, extra_deck, verbose=False, **kwargs)
+    start = time.perf_counter()
+    terminals = engine.enumerate_from_hand(list(hand))
+    elapsed = time.perf_counter() - start
+    stats = engine.replay_stats()
+    return {
+        "backend": label,
+        "elapsed_s": elapsed,
+        "paths_explored": engine.paths_explored,
+        "terminals": len(terminals),
+        "unique_boards": len({t.board_hash for t in terminals if t.board_hash is not None}),
+        "nodes_per_sec": engine.paths_explored / elapsed if elapsed > 0 else 0.0,
+        **stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark replay vs fork snapshot backends")
+    parser.add_argument("--hand", type=str, default="",
+                        help="Comma-separated passcodes (default: Engraver + 4 Holactie)")
+    parser.add_argument("--max-depth", type=int, default=25)
+    parser.add_argument("--max-paths", type=int, default=2000)
+    parser.add_argument("--max-forks", type=int, default=None,
+                        help="Concurrent children for the fork backend (default: CPU count)")
+    parser.add_argument("--backends", type=str, default=",".join(b[0] for b in BACKENDS),
+                        help="Comma-separated subset of backends to run")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    if args.hand:
+        hand = [int(x) for x in args.hand.split(",") if x.strip()]
+    else:
+        hand = [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
+
+    ce.MAX_DEPTH = args.max_depth
+    ce.MAX_PATHS = args.max_paths
+
+    init_card_database()
+    lib = load_library()
+    set_lib(lib)
+    main_deck, extra_deck = get_deck_lists(load_locked_library())
+
+    selected = {b.strip() for b in args.backends.split(",")}
+    results = []
+    for label, engine_cls, kwargs in BACKENDS:
+        if label not in selected:
+            continue
+        if engine_cls is ForkEnumerationEngine:
+            kwargs = dict(kwargs, max_forks=args.max_forks)
+        results.append(run_backend(label, engine_cls, kwargs, lib, main_deck, extra_deck, hand))
+
+    print("\n" + "=" * 88)
+    print(f"{'backend':<16}{'paths':>10}{'boards':>10}{'duels':>10}"
+          f"{'replay/node':>14}{'seconds':>12}{'nodes/sec':>14}")
+    print("-" * 88)
+    for r in results:
+        print(f"{r['backend']:<16}{r['paths_explored']:>10}{r['unique_boards']:>10}"
+              f"{r['duels_created']:>10}{r['replayed_actions_per_node']:>14.2f}"
+              f"{r['elapsed_s']:>12.2f}{r['nodes_per_sec']:>14.1f}")
+    print("=" * 88)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"hand": hand, "results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark transposition table backends: memory and throughput.
+
+Fills TranspositionTable (dict) and CompactTranspositionTable (typed
+columns) with N random 64-bit Zobrist keys, then times N hit lookups and
+N miss lookups. Memory is measured with tracemalloc over the fill alone,
+so it covers the table and the key objects it keeps alive.
+
+Usage:
+    python scripts/benchmarks/bench_transposition_tables.py
+    python scripts/benchmarks/bench_transposition_tables.py --sizes 100000,1000000
+    python scripts/benchmarks/bench_transposition_tables.py --backends compact -o bench.json
+
+The default sizes (1M and 10M) need several GB of RAM for the dict backend.
+No engine is required.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+
+from ygo_combo.search.compact_transposition import CompactTranspositionTable  # noqa: E402
+from ygo_combo.search.transposition import TranspositionEntry, TranspositionTable  # noqa: E402
+
+BACKENDS = {
+    "dict": TranspositionTable,
+    "compact": CompactTranspositionTable,
+}
+
+
+def fill(table, size, seed):
+    """Store size random keys (depth 0-19) in table."""
+    rng = random.Random(seed)
+    for n in range(size):
+        key = rng.getrandbits(64)
+        table.store(key, TranspositionEntry(
+            state_hash=key,
+            best_terminal_hash="",
+            best_terminal_value=0.0,
+            creation_depth=n % 20,
+            visit_count=1,
+        ))
+
+
+def time_lookups(table, size, seed):
+    """Seconds for size lookups of the keys generated from seed."""
+    rng = random.Random(seed)
+    keys = [rng.getrandbits(64) for _ in range(size)]
+    start = time.perf_counter()
+    for key in keys:
+        table.lookup(key)
+    return time.perf_counter() - start
+
+
+def run_backend(label, size, seed):
+    table_cls = BACKENDS[label]
+
+    gc.collect()
+    tracemalloc.start()
+    table = table_cls(max_size=size)
+    fill(table, size, seed)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del table
+    gc.collect()
+
+    table = table_cls(max_size=size)
+    start = time.perf_counter()
+    fill(table, size, seed)
+    store_s = time.perf_counter() - start
+    hit_s = time_lookups(table, size, seed)
+    miss_s = time_lookups(table, size, seed + 1)
+    assert table.hits == size, f"{label}: expected {size} hits, got {table.hits}"
+    del table
+    gc.collect()
+
+    return {
+        "backend": label,
+        "entries": size,
+        "memory_bytes": memory,
+        "bytes_per_entry": memory / size,
+        "stores_per_sec": size / store_s,
+        "hits_per_sec": size / hit_s,
+        "misses_per_sec": size / miss_s,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dict vs compact transposition tables")
+    parser.add_argument("--sizes", type=str, default="1000000,10000000",
+                        help="Comma-separated entry counts")
+    parser.add_argument("--backends", type=str, default=",".join(BACKENDS),
+                        help="Comma-separated subset of backends to run")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    selected = [b.strip() for b in args.backends.split(",") if b.strip()]
+
+    results = []
+    for size in sizes:
+        for label in selected:
+            print(f"Running {label} @ {size:,} entries...", flush=True)
+            results.append(run_backend(label, size, args.seed))
+
+    print("\n" + "=" * 84)
+    print(f"{'backend':<10}{'entries':>12}{'MB':>10}{'B/entry':>10}"
+          f"{'stores/s':>14}{'hits/s':>14}{'misses/s':>14}")
+    print("-" * 84)
+    for r in results:
+        print(f"{r['backend']:<10}{r['entries']:>12,}{r['memory_bytes'] / 2**20:>10.1f}"
+              f"{r['bytes_per_entry']:>10.1f}{r['stores_per_sec']:>14,.0f}"
+              f"{r['hits_per_sec']:>14,.0f}{r['misses_per_sec']:>14,.0f}")
+    print("=" * 84)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"results": results}, indent=2))
+        print(f"Results saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Pack ygopro-core Lua scripts into one memory-mappable file.
+
+Workers started with YGOPRO_SCRIPTS_PACK pointing at the pack load every
+script from it instead of the YGOPRO_SCRIPTS_PATH directory (see
+src/ygo_combo/engine/script_store.py).
+
+Usage:
+    python scripts/pack_scripts.py -o build/scripts.pack
+    python scripts/pack_scripts.py -o build/library.pack --library-only
+    export YGOPRO_SCRIPTS_PACK=$PWD/build/scripts.pack
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from ygo_combo.engine.script_store import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
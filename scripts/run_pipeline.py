@@ -27,7 +27,7 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
@@ -80,6 +80,7 @@ class PipelineConfig:
     num_workers: Optional[int] = None
     max_depth: int = 25
     max_paths_per_hand: int = 0
+    split_depth: Optional[int] = None   # Intra-hand split (None = auto, 0 = off)
 
     # Checkpointing
     checkpoint_dir: Optional[Path] = None
@@ -354,9 +355,11 @@ def run_fixed_hand(
         checkpoint_interval=config.checkpoint_interval,
         resume=config.resume,
         fixed_hands=[tuple(hand_codes)],  # Only enumerate this hand
+        split_depth=config.split_depth,   # Spread the hand's tree across workers
     )
 
     logger.info(f"\nEnumerating fixed hand with {parallel_config.num_workers} workers")
+    logger.info(f"Intra-hand split depth: {config.split_depth if config.split_depth is not None else 'auto'}")
     logger.info(f"Max depth: {config.max_depth}, Max paths: {config.max_paths_per_hand or 'unlimited'}")
 
     if checkpoint_path:
@@ -478,6 +481,7 @@ def run_enumeration(
     hands: List[Tuple[int, ...]],
     deck: List[int],
     config: PipelineConfig,
+    hand_cost: Optional[Callable[[Tuple[int, ...]], float]] = None,
 ) -> ParallelResult:
     """Run parallel enumeration across sampled hands.
 
@@ -485,6 +489,8 @@ def run_enumeration(
         hands: List of starting hands to enumerate.
         deck: Full deck list (for worker initialization).
         config: Pipeline configuration.
+        hand_cost: Optional search cost predictor, used to schedule
+            expensive hands first.
 
     Returns:
         ParallelResult with enumeration statistics.
@@ -508,6 +514,7 @@ def run_enumeration(
         checkpoint_path=checkpoint_path,
         checkpoint_interval=config.checkpoint_interval,
         resume=config.resume,
+        hand_cost=hand_cost,
     )
 
     logger.info(f"Enumerating {len(hands)} hands with {parallel_config.num_workers} workers")
@@ -615,6 +622,8 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
         hands=sampling_result.hands,
         deck=full_deck,
         config=config,
+        # Role strata predict search cost, so expensive hands start first
+        hand_cost=StratifiedSampler(full_deck, classifier).search_cost,
     )
 
     # Stage 3: Ranking
@@ -769,6 +778,13 @@ def main():
         default=0,
         help="Maximum paths per hand, 0=unlimited (default: 0)",
     )
+    parser.add_argument(
+        "--split-depth",
+        type=int,
+        default=None,
+        help="Split a fixed hand's search tree into prefixes of this many "
+             "actions across workers, 0=never (default: auto)",
+    )
 
     # Checkpoint options
     parser.add_argument(
@@ -811,6 +827,7 @@ def main():
         num_workers=args.workers,
         max_depth=args.max_depth,
         max_paths_per_hand=args.max_paths,
+        split_depth=args.split_depth,
         checkpoint_dir=args.checkpoint_dir,
         resume=args.resume,
         output_path=args.output,
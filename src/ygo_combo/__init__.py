@@ -44,7 +44,7 @@ from .engine.bindings import (
 )
 
 # Shared types
-from .types import Action, TerminalState
+from .types import Action, ActionHistory, TerminalState
 
 # Ranking
 from .ranking import ComboScore, ComboRanker, SortKey, rank_terminals
@@ -83,6 +83,7 @@ __all__ = [
     "DUEL_FLAGS_MR5",
     # Shared types
     "Action",
+    "ActionHistory",
     "TerminalState",
     # Ranking
     "ComboScore",
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Beam search over IDLE decision levels.
+
+Exhaustive DFS under MAX_PATHS explores one corner of the tree thoroughly
+and never reaches the rest. BeamSearchEngine trades completeness for
+breadth: level by level it keeps only the beam_width best IDLE nodes
+(ranked by a pluggable scorer, see search/scorers.py) and expands those.
+
+A level is one IDLE decision. Expanding a node branches on every IDLE
+action; each child is followed depth-first through the SELECT_* prompts
+after it, and the IDLE node it reaches becomes a candidate for the next
+level (exactly as in BestFirstEngine, which this engine extends). PASS
+terminals are recorded at every expanded node, so shallow boards are never
+lost to the beam.
+
+The transposition table is shared by the whole search: a state pushed by
+one beam node (whether kept or cut) is not pushed again from another node
+or a later level.
+
+After each level the engine appends a point to self.curve (paths spent vs
+best board so far), so widths can be compared by quality per path.
+
+Usage:
+    engine = BeamSearchEngine(lib, main_deck, extra_deck, beam_width=[32, 16, 8])
+    terminals = engine.enumerate_from_hand(hand)
+    for point in engine.curve:
+        print(point["level"], point["paths"], point["best_score"])
+"""
+
+import heapq
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .best_first import BestFirstEngine
+from .types import ActionHistory
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_BEAM_WIDTH = 16
+
+
+def parse_beam_width(text: str) -> List[int]:
+    """Parse a CLI width schedule: "16" or "32,16,8" (last width repeats)."""
+    widths = [int(part) for part in text.split(",") if part.strip()]
+    if not widths or min(widths) < 1:
+        raise ValueError(f"Beam width must be one or more positive integers, got {text!r}")
+    return widths
+
+
+# =============================================================================
+# BEAM SEARCH ENGINE
+# =============================================================================
+
+class BeamSearchEngine(BestFirstEngine):
+    """BestFirstEngine that expands the best beam_width nodes per IDLE level.
+
+    Args:
+        lib, main_deck, extra_deck: As for EnumerationEngine.
+        beam_width: Nodes kept per level, or a schedule of widths by level
+            (the last one repeats).
+        beam_depth: Maximum number of levels (None = until the beam empties
+            or MAX_DEPTH / MAX_PATHS is reached).
+        **kwargs: Passed through to BestFirstEngine (scorer, depth_penalty,
+            stopping_conditions, evaluator, ...).
+    """
+
+    search_mode = "beam"
+
+    def __init__(self, lib, main_deck, extra_deck,
+                 beam_width: Union[int, Sequence[int]] = DEFAULT_BEAM_WIDTH,
+                 beam_depth: Optional[int] = None, **kwargs):
+        widths = [beam_width] if isinstance(beam_width, int) else list(beam_width)
+        if not widths or min(widths) < 1:
+            raise ValueError(f"beam_width must be positive, got {beam_width!r}")
+        if beam_depth is not None and beam_depth < 1:
+            raise ValueError(f"beam_depth must be >= 1, got {beam_depth}")
+        super().__init__(lib, main_deck, extra_deck, **kwargs)
+
+        self.beam_widths = widths
+        self.beam_depth = beam_depth
+        self.levels_searched = 0
+        self.beam_cut = 0           # Candidates dropped by the width limit
+        self.curve: List[Dict[str, Any]] = []
+
+    def _reset_for_hand(self, starting_hand, prefix=None):
+        super()._reset_for_hand(starting_hand, prefix)
+        self.levels_searched = 0
+        self.beam_cut = 0
+        self.curve = []
+
+    def replay_stats(self) -> Dict[str, Any]:
+        stats = super().replay_stats()
+        stats["beam_widths"] = self.beam_widths
+        stats["levels_searched"] = self.levels_searched
+        stats["beam_cut"] = self.beam_cut
+        return stats
+
+    def width_at(self, level: int) -> int:
+        """Beam width used at a level (0-based)."""
+        return self.beam_widths[min(level, len(self.beam_widths) - 1)]
+
+    def _push(self, priority: float, action_history: ActionHistory):
+        """Add an IDLE node to the next level's candidates."""
+        self._open.append((-priority, self._pushed, action_history))
+        self._pushed += 1
+
+    def _run_search(self):
+        """Expand the root, then the best candidates of each level in turn."""
+        self._expand_depth = None
+        self._enumerate_recursive(ActionHistory.from_actions(self._root_prefix))
+
+        level = 0
+        while self._open and not self._should_stop():
+            if self.beam_depth is not None and level >= self.beam_depth:
+                self.stopped_reason = "beam_depth"
+                break
+
+            width = self.width_at(level)
+            beam = heapq.nsmallest(width, self._open)
+            self.beam_cut += len(self._open) - len(beam)
+            self._open = []
+
+            for _, _, action_history in beam:
+                if self._should_stop():
+                    break
+                self._expand(action_history)
+
+            level += 1
+            self.levels_searched = level
+            self._record_curve(level, len(beam))
+            logger.info(f"Beam level {level}: {len(beam)} expanded (width {width}), "
+                        f"{len(self._open)} candidates, best {self.best_tier} ({self.best_score:.0f}), "
+                        f"{self.paths_explored} paths")
+
+        if self.stopped_reason is None:
+            self.stopped_reason = "beam_exhausted" if not self._open else "max_paths"
+
+    def _record_curve(self, level: int, expanded: int):
+        self.curve.append({
+            "level": level,
+            "expanded": expanded,
+            "paths": self.paths_explored,
+            "terminals": len(self.terminals),
+            "best_score": self.best_score,
+            "best_tier": self.best_tier,
+        })
+
+
+__all__ = [
+    'DEFAULT_BEAM_WIDTH',
+    'BeamSearchEngine',
+    'parse_beam_width',
+]
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Best-first combo search.
+
+EnumerationEngine walks the tree depth-first, so under MAX_PATHS it spends
+its budget exhausting the first branches it meets; the Caesar line of the
+gold standard combo is 23 actions deep. BestFirstEngine keeps an open list
+of IDLE nodes instead and always expands the most promising one:
+
+    priority = scorer(IDLE board) - depth_penalty * depth
+
+The default scorer is the evaluate_board_quality score; see
+search/scorers.py for the role-progress and learned alternatives.
+
+Expanding a node branches on every IDLE action (PASS is recorded as a
+terminal as usual). Each child is followed depth-first through the forced
+and SELECT_* prompts that come after it, until it reaches its own IDLE
+prompt; that IDLE node is scored and pushed onto the open list. So only
+IDLE nodes are ordered, and the SELECT_* handlers are reused unchanged.
+
+IDLE nodes are deduplicated with the transposition table when they are
+pushed, so a state reached by several orderings is expanded once. The
+search stops when the open list is empty, at MAX_PATHS, or when any of the
+StoppingCondition objects from search/iddfs.py fires. They see the same
+search-state keys IterativeDeepeningSearch gives them, with terminals
+scored by the same evaluator.
+
+Popped nodes are reached by replaying their history on a fresh duel. Their
+first child still inherits the live duel ("prefix" replay mode).
+
+Usage:
+    engine = BestFirstEngine(lib, main_deck, extra_deck,
+                             stopping_conditions=[TargetTierReached("S")])
+    terminals = engine.enumerate_from_hand(hand)
+    print(engine.stopped_reason, engine.paths_explored)
+"""
+
+import heapq
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import combo_enumeration as ce
+from .combo_enumeration import EnumerationEngine, _SpineNode
+from .engine.evaluator import BoardEvaluator, get_evaluator
+from .engine.state import BoardSignature, IntermediateState
+from .search.iddfs import StoppingCondition
+from .search.scorers import BoardQualityScorer
+from .types import ActionHistory, TerminalState
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Search strategies selectable from the CLI (--search)
+SEARCH_MODES = ("dfs", "best-first", "beam", "mcts")
+DEFAULT_SEARCH_MODE = "dfs"
+
+# Priority lost per action of depth (one monster on field is worth 5)
+DEFAULT_DEPTH_PENALTY = 1.0
+
+
+# =============================================================================
+# BEST-FIRST ENGINE
+# =============================================================================
+
+class BestFirstEngine(EnumerationEngine):
+    """EnumerationEngine that expands IDLE nodes in order of board quality.
+
+    Args:
+        lib, main_deck, extra_deck: As for EnumerationEngine.
+        depth_penalty: Priority subtracted per action of depth.
+        stopping_conditions: StoppingCondition objects checked after every
+            expansion (None = run until the open list is empty or MAX_PATHS).
+        evaluator: BoardEvaluator scoring terminals for the stopping
+            conditions (default: the shared evaluator for
+            config/evaluation_config.json).
+        scorer: Callable ranking IDLE boards (BoardSignature -> float,
+            higher first; default: BoardQualityScorer(evaluator)).
+        **kwargs: Passed through to EnumerationEngine.
+    """
+
+    search_mode = "best-first"
+
+    def __init__(self, lib, main_deck, extra_deck, depth_penalty: float = DEFAULT_DEPTH_PENALTY,
+                 stopping_conditions: Optional[List[StoppingCondition]] = None,
+                 evaluator: Optional[BoardEvaluator] = None,
+                 scorer: Optional[Callable[[BoardSignature], float]] = None, **kwargs):
+        super().__init__(lib, main_deck, extra_deck, **kwargs)
+        self.depth_penalty = depth_penalty
+        self.stopping_conditions = list(stopping_conditions or [])
+        self.evaluator = evaluator or get_evaluator()
+        self.scorer = scorer or BoardQualityScorer(self.evaluator)
+
+        # Open list: (-priority, push order, action history at an IDLE prompt)
+        self._open: List[Tuple[float, int, ActionHistory]] = []
+        self._pushed = 0
+        self._expand_depth: Optional[int] = None  # History length of the node being expanded
+
+        self.nodes_expanded = 0
+        self.stopped_reason: Optional[str] = None
+        self.best_score = 0.0
+        self.best_tier = "brick"
+        self.terminals_with_boss = 0
+
+    def _reset_for_hand(self, starting_hand, prefix=None):
+        super()._reset_for_hand(starting_hand, prefix)
+        self._open = []
+        self._pushed = 0
+        self.nodes_expanded = 0
+        self.stopped_reason = None
+        self.best_score = 0.0
+        self.best_tier = "brick"
+        self.terminals_with_boss = 0
+
+    def replay_stats(self) -> Dict[str, Any]:
+        stats = super().replay_stats()
+        stats["search"] = self.search_mode
+        stats["nodes_expanded"] = self.nodes_expanded
+        stats["open_nodes"] = len(self._open)
+        stats["stopped_reason"] = self.stopped_reason
+        return stats
+
+    def search_state(self) -> Dict[str, Any]:
+        """Search state in the form StoppingCondition.should_stop expects."""
+        return {
+            "depth": self.max_depth_seen,
+            "best_score": self.best_score,
+            "best_tier": self.best_tier,
+            "total_terminals": len(self.terminals),
+            "terminals_with_boss": self.terminals_with_boss,
+            "total_paths": self.paths_explored,
+        }
+
+    # =========================================================================
+    # SEARCH LOOP
+    # =========================================================================
+
+    def _run_search(self):
+        """Push the root IDLE node, then expand the best open node until done."""
+        self._expand_depth = None
+        self._enumerate_recursive(ActionHistory.from_actions(self._root_prefix))
+
+        while self._open and not self._should_stop():
+            _, _, action_history = heapq.heappop(self._open)
+            self._expand(action_history)
+
+        if self.stopped_reason is None:
+            self.stopped_reason = "open_list_exhausted" if not self._open else "max_paths"
+        logger.info(f"Best-first search stopped ({self.stopped_reason}): "
+                    f"{self.nodes_expanded} nodes expanded, {len(self._open)} left open")
+
+    def _should_stop(self) -> bool:
+        if ce._shutdown_requested:
+            self.stopped_reason = "shutdown_requested"
+            return True
+        if self.paths_explored >= self.max_paths:
+            return True
+        if self.stopping_conditions:
+            state = self.search_state()
+            for condition in self.stopping_conditions:
+                if condition.should_stop(state):
+                    self.stopped_reason = condition.reason()
+                    return True
+        return False
+
+    def _expand(self, action_history: ActionHistory):
+        """Replay to an open IDLE node and branch on all of its actions."""
+        duel = self._replay_to(action_history)
+        if duel is None:
+            return
+
+        self.nodes_expanded += 1
+        self._expand_depth = len(action_history)
+        self._spine.append(_SpineNode(duel))
+        try:
+            self._explore_from_state(duel, action_history)
+        finally:
+            self._expand_depth = None
+            if self._spine.pop().duel is not None:
+                self.lib.OCG_DestroyDuel(duel)
+
+    # =========================================================================
+    # IDLE NODES
+    # =========================================================================
+
+    def _handle_idle(self, duel, action_history: ActionHistory, idle_data: dict):
+        """Branch at the node being expanded; score and push any other IDLE node."""
+        depth = len(action_history)
+        if depth == self._expand_depth:
+            # Already deduplicated when it was pushed
+            self._expand_depth = None
+            self._branch_idle(duel, action_history, idle_data)
+            return
+
+        sig, state_hash = self._idle_board(duel, idle_data, depth)
+        if self.dedupe_intermediate and self._prune_intermediate(state_hash, depth, action_history):
+            return
+
+        self._push(self.scorer(sig) - self.depth_penalty * depth, ActionHistory.of(action_history))
+
+    def _push(self, priority: float, action_history: ActionHistory):
+        """Add an IDLE node to the open list."""
+        heapq.heappush(self._open, (-priority, self._pushed, action_history))
+        self._pushed += 1
+
+    def _idle_board(self, duel, idle_data: dict, depth: int) -> Tuple[BoardSignature, int]:
+        """Board signature at an IDLE node and its intermediate-state hash."""
+        tracker = self._trackers.get(duel) if self.idle_capture == "incremental" else None
+        if tracker is not None:
+            state_hash = self._incremental_state_hash(duel, idle_data, depth)
+            return tracker.signature(), state_hash
+        sig = self._capture_signature(self.lib, duel)
+        return sig, IntermediateState.from_signature(sig, idle_data).zobrist_hash()
+
+    def _record_terminal(self, action_history: ActionHistory, reason: str, duel=None):
+        """Record the terminal as usual, then score it for the stopping conditions."""
+        recorded = len(self.terminals)
+        super()._record_terminal(action_history, reason, duel=duel)
+        for terminal in self.terminals[recorded:]:
+            self._score_terminal(terminal)
+
+    def _board_value(self, board_state, board_hash) -> float:
+        return self.evaluator.evaluate_board(board_state, board_hash)["score"]
+
+    def _score_terminal(self, terminal: TerminalState):
+        """Fold a newly recorded terminal into best_score, best_tier and terminals_with_boss."""
+        if not terminal.board_state:
+            return
+        result = self.evaluator.evaluate_board(terminal.board_state, terminal.board_hash)
+        if result["has_boss"]:
+            self.terminals_with_boss += 1
+        if result["score"] > self.best_score:
+            self.best_score = result["score"]
+            self.best_tier = result["tier"]
+
+
+__all__ = [
+    'SEARCH_MODES',
+    'DEFAULT_SEARCH_MODE',
+    'DEFAULT_DEPTH_PENALTY',
+    'BestFirstEngine',
+]
@@ -246,8 +246,6 @@ def create_checkpoint_from_engine(engine, description: str = "") -> Checkpoint:
     Returns:
         Checkpoint object ready to be saved.
     """
-    from .combo_enumeration import MAX_DEPTH, MAX_PATHS
-
     checkpoint = Checkpoint()
 
     # Metadata
@@ -261,8 +259,8 @@ def create_checkpoint_from_engine(engine, description: str = "") -> Checkpoint:
         dedupe_boards=engine.dedupe_boards,
         dedupe_intermediate=engine.dedupe_intermediate,
         prioritize_cards=list(engine.prioritize_order),
-        max_depth=MAX_DEPTH,
-        max_paths=MAX_PATHS,
+        max_depth=engine.max_depth,
+        max_paths=engine.max_paths,
     )
 
     # Progress
@@ -277,7 +275,7 @@ def create_checkpoint_from_engine(engine, description: str = "") -> Checkpoint:
     # Transposition table
     tt = engine.transposition_table
     entries = {}
-    for hash_key, entry in tt.table.items():
+    for hash_key, entry in tt.items():
         # Convert int hashes to string for JSON
         str_key = str(hash_key)
         entries[str_key] = {
@@ -286,6 +284,7 @@ def create_checkpoint_from_engine(engine, description: str = "") -> Checkpoint:
             "best_terminal_value": entry.best_terminal_value,
             "creation_depth": entry.creation_depth,
             "visit_count": entry.visit_count,
+            "remaining_depth": entry.remaining_depth,
         }
 
     checkpoint.transposition_table = TranspositionTableState(
@@ -351,6 +350,10 @@ def restore_engine_from_checkpoint(engine, checkpoint: Checkpoint):
         engine._starting_hand = cfg.starting_hand if cfg.starting_hand else None
         engine.dedupe_boards = cfg.dedupe_boards
         engine.dedupe_intermediate = cfg.dedupe_intermediate
+        # Entry remaining depths are relative to the limit they were searched under
+        engine.max_depth = cfg.max_depth
+        if cfg.max_paths is not None:
+            engine.max_paths = cfg.max_paths
         engine.prioritize_cards = set(cfg.prioritize_cards)
         engine.prioritize_order = list(cfg.prioritize_cards)
 
@@ -366,12 +369,6 @@ def restore_engine_from_checkpoint(engine, checkpoint: Checkpoint):
     tt_state = checkpoint.transposition_table
     if tt_state:
         engine.transposition_table = TranspositionTable(max_size=tt_state.max_size)
-        engine.transposition_table.hits = tt_state.hits
-        engine.transposition_table.misses = tt_state.misses
-        engine.transposition_table.stores = tt_state.stores
-        engine.transposition_table.overwrites = tt_state.overwrites
-        engine.transposition_table.evictions = tt_state.evictions
-        engine.transposition_table.evicted_entries = tt_state.evicted_entries
 
         for str_key, entry_data in tt_state.entries.items():
             # Reconstruct hash key (try int first, fall back to string)
@@ -400,8 +397,18 @@ def restore_engine_from_checkpoint(engine, checkpoint: Checkpoint):
                 best_terminal_value=entry_data["best_terminal_value"],
                 creation_depth=entry_data["creation_depth"],
                 visit_count=entry_data["visit_count"],
+                remaining_depth=entry_data.get("remaining_depth"),
             )
-            engine.transposition_table.table[hash_key] = entry
+            # Through store() so the replacement policy tracks the entry
+            engine.transposition_table.store(hash_key, entry)
+
+        # Counters last: the store() calls above must not count
+        engine.transposition_table.hits = tt_state.hits
+        engine.transposition_table.misses = tt_state.misses
+        engine.transposition_table.stores = tt_state.stores
+        engine.transposition_table.overwrites = tt_state.overwrites
+        engine.transposition_table.evictions = tt_state.evictions
+        engine.transposition_table.evicted_entries = tt_state.evicted_entries
 
     # Restore seen board signatures
     engine.seen_board_sigs = set(checkpoint.seen_board_sigs)
@@ -18,8 +18,26 @@ from .combo_enumeration import (
     EnumerationEngine,
     MAX_DEPTH,
     MAX_PATHS,
+    REPLAY_MODES,
+    DEFAULT_REPLAY_MODE,
+    TRANSPOSITION_BACKENDS,
+    DEFAULT_TRANSPOSITION_BACKEND,
+    IDLE_CAPTURE_MODES,
+    DEFAULT_IDLE_CAPTURE,
+    DEFAULT_VERIFY_INTERVAL,
     _signal_handler,
 )
+from .search.transposition import EVICTION_POLICIES, DEFAULT_EVICTION_POLICY
+from .search.compact_transposition import COMPACT_EVICTION_POLICIES
+from .search.persistent_transposition import PersistentTranspositionTable, library_fingerprint
+from .fork_enumeration import SNAPSHOT_MODES, DEFAULT_SNAPSHOT_MODE, ForkEnumerationEngine
+from .best_first import SEARCH_MODES, DEFAULT_SEARCH_MODE, DEFAULT_DEPTH_PENALTY, BestFirstEngine
+from .beam_search import DEFAULT_BEAM_WIDTH, BeamSearchEngine, parse_beam_width
+from .mcts import (
+    ROLLOUT_POLICIES, DEFAULT_ROLLOUT_POLICY, DEFAULT_ITERATIONS, DEFAULT_EXPLORATION, MCTSEngine,
+)
+from .search.scorers import SCORERS, DEFAULT_SCORER, make_scorer
+from .search.iddfs import TargetScoreReached, TargetTierReached
 from .engine.interface import init_card_database, load_library, set_lib
 from .engine.duel_factory import load_locked_library, get_deck_lists
 
@@ -46,7 +64,69 @@ def main():
                         help="Disable intermediate state pruning")
     parser.add_argument("--prioritize-cards", type=str, default="",
                         help="Comma-separated list of card passcodes to explore first during SELECT_CARD")
+    parser.add_argument("--replay-mode", choices=REPLAY_MODES, default=DEFAULT_REPLAY_MODE,
+                        help="How nodes reach their duel state: 'prefix' reuses the parent's live duel "
+                             "for the first child, 'path' replays every node from scratch")
+    parser.add_argument("--transposition-backend", choices=TRANSPOSITION_BACKENDS,
+                        default=DEFAULT_TRANSPOSITION_BACKEND,
+                        help="Intermediate-state table: 'dict' (default) or 'compact' "
+                             "(typed columns, ~24 bytes/entry)")
+    parser.add_argument("--eviction-policy", choices=EVICTION_POLICIES, default=DEFAULT_EVICTION_POLICY,
+                        help="Replacement policy of the transposition table when it fills "
+                             "('compact' supports depth_bucketed and sorted)")
+    parser.add_argument("--tt-cache", type=str, default=None,
+                        help="Persistent transposition cache file: states explored by earlier runs "
+                             "with the same library fingerprint are pruned and their best board "
+                             "reported as a CACHED terminal")
+    parser.add_argument("--snapshot-mode", choices=SNAPSHOT_MODES, default=DEFAULT_SNAPSHOT_MODE,
+                        help="'fork' snapshots IDLE/SELECT_CARD branch points with os.fork() "
+                             "instead of replaying (POSIX only)")
+    parser.add_argument("--max-forks", type=int, default=None,
+                        help="Concurrent forked children in fork snapshot mode (default: CPU count)")
+    parser.add_argument("--search", choices=SEARCH_MODES, default=DEFAULT_SEARCH_MODE,
+                        help="'dfs' enumerates depth-first; 'best-first' expands the IDLE node "
+                             "with the best score (minus a depth penalty) next; 'beam' keeps the "
+                             "best --beam-width IDLE nodes per decision level; 'mcts' runs UCT "
+                             "with rollouts to PASS")
+    parser.add_argument("--scorer", choices=SCORERS, default=DEFAULT_SCORER,
+                        help="With best-first/beam: rank IDLE nodes by board evaluation ('board') "
+                             "or card-role progress ('roles'); with mcts: order unvisited children")
+    parser.add_argument("--depth-penalty", type=float, default=DEFAULT_DEPTH_PENALTY,
+                        help="With best-first/beam: priority lost per action of depth")
+    parser.add_argument("--beam-width", type=str, default=str(DEFAULT_BEAM_WIDTH),
+                        help="With --search beam: nodes kept per level, or a per-level schedule "
+                             "like 32,16,8 (the last width repeats)")
+    parser.add_argument("--beam-depth", type=int, default=None,
+                        help="With --search beam: maximum number of IDLE decision levels")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="With --search mcts: rollouts to run (0 = until another budget ends the search)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="With --search mcts: wall-clock seconds to search")
+    parser.add_argument("--exploration", type=float, default=DEFAULT_EXPLORATION,
+                        help="With --search mcts: UCT exploration constant")
+    parser.add_argument("--rollout-policy", choices=ROLLOUT_POLICIES, default=DEFAULT_ROLLOUT_POLICY,
+                        help="With --search mcts: pick rollout actions uniformly ('random') or "
+                             "weighted by card role ('roles')")
+    parser.add_argument("--rollout-workers", type=int, default=1,
+                        help="With --search mcts: rollouts run in parallel in a process pool")
+    parser.add_argument("--target-tier", type=str, default=None,
+                        help="With best-first/beam/mcts: stop once a terminal of this tier is found")
+    parser.add_argument("--target-score", type=float, default=None,
+                        help="With best-first/beam/mcts: stop once a terminal scores this much")
+    parser.add_argument("--idle-capture", choices=IDLE_CAPTURE_MODES, default=DEFAULT_IDLE_CAPTURE,
+                        help="Board capture for intermediate-state hashing: 'targeted' queries only the "
+                             "hashed player-0 zones, 'full' builds a BoardState (debugging), "
+                             "'incremental' follows move/draw/equip messages")
+    parser.add_argument("--verify-interval", type=int, default=DEFAULT_VERIFY_INTERVAL,
+                        help="With --idle-capture incremental: cross-check the running hash against "
+                             "a zone query every N IDLE nodes (1 = always, 0 = never)")
+    parser.add_argument("--debug-messages", action="store_true",
+                        help="Keep raw SELECT_SUM message bytes and log them in the SELECT_SUM handler")
     args = parser.parse_args()
+    if args.search != "dfs" and args.snapshot_mode == "fork":
+        parser.error(f"--search {args.search} does not support --snapshot-mode fork")
+    if args.transposition_backend == "compact" and args.eviction_policy not in COMPACT_EVICTION_POLICIES:
+        parser.error(f"--transposition-backend compact does not support --eviction-policy {args.eviction_policy}")
 
     # Parse prioritized cards
     prioritize_cards = []
@@ -55,10 +135,6 @@ def main():
         if prioritize_cards:
             print(f"Card prioritization enabled: {prioritize_cards}")
 
-    # Update limits
-    ce.MAX_DEPTH = args.max_depth
-    ce.MAX_PATHS = args.max_paths
-
     # Initialize
     logger.info("Loading card database...")
     if not init_card_database():
@@ -81,14 +157,70 @@ def main():
     # Run enumeration
     dedupe_terminals = not args.no_dedupe
     dedupe_intermediate = not args.no_dedupe_intermediate
-    engine = EnumerationEngine(
+    engine_kwargs = {}
+    engine_cls = EnumerationEngine
+    if args.snapshot_mode == "fork":
+        engine_cls = ForkEnumerationEngine
+        engine_kwargs["max_forks"] = args.max_forks
+    elif args.search in ("best-first", "beam", "mcts"):
+        engine_cls = BestFirstEngine
+        if args.search == "mcts":
+            engine_cls = MCTSEngine
+            engine_kwargs["iterations"] = args.iterations or None
+            engine_kwargs["time_budget"] = args.time_budget
+            engine_kwargs["exploration"] = args.exploration
+            engine_kwargs["rollout_policy"] = args.rollout_policy
+            engine_kwargs["rollout_workers"] = args.rollout_workers
+        elif args.search == "beam":
+            engine_cls = BeamSearchEngine
+            try:
+                engine_kwargs["beam_width"] = parse_beam_width(args.beam_width)
+            except ValueError as e:
+                parser.error(str(e))
+            engine_kwargs["beam_depth"] = args.beam_depth
+        stopping_conditions = []
+        if args.target_tier:
+            stopping_conditions.append(TargetTierReached(args.target_tier))
+        if args.target_score is not None:
+            stopping_conditions.append(TargetScoreReached(args.target_score))
+        engine_kwargs["depth_penalty"] = args.depth_penalty
+        engine_kwargs["scorer"] = make_scorer(args.scorer)
+        engine_kwargs["stopping_conditions"] = stopping_conditions
+    tt_cache = None
+    if args.tt_cache:
+        tt_cache = PersistentTranspositionTable.open(args.tt_cache, library_fingerprint(extra={
+            "main_deck": sorted(main_deck),
+            "extra_deck": sorted(extra_deck),
+            "max_depth": args.max_depth,
+            "max_paths": args.max_paths,
+        }))
+        engine_kwargs["shared_table"] = tt_cache
+        print(f"Transposition cache: {args.tt_cache} ({tt_cache.warm_entries:,} warm entries"
+              f"{', invalidated: ' + tt_cache.invalidated if tt_cache.invalidated else ''})")
+    engine = engine_cls(
         lib, main_deck, extra_deck,
         verbose=args.verbose,
         dedupe_boards=dedupe_terminals,
         dedupe_intermediate=dedupe_intermediate,
-        prioritize_cards=prioritize_cards if prioritize_cards else None
+        prioritize_cards=prioritize_cards if prioritize_cards else None,
+        replay_mode=args.replay_mode,
+        transposition_backend=args.transposition_backend,
+        eviction_policy=args.eviction_policy,
+        debug_messages=args.debug_messages,
+        idle_capture=args.idle_capture,
+        verify_interval=args.verify_interval,
+        max_depth=args.max_depth,
+        max_paths=args.max_paths,
+        **engine_kwargs,
     )
-    terminals = engine.enumerate_all()
+    completed = False
+    try:
+        terminals = engine.enumerate_all()
+        completed = not ce._shutdown_requested and engine.paths_explored < engine.max_paths
+    finally:
+        if tt_cache is not None:
+            # Only a search that ran to the end leaves nothing half explored
+            tt_cache.close(clean=completed)
 
     # Save results
     output_path = Path(args.output)
@@ -96,8 +228,8 @@ def main():
     results = {
         "meta": {
             "timestamp": datetime.now().isoformat(),
-            "max_depth": ce.MAX_DEPTH,
-            "max_paths": ce.MAX_PATHS,
+            "max_depth": engine.max_depth,
+            "max_paths": engine.max_paths,
             "paths_explored": engine.paths_explored,
             "terminals_found": len(terminals),
             "unique_board_signatures": len(engine.terminal_boards),
@@ -109,10 +241,13 @@ def main():
             "dedupe_intermediate_enabled": dedupe_intermediate,
             "prioritize_cards": prioritize_cards if prioritize_cards else [],
             "max_depth_seen": engine.max_depth_seen,
+            **engine.replay_stats(),
         },
         "terminals": [t.to_dict() for t in terminals],
         "board_groups": {k: len(v) for k, v in engine.terminal_boards.items()},
     }
+    if args.search in ("beam", "mcts"):
+        results["quality_curve"] = engine.curve
 
     with open(output_path, "w") as f:
         json.dump(results, f, indent=2)
@@ -138,6 +273,17 @@ def main():
     for depth in sorted(by_depth.keys()):
         print(f"  Depth {depth}: {by_depth[depth]}")
 
+    if args.search == "beam":
+        print("\nQuality vs paths (per beam level):")
+        for point in engine.curve:
+            print(f"  Level {point['level']}: {point['paths']} paths, "
+                  f"best {point['best_tier']} ({point['best_score']:.0f})")
+    elif args.search == "mcts":
+        print("\nBest board vs CPU (each improvement):")
+        for point in engine.curve:
+            print(f"  Iteration {point['iteration']}: {point['paths']} paths, {point['seconds']:.1f}s, "
+                  f"best {point['best_tier']} ({point['best_score']:.0f})")
+
     return 0
 
 
@@ -6,7 +6,11 @@ Explores ALL possible action sequences from a starting game state.
 No AI makes decisions - code explores every legal path.
 
 Key design:
-- Forward replay (no save/restore)
+- Forward replay (no save/restore), sharing prefixes along the DFS spine:
+  each node hands its live duel to its first child, so only later
+  siblings pay for a fresh replay (see REPLAY_MODES)
+- Action paths are ActionHistory chains: a child adds one node to its
+  parent's path, and terminals keep the shared chain, not a list copy
 - Branch at IDLE (all actions + PASS) and SELECT_CARD (all choices)
 - Auto-decline chains (opponent has no responses)
 - PASS creates terminal states
@@ -20,15 +24,16 @@ TODO (Phase 6 Refactoring):
 """
 
 import hashlib
-import io
 import logging
 import signal
+import time
+import weakref
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import shared types to avoid circular imports
 # These are re-exported for backwards compatibility
-from .types import Action, TerminalState, HashValue
+from .types import Action, ActionHistory, TerminalState, HashValue
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -78,17 +83,18 @@ from .engine.bindings import (
     MSG_CARD_HINT, MSG_TAG_SWAP, MSG_RELOAD_FIELD, MSG_AI_NAME,
     MSG_SHOW_HINT, MSG_PLAYER_HINT, MSG_MATCH_KILL, MSG_CUSTOM_MSG, MSG_REMOVE_CARDS,
 )
-from .engine.state import BoardSignature, evaluate_board_quality
+from .engine.board_bits import BoardBits, get_card_index
+from .engine.evaluator import evaluate_board_bits, get_evaluator
 from .engine.board_capture import capture_board_state
-from .engine.duel_factory import load_locked_library, get_deck_lists, create_duel
-from .search.transposition import TranspositionTable
-from .enumeration import (
-    read_u8, read_u32,
-    parse_idle, parse_select_card, parse_select_chain, parse_select_place,
-    parse_select_unselect_card, parse_select_option, parse_select_tribute,
-    parse_select_sum,
-    build_decline_chain_response,
-)
+from .engine.board_types import BoardState
+from .engine.board_tracker import BoardTracker
+from .utils.hashing import get_hasher
+from .engine.duel_factory import load_locked_library, get_deck_lists, DuelFactory
+from .search.transposition import TranspositionTable, EVICTION_POLICIES, DEFAULT_EVICTION_POLICY
+from .search.compact_transposition import COMPACT_EVICTION_POLICIES, CompactTranspositionTable
+from .search.persistent_transposition import CachedResult
+from .enumeration import build_decline_chain_response
+from .enumeration.decoder import DECODERS, TRACKING_DECODERS, decode_messages
 from .enumeration.handlers import MessageHandlerMixin
 
 
@@ -123,6 +129,35 @@ MSG_TYPE_NAMES = {
 MAX_DEPTH = 50          # Maximum actions per path
 MAX_PATHS = 100000      # Maximum paths to explore (safety limit)
 MAX_ITERATIONS = 1000   # Maximum engine iterations per action
+MAX_SPLIT_DEPTH = 6     # Deepest frontier tried when splitting one hand across workers
+
+# Replay strategies for reaching a node's duel state:
+#   "prefix" - the first child of every node continues on the parent's live
+#              duel; later siblings create a fresh duel and replay the prefix.
+#              Forced moves (single-child prompts) never replay.
+#   "path"   - every node creates a fresh duel and replays its full history
+#              (original behaviour, kept as the reference implementation).
+REPLAY_MODES = ("prefix", "path")
+DEFAULT_REPLAY_MODE = "prefix"
+
+# Transposition table implementations for intermediate pruning:
+#   "dict"    - TranspositionTable, a dict of TranspositionEntry objects
+#   "compact" - CompactTranspositionTable, typed columns at ~24 bytes/entry
+TRANSPOSITION_BACKENDS = ("dict", "compact")
+DEFAULT_TRANSPOSITION_BACKEND = "dict"
+
+# Board capture behind the intermediate-state hash at MSG_IDLE:
+#   "targeted"    - capture_board_signature: player-0 signature zones only,
+#                   QUERY_CODE | QUERY_EQUIP_CARD, no BoardState
+#   "full"        - capture_board_state for both players, converted to a
+#                   BoardSignature, equips from the targeted zone query
+#                   (slower; kept for debugging)
+#   "incremental" - BoardTracker hash kept up to date from MSG_MOVE/DRAW/
+#                   EQUIP/UNEQUIP; zones are queried only to seed each duel
+#                   and every verify_interval IDLE nodes as a cross-check
+IDLE_CAPTURE_MODES = ("targeted", "full", "incremental")
+DEFAULT_IDLE_CAPTURE = "targeted"
+DEFAULT_VERIFY_INTERVAL = 64
 
 # Informational messages that don't require responses (for _explore_from_state)
 INFORMATIONAL_MESSAGES = {
@@ -150,6 +185,24 @@ INFORMATIONAL_MESSAGES = {
 # ENUMERATION ENGINE
 # =============================================================================
 
+class _SpineNode:
+    """A node on the current DFS spine.
+
+    Attributes:
+        duel: Live duel sitting at this node's prompt, or None once a child
+            has inherited it.
+        board: Board captured at this node (memoized by _capture_board).
+        needs_board: True at an IDLE prompt that can PASS; the board must be
+            captured before the duel is handed to a child.
+    """
+    __slots__ = ("duel", "board", "needs_board")
+
+    def __init__(self, duel):
+        self.duel = duel
+        self.board = None
+        self.needs_board = False
+
+
 class EnumerationEngine(MessageHandlerMixin):
     """Exhaustive combo path enumeration with deduplication optimizations.
 
@@ -157,13 +210,46 @@ class EnumerationEngine(MessageHandlerMixin):
     """
 
     def __init__(self, lib, main_deck, extra_deck, verbose=False, dedupe_boards=True, dedupe_intermediate=True,
-                 prioritize_cards=None):
+                 prioritize_cards=None, replay_mode=DEFAULT_REPLAY_MODE, shared_table=None,
+                 transposition_backend=DEFAULT_TRANSPOSITION_BACKEND,
+                 eviction_policy=DEFAULT_EVICTION_POLICY, debug_messages=False,
+                 idle_capture=DEFAULT_IDLE_CAPTURE, verify_interval=DEFAULT_VERIFY_INTERVAL,
+                 max_depth: Optional[int] = None, max_paths: Optional[int] = None):
+        if replay_mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay_mode {replay_mode!r}, expected one of {REPLAY_MODES}")
+        if transposition_backend not in TRANSPOSITION_BACKENDS:
+            raise ValueError(f"Unknown transposition_backend {transposition_backend!r}, "
+                             f"expected one of {TRANSPOSITION_BACKENDS}")
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction_policy {eviction_policy!r}, "
+                             f"expected one of {EVICTION_POLICIES}")
+        if transposition_backend == "compact" and eviction_policy not in COMPACT_EVICTION_POLICIES:
+            raise ValueError(f"eviction_policy {eviction_policy!r} is not supported by the compact "
+                             f"backend, expected one of {COMPACT_EVICTION_POLICIES}")
+        if idle_capture not in IDLE_CAPTURE_MODES:
+            raise ValueError(f"Unknown idle_capture {idle_capture!r}, expected one of {IDLE_CAPTURE_MODES}")
+
         self.lib = lib
         self.main_deck = main_deck
         self.extra_deck = extra_deck
+        get_hasher().register_cards(list(main_deck) + list(extra_deck))  # Key rows for the deck
         self.verbose = verbose
+        # Search limits (default: the module MAX_DEPTH / MAX_PATHS at construction)
+        self.max_depth = MAX_DEPTH if max_depth is None else max_depth
+        self.max_paths = MAX_PATHS if max_paths is None else max_paths
         self.dedupe_boards = dedupe_boards  # Skip duplicate terminal board states
         self.dedupe_intermediate = dedupe_intermediate  # Skip duplicate intermediate states
+        self.idle_capture = idle_capture  # Board capture for the intermediate-state hash
+        # "incremental" capture: one BoardTracker per live duel, re-checked
+        # against a zone query every verify_interval IDLE nodes (0 = never)
+        self.verify_interval = verify_interval
+        self._trackers = weakref.WeakKeyDictionary()    # duel -> BoardTracker
+        self._decoders = TRACKING_DECODERS if idle_capture == "incremental" else DECODERS
+        self.incremental_checks = 0       # Cross-check captures compared with a tracker
+        self.incremental_mismatches = 0   # ... that disagreed (tracker re-synced)
+        self.debug_messages = debug_messages  # Attach raw SELECT_SUM bytes for the handler's dump
+        # Set to a list to record every raw OCG_DuelGetMessage batch (message corpora)
+        self.message_log: Optional[List[bytes]] = None
 
         # Card prioritization for SELECT_CARD - these codes are explored first
         # Format: list of card passcodes to prioritize (explored in order given)
@@ -176,10 +262,21 @@ class EnumerationEngine(MessageHandlerMixin):
         self.seen_board_sigs = set()  # Board signatures already recorded (terminals)
 
         # Transposition table for intermediate state deduplication
-        self.transposition_table = TranspositionTable(max_size=1_000_000)
+        self.transposition_backend = transposition_backend
+        self.eviction_policy = eviction_policy    # Replacement policy of either backend
+        self.transposition_table = self._new_transposition_table()
+        # Optional SharedTranspositionTable consulted on local misses; it
+        # persists across hands and is shared with other workers
+        self.shared_table = shared_table
+        self.shared_states_pruned = 0  # Subset of intermediate_states_pruned
+        # Hits whose entry was searched with less remaining depth (re-expanded)
+        self.states_reexpanded = 0
+        # One [best value, cut] frame per IDLE state being searched (see
+        # MessageHandlerMixin._close_subtree), innermost last
+        self._subtrees: List[list] = []
 
         # Group terminals by board signature
-        self.terminal_boards: Dict[HashValue, List] = {}  # board_hash -> list of action sequences
+        self.terminal_boards: Dict[HashValue, List] = {}  # board_hash -> ActionHistory per terminal
 
         self.duplicate_boards_skipped = 0  # Counter for stats
         self.intermediate_states_pruned = 0  # Counter for intermediate pruning
@@ -191,10 +288,56 @@ class EnumerationEngine(MessageHandlerMixin):
 
         # Custom starting hand (None = use default)
         self._starting_hand = None
-
-    def _recurse(self, action_history: List[Action]):
-        """Continue enumeration from action history (alias for handlers)."""
-        self._enumerate_recursive(action_history)
+        # Reused for every duel of the current hand (rebuilt when the hand changes)
+        self._duel_factory: Optional[DuelFactory] = None
+
+        # Replay bookkeeping
+        self.replay_mode = replay_mode
+        self.duels_created = 0      # New duels (node replays + fallback terminal captures)
+        self.actions_replayed = 0   # Actions fed through _replay_action
+        # Nodes on the current DFS spine, root first
+        self._spine: List[_SpineNode] = []
+
+        # Frontier splitting (see expand_frontier / enumerate_from_hand prefix)
+        self._root_prefix: List[Action] = []         # Where _run_search starts
+        self._frontier_depth: Optional[int] = None   # Cut depth while expanding
+        self._deadline: Optional[float] = None       # time.monotonic() budget end
+        self.frontier: List[List[Action]] = []       # Prefixes collected at the cut
+
+        # Depth-limit frontier (see deepen)
+        self.cutoffs: Optional[List[ActionHistory]] = None   # Nodes cut at max_depth
+        self._max_cutoffs: Optional[int] = None              # Drop cutoffs beyond this
+        self._deepening = False     # deepen() re-search: frontier nodes are the old limit
+        self.research_seconds = 0.0
+        self.expansion_seconds = 0.0
+
+    def _new_transposition_table(self):
+        """Create the transposition table used for intermediate pruning."""
+        if self.transposition_backend == "compact":
+            return CompactTranspositionTable(max_size=1_000_000, eviction_policy=self.eviction_policy)
+        return TranspositionTable(max_size=1_000_000, eviction_policy=self.eviction_policy)
+
+    def _run_search(self):
+        """Explore the whole tree from the starting position (or root prefix)."""
+        self._enumerate_recursive(ActionHistory.from_actions(self._root_prefix))
+
+    def _recurse(self, action_history: ActionHistory):
+        """Continue enumeration from action history (alias for handlers).
+
+        In "prefix" replay mode the first child of a node inherits the node's
+        live duel, which is sitting at the prompt the child's last action
+        answers, so no replay is needed. Later siblings replay from scratch.
+        """
+        duel = None
+        node = self._spine[-1] if self._spine else None
+        if self.replay_mode == "prefix" and node is not None and node.duel is not None:
+            if node.needs_board:
+                # PASS terminal is recorded after the children; grab its board now
+                self._capture_board(self.lib, node.duel)
+            duel, node.duel = node.duel, None
+            action = action_history[-1]
+            self.lib.OCG_DuelSetResponse(duel, action.response_bytes, len(action.response_bytes))
+        self._enumerate_recursive(action_history, duel)
 
     def log(self, msg, depth=0):
         if self.verbose:
@@ -230,15 +373,38 @@ class EnumerationEngine(MessageHandlerMixin):
         """Get the set of cards that have failed at this context."""
         return self.failed_at_context.get(context_hash, set())
 
+    def replay_stats(self) -> Dict[str, Any]:
+        """Get replay cost counters for the current enumeration.
+
+        Returns:
+            Dict with replay_mode, duels_created, actions_replayed,
+            replayed_actions_per_node (actions replayed / paths explored),
+            idle_capture and the incremental cross-check counters.
+        """
+        return {
+            "replay_mode": self.replay_mode,
+            "duels_created": self.duels_created,
+            "actions_replayed": self.actions_replayed,
+            "replayed_actions_per_node": self.actions_replayed / max(self.paths_explored, 1),
+            "idle_capture": self.idle_capture,
+            "incremental_checks": self.incremental_checks,
+            "incremental_mismatches": self.incremental_mismatches,
+        }
+
+    def _print_replay_stats(self):
+        stats = self.replay_stats()
+        print(f"Replay ({stats['replay_mode']}): {stats['duels_created']} duels created, "
+              f"{stats['replayed_actions_per_node']:.2f} replayed actions/node")
+
     def enumerate_all(self):
         """Main entry point - enumerate all paths from starting state."""
         print("=" * 80)
         print("STARTING ENUMERATION")
-        print(f"Max depth: {MAX_DEPTH}")
-        print(f"Max paths: {MAX_PATHS}")
+        print(f"Max depth: {self.max_depth}")
+        print(f"Max paths: {self.max_paths}")
         print("=" * 80)
 
-        self._enumerate_recursive([])
+        self._run_search()
 
         print("\n" + "=" * 80)
         print("ENUMERATION COMPLETE")
@@ -250,29 +416,20 @@ class EnumerationEngine(MessageHandlerMixin):
         if self.dedupe_intermediate:
             tt_stats = self.transposition_table.stats()
             print(f"Intermediate states pruned: {self.intermediate_states_pruned}")
+            if self.states_reexpanded:
+                print(f"States re-expanded with more depth: {self.states_reexpanded}")
             print(f"Transposition table: {tt_stats['size']} entries, "
                   f"{tt_stats['hit_rate']:.1%} hit rate")
+            if self.shared_table is not None:
+                print(f"Shared transposition table: {self.shared_states_pruned} pruned")
         print(f"Max depth seen: {self.max_depth_seen}")
+        self._print_replay_stats()
         print("=" * 80)
 
         return self.terminals
 
-    def enumerate_from_hand(self, starting_hand: List[int]) -> List[TerminalState]:
-        """
-        Enumerate combos from a specific starting hand.
-
-        Args:
-            starting_hand: List of up to 5 card passcodes for starting hand.
-                          Will be padded with HOLACTIE if less than 5 cards.
-
-        Returns:
-            List of terminal states (completed combo boards).
-
-        Example:
-            # Test Engraver + Terrortop opener
-            hand = [60764609, 81275020, 14558127, 14558127, 14558127]
-            results = engine.enumerate_from_hand(hand)
-        """
+    def _reset_for_hand(self, starting_hand: List[int], prefix: Optional[List[Action]] = None):
+        """Validate starting_hand and reset all per-enumeration state."""
         if not starting_hand:
             raise ValueError("Hand cannot be empty")
 
@@ -280,8 +437,9 @@ class EnumerationEngine(MessageHandlerMixin):
             logger.warning(f"Hand has {len(starting_hand)} cards, truncating to 5")
             starting_hand = starting_hand[:5]
 
-        # Store the starting hand for create_duel calls
+        # Store the starting hand for duel creation
         self._starting_hand = list(starting_hand)
+        self._root_prefix = list(prefix) if prefix else []
 
         # Reset state for fresh enumeration
         self.terminals = []
@@ -291,43 +449,269 @@ class EnumerationEngine(MessageHandlerMixin):
         self.terminal_boards = {}
         self.duplicate_boards_skipped = 0
         self.intermediate_states_pruned = 0
-        self.transposition_table = TranspositionTable(max_size=1_000_000)
+        self.shared_states_pruned = 0
+        self.states_reexpanded = 0
+        self.transposition_table = self._new_transposition_table()
+        self.duels_created = 0
+        self.actions_replayed = 0
+        self.frontier = []
+        self.cutoffs = None
+
+    def enumerate_from_hand(self, starting_hand: List[int],
+                            prefix: Optional[List[Action]] = None,
+                            time_budget: Optional[float] = None) -> List[TerminalState]:
+        """
+        Enumerate combos from a specific starting hand.
+
+        Args:
+            starting_hand: List of up to 5 card passcodes for starting hand.
+                          Will be padded with HOLACTIE if less than 5 cards.
+            prefix: Optional action history to start from (a frontier entry
+                    from expand_frontier). Only the subtree below it is
+                    explored.
+            time_budget: Optional wall-clock budget in seconds. Once it is
+                    spent, every node not yet explored is donated to
+                    self.frontier as a prefix instead (see expand_frontier)
+                    so another worker can take it over.
+
+        Returns:
+            List of terminal states (completed combo boards).
+
+        Example:
+            # Test Engraver + Terrortop opener
+            hand = [60764609, 81275020, 14558127, 14558127, 14558127]
+            results = engine.enumerate_from_hand(hand)
+        """
+        self._reset_for_hand(starting_hand, prefix)
 
         print("=" * 80)
         print("ENUMERATE FROM HAND")
-        print(f"Hand: {starting_hand}")
-        print(f"Max depth: {MAX_DEPTH}")
-        print(f"Max paths: {MAX_PATHS}")
+        print(f"Hand: {self._starting_hand}")
+        if self._root_prefix:
+            print(f"Prefix: {len(self._root_prefix)} actions")
+        print(f"Max depth: {self.max_depth}")
+        print(f"Max paths: {self.max_paths}")
         print("=" * 80)
 
-        self._enumerate_recursive([])
+        if time_budget:
+            self._deadline = time.monotonic() + time_budget
+        try:
+            self._run_search()
+        finally:
+            self._deadline = None
 
         print("\n" + "=" * 80)
         print("ENUMERATION COMPLETE")
         print(f"Paths explored: {self.paths_explored}")
         print(f"Terminal states: {len(self.terminals)} unique boards")
+        if self.frontier:
+            print(f"Time budget spent: {len(self.frontier)} subtrees donated")
         print(f"Max depth seen: {self.max_depth_seen}")
+        self._print_replay_stats()
         print("=" * 80)
 
         return self.terminals
 
-    def _enumerate_recursive(self, action_history: List[Action]):
+    def expand_frontier(self, starting_hand: List[int], depth: int) -> List[List[Action]]:
+        """Explore a starting hand down to depth and collect the cut prefixes.
+
+        Nodes shallower than depth are explored normally, so terminals and
+        transposition pruning above the cut are recorded on this engine.
+        Every node reached at exactly depth is not explored; its action
+        history is appended to self.frontier instead. Enumerating each
+        frontier prefix (enumerate_from_hand(hand, prefix=...)) and adding
+        the terminals found here covers the whole tree.
+
+        Args:
+            starting_hand: As for enumerate_from_hand.
+            depth: Number of actions in every frontier prefix (>= 1).
+
+        Returns:
+            The frontier prefixes, in DFS order.
+        """
+        if depth < 1:
+            raise ValueError(f"Frontier depth must be >= 1, got {depth}")
+
+        self._reset_for_hand(starting_hand)
+        self._frontier_depth = depth
+        try:
+            self._run_search()
+        finally:
+            self._frontier_depth = None
+
+        logger.info(f"Frontier at depth {depth}: {len(self.frontier)} prefixes, "
+                    f"{len(self.terminals)} shallow terminals")
+        return self.frontier
+
+    def enumerate_with_depth_limit(self, depth: int,
+                                   starting_hand: Optional[List[int]] = None) -> List[TerminalState]:
+        """Enumerate a hand down to depth actions, keeping the transposition table.
+
+        The entry point IterativeDeepeningSearch drives. Terminals and
+        counters start afresh on every call, but the transposition table
+        of the previous call on the same hand is kept: a state whose
+        subtree was searched completely is pruned again, and one that was
+        cut off by the old limit is re-expanded only if it now has more
+        depth left (see TranspositionEntry.remaining_depth).
+
+        Args:
+            depth: Depth limit for this call (self.max_depth is restored
+                afterwards).
+            starting_hand: Hand to enumerate (default: the hand of the
+                previous call). A different hand starts a new table.
+
+        Returns:
+            List of terminal states found within depth actions.
+        """
+        self._reset_keeping_table(starting_hand)
+
+        limit, self.max_depth = self.max_depth, depth
+        try:
+            self._run_search()
+        finally:
+            self.max_depth = limit
+
+        logger.info(f"Depth {depth}: {self.paths_explored} paths, {len(self.terminals)} terminals, "
+                    f"{self.intermediate_states_pruned} pruned, {self.states_reexpanded} re-expanded")
+        return self.terminals
+
+    def deepen(self, depth: int, frontier: Optional[List[ActionHistory]] = None,
+               previous_depth: Optional[int] = None, starting_hand: Optional[List[int]] = None,
+               max_frontier: Optional[int] = None) -> List[TerminalState]:
+        """Search a hand down to depth, continuing from the previous limit's frontier.
+
+        enumerate_with_depth_limit walks the tree from the root on every
+        call. Given frontier - the nodes the previous call cut off at its
+        limit - this call only searches below those nodes, each reached by
+        replaying its prefix. Without one (first call, or a frontier that
+        was dropped) it re-searches from the root, and each node the old
+        limit (previous_depth, default depth - 1) would cut is searched
+        on down to depth as it is reached.
+
+        Either way every terminal below the old limit is found, as with
+        enumerate_with_depth_limit(depth); those above it (returned by
+        the previous call) are only found again when re-searching. Nodes
+        cut at depth are kept in self.cutoffs for the next call, as
+        ActionHistory chains that share their prefixes.
+        If more than max_frontier are cut, self.cutoffs is dropped (None)
+        and the next call falls back to re-searching.
+
+        Wall time is split into self.research_seconds (replaying prefixes,
+        or searching the levels above the old limit again) and
+        self.expansion_seconds (searching below the old limit).
+
+        Args:
+            depth: Depth limit for this call.
+            frontier: self.cutoffs of the previous call on the same hand.
+            previous_depth: Limit of the previous call when re-searching.
+            starting_hand: As for enumerate_with_depth_limit.
+            max_frontier: Most cut nodes kept for the next call (None = all).
+
+        Returns:
+            List of terminal states found.
+        """
+        if previous_depth is not None and not 0 <= previous_depth < depth:
+            raise ValueError(f"previous_depth must be in [0, {depth}), got {previous_depth}")
+        if not self._reset_keeping_table(starting_hand):
+            frontier = None     # Prefixes of another hand
+        self.cutoffs = []
+        self._max_cutoffs = max_frontier
+        self.research_seconds = 0.0
+        self.expansion_seconds = 0.0
+
+        limit, self.max_depth = self.max_depth, depth
+        start = time.perf_counter()
+        try:
+            if frontier is not None:
+                self._search_frontier(frontier)
+            else:
+                # Nodes at the old limit are searched as they are reached
+                self._frontier_depth = depth - 1 if previous_depth is None else previous_depth
+                self._deepening = True
+                self._run_search()
+                self.research_seconds = time.perf_counter() - start - self.expansion_seconds
+        finally:
+            self.max_depth = limit
+            self._frontier_depth = None
+            self._deepening = False
+        if _shutdown_requested or self.paths_explored >= self.max_paths:
+            self.cutoffs = None     # Stopped early: some nodes were never reached
+
+        logger.info(f"Depth {depth} ({'frontier' if frontier is not None else 're-search'}): "
+                    f"{self.paths_explored} paths, {len(self.terminals)} terminals, "
+                    f"{self.research_seconds:.2f}s re-search, {self.expansion_seconds:.2f}s expansion, "
+                    f"{'dropped' if self.cutoffs is None else len(self.cutoffs)} cut nodes kept")
+        return self.terminals
+
+    def _search_frontier(self, frontier: List[ActionHistory]):
+        """Replay each frontier prefix and search below it (see deepen)."""
+        for prefix in frontier:
+            if _shutdown_requested or self.paths_explored >= self.max_paths:
+                return
+            start = time.perf_counter()
+            duel = self._replay_to(prefix)
+            replayed = time.perf_counter()
+            self.research_seconds += replayed - start
+            if duel is not None:
+                self._enumerate_recursive(prefix, duel)
+                self.expansion_seconds += time.perf_counter() - replayed
+
+    def _reset_keeping_table(self, starting_hand: Optional[List[int]]) -> bool:
+        """_reset_for_hand, keeping the transposition table if the hand is unchanged.
+
+        Returns:
+            Whether the hand is the one the previous call enumerated.
+        """
+        hand = list(starting_hand) if starting_hand is not None else self._starting_hand
+        if not hand:
+            raise ValueError("No starting hand: pass one or enumerate a hand first")
+
+        table = self.transposition_table
+        same_hand = hand[:5] == self._starting_hand
+        self._reset_for_hand(hand)
+        if same_hand:
+            self.transposition_table = table
+        return same_hand
+
+    def _enumerate_recursive(self, action_history: ActionHistory, duel=None):
         """Recursively explore all paths from current action history.
 
         Uses self._starting_hand if set, otherwise uses default deck order.
+
+        Args:
+            action_history: Actions leading to this node.
+            duel: Live duel already advanced to this node (response to the
+                last action set, not yet processed). Ownership passes to
+                this call. If None, a fresh duel is created and replayed.
         """
         global _shutdown_requested
 
         # Check for graceful shutdown
         if _shutdown_requested:
+            self._mark_cut()
+            self._release_duel(duel)
             return
 
         # Safety limits
-        if len(action_history) >= MAX_DEPTH:
-            self._record_terminal(action_history, "MAX_DEPTH")
+        if len(action_history) >= self.max_depth:
+            self._mark_cut()
+            self._cut_off(action_history, duel)
             return
 
-        if self.paths_explored >= MAX_PATHS:
+        # Frontier: leave this subtree to a separate work unit
+        if self._at_frontier(action_history):
+            if self._deepening:
+                # deepen() re-search: the old limit, search on below it now
+                self._search_below_old_limit(action_history, duel)
+                return
+            self._mark_cut()
+            self._release_duel(duel)
+            self.frontier.append(action_history.to_list())
+            return
+
+        if self.paths_explored >= self.max_paths:
+            self._mark_cut()
+            self._release_duel(duel)
             return
 
         self.paths_explored += 1
@@ -336,33 +720,130 @@ class EnumerationEngine(MessageHandlerMixin):
         if self.paths_explored % 100 == 0:
             print(f"  Progress: {self.paths_explored} paths, {len(self.terminals)} terminals", flush=True)
 
-        # Create fresh duel (with optional starting hand)
-        duel = create_duel(self.lib, self.main_deck, self.extra_deck,
-                           starting_hand=self._starting_hand)
+        if duel is None:
+            duel = self._replay_to(action_history)
+            if duel is None:
+                return
 
+        # Expose the live duel so the first child can inherit it (_recurse)
+        self._spine.append(_SpineNode(duel))
         try:
-            # Start duel
-            self.lib.OCG_StartDuel(duel)
+            # Now explore from current state
+            self._explore_from_state(duel, action_history)
 
-            # Replay all previous actions
+        finally:
+            if self._spine.pop().duel is not None:
+                self.lib.OCG_DestroyDuel(duel)
+
+    def _cut_off(self, action_history: ActionHistory, duel=None):
+        """Handle a node at the depth limit: record a MAX_DEPTH terminal.
+
+        While deepen() collects a frontier the node is also kept in
+        self.cutoffs.
+        """
+        try:
+            self._record_terminal(action_history, "MAX_DEPTH", duel=duel)
+        finally:
+            self._release_duel(duel)
+        if self.cutoffs is not None:
+            if self._max_cutoffs is not None and len(self.cutoffs) >= self._max_cutoffs:
+                logger.info(f"More than {self._max_cutoffs} cut nodes: frontier dropped")
+                self.cutoffs = None
+            else:
+                self.cutoffs.append(action_history)
+
+    def _search_below_old_limit(self, action_history: ActionHistory, duel=None):
+        """Search a node at deepen()'s old limit, timed as new expansion."""
+        cut, self._frontier_depth = self._frontier_depth, None
+        start = time.perf_counter()
+        try:
+            self._enumerate_recursive(action_history, duel)
+        finally:
+            self.expansion_seconds += time.perf_counter() - start
+            self._frontier_depth = cut
+
+    def _at_frontier(self, action_history: ActionHistory) -> bool:
+        """Whether this node is cut off and collected into self.frontier.
+
+        Nodes are cut at the expansion depth, or once the time budget is
+        spent. The root of the search (the root prefix) is always explored,
+        so every donated prefix is strictly deeper than the one it came from.
+        """
+        if self._frontier_depth is not None:
+            return len(action_history) >= self._frontier_depth
+        return (self._deadline is not None
+                and len(action_history) > len(self._root_prefix)
+                and time.monotonic() >= self._deadline)
+
+    def _capture_board(self, lib, duel):
+        """Capture the board at the current spine node, memoized per node.
+
+        Used for the PASS terminal of the node (and for the intermediate-state
+        hash at IDLE when idle_capture is "full", so one capture serves both).
+        """
+        node = self._spine[-1] if self._spine else None
+        if node is None:
+            return capture_board_state(lib, duel)
+        if node.board is None:
+            node.board = capture_board_state(lib, duel)
+        return node.board
+
+    def _create_duel(self):
+        """Create a fresh duel for the configured deck and starting hand."""
+        factory = self._duel_factory
+        if factory is None or factory.starting_hand != self._starting_hand:
+            factory = self._duel_factory = DuelFactory(
+                self.lib, self.main_deck, self.extra_deck, starting_hand=self._starting_hand)
+        self.duels_created += 1
+        duel = factory.new_duel()
+        if self.idle_capture == "incremental":
+            self._trackers[duel] = BoardTracker()
+        return duel
+
+    def _release_duel(self, duel):
+        """Destroy an inherited duel that will not be explored."""
+        if duel is not None:
+            self.lib.OCG_DestroyDuel(duel)
+
+    def _replay_to(self, action_history: ActionHistory):
+        """Create a fresh duel, start it and replay action_history.
+
+        Returns:
+            The live duel, or None if replay failed (the duel is destroyed).
+        """
+        duel = self._create_duel()
+        try:
+            self.lib.OCG_StartDuel(duel)
             for action in action_history:
                 if not self._replay_action(duel, action):
                     self.log(f"Replay failed at action: {action.description}", len(action_history))
-                    return
-
-            # Now explore from current state
-            self._explore_from_state(duel, action_history)
+                    self.lib.OCG_DestroyDuel(duel)
+                    return None
+        except Exception:
+            self.lib.OCG_DestroyDuel(duel)
+            raise
+        return duel
 
+    def _capture_by_replay(self, action_history: ActionHistory):
+        """Capture the board at the end of action_history on a fresh duel."""
+        duel = self._create_duel()
+        try:
+            self.lib.OCG_StartDuel(duel)
+            for action in action_history:
+                self._replay_action(duel, action)
+            return capture_board_state(self.lib, duel)
         finally:
             self.lib.OCG_DestroyDuel(duel)
 
     def _replay_action(self, duel, action: Action) -> bool:
         """Replay a single action, handling any intermediate prompts."""
+        self.actions_replayed += 1
 
         # Process until we need the action's response
         for _ in range(MAX_ITERATIONS):
             status = self.lib.OCG_DuelProcess(duel)
             messages = self._get_messages(duel)
+            self._track_messages(duel, messages)
 
             for msg_type, msg_data in messages:
                 if msg_type == MSG_SELECT_CHAIN:
@@ -382,11 +863,12 @@ class EnumerationEngine(MessageHandlerMixin):
 
         return False  # Max iterations
 
-    def _explore_from_state(self, duel, action_history: List[Action]):
+    def _explore_from_state(self, duel, action_history: ActionHistory):
         """Explore all branches from current duel state."""
         for iteration in range(MAX_ITERATIONS):
             status = self.lib.OCG_DuelProcess(duel)
             messages = self._get_messages(duel)
+            self._track_messages(duel, messages)
 
             decision_found = False
 
@@ -397,6 +879,8 @@ class EnumerationEngine(MessageHandlerMixin):
                     continue
 
                 if msg_type == MSG_IDLE:
+                    if self._spine:
+                        self._spine[-1].needs_board = bool(msg_data.get("to_ep"))
                     self._handle_idle(duel, action_history, msg_data)
                     return  # Branching handled
 
@@ -455,7 +939,7 @@ class EnumerationEngine(MessageHandlerMixin):
                     self.log(f"Unhandled message type {msg_type} ({msg_name})", len(action_history))
 
             if status == 0:  # DUEL_END
-                self._record_terminal(action_history, "DUEL_END")
+                self._record_terminal(action_history, "DUEL_END", duel=duel)
                 return
             elif status == 1 and not decision_found:  # AWAITING but nothing handled
                 if not messages:
@@ -476,101 +960,91 @@ class EnumerationEngine(MessageHandlerMixin):
     #   _handle_legacy_message_12
 
     def _get_messages(self, duel):
-        """Get all pending messages from engine."""
-        messages = []
+        """Get all pending messages from engine.
 
+        Decodes the batch in place (see enumeration/decoder.py): only
+        decision messages become dicts, everything else is (msg_type, None).
+        """
         length = ffi.new("uint32_t*")
         buf = self.lib.OCG_DuelGetMessage(duel, length)
 
         if length[0] == 0:
-            return messages
-
-        data = bytes(ffi.buffer(buf, length[0]))
-        stream = io.BytesIO(data)
+            return []
 
-        while stream.tell() < len(data):
-            # Each message has length prefix
-            if stream.tell() + 4 > len(data):
-                break
-            msg_len = read_u32(stream)
-            if msg_len == 0:
-                break
-
-            msg_start = stream.tell()
-            msg_type = read_u8(stream)
-
-            # Read message body
-            remaining = msg_len - 1  # Already read msg_type
-            msg_body = stream.read(remaining)
-
-            if msg_type == MSG_IDLE:
-                msg_data = parse_idle(msg_body)
-                messages.append((MSG_IDLE, msg_data))
-            elif msg_type == MSG_SELECT_CARD:
-                msg_data = parse_select_card(msg_body)
-                messages.append((MSG_SELECT_CARD, msg_data))
-            elif msg_type == MSG_SELECT_CHAIN:
-                msg_data = parse_select_chain(msg_body)
-                messages.append((MSG_SELECT_CHAIN, msg_data))
-            elif msg_type == MSG_SELECT_PLACE:
-                msg_data = parse_select_place(msg_body)
-                messages.append((MSG_SELECT_PLACE, msg_data))
-            elif msg_type == MSG_SELECT_UNSELECT_CARD:
-                msg_data = parse_select_unselect_card(msg_body)
-                messages.append((MSG_SELECT_UNSELECT_CARD, msg_data))
-            elif msg_type == MSG_SELECT_OPTION:
-                msg_data = parse_select_option(msg_body)
-                messages.append((MSG_SELECT_OPTION, msg_data))
-            elif msg_type == MSG_SELECT_SUM:
-                msg_data = parse_select_sum(msg_body)
-                msg_data["_raw"] = msg_body.hex()  # Debug: include raw bytes
-                messages.append((MSG_SELECT_SUM, msg_data))
-            elif msg_type == MSG_SELECT_TRIBUTE:
-                msg_data = parse_select_tribute(msg_body)
-                messages.append((MSG_SELECT_TRIBUTE, msg_data))
-            elif msg_type == 12:
-                # Legacy message type - pass raw data for handler
-                msg_data = {"raw": msg_body}
-                messages.append((12, msg_data))
-            else:
-                # Unhandled message type
-                messages.append((msg_type, None))
+        data = ffi.buffer(buf, length[0])
+        if self.message_log is not None:
+            self.message_log.append(bytes(data))
+        return decode_messages(data, debug=self.debug_messages, decoders=self._decoders)
 
-        return messages
+    def _track_messages(self, duel, messages):
+        """Feed a message batch to the duel's BoardTracker, if it has one."""
+        if self._trackers:
+            tracker = self._trackers.get(duel)
+            if tracker is not None:
+                tracker.apply(messages)
 
-    def _record_terminal(self, action_history: List[Action], reason: str):
+    def _record_terminal(self, action_history: ActionHistory, reason: str, duel=None):
         """Record a terminal state with full board capture.
 
+        The board comes from a live duel whenever one is at the terminal
+        position, so no replay is needed:
+            - PASS: the IDLE node's board (the pass response is never
+              processed, so this is the board the line ends on)
+            - duel given: the caller's duel (DUEL_END, or an inherited
+              duel at MAX_DEPTH)
+        Otherwise the history is replayed on a fresh duel.
+
         If dedupe_boards is enabled, skips recording if we've already
         seen an identical board state (reached via a different path).
         """
 
-        # Create state hash from action sequence
-        action_str = "|".join(a.description for a in action_history)
-        state_hash = hashlib.md5(action_str.encode()).hexdigest()[:16]
-
-        # Capture board state by replaying actions
         board_state = {}
         if action_history:
-            duel = create_duel(self.lib, self.main_deck, self.extra_deck)
             try:
-                self.lib.OCG_StartDuel(duel)
-                # Replay all actions
-                for action in action_history:
-                    self._replay_action(duel, action)
-                # Capture the final board state
-                board_state = capture_board_state(self.lib, duel)
+                node = self._spine[-1] if self._spine else None
+                if reason == "PASS" and node is not None and (node.board is not None or node.duel is not None):
+                    board_state = self._capture_board(self.lib, node.duel)
+                elif duel is not None:
+                    board_state = capture_board_state(self.lib, duel)
+                else:
+                    board_state = self._capture_by_replay(action_history)
             except Exception as e:
                 self.log(f"Board capture failed: {e}", len(action_history))
-            finally:
-                self.lib.OCG_DestroyDuel(duel)
 
-        # Check for duplicate board state using BoardSignature
+        # Bitset form of the board (same hash as BoardSignature)
         board_hash = None
         if board_state:
-            sig = BoardSignature.from_board_state(board_state)
-            board_hash = sig.zobrist_hash()
+            board_hash = BoardBits.from_board_state(board_state).zobrist_hash()
+        terminal = self._add_terminal(action_history, board_state, board_hash, reason)
+        if board_state and self._subtrees:
+            # Best board below the IDLE state being searched (duplicates count too)
+            self._note_subtree(self._board_value(board_state, board_hash), result=terminal)
+
+    def _add_terminal(self, action_history: ActionHistory, board_state, board_hash: Optional[HashValue],
+                      reason: str) -> TerminalState:
+        """Group a terminal by board and record it, unless dedupe_boards skips it.
 
+        Returns:
+            The TerminalState, recorded or not.
+        """
+        # Create state hash from action sequence (raw fields: descriptions
+        # would render every card name while the search runs)
+        action_str = "|".join(
+            f"{a.action_type}:{a.card_code}:{a.response_bytes.hex()}" for a in action_history
+        )
+        state_hash = hashlib.md5(action_str.encode()).hexdigest()[:16]
+
+        terminal = TerminalState(
+            action_sequence=action_history,
+            board_state=board_state,
+            depth=len(action_history),
+            state_hash=state_hash,
+            termination_reason=reason,
+            board_hash=board_hash,  # Add board hash for reference
+        )
+
+        # Check for duplicate board state
+        if board_state:
             # Group by board signature
             if board_hash not in self.terminal_boards:
                 self.terminal_boards[board_hash] = []
@@ -581,18 +1055,9 @@ class EnumerationEngine(MessageHandlerMixin):
                     self.duplicate_boards_skipped += 1
                     if self.verbose:
                         logger.debug(f"SKIPPED duplicate board at depth {len(action_history)}")
-                    return  # Skip recording this duplicate
+                    return terminal  # Skip recording this duplicate
                 self.seen_board_sigs.add(board_hash)
 
-        terminal = TerminalState(
-            action_sequence=action_history,
-            board_state=board_state,
-            depth=len(action_history),
-            state_hash=state_hash,
-            termination_reason=reason,
-            board_hash=board_hash,  # Add board hash for reference
-        )
-
         self.terminals.append(terminal)
 
         if self.verbose:
@@ -601,18 +1066,133 @@ class EnumerationEngine(MessageHandlerMixin):
             gy = [c.name for c in board_state.player0.graveyard]
             print(f"  TERMINAL [{reason}] depth={len(action_history)}: "
                   f"Field={monsters}, GY={gy}")
+        return terminal
+
+    def _use_cached_result(self, action_history: ActionHistory, result: CachedResult):
+        """Report what an earlier run found below a state the persistent cache pruned.
+
+        Its best board is recorded as a "CACHED" terminal reached by this
+        run's path to the state, and folded into the state being searched.
+        """
+        if result.board_state and action_history is not None:
+            self._add_terminal(ActionHistory.of(action_history), BoardState.from_dict(result.board_state),
+                               result.board_hash, "CACHED")
+        self._note_subtree(result.value, not result.complete, result.offset)
+
+    def _persist_subtree(self, state_hash: int, remaining: Optional[int], best: float, result):
+        """Record a closed subtree in the persistent cache.
+
+        Skipped once the search has stopped early (max_paths or shutdown):
+        subtrees closing then were only partly explored.
+        """
+        if _shutdown_requested or self.paths_explored >= self.max_paths:
+            return
+        self.shared_table.record(state_hash, remaining, best, result)
+
+    def _board_value(self, board_state, board_hash: HashValue) -> float:
+        """Evaluation score of a terminal board (kept as best_terminal_value)."""
+        return get_evaluator().evaluate_board(board_state, board_hash)["score"]
 
 
 # =============================================================================
 # PARALLEL WORKER ENTRY POINT
 # =============================================================================
 
+def _create_worker_engine(max_depth: Optional[int] = None, max_paths: int = 0) -> EnumerationEngine:
+    """Load the engine and locked library and build a quiet EnumerationEngine.
+
+    max_depth None means MAX_DEPTH; max_paths 0 means the default
+    100000-path safety limit.
+    """
+    # Initialize card database if not already done
+    init_card_database()
+
+    # Load library and get deck lists
+    library = load_locked_library()
+    main_deck, extra_deck = get_deck_lists(library)
+
+    # Load the shared library
+    lib = load_library()
+    set_lib(lib)
+
+    # Create engine with library deck
+    return EnumerationEngine(
+        lib=lib,
+        main_deck=main_deck,
+        extra_deck=extra_deck,
+        verbose=False,
+        dedupe_boards=True,
+        dedupe_intermediate=True,
+        max_depth=max_depth,
+        max_paths=max_paths if max_paths > 0 else 100000,
+    )
+
+
+def _terminal_score(terminal: TerminalState) -> float:
+    """Board evaluation score for a terminal (0.0 if it cannot be scored)."""
+    if not terminal.board_state:
+        return 0.0
+    try:
+        # Monsters only (BoardState has direct accessors)
+        bits = BoardBits(monsters=get_card_index().mask(terminal.board_state.get_monster_codes()))
+        return evaluate_board_bits(bits).get("score", 0.0)
+    except Exception:
+        return 0.0
+
+
+def _hand_result(
+    engine: Optional[EnumerationEngine],
+    terminals: List[TerminalState],
+    include_traces: bool,
+) -> Dict[str, Any]:
+    """Summarize a finished engine run as a worker result dict."""
+    terminal_hashes = [t.board_hash for t in terminals if t.board_hash is not None]
+    scores = [_terminal_score(t) for t in terminals]
+
+    result = {
+        "terminal_hashes": terminal_hashes,
+        "best_score": max(scores, default=0.0),
+        "paths_explored": engine.paths_explored if engine else 0,
+        "max_depth_reached": engine.max_depth_seen if engine else 0,
+        "intermediate_states_pruned": engine.intermediate_states_pruned if engine else 0,
+        "shared_states_pruned": engine.shared_states_pruned if engine else 0,
+        "replay_stats": engine.replay_stats() if engine else {},
+    }
+
+    # Include full action traces if requested (for pattern mining)
+    if include_traces and terminals:
+        action_traces = []
+        for terminal, score in zip(terminals, scores):
+            trace = {
+                "actions": [a.to_dict() for a in terminal.action_sequence],
+                "depth": terminal.depth,
+                "termination_reason": terminal.termination_reason,
+                "board_hash": terminal.board_hash,
+            }
+            # Include board state if available
+            if terminal.board_state:
+                if hasattr(terminal.board_state, 'to_dict'):
+                    trace["board_state"] = terminal.board_state.to_dict()
+                else:
+                    trace["board_state"] = terminal.board_state
+            else:
+                trace["board_state"] = None
+            trace["score"] = score
+            action_traces.append(trace)
+        result["action_traces"] = action_traces
+
+    return result
+
+
 def enumerate_from_hand(
     hand: Tuple[int, ...],
     deck: List[int] = None,
     max_depth: int = 25,
     max_paths: int = 0,
     include_traces: bool = False,
+    prefix: Optional[List[Action]] = None,
+    time_budget: Optional[float] = None,
+    shared_table=None,
 ) -> Dict[str, Any]:
     """Enumerate all combos from a specific starting hand.
 
@@ -625,6 +1205,14 @@ def enumerate_from_hand(
         max_depth: Maximum search depth.
         max_paths: Maximum paths to explore (0 = unlimited).
         include_traces: If True, include full action traces for pattern mining.
+        prefix: Optional frontier prefix from expand_frontier; only the
+            subtree below it is enumerated.
+        time_budget: Optional budget in seconds; subtrees not reached in
+            time are returned in "frontier" instead of being explored.
+        shared_table: Optional SharedTranspositionTable shared with other
+            hands and workers. States already explored elsewhere are pruned,
+            so terminals below them are credited to the hand that got there
+            first.
 
     Returns:
         Dict with:
@@ -632,131 +1220,80 @@ def enumerate_from_hand(
             - best_score: Highest board evaluation score
             - paths_explored: Number of paths explored
             - max_depth_reached: Deepest point in search tree
+            - intermediate_states_pruned: Transposition table hits
+            - shared_states_pruned: Of those, hits in shared_table
+            - replay_stats: Replay cost counters (see EnumerationEngine.replay_stats)
+            - frontier: Prefixes donated when the time budget ran out
             - action_traces: (if include_traces=True) List of terminal traces with
               full action sequences, board states, scores, and termination reasons
     """
-    global MAX_DEPTH, MAX_PATHS
-
-    # Override global limits with function parameters
-    original_max_depth = MAX_DEPTH
-    original_max_paths = MAX_PATHS
-    MAX_DEPTH = max_depth
-    MAX_PATHS = max_paths if max_paths > 0 else 100000
-
-    terminal_hashes: List[str] = []
-    best_score = 0.0
-    paths_explored = 0
-    max_depth_reached = 0
+    engine = None
     terminals: List[TerminalState] = []  # Preserve for action trace export
 
     try:
-        # Initialize card database if not already done
-        init_card_database()
-
-        # Load library and get deck lists
-        library = load_locked_library()
-        main_deck, extra_deck = get_deck_lists(library)
-
-        # Load the shared library
-        lib = load_library()
-        set_lib(lib)
-
-        # Create engine with library deck
-        engine = EnumerationEngine(
-            lib=lib,
-            main_deck=main_deck,
-            extra_deck=extra_deck,
-            verbose=False,
-            dedupe_boards=True,
-            dedupe_intermediate=True,
-        )
-
+        engine = _create_worker_engine(max_depth, max_paths)
+        engine.shared_table = shared_table
         # Run enumeration from specific hand
-        terminals = engine.enumerate_from_hand(list(hand))
+        terminals = engine.enumerate_from_hand(list(hand), prefix=prefix, time_budget=time_budget)
+    except Exception as e:
+        logger.warning(f"Enumeration error for hand {hand}: {e}")
 
-        # Extract results
-        paths_explored = engine.paths_explored
-        max_depth_reached = engine.max_depth_seen
+    result = _hand_result(engine, terminals, include_traces)
+    result["frontier"] = engine.frontier if engine else []
+    return result
 
-        # Collect terminal hashes and find best score
-        for terminal in terminals:
-            if terminal.board_hash is not None:
-                terminal_hashes.append(terminal.board_hash)
 
-            # Evaluate board quality if we have board state
-            if terminal.board_state:
-                try:
-                    # Build signature for evaluation (BoardState has direct accessors)
-                    monsters = frozenset(terminal.board_state.get_monster_codes())
-                    sig = BoardSignature(
-                        monsters=monsters,
-                        spells=frozenset(),
-                        graveyard=frozenset(),
-                        hand=frozenset(),
-                        banished=frozenset(),
-                        extra_deck=frozenset(),
-                        equips=frozenset(),
-                    )
-                    eval_result = evaluate_board_quality(sig)
-                    score = eval_result.get("score", 0.0)
-                    if score > best_score:
-                        best_score = score
-                except Exception:
-                    pass
+def expand_frontier(
+    hand: Tuple[int, ...],
+    deck: List[int] = None,
+    max_depth: int = 25,
+    max_paths: int = 0,
+    include_traces: bool = False,
+    split_depth: Optional[int] = None,
+    min_units: int = 1,
+) -> Dict[str, Any]:
+    """Split one hand's search tree into independent prefix work units.
 
-    except Exception as e:
-        logger.warning(f"Enumeration error for hand {hand}: {e}")
+    Worker entry point for intra-hand parallelism. With a fixed split_depth
+    the tree is cut at that depth. Otherwise the cut is deepened one action
+    at a time (up to MAX_SPLIT_DEPTH) until the frontier holds at least
+    min_units prefixes. If expansion fails, the frontier is a single empty
+    prefix (the whole tree as one unit).
 
-    finally:
-        # Restore global limits
-        MAX_DEPTH = original_max_depth
-        MAX_PATHS = original_max_paths
+    Args:
+        hand, deck, max_depth, max_paths, include_traces: As for
+            enumerate_from_hand.
+        split_depth: Fixed frontier depth (None = adaptive).
+        min_units: Target number of prefixes for the adaptive split.
 
-    result = {
-        "terminal_hashes": terminal_hashes,
-        "best_score": best_score,
-        "paths_explored": paths_explored,
-        "max_depth_reached": max_depth_reached,
-    }
+    Returns:
+        The enumerate_from_hand result dict for the part of the tree above
+        the cut (terminals shallower than the frontier), plus:
+            - frontier: List of action-history prefixes to enumerate
+            - split_depth: Depth the tree was cut at
+    """
+    engine = None
+    terminals: List[TerminalState] = []
+    frontier: List[List[Action]] = []
+    depth = split_depth or 1
+    deepest = split_depth or max(1, min(MAX_SPLIT_DEPTH, max_depth - 1))
 
-    # Include full action traces if requested (for pattern mining)
-    if include_traces and terminals:
-        action_traces = []
-        for terminal in terminals:
-            trace = {
-                "actions": [a.to_dict() for a in terminal.action_sequence],
-                "depth": terminal.depth,
-                "termination_reason": terminal.termination_reason,
-                "board_hash": terminal.board_hash,
-            }
-            # Include board state if available
-            if terminal.board_state:
-                if hasattr(terminal.board_state, 'to_dict'):
-                    trace["board_state"] = terminal.board_state.to_dict()
-                else:
-                    trace["board_state"] = terminal.board_state
-                # Calculate score for this terminal
-                try:
-                    monsters = frozenset(terminal.board_state.get_monster_codes())
-                    sig = BoardSignature(
-                        monsters=monsters,
-                        spells=frozenset(),
-                        graveyard=frozenset(),
-                        hand=frozenset(),
-                        banished=frozenset(),
-                        extra_deck=frozenset(),
-                        equips=frozenset(),
-                    )
-                    eval_result = evaluate_board_quality(sig)
-                    trace["score"] = eval_result.get("score", 0.0)
-                except Exception:
-                    trace["score"] = 0.0
-            else:
-                trace["board_state"] = None
-                trace["score"] = 0.0
-            action_traces.append(trace)
-        result["action_traces"] = action_traces
+    try:
+        engine = _create_worker_engine(max_depth, max_paths)
+        while True:
+            frontier = list(engine.expand_frontier(list(hand), depth))
+            terminals = engine.terminals
+            if len(frontier) >= min_units or depth >= deepest or not frontier:
+                break
+            depth += 1
+    except Exception as e:
+        logger.warning(f"Frontier expansion error for hand {hand}: {e}")
+        # Fall back to a single unit covering the whole tree
+        engine, terminals, frontier = None, [], [[]]
 
+    result = _hand_result(engine, terminals, include_traces)
+    result["frontier"] = frontier
+    result["split_depth"] = depth
     return result
 
 
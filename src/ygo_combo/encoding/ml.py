@@ -633,7 +633,7 @@ class StateEncoder:
             "spells": list(board_sig.spells),
             "graveyard": list(board_sig.graveyard),
             "banished": list(board_sig.banished),
-            "extra_deck_used": list(board_sig.extra_deck_used),
+            "extra_deck_used": list(board_sig.extra_deck),
         }
 
         # Build cards list from all zones
@@ -66,7 +66,7 @@ from .bindings import (
 
 from .interface import (
     init_card_database, load_library as load_library_interface,
-    preload_utility_scripts,
+    preload_card_data, preload_utility_scripts,
     py_card_reader, py_card_reader_done, py_script_reader, py_log_handler,
     get_card_name, set_lib,
 )
@@ -83,16 +83,32 @@ from .paths import (
 
 from .board_capture import (
     parse_query_response,
+    scan_query_codes,
+    capture_board_signature,
     compute_board_signature,
     compute_idle_state_hash,
     capture_board_state,
 )
 
+from .board_tracker import BoardTracker
+
+from .board_bits import BoardBits, CardIndex, get_card_index, dedupe_terminals
+
+from .evaluator import (
+    BoardEvaluator, compile_evaluation_config, get_evaluator, evaluate_board_bits,
+)
+
+from .script_store import (
+    DirectoryScriptStore, PackedScriptStore,
+    get_script_store, set_script_store, pack_scripts,
+)
+
 from .duel_factory import (
     ENGRAVER,
     HOLACTIE,
     load_locked_library,
     get_deck_lists,
+    DuelFactory,
     create_duel,
 )
 
@@ -109,7 +125,7 @@ __all__ = [
     # Query flags
     'QUERY_CODE', 'QUERY_POSITION', 'QUERY_ATTACK', 'QUERY_DEFENSE', 'QUERY_END',
     # Interface
-    'init_card_database', 'preload_utility_scripts',
+    'init_card_database', 'preload_card_data', 'preload_utility_scripts',
     'py_card_reader', 'py_card_reader_done', 'py_script_reader', 'py_log_handler',
     'get_card_name', 'set_lib',
     # State
@@ -118,9 +134,18 @@ __all__ = [
     # Paths
     'get_scripts_path', 'get_library_path', 'CDB_PATH', 'LOCKED_LIBRARY_PATH',
     # Board capture
-    'parse_query_response', 'compute_board_signature',
-    'compute_idle_state_hash', 'capture_board_state',
+    'parse_query_response', 'scan_query_codes', 'capture_board_signature',
+    'compute_board_signature', 'compute_idle_state_hash', 'capture_board_state',
+    # Incremental board hash
+    'BoardTracker',
+    # Bitset boards
+    'BoardBits', 'CardIndex', 'get_card_index', 'dedupe_terminals',
+    # Compiled evaluation
+    'BoardEvaluator', 'compile_evaluation_config', 'get_evaluator', 'evaluate_board_bits',
+    # Script store
+    'DirectoryScriptStore', 'PackedScriptStore',
+    'get_script_store', 'set_script_store', 'pack_scripts',
     # Duel factory
     'ENGRAVER', 'HOLACTIE',
-    'load_locked_library', 'get_deck_lists', 'create_duel',
+    'load_locked_library', 'get_deck_lists', 'DuelFactory', 'create_duel',
 ]
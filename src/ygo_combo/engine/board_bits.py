@@ -0,0 +1,253 @@
+"""
+Bitset board representation.
+
+BoardSignature keeps its zones as frozensets of passcodes. BoardBits maps
+every card to a bit position of a CardIndex and stores each zone as a
+Python int, so equality and hashing compare a handful of ints, zone sizes
+are int.bit_count(), and scoring against the evaluation config is a mask
+AND plus a popcount (BoardEvaluator.evaluate_bits). Convert back with
+to_signature() at the edges (serialization, display).
+
+The default index (get_card_index) numbers the locked library's passcodes
+in sorted order, so their bit positions agree between processes. Cards
+outside the library (tokens, synthetic test codes) get the next free bit
+the first time they are seen; those positions are process-local, which is
+why persisted and cross-worker identities stay Zobrist hashes
+(BoardBits.zobrist_hash() equals BoardSignature.zobrist_hash()).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .bindings import (
+        LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE, LOCATION_REMOVED,
+    )
+    from .board_types import BoardState
+    from .state import BoardSignature
+    from ..utils.hashing import ZobristHasher, get_hasher
+except ImportError:
+    from engine.bindings import (
+        LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE, LOCATION_REMOVED,
+    )
+    from engine.board_types import BoardState
+    from engine.state import BoardSignature
+    from utils.hashing import ZobristHasher, get_hasher
+
+
+# BoardBits field -> location it is hashed under (see ZobristHasher.hash_board)
+ZONE_LOCATIONS = (
+    ("monsters", LOCATION_MZONE),
+    ("spells", LOCATION_SZONE),
+    ("graveyard", LOCATION_GRAVE),
+    ("hand", LOCATION_HAND),
+    ("banished", LOCATION_REMOVED),
+)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Positions of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# =============================================================================
+# CARD INDEX
+# =============================================================================
+
+class CardIndex:
+    """Passcode <-> bit position mapping shared by a set of BoardBits.
+
+    Attributes:
+        codes: Passcode of each bit position.
+        bits: Bit position of each passcode.
+    """
+
+    def __init__(self, codes: Iterable[int] = ()):
+        self.codes: List[int] = []
+        self.bits: Dict[int, int] = {}
+        for code in sorted(set(codes)):
+            self.bit(code)
+        self._masks: Dict[FrozenSet[int], int] = {}  # cached_mask results
+        self._hasher: Optional[ZobristHasher] = None
+        self._zone_keys: Dict[int, List[int]] = {}  # location -> Zobrist key per bit
+
+    @classmethod
+    def from_library(cls, library: Optional[dict] = None) -> "CardIndex":
+        """Index of the locked library's passcodes (sorted).
+
+        Raises:
+            FileNotFoundError: If library is None and the locked library
+                file is missing.
+        """
+        if library is None:
+            from .duel_factory import load_locked_library
+            library = load_locked_library()
+        return cls(int(code) for code in library.get("cards", {}))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def bit(self, code: int) -> int:
+        """Bit position of code, assigning the next free one if unseen."""
+        bit = self.bits.get(code)
+        if bit is None:
+            bit = self.bits[code] = len(self.codes)
+            self.codes.append(code)
+        return bit
+
+    def mask(self, codes: Iterable[int]) -> int:
+        """Bitset of a collection of passcodes."""
+        mask = 0
+        bits = self.bits
+        for code in codes:
+            bit = bits.get(code)
+            mask |= 1 << (self.bit(code) if bit is None else bit)
+        return mask
+
+    def decode(self, mask: int) -> List[int]:
+        """Passcodes of a bitset, in bit order."""
+        codes = self.codes
+        return [codes[bit] for bit in iter_bits(mask)]
+
+    def cached_mask(self, codes: FrozenSet[int]) -> int:
+        """mask(codes), memoized per set (for fixed config card sets)."""
+        mask = self._masks.get(codes)
+        if mask is None:
+            mask = self._masks[codes] = self.mask(codes)
+        return mask
+
+    def zobrist_keys(self, location: int) -> List[int]:
+        """Zobrist key of every indexed card in a signature zone, by bit."""
+        hasher = get_hasher()
+        if hasher is not self._hasher:
+            self._hasher = hasher
+            self._zone_keys.clear()
+        keys = self._zone_keys.setdefault(location, [])
+        if len(keys) < len(self.codes):
+            keys.extend(hasher.board_card_key(code, location) for code in self.codes[len(keys):])
+        return keys
+
+
+_default_index: Optional[CardIndex] = None
+
+
+def get_card_index() -> CardIndex:
+    """Get or create the default index (locked library, else empty)."""
+    global _default_index
+    if _default_index is None:
+        try:
+            _default_index = CardIndex.from_library()
+        except FileNotFoundError:
+            _default_index = CardIndex()
+    return _default_index
+
+
+# =============================================================================
+# BOARD BITS
+# =============================================================================
+
+@dataclass(frozen=True)
+class BoardBits:
+    """BoardSignature with each zone as a bitset over a CardIndex.
+
+    Extra deck is not kept (it is excluded from board hashes and scoring).
+    Bitsets are only comparable when built with the same index.
+    """
+    monsters: int = 0
+    spells: int = 0
+    graveyard: int = 0
+    hand: int = 0
+    banished: int = 0
+    equips: FrozenSet[Tuple[int, int]] = frozenset()  # (equipped_passcode, target_passcode)
+
+    @classmethod
+    def from_signature(cls, sig: BoardSignature, index: Optional[CardIndex] = None) -> "BoardBits":
+        index = index or get_card_index()
+        return cls(
+            monsters=index.mask(sig.monsters),
+            spells=index.mask(sig.spells),
+            graveyard=index.mask(sig.graveyard),
+            hand=index.mask(sig.hand),
+            banished=index.mask(sig.banished),
+            equips=sig.equips,
+        )
+
+    @classmethod
+    def from_board_state(cls, board_state: Union[dict, BoardState],
+                         index: Optional[CardIndex] = None) -> "BoardBits":
+        """Same board as BoardSignature.from_board_state, without the sets."""
+        if not isinstance(board_state, BoardState):
+            return cls.from_signature(BoardSignature.from_board_state(board_state), index)
+        index = index or get_card_index()
+        p0 = board_state.player0
+
+        def zone_mask(zone) -> int:
+            return index.mask(c.code for c in zone if c.code)
+
+        return cls(
+            monsters=zone_mask(p0.monsters),
+            spells=zone_mask(p0.spells),
+            graveyard=zone_mask(p0.graveyard),
+            hand=zone_mask(p0.hand),
+            banished=zone_mask(p0.banished),
+        )
+
+    def to_signature(self, index: Optional[CardIndex] = None) -> BoardSignature:
+        index = index or get_card_index()
+        return BoardSignature(
+            monsters=frozenset(index.decode(self.monsters)),
+            spells=frozenset(index.decode(self.spells)),
+            graveyard=frozenset(index.decode(self.graveyard)),
+            hand=frozenset(index.decode(self.hand)),
+            banished=frozenset(index.decode(self.banished)),
+            extra_deck=frozenset(),
+            equips=self.equips,
+        )
+
+    def zobrist_hash(self, index: Optional[CardIndex] = None) -> int:
+        """Equals to_signature(index).zobrist_hash()."""
+        index = index or get_card_index()
+        h = 0
+        for field, location in ZONE_LOCATIONS:
+            keys = index.zobrist_keys(location)
+            for bit in iter_bits(getattr(self, field)):
+                h ^= keys[bit]
+        return h ^ get_hasher().hash_equips(self.equips)
+
+    def monster_count(self) -> int:
+        return self.monsters.bit_count()
+
+    def total_cards_on_field(self) -> int:
+        return self.monsters.bit_count() + self.spells.bit_count()
+
+
+# =============================================================================
+# BULK OPERATIONS
+# =============================================================================
+
+def dedupe_terminals(terminals: list, index: Optional[CardIndex] = None) -> list:
+    """First terminal per distinct end board (terminals without a board are kept)."""
+    index = index or get_card_index()
+    seen = set()
+    unique = []
+    for terminal in terminals:
+        if terminal.board_state:
+            bits = BoardBits.from_board_state(terminal.board_state, index)
+            if bits in seen:
+                continue
+            seen.add(bits)
+        unique.append(terminal)
+    return unique
+
+
+__all__ = [
+    'BoardBits',
+    'CardIndex',
+    'ZONE_LOCATIONS',
+    'dedupe_terminals',
+    'get_card_index',
+    'iter_bits',
+]
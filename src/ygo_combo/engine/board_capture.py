@@ -8,7 +8,7 @@ computing board signatures for deduplication, and parsing query responses.
 import io
 import logging
 import struct
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 # Support both relative imports (package) and absolute imports (sys.path)
 try:
@@ -16,9 +16,10 @@ try:
         ffi,
         LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE,
         LOCATION_GRAVE, LOCATION_REMOVED, LOCATION_EXTRA,
-        QUERY_CODE, QUERY_POSITION, QUERY_ATTACK, QUERY_DEFENSE, QUERY_END,
+        QUERY_CODE, QUERY_POSITION, QUERY_EQUIP_CARD, QUERY_ATTACK, QUERY_DEFENSE, QUERY_END,
     )
     from .interface import get_card_name
+    from ..types import CardText
     from .state import BoardSignature, IntermediateState
     from .board_types import BoardState
     from ..enumeration.parsers import read_u32, read_i32
@@ -27,15 +28,29 @@ except ImportError:
         ffi,
         LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE,
         LOCATION_GRAVE, LOCATION_REMOVED, LOCATION_EXTRA,
-        QUERY_CODE, QUERY_POSITION, QUERY_ATTACK, QUERY_DEFENSE, QUERY_END,
+        QUERY_CODE, QUERY_POSITION, QUERY_EQUIP_CARD, QUERY_ATTACK, QUERY_DEFENSE, QUERY_END,
     )
     from engine.interface import get_card_name
+    from src.ygo_combo.types import CardText
     from engine.state import BoardSignature, IntermediateState
     from engine.board_types import BoardState
     from enumeration.parsers import read_u32, read_i32
 
 logger = logging.getLogger(__name__)
 
+# Player-0 zones that feed the BoardSignature hash (the extra deck does not)
+SIGNATURE_ZONES = (
+    ("hand", LOCATION_HAND),
+    ("monsters", LOCATION_MZONE),
+    ("spells", LOCATION_SZONE),
+    ("graveyard", LOCATION_GRAVE),
+    ("banished", LOCATION_REMOVED),
+)
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_LOC_INFO = struct.Struct("<BBII")      # controller, location, sequence, position
+
 
 def parse_query_response(data: bytes) -> List[Optional[Dict[str, Any]]]:
     """Parse OCG_DuelQueryLocation response to extract card codes.
@@ -111,6 +126,129 @@ def parse_query_response(data: bytes) -> List[Optional[Dict[str, Any]]]:
     return cards
 
 
+def scan_query_codes(buffer) -> Tuple[List[int], List[Tuple[int, int, int, int]]]:
+    """Read codes and equip targets from a QUERY_CODE | QUERY_EQUIP_CARD response.
+
+    Same block format as parse_query_response, read in place from a
+    memoryview; fields other than code and equip target are skipped.
+
+    Args:
+        buffer: Raw OCG_DuelQueryLocation response (any buffer)
+
+    Returns:
+        (codes, equips): codes has one entry per slot (0 for an empty slot),
+        equips has (slot, target_controller, target_location, target_sequence)
+        for every card that is equipped to something.
+    """
+    view = memoryview(buffer)
+    size = len(view)
+    codes: List[int] = []
+    equips: List[Tuple[int, int, int, int]] = []
+    pos = 4     # Skip total size
+    while pos + 2 <= size:
+        if _U16.unpack_from(view, pos)[0] == 0:
+            codes.append(0)     # Empty slot
+            pos += 2
+            continue
+
+        code = 0
+        target = None
+        while pos + 2 <= size:
+            (block_size,) = _U16.unpack_from(view, pos)
+            if block_size < 4 or pos + 2 + block_size > size:
+                pos = size
+                break
+            (flag,) = _U32.unpack_from(view, pos + 2)
+            if flag == QUERY_CODE:
+                (code,) = _U32.unpack_from(view, pos + 6)
+            elif flag == QUERY_EQUIP_CARD and block_size >= 4 + _LOC_INFO.size:
+                target = _LOC_INFO.unpack_from(view, pos + 6)[:3]
+            pos += 2 + block_size
+            if flag == QUERY_END:
+                break
+
+        if code and target is not None and target[1]:
+            equips.append((len(codes),) + target)
+        codes.append(code)
+
+    return codes, equips
+
+
+def query_signature_zones(lib, duel) -> Tuple[Dict[int, List[int]], List[Tuple[int, int, int, int]]]:
+    """Query the player-0 SIGNATURE_ZONES with QUERY_CODE | QUERY_EQUIP_CARD.
+
+    Args:
+        lib: CFFI library handle
+        duel: Duel handle from OCG_CreateDuel
+
+    Returns:
+        (zones, equips): zones maps each location to its per-slot codes
+        (see scan_query_codes), equips lists the spell/trap zone's equip
+        cards as (slot, target_controller, target_location, target_sequence).
+    """
+    query_info = ffi.new("OCG_QueryInfo*")
+    query_info.flags = QUERY_CODE | QUERY_EQUIP_CARD
+    query_info.con = 0
+    query_info.seq = 0
+    query_info.overlay_seq = 0
+    length = ffi.new("uint32_t*")
+
+    zones: Dict[int, List[int]] = {}
+    equipped: List[Tuple[int, int, int, int]] = []
+    for _, location in SIGNATURE_ZONES:
+        query_info.loc = location
+        buf = lib.OCG_DuelQueryLocation(duel, length, query_info)
+        if length[0] == 0:
+            zones[location] = []
+            continue
+        codes, equips = scan_query_codes(ffi.buffer(buf, length[0]))
+        zones[location] = codes
+        if location == LOCATION_SZONE:
+            equipped = equips
+    return zones, equipped
+
+
+def signature_from_zones(zones: Dict[int, List[int]],
+                         equipped: List[Tuple[int, int, int, int]]) -> BoardSignature:
+    """BoardSignature from query_signature_zones output."""
+    monsters = zones.get(LOCATION_MZONE, [])
+    spells = zones.get(LOCATION_SZONE, [])
+    return BoardSignature(
+        monsters=frozenset(c for c in monsters if c),
+        spells=frozenset(c for c in spells if c),
+        graveyard=frozenset(c for c in zones.get(LOCATION_GRAVE, []) if c),
+        hand=frozenset(c for c in zones.get(LOCATION_HAND, []) if c),
+        banished=frozenset(c for c in zones.get(LOCATION_REMOVED, []) if c),
+        extra_deck=frozenset(),
+        equips=frozenset(
+            (spells[slot], monsters[seq])
+            for slot, con, loc, seq in equipped
+            if con == 0 and loc == LOCATION_MZONE and seq < len(monsters) and monsters[seq]
+        ),
+    )
+
+
+def capture_board_signature(lib, duel) -> BoardSignature:
+    """Capture the BoardSignature of the current duel position directly.
+
+    Fast path for intermediate-state hashing at MSG_IDLE: queries only
+    SIGNATURE_ZONES for player 0, with QUERY_CODE | QUERY_EQUIP_CARD, and
+    builds the signature from the response buffers without card dicts or
+    a BoardState. Use capture_board_state for terminals and debugging.
+
+    Unlike BoardSignature.from_board_state(capture_board_state(...)), the
+    extra deck is left empty (it is not hashed) and equips are filled in.
+
+    Args:
+        lib: CFFI library handle
+        duel: Duel handle from OCG_CreateDuel
+
+    Returns:
+        BoardSignature for player 0
+    """
+    return signature_from_zones(*query_signature_zones(lib, duel))
+
+
 def compute_board_signature(board_state: Union[Dict[str, Any], BoardState]) -> str:
     """Compute a unique signature for a board state.
 
@@ -221,10 +359,10 @@ def capture_board_state(lib, duel) -> BoardState:
                 for card in cards:
                     if card and "code" in card:
                         code = card["code"]
-                        name = get_card_name(code)
                         card_entry: Dict[str, Any] = {
                             "code": code,
-                            "name": name,
+                            # Looked up only if the name is read
+                            "name": CardText("{}", (code,), get_card_name),
                         }
                         if "attack" in card:
                             card_entry["atk"] = card["attack"]
@@ -238,6 +376,11 @@ def capture_board_state(lib, duel) -> BoardState:
 
 __all__ = [
     'parse_query_response',
+    'scan_query_codes',
+    'capture_board_signature',
+    'query_signature_zones',
+    'signature_from_zones',
+    'SIGNATURE_ZONES',
     'compute_board_signature',
     'compute_idle_state_hash',
     'capture_board_state',
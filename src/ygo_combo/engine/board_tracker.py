@@ -0,0 +1,179 @@
+"""
+Incremental board hash driven by the engine message stream.
+
+capture_board_signature costs one OCG_DuelQueryLocation per signature zone
+at every MSG_IDLE. BoardTracker instead follows the board-changing
+informational messages the enumeration otherwise skips (MSG_MOVE,
+MSG_DRAW, MSG_EQUIP, MSG_UNEQUIP, decoded with TRACKING_DECODERS) and
+keeps player 0's signature zones and their Zobrist hash up to date with
+one Zobrist key XOR per card entering or leaving a zone.
+
+The tracker is seeded from query_signature_zones (a fresh duel's starting
+hand is placed without messages) and can be re-synced the same way; its
+hash() equals signature().zobrist_hash(), i.e. the hash of the captured
+BoardSignature.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    from .bindings import (
+        LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE, LOCATION_REMOVED,
+        MSG_MOVE, MSG_DRAW, MSG_EQUIP, MSG_UNEQUIP,
+    )
+    from .state import BoardSignature
+    from ..utils.hashing import ZobristHasher, get_hasher
+except ImportError:
+    from engine.bindings import (
+        LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE, LOCATION_REMOVED,
+        MSG_MOVE, MSG_DRAW, MSG_EQUIP, MSG_UNEQUIP,
+    )
+    from engine.state import BoardSignature
+    from utils.hashing import ZobristHasher, get_hasher
+
+
+# Player-0 locations in BoardSignature; cards elsewhere are not tracked
+TRACKED_LOCATIONS = frozenset((
+    LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE, LOCATION_REMOVED,
+))
+
+# Zones whose sequence numbers are slots (needed to resolve equips)
+_SLOTTED = (LOCATION_MZONE, LOCATION_SZONE)
+
+
+class BoardTracker:
+    """Player-0 signature zones and their Zobrist hash, updated per message.
+
+    Attributes:
+        seeded: False until reset() has been called with a captured board.
+        nodes_since_check: IDLE nodes hashed since the last reset (used by
+            the engine to schedule cross-check captures).
+    """
+
+    def __init__(self, hasher: ZobristHasher = None):
+        self.hasher = hasher or get_hasher()
+        self.seeded = False
+        self.nodes_since_check = 0
+        self._counts: Dict[int, Counter] = {loc: Counter() for loc in TRACKED_LOCATIONS}
+        self._slots: Dict[int, Dict[int, int]] = {loc: {} for loc in _SLOTTED}
+        self._equips: Dict[int, int] = {}   # Equip card S/T slot -> target monster slot
+        self._card_hash = 0                 # Zone cards only; equips are added in hash()
+
+    def reset(self, zones: Dict[int, List[int]], equipped: Iterable[Tuple[int, int, int, int]]):
+        """Re-seed from query_signature_zones output."""
+        for counts in self._counts.values():
+            counts.clear()
+        for slots in self._slots.values():
+            slots.clear()
+        self._equips.clear()
+        self._card_hash = 0
+
+        for location, codes in zones.items():
+            for seq, code in enumerate(codes):
+                if code:
+                    self._add(location, seq, code)
+        for slot, con, loc, seq in equipped:
+            if con == 0 and loc == LOCATION_MZONE:
+                self._equips[slot] = seq
+
+        self.seeded = True
+        self.nodes_since_check = 0
+
+    # =========================================================================
+    # MESSAGE STREAM
+    # =========================================================================
+
+    def apply(self, messages):
+        """Fold one batch of decoded (msg_type, data) messages into the board."""
+        for msg_type, data in messages:
+            if msg_type == MSG_MOVE:
+                con, loc, seq = data["from"]
+                if con == 0 and loc in TRACKED_LOCATIONS:
+                    self._remove(loc, seq, data["code"])
+                con, loc, seq = data["to"]
+                if con == 0 and loc in TRACKED_LOCATIONS:
+                    self._add(loc, seq, data["code"])
+            elif msg_type == MSG_DRAW:
+                if data["player"] == 0:
+                    for code in data["codes"]:
+                        self._add(LOCATION_HAND, None, code)
+            elif msg_type == MSG_EQUIP:
+                con, loc, seq = data["card"]
+                if con == 0 and loc == LOCATION_SZONE:
+                    tcon, tloc, tseq = data["target"]
+                    if tcon == 0 and tloc == LOCATION_MZONE:
+                        self._equips[seq] = tseq
+                    else:
+                        self._equips.pop(seq, None)
+            elif msg_type == MSG_UNEQUIP:
+                con, loc, seq = data["card"]
+                if con == 0 and loc == LOCATION_SZONE:
+                    self._equips.pop(seq, None)
+
+    def _toggle(self, location: int, code: int):
+        """XOR a zone card in or out of the hash (set membership changed)."""
+        self._card_hash ^= self.hasher.board_card_key(code, location)
+
+    def _add(self, location: int, seq, code: int):
+        slots = self._slots.get(location)
+        if slots is not None:
+            old = slots.get(seq)
+            if old is not None:
+                self._remove(location, seq, old)
+            slots[seq] = code
+        counts = self._counts[location]
+        counts[code] += 1
+        if counts[code] == 1:
+            self._toggle(location, code)
+
+    def _remove(self, location: int, seq, code: int):
+        slots = self._slots.get(location)
+        if slots is not None:
+            # The slot knows the code the card had when it arrived
+            code = slots.pop(seq, code)
+            if location == LOCATION_SZONE:
+                self._equips.pop(seq, None)
+            else:
+                for slot in [s for s, target in self._equips.items() if target == seq]:
+                    del self._equips[slot]
+        counts = self._counts[location]
+        if counts[code] <= 0:
+            return
+        counts[code] -= 1
+        if counts[code] == 0:
+            del counts[code]
+            self._toggle(location, code)
+
+    # =========================================================================
+    # OUTPUT
+    # =========================================================================
+
+    def _equip_pairs(self) -> Set[Tuple[int, int]]:
+        spells = self._slots[LOCATION_SZONE]
+        monsters = self._slots[LOCATION_MZONE]
+        return {
+            (spells[slot], monsters[seq])
+            for slot, seq in self._equips.items()
+            if slot in spells and seq in monsters
+        }
+
+    def hash(self) -> int:
+        """Zobrist hash of signature() (see ZobristHasher.hash_board)."""
+        return self._card_hash ^ self.hasher.hash_equips(self._equip_pairs())
+
+    def signature(self) -> BoardSignature:
+        """Tracked board as a BoardSignature (extra deck empty)."""
+        counts = self._counts
+        return BoardSignature(
+            monsters=frozenset(counts[LOCATION_MZONE]),
+            spells=frozenset(counts[LOCATION_SZONE]),
+            graveyard=frozenset(counts[LOCATION_GRAVE]),
+            hand=frozenset(counts[LOCATION_HAND]),
+            banished=frozenset(counts[LOCATION_REMOVED]),
+            extra_deck=frozenset(),
+            equips=frozenset(self._equip_pairs()),
+        )
+
+
+__all__ = ['BoardTracker', 'TRACKED_LOCATIONS']
@@ -12,6 +12,11 @@ This module exists to prevent hallucination errors where incorrect field names
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    from ..types import card_text_property
+except ImportError:
+    from src.ygo_combo.types import card_text_property
+
 
 @dataclass(frozen=True)
 class CardInfo:
@@ -21,7 +26,7 @@ class CardInfo:
 
     Attributes:
         code: Card passcode (unique identifier)
-        name: Card name
+        name: Card name (a CardText is rendered on first read)
         atk: Attack value (None for spells/traps)
         def_: Defense value (None for spells/traps, named def_ because 'def' is reserved)
     """
@@ -56,6 +61,10 @@ class CardInfo:
         )
 
 
+# Board capture passes CardText names so they are only looked up on output
+CardInfo.name = card_text_property("_name", "Card name")
+
+
 @dataclass(frozen=True)
 class PlayerState:
     """Complete state for one player.
@@ -56,11 +56,11 @@ def preload_card_scripts(lib, duel, card_codes: List[int]) -> int:
         Number of scripts successfully loaded
     """
     try:
-        from .interface import get_scripts_path
+        from .script_store import get_script_store
     except ImportError:
-        from engine.interface import get_scripts_path
+        from engine.script_store import get_script_store
 
-    script_path = get_scripts_path()
+    store = get_script_store()
     loaded = 0
     seen = set()  # Avoid loading same script twice
 
@@ -69,12 +69,12 @@ def preload_card_scripts(lib, duel, card_codes: List[int]) -> int:
             continue
         seen.add(code)
 
-        script_file = script_path / "official" / f"c{code}.lua"
-        if script_file.exists():
+        script = store.read(f"official/c{code}.lua")
+        if script is not None:
             try:
-                content = script_file.read_bytes()
+                content, size = script
                 script_name = f"c{code}.lua".encode('utf-8')
-                result = lib.OCG_LoadScript(duel, content, len(content), script_name)
+                result = lib.OCG_LoadScript(duel, content, size, script_name)
                 if result == 1:
                     loaded += 1
             except Exception as e:
@@ -149,131 +149,191 @@ def get_deck_lists(library: Dict[str, Any]) -> Tuple[List[int], List[int]]:
     return main_deck, extra_deck
 
 
-def create_duel(lib, main_deck_cards: List[int], extra_deck_cards: List[int],
-                starting_hand: Optional[List[int]] = None):
-    """Create a fresh duel with the starting state.
+# Duel settings shared by every duel
+DUEL_SEED = (12345, 67890, 11111, 22222)   # Fixed seed for reproducibility
+DUEL_FLAGS = (5 << 16)                     # MR5
+HAND_SIZE = 5
+DECK_SIZE = 40                             # Main deck padded with Holactie
+
+# (team, duelist, code, con, loc, seq, pos) for OCG_NewCardInfo
+Placement = Tuple[int, int, int, int, int, int, int]
+
+
+def card_placements(main_deck_cards: List[int], extra_deck_cards: List[int],
+                    starting_hand: Optional[List[int]] = None) -> List[Placement]:
+    """Every card a fresh duel starts with, in OCG_DuelNewCard order.
 
     Args:
-        lib: CFFI library handle
         main_deck_cards: List of main deck passcodes
         extra_deck_cards: List of extra deck passcodes
         starting_hand: Optional list of 5 passcodes for starting hand.
                        If None, uses default [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
 
     Returns:
-        Duel handle for use with OCG_* functions
-
-    Raises:
-        RuntimeError: If duel creation fails
+        Placements for the hand, main deck, extra deck and opponent deck.
     """
-    # CRITICAL: Set the library reference for callbacks
-    # The py_script_reader callback uses a global _lib which must be set
-    set_lib(lib)
-
-    options = ffi.new("OCG_DuelOptions*")
-
-    # Fixed seed for reproducibility
-    options.seed[0] = 12345
-    options.seed[1] = 67890
-    options.seed[2] = 11111
-    options.seed[3] = 22222
-
-    options.flags = (5 << 16)  # MR5
-
-    # Player 0 (us)
-    options.team1.startingLP = 8000
-    options.team1.startingDrawCount = 0  # Hand set manually
-    options.team1.drawCountPerTurn = 0   # No draws during combo
-
-    # Player 1 (opponent - does nothing)
-    options.team2.startingLP = 8000
-    options.team2.startingDrawCount = 5
-    options.team2.drawCountPerTurn = 1
-
-    # Callbacks
-    options.cardReader = py_card_reader
-    options.scriptReader = py_script_reader
-    options.logHandler = py_log_handler
-    options.cardReaderDone = py_card_reader_done
-
-    duel_ptr = ffi.new("OCG_Duel*")
-    result = lib.OCG_CreateDuel(duel_ptr, options)
-
-    if result != 0:
-        raise RuntimeError(f"Failed to create duel: {result}")
-
-    duel = duel_ptr[0]
-    preload_utility_scripts(lib, duel)
-
-    # NOTE: Removed card script preloading - it doesn't work because
-    # OCG_LoadScript() called outside load_card_script() has no self_table context.
-    # The callback path should work if self_table is set when the callback runs.
-
     # === HAND: Use provided hand or default ===
     if starting_hand is not None:
         hand_cards = list(starting_hand)
         # Pad with HOLACTIE if less than 5 cards
-        while len(hand_cards) < 5:
+        while len(hand_cards) < HAND_SIZE:
             hand_cards.append(HOLACTIE)
         # Truncate if more than 5 cards
-        hand_cards = hand_cards[:5]
+        hand_cards = hand_cards[:HAND_SIZE]
     else:
         # Default: 1 Engraver + 4 Holactie (original behavior)
         hand_cards = [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
 
-    for i, code in enumerate(hand_cards):
-        card_info = ffi.new("OCG_NewCardInfo*")
-        card_info.team = 0
-        card_info.duelist = 0
-        card_info.code = code
-        card_info.con = 0
-        card_info.loc = LOCATION_HAND
-        card_info.seq = i
-        card_info.pos = POS_FACEUP_ATTACK
-        lib.OCG_DuelNewCard(duel, card_info)
+    placements = [
+        (0, 0, code, 0, LOCATION_HAND, i, POS_FACEUP_ATTACK)
+        for i, code in enumerate(hand_cards)
+    ]
 
     # === MAIN DECK ===
     # Include all main deck cards, pad to 40 with Holactie
     deck = list(main_deck_cards)
-    while len(deck) < 40:
+    while len(deck) < DECK_SIZE:
         deck.append(HOLACTIE)
-
-    for i, code in enumerate(deck):
-        card_info = ffi.new("OCG_NewCardInfo*")
-        card_info.team = 0
-        card_info.duelist = 0
-        card_info.code = code
-        card_info.con = 0
-        card_info.loc = LOCATION_DECK
-        card_info.seq = i
-        card_info.pos = POS_FACEDOWN_DEFENSE
-        lib.OCG_DuelNewCard(duel, card_info)
+    placements += [
+        (0, 0, code, 0, LOCATION_DECK, i, POS_FACEDOWN_DEFENSE)
+        for i, code in enumerate(deck)
+    ]
 
     # === EXTRA DECK ===
-    for i, code in enumerate(extra_deck_cards):
-        card_info = ffi.new("OCG_NewCardInfo*")
-        card_info.team = 0
-        card_info.duelist = 0
-        card_info.code = code
-        card_info.con = 0
-        card_info.loc = LOCATION_EXTRA
-        card_info.seq = i
-        card_info.pos = POS_FACEDOWN_DEFENSE
-        lib.OCG_DuelNewCard(duel, card_info)
+    placements += [
+        (0, 0, code, 0, LOCATION_EXTRA, i, POS_FACEDOWN_DEFENSE)
+        for i, code in enumerate(extra_deck_cards)
+    ]
 
     # === OPPONENT DECK (Holactie filler) ===
-    for i in range(40):
-        card_info = ffi.new("OCG_NewCardInfo*")
-        card_info.team = 1
-        card_info.duelist = 0
-        card_info.code = HOLACTIE
-        card_info.con = 1
-        card_info.loc = LOCATION_DECK
-        card_info.seq = i
-        card_info.pos = POS_FACEDOWN_DEFENSE
-        lib.OCG_DuelNewCard(duel, card_info)
+    placements += [
+        (1, 0, HOLACTIE, 1, LOCATION_DECK, i, POS_FACEDOWN_DEFENSE)
+        for i in range(DECK_SIZE)
+    ]
+    return placements
+
+
+class DuelFactory:
+    """Creates identical fresh duels for one (deck, starting hand) pair.
+
+    Everything create_duel() rebuilt per call is prepared once: the
+    OCG_DuelOptions struct, and one OCG_NewCardInfo array holding every
+    card placement (the engine copies both, so they are reused). new_duel()
+    is then just OCG_CreateDuel, the utility scripts, and one
+    OCG_DuelNewCard per card.
+
+    Usage:
+        factory = DuelFactory(lib, main_deck, extra_deck, starting_hand=hand)
+        duel = factory.new_duel()
+        ...
+        lib.OCG_DestroyDuel(duel)
+
+    Attributes:
+        starting_hand: The starting_hand argument (None = default hand)
+        placements: Card placements, as returned by card_placements()
+        duels_created: Number of new_duel() calls
+    """
+
+    def __init__(self, lib, main_deck_cards: List[int], extra_deck_cards: List[int],
+                 starting_hand: Optional[List[int]] = None):
+        """
+        Args:
+            lib: CFFI library handle
+            main_deck_cards: List of main deck passcodes
+            extra_deck_cards: List of extra deck passcodes
+            starting_hand: Optional starting hand (see card_placements())
+        """
+        self.lib = lib
+        self.starting_hand = list(starting_hand) if starting_hand is not None else None
+        self.placements = card_placements(main_deck_cards, extra_deck_cards, starting_hand)
+        self.duels_created = 0
+
+        self._options = ffi.new("OCG_DuelOptions*")
+        options = self._options
+        for i, seed in enumerate(DUEL_SEED):
+            options.seed[i] = seed
+        options.flags = DUEL_FLAGS
+
+        # Player 0 (us)
+        options.team1.startingLP = 8000
+        options.team1.startingDrawCount = 0  # Hand set manually
+        options.team1.drawCountPerTurn = 0   # No draws during combo
+
+        # Player 1 (opponent - does nothing)
+        options.team2.startingLP = 8000
+        options.team2.startingDrawCount = 5
+        options.team2.drawCountPerTurn = 1
+
+        # Callbacks
+        options.cardReader = py_card_reader
+        options.scriptReader = py_script_reader
+        options.logHandler = py_log_handler
+        options.cardReaderDone = py_card_reader_done
+
+        self._duel_ptr = ffi.new("OCG_Duel*")
+        self._cards = ffi.new("OCG_NewCardInfo[]", len(self.placements))
+        for info, (team, duelist, code, con, loc, seq, pos) in zip(self._cards, self.placements):
+            info.team = team
+            info.duelist = duelist
+            info.code = code
+            info.con = con
+            info.loc = loc
+            info.seq = seq
+            info.pos = pos
+        self._card_ptrs = [self._cards + i for i in range(len(self.placements))]
+
+    def new_duel(self):
+        """Create a fresh duel with the starting state.
+
+        Returns:
+            Duel handle for use with OCG_* functions
+
+        Raises:
+            RuntimeError: If duel creation fails
+        """
+        lib = self.lib
+        # CRITICAL: Set the library reference for callbacks
+        # The py_script_reader callback uses a global _lib which must be set
+        set_lib(lib)
+
+        result = lib.OCG_CreateDuel(self._duel_ptr, self._options)
+        if result != 0:
+            raise RuntimeError(f"Failed to create duel: {result}")
+
+        duel = self._duel_ptr[0]
+        self.duels_created += 1
+        preload_utility_scripts(lib, duel)
+
+        # NOTE: Card scripts are not preloaded - OCG_LoadScript() called outside
+        # load_card_script() has no self_table context. The callback path loads them.
+
+        new_card = lib.OCG_DuelNewCard
+        for info in self._card_ptrs:
+            new_card(duel, info)
+        return duel
+
+
+def create_duel(lib, main_deck_cards: List[int], extra_deck_cards: List[int],
+                starting_hand: Optional[List[int]] = None):
+    """Create a fresh duel with the starting state.
+
+    One-off convenience wrapper; code that creates many duels for the same
+    deck and hand should keep a DuelFactory instead.
+
+    Args:
+        lib: CFFI library handle
+        main_deck_cards: List of main deck passcodes
+        extra_deck_cards: List of extra deck passcodes
+        starting_hand: Optional list of 5 passcodes for starting hand.
+                       If None, uses default [ENGRAVER, HOLACTIE, HOLACTIE, HOLACTIE, HOLACTIE]
 
-    return duel
+    Returns:
+        Duel handle for use with OCG_* functions
+
+    Raises:
+        RuntimeError: If duel creation fails
+    """
+    return DuelFactory(lib, main_deck_cards, extra_deck_cards, starting_hand).new_duel()
 
 
 __all__ = [
@@ -281,5 +341,7 @@ __all__ = [
     'HOLACTIE',
     'load_locked_library',
     'get_deck_lists',
+    'card_placements',
+    'DuelFactory',
     'create_duel',
 ]
@@ -0,0 +1,333 @@
+"""
+Compiled board evaluation.
+
+compile_evaluation_config turns config/evaluation_config.json into a
+BoardEvaluator: per-code weight and flag tables for evaluate_board_quality
+scoring, masks for bitset boards, and a per-code class table for the
+endboard scorer. Scoring a board is then one pass over its monsters and
+graveyard with dict lookups, instead of rebuilding the config sets on
+every call.
+
+Ranking scores thousands of terminals per hand and many share an end
+board, so evaluate_board() also takes the board's Zobrist hash and keeps
+results in an LRU cache; on a hit the board is not even converted.
+
+get_evaluator() returns the process-wide evaluator compiled from the
+config file; evaluate_board_quality, evaluate_board_bits and
+evaluate_endboard all go through it.
+"""
+
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Callable, Dict, Optional, Tuple, Union
+
+try:
+    from .board_bits import BoardBits, CardIndex, get_card_index
+    from .board_types import BoardState
+    from .state import BoardSignature, _load_evaluation_config
+except ImportError:
+    from engine.board_bits import BoardBits, CardIndex, get_card_index
+    from engine.board_types import BoardState
+    from engine.state import BoardSignature, _load_evaluation_config
+
+
+DEFAULT_EVAL_CACHE_SIZE = 1 << 16   # Board results kept by evaluate_board()
+
+# Monster flags in BoardEvaluator.monster_flags
+_BOSS = 1
+_INTERACTION = 2
+
+# Endboard classes (evaluate_endboard), decided once per passcode
+ENDBOARD_CAESAR = 0      # "D/D/D Wave High King Caesar": 100
+ENDBOARD_DESIRAE = 1     # "...Desirae...": 100 if equipped (ATK > 2500), else 40
+ENDBOARD_SEQUENCE = 2    # "...Sequence...": 50
+ENDBOARD_FIENDSMITH = 3  # Other "...Fiendsmith...": 30
+ENDBOARD_OTHER = 4       # Any other monster: 10
+
+_ENDBOARD_MONSTER_POINTS = {
+    ENDBOARD_CAESAR: 100,
+    ENDBOARD_SEQUENCE: 50,
+    ENDBOARD_FIENDSMITH: 30,
+    ENDBOARD_OTHER: 10,
+}
+
+
+def endboard_class(name: str) -> int:
+    """Endboard class of a card name (the old substring rules, in order)."""
+    if name == "D/D/D Wave High King Caesar":
+        return ENDBOARD_CAESAR
+    if "Desirae" in name:
+        return ENDBOARD_DESIRAE
+    if "Sequence" in name:
+        return ENDBOARD_SEQUENCE
+    if "Fiendsmith" in name:
+        return ENDBOARD_FIENDSMITH
+    return ENDBOARD_OTHER
+
+
+class BoardEvaluator:
+    """Evaluation config compiled to per-code tables.
+
+    Attributes:
+        thresholds: (tier, minimum score) pairs, best tier first.
+        monster_weights: Passcode -> score for that card on the field
+            (monster_on_field plus boss / interaction weights).
+        monster_flags: Passcode -> boss / interaction bits.
+        gy_weights: Passcode -> score for that card in the graveyard.
+        endboard_cards: Passcode -> (ENDBOARD_* class, Fiendsmith, Holactie),
+            from card names.
+        hits, misses: evaluate_board() cache counters.
+    """
+
+    def __init__(self, config: dict, names: Optional[Dict[int, str]] = None,
+                 cache_size: int = DEFAULT_EVAL_CACHE_SIZE):
+        """
+        Args:
+            config: Parsed evaluation_config.json.
+            names: Passcode -> card name used to pre-classify endboard
+                cards (e.g. the locked library); other passcodes are
+                classified from their board name on first sight.
+            cache_size: evaluate_board() LRU capacity (0 disables it).
+        """
+        weights = config.get("score_weights", {})
+        thresholds = config.get("tier_thresholds", {"S": 100, "A": 70, "B": 40, "C": 20})
+        defaults = {"S": 100, "A": 70, "B": 40, "C": 20}
+        self.thresholds = tuple((tier, thresholds.get(tier, defaults[tier])) for tier in defaults)
+
+        self.boss_weight = weights.get("boss_monster", 50)
+        self.interaction_weight = weights.get("interaction_piece", 30)
+        self.equip_weight = weights.get("equipped_link", 20)
+        self.monster_weight = weights.get("monster_on_field", 5)
+        self.gy_weight = weights.get("fiendsmith_in_gy", 10)
+
+        self.boss_codes = frozenset(config.get("boss_monsters", []))
+        self.interaction_codes = frozenset(config.get("interaction_pieces", []))
+        self.gy_codes = frozenset(config.get("fiendsmith_gy_targets", []))
+
+        self.monster_flags: Dict[int, int] = {}
+        self.monster_weights: Dict[int, int] = {}
+        for code in self.boss_codes | self.interaction_codes:
+            flags = (_BOSS if code in self.boss_codes else 0) | \
+                    (_INTERACTION if code in self.interaction_codes else 0)
+            self.monster_flags[code] = flags
+            self.monster_weights[code] = (
+                self.monster_weight
+                + (self.boss_weight if flags & _BOSS else 0)
+                + (self.interaction_weight if flags & _INTERACTION else 0)
+            )
+        self.gy_weights: Dict[int, int] = {code: self.gy_weight for code in self.gy_codes}
+
+        # Passcode -> (ENDBOARD_* class, is Fiendsmith, is Holactie)
+        self.endboard_cards: Dict[int, Tuple[int, bool, bool]] = {
+            code: _endboard_entry(name) for code, name in (names or {}).items()
+        }
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # =========================================================================
+    # evaluate_board_quality
+    # =========================================================================
+
+    def _result(self, score, bosses, interaction, equips, monsters, gy) -> dict:
+        details = []
+        if bosses:
+            details.append(f"Boss monsters: {bosses}")
+        if interaction:
+            details.append(f"Interaction pieces: {interaction}")
+        if equips:
+            details.append(f"Equipped Links: {equips}")
+        if gy:
+            details.append(f"Fiendsmith pieces in GY: {gy}")
+
+        tier = "brick"
+        for name, minimum in self.thresholds:
+            if score >= minimum:
+                tier = name
+                break
+
+        return {
+            "tier": tier,
+            "score": score,
+            "monsters_on_field": monsters,
+            "has_boss": bool(bosses),
+            "has_interaction": bool(interaction),
+            "details": details,
+        }
+
+    def evaluate(self, sig: BoardSignature) -> dict:
+        """evaluate_board_quality: one pass over monsters and graveyard."""
+        weights, flags_of, base = self.monster_weights, self.monster_flags, self.monster_weight
+        score = 0
+        bosses = interaction = 0
+        for code in sig.monsters:
+            score += weights.get(code, base)
+            flags = flags_of.get(code)
+            if flags:
+                bosses += flags & _BOSS
+                interaction += flags >> 1
+        gy = 0
+        gy_weights = self.gy_weights
+        for code in sig.graveyard:
+            weight = gy_weights.get(code)
+            if weight is not None:
+                score += weight
+                gy += 1
+        score += self.equip_weight * len(sig.equips)
+        return self._result(score, bosses, interaction, len(sig.equips), len(sig.monsters), gy)
+
+    def evaluate_bits(self, bits: BoardBits, index: Optional[CardIndex] = None) -> dict:
+        """evaluate() on a bitset board: config sets as masks, popcounts."""
+        index = index or get_card_index()
+        bosses = (bits.monsters & index.cached_mask(self.boss_codes)).bit_count()
+        interaction = (bits.monsters & index.cached_mask(self.interaction_codes)).bit_count()
+        gy = (bits.graveyard & index.cached_mask(self.gy_codes)).bit_count()
+        monsters = bits.monsters.bit_count()
+        score = (self.boss_weight * bosses + self.interaction_weight * interaction
+                 + self.equip_weight * len(bits.equips) + self.monster_weight * monsters
+                 + self.gy_weight * gy)
+        return self._result(score, bosses, interaction, len(bits.equips), monsters, gy)
+
+    def evaluate_board(self, board: Union[BoardSignature, BoardBits, BoardState, dict],
+                       board_hash: Optional[int] = None) -> dict:
+        """
+        Evaluate any board form, cached by its Zobrist hash when given.
+
+        Args:
+            board: BoardSignature, BoardBits, BoardState or board dict.
+            board_hash: Zobrist hash of the board (e.g. TerminalState.board_hash).
+                Must be the hash of this board's signature; only then is
+                the result cached.
+
+        Returns:
+            evaluate_board_quality result (a fresh copy per call).
+        """
+        if board_hash is None or not self.cache_size:
+            return self._evaluate_any(board)
+        cached = self._cache.get(board_hash)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(board_hash)
+        else:
+            self.misses += 1
+            cached = self._cache[board_hash] = self._evaluate_any(board)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return {**cached, "details": list(cached["details"])}
+
+    def _evaluate_any(self, board) -> dict:
+        if isinstance(board, BoardSignature):
+            return self.evaluate(board)
+        if not isinstance(board, BoardBits):
+            board = BoardBits.from_board_state(board)
+        return self.evaluate_bits(board)
+
+    def cache_info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._cache), "capacity": self.cache_size}
+
+    # =========================================================================
+    # evaluate_endboard
+    # =========================================================================
+
+    def _endboard_card(self, code: int, card, name_of: Callable) -> Tuple[int, bool, bool]:
+        """(class, Fiendsmith, Holactie) of a card; names are read once per code."""
+        entry = self.endboard_cards.get(code) if code else None
+        if entry is None:
+            entry = _endboard_entry(name_of(card))
+            if code:
+                self.endboard_cards[code] = entry
+        return entry
+
+    def score_endboard(self, board_state: Union[dict, BoardState]) -> int:
+        """evaluate_endboard by passcode instead of by card name."""
+        if not board_state:
+            return 0
+
+        if isinstance(board_state, BoardState):
+            p0 = board_state.player0
+            monsters, graveyard, hand = p0.monsters, p0.graveyard, p0.hand
+            code_of, name_of, atk_of = attrgetter("code"), attrgetter("name"), attrgetter("atk")
+        else:
+            p0 = board_state.get("player0", {})
+            monsters, graveyard, hand = p0.get("monsters", []), p0.get("graveyard", []), p0.get("hand", [])
+            code_of = _get("code", None)
+            name_of = _get("name", "")
+            atk_of = _get("atk", 0)
+
+        card = self._endboard_card
+        score = 0
+        for c in monsters:
+            cls = card(code_of(c), c, name_of)[0]
+            if cls == ENDBOARD_DESIRAE:
+                score += 100 if (atk_of(c) or 0) > 2500 else 40
+            else:
+                score += _ENDBOARD_MONSTER_POINTS[cls]
+        for c in graveyard:
+            if card(code_of(c), c, name_of)[1]:
+                score += 10
+        for c in hand:
+            if not card(code_of(c), c, name_of)[2]:
+                score += 5
+        return score
+
+
+def _get(key: str, default):
+    """dict.get accessor (card dicts may omit fields)."""
+    return lambda d: d.get(key, default)
+
+
+def _endboard_entry(name: str) -> Tuple[int, bool, bool]:
+    return endboard_class(name), "Fiendsmith" in name, "Holactie" in name
+
+
+def compile_evaluation_config(config: Optional[dict] = None, library: Optional[dict] = None,
+                              cache_size: int = DEFAULT_EVAL_CACHE_SIZE) -> BoardEvaluator:
+    """
+    Compile the evaluation config (and locked library names) to a BoardEvaluator.
+
+    Args:
+        config: Parsed evaluation config (default: config/evaluation_config.json).
+        library: Locked library dict for endboard card names (default: the
+            locked library if present; otherwise codes are classified as
+            they are seen).
+        cache_size: evaluate_board() LRU capacity.
+    """
+    if config is None:
+        config = _load_evaluation_config()
+    if library is None:
+        try:
+            from .duel_factory import load_locked_library
+            library = load_locked_library()
+        except (ImportError, FileNotFoundError):
+            library = {}
+    names = {int(code): card.get("name", "") for code, card in library.get("cards", {}).items()}
+    return BoardEvaluator(config, names=names, cache_size=cache_size)
+
+
+_default_evaluator: Optional[BoardEvaluator] = None
+
+
+def get_evaluator() -> BoardEvaluator:
+    """Get or compile the process-wide evaluator."""
+    global _default_evaluator
+    if _default_evaluator is None:
+        _default_evaluator = compile_evaluation_config()
+    return _default_evaluator
+
+
+def evaluate_board_bits(bits: BoardBits, index: Optional[CardIndex] = None) -> dict:
+    """evaluate_board_quality on a bitset board (see BoardEvaluator.evaluate_bits)."""
+    return get_evaluator().evaluate_bits(bits, index)
+
+
+__all__ = [
+    'BoardEvaluator',
+    'DEFAULT_EVAL_CACHE_SIZE',
+    'compile_evaluation_config',
+    'endboard_class',
+    'evaluate_board_bits',
+    'get_evaluator',
+]
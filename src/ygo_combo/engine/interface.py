@@ -16,7 +16,7 @@ import logging
 import sqlite3
 import struct
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .bindings import (
     ffi, load_library,
@@ -30,6 +30,7 @@ from .bindings import (
     TYPE_LINK, TYPE_SYNCHRO, TYPE_XYZ, TYPE_FUSION,
 )
 from .paths import CDB_PATH, get_scripts_path, verify_scripts_path
+from .script_store import get_script_store
 
 
 # Re-export commonly used items from ocg_bindings for convenience
@@ -37,8 +38,9 @@ __all__ = [
     # From this module
     'EngineContext',  # Context manager for safe state management
     'init_card_database', 'close_card_database', 'get_card_name', 'location_name',
+    'preload_card_data', 'clear_card_data_cache', 'card_data_cache_size', 'get_card_data',
     'set_lib', 'get_lib',
-    'preload_utility_scripts', 'process_messages', 'parse_msg_idle',
+    'UTILITY_SCRIPTS', 'preload_utility_scripts', 'process_messages', 'parse_msg_idle',
     'read_u8', 'read_u16', 'read_u32', 'read_u64', 'read_i32', 'read_cardlist',
     'get_setcodes', 'get_setcode_array', 'clear_setcode_cache',
     'py_card_reader', 'py_card_reader_done', 'py_script_reader', 'py_log_handler',
@@ -58,6 +60,30 @@ _card_db: Optional[sqlite3.Connection] = None
 _lib = None  # Library reference for callbacks
 _setcode_cache: Dict[int, List[int]] = {}
 _setcode_arrays: Dict[Tuple[int, ...], Any] = {}
+_card_data: Dict[int, Any] = {}  # code -> prebuilt OCG_CardData* served by py_card_reader
+_card_names: Dict[int, str] = {}  # code -> name (preloaded, then memoized on lookup)
+
+_CARD_DATA_SIZE = ffi.sizeof("OCG_CardData")
+_CARD_DATA_COLUMNS = "id, alias, setcode, type, atk, def, level, race, attribute"
+
+# Utility scripts loaded before card scripts (order matters: dependency order)
+UTILITY_SCRIPTS = (
+    "constant.lua",
+    "utility.lua",
+    "archetype_setcode_constants.lua",
+    "proc_fusion.lua",
+    "proc_link.lua",
+    "proc_synchro.lua",
+    "proc_xyz.lua",
+    "proc_ritual.lua",
+    "proc_pendulum.lua",
+    "proc_normal.lua",
+    "proc_equip.lua",
+    "proc_gemini.lua",
+    "proc_spirit.lua",
+    "proc_union.lua",
+    "cards_specific_functions.lua",
+)
 
 
 def get_card_db() -> Optional[sqlite3.Connection]:
@@ -185,11 +211,14 @@ class EngineContext:
 # Card Database Functions
 # =============================================================================
 
-def init_card_database(cdb_path: Optional[Path] = None) -> bool:
+def init_card_database(cdb_path: Optional[Path] = None, preload: bool = True) -> bool:
     """Initialize the card database connection.
 
     Args:
         cdb_path: Optional path to cards.cdb. Defaults to CDB_PATH from paths module.
+        preload: If True, load every card row and name into the in-memory
+            tables so py_card_reader and get_card_name never query SQLite.
+            Pass False and call preload_card_data(codes) to cache only a deck.
 
     Returns:
         True if database loaded successfully, False otherwise.
@@ -200,37 +229,46 @@ def init_card_database(cdb_path: Optional[Path] = None) -> bool:
         cdb_path = CDB_PATH
 
     if cdb_path.exists():
+        close_card_database()
         _card_db = sqlite3.connect(str(cdb_path))
         _card_db.row_factory = sqlite3.Row
+        if preload:
+            preload_card_data()
         return True
     else:
         return False
 
 
 def close_card_database() -> None:
-    """Close the card database connection."""
+    """Close the card database connection and drop the card data cache."""
     global _card_db
+    _card_data.clear()
+    _card_names.clear()
     if _card_db is not None:
         _card_db.close()
         _card_db = None
 
 
 def get_card_name(code: int) -> str:
-    """Look up card name from database."""
-    global _card_db
+    """Look up card name (preloaded table, else database, memoized)."""
+    name = _card_names.get(code)
+    if name is not None:
+        return name
     if _card_db is None:
         return f"Card#{code}"
 
+    name = f"Card#{code}"
     try:
         cursor = _card_db.execute(
             "SELECT name FROM texts WHERE id = ?", (code,)
         )
         row = cursor.fetchone()
         if row:
-            return row[0]
+            name = row[0]
     except (sqlite3.Error, TypeError, KeyError):
-        pass
-    return f"Card#{code}"
+        return name
+    _card_names[code] = name
+    return name
 
 
 def location_name(loc: int) -> str:
@@ -293,12 +331,111 @@ def clear_setcode_cache() -> None:
     """Clear the setcode arrays cache.
 
     Call this between duels if memory is a concern, but only after
-    ensuring no duel is referencing the arrays.
+    ensuring no duel is referencing the arrays. The card data cache points
+    into these arrays, so it is cleared as well.
     """
     global _setcode_arrays
+    _card_data.clear()
     _setcode_arrays.clear()
 
 
+# =============================================================================
+# Card Data Cache
+# =============================================================================
+
+def _build_card_data(row) -> Any:
+    """Build the OCG_CardData the engine expects for a datas row.
+
+    Args:
+        row: Row with the _CARD_DATA_COLUMNS columns.
+
+    Returns:
+        Owned OCG_CardData* (setcodes point into a persistent array).
+    """
+    data = ffi.new("OCG_CardData*")
+    data.code = row["id"]
+    data.alias = row["alias"] or 0
+    data.type = row["type"] or 0
+
+    # Parse level field (contains level, lscale, rscale)
+    level_raw = row["level"] or 0
+    data.level = level_raw & 0xFF
+    data.lscale = (level_raw >> 24) & 0xFF
+    data.rscale = (level_raw >> 16) & 0xFF
+
+    data.attribute = row["attribute"] or 0
+    data.race = row["race"] or 0
+    data.attack = row["atk"] if row["atk"] is not None else 0
+    data.defense = row["def"] if row["def"] is not None else 0
+
+    # Handle Link monsters
+    if data.type & TYPE_LINK:
+        data.link_marker = data.defense
+        data.defense = 0
+
+    # Parse setcodes
+    setcode_raw = row["setcode"] or 0
+    if setcode_raw:
+        setcodes = get_setcodes(setcode_raw)
+        if setcodes:
+            data.setcodes = get_setcode_array(setcodes)
+    return data
+
+
+def preload_card_data(codes: Optional[Iterable[int]] = None) -> int:
+    """Load card rows and names into the in-memory tables.
+
+    Each row is converted once into a ready OCG_CardData, so the callback
+    only copies 64 bytes instead of running a SQL query per card, and
+    get_card_name() becomes a dict lookup.
+
+    Args:
+        codes: Passcodes to load (e.g. a deck list). None loads every
+            card in the database.
+
+    Returns:
+        Number of cards in the cache afterwards.
+    """
+    if _card_db is None:
+        return len(_card_data)
+
+    if codes is None:
+        where, params = "", []
+    else:
+        params = sorted({int(code) for code in codes} - _card_data.keys())
+        if not params:
+            return len(_card_data)
+        where = f" WHERE id IN ({','.join('?' * len(params))})"
+
+    for row in _card_db.execute(f"SELECT {_CARD_DATA_COLUMNS} FROM datas{where}", params):
+        _card_data[row["id"]] = _build_card_data(row)
+    try:
+        _card_names.update(_card_db.execute(f"SELECT id, name FROM texts{where}", params))
+    except sqlite3.Error as e:
+        logging.warning(f"Card names not preloaded: {e}")
+    logging.debug(f"Card data cache: {len(_card_data)} cards")
+    return len(_card_data)
+
+
+def clear_card_data_cache() -> None:
+    """Drop all cached card data and names (lookups fall back to SQLite)."""
+    _card_data.clear()
+    _card_names.clear()
+
+
+def get_card_data(code: int) -> Optional[Any]:
+    """Preloaded OCG_CardData for code (type, level, atk, ...), or None.
+
+    The struct is shared with py_card_reader: read it, do not modify it.
+    """
+    return _card_data.get(code)
+
+
+def card_data_cache_size() -> int:
+    """Number of cards currently served from memory."""
+    return len(_card_data)
+
+
 # =============================================================================
 # CFFI Callbacks
 # =============================================================================
@@ -306,9 +443,12 @@ def clear_setcode_cache() -> None:
 @ffi.callback("void(void*, uint32_t, OCG_CardData*)")
 def py_card_reader(payload, code, data):
     """Callback to provide card data to the engine."""
-    global _card_db
+    cached = _card_data.get(code)
+    if cached is not None:
+        ffi.memmove(data, cached, _CARD_DATA_SIZE)
+        return
 
-    # Set defaults
+    # Not preloaded: set defaults, then query the database
     data.code = code
     data.alias = 0
     data.setcodes = ffi.NULL
@@ -327,37 +467,11 @@ def py_card_reader(payload, code, data):
 
     try:
         cursor = _card_db.execute(
-            "SELECT * FROM datas WHERE id = ?", (code,)
+            f"SELECT {_CARD_DATA_COLUMNS} FROM datas WHERE id = ?", (code,)
         )
         row = cursor.fetchone()
         if row:
-            data.code = row["id"]
-            data.alias = row["alias"] or 0
-            data.type = row["type"] or 0
-
-            # Parse level field (contains level, lscale, rscale)
-            level_raw = row["level"] or 0
-            data.level = level_raw & 0xFF
-            data.lscale = (level_raw >> 24) & 0xFF
-            data.rscale = (level_raw >> 16) & 0xFF
-
-            data.attribute = row["attribute"] or 0
-            data.race = row["race"] or 0
-            data.attack = row["atk"] if row["atk"] is not None else 0
-            data.defense = row["def"] if row["def"] is not None else 0
-
-            # Handle Link monsters
-            if data.type & TYPE_LINK:
-                data.link_marker = data.defense
-                data.defense = 0
-
-            # Parse setcodes
-            setcode_raw = row["setcode"] or 0
-            if setcode_raw:
-                setcodes = get_setcodes(setcode_raw)
-                if setcodes:
-                    arr = get_setcode_array(setcodes)
-                    data.setcodes = arr
+            ffi.memmove(data, _build_card_data(row), _CARD_DATA_SIZE)
     except Exception as e:
         logging.warning(f"Card reader error for code {code}: {e}")
 
@@ -383,42 +497,20 @@ def py_script_reader(payload, duel, name):
     if _lib is None:
         return 0
 
-    script_path = get_scripts_path()
-
-    # Search paths in order
-    search_paths = [
-        script_path / "official" / script_name,
-        script_path / "official" / f"{script_name}.lua",
-        script_path / script_name,
-        script_path / f"{script_name}.lua",
-    ]
-
-    # Also try utility scripts
-    if not script_name.startswith("c"):
-        search_paths.extend([
-            script_path / script_name,
-            script_path / f"{script_name}.lua",
-        ])
-
-    for script_file in search_paths:
-        if script_file.exists():
-            try:
-                script_content = script_file.read_bytes()
-                result = _lib.OCG_LoadScript(
-                    duel,
-                    script_content,
-                    len(script_content),
-                    name
-                )
-                if result != 1:
-                    logging.debug(f"[SCRIPT_READER] OCG_LoadScript returned {result} for {script_name}")
-                return 1 if result == 1 else 0
-            except Exception as e:
-                logging.warning(f"Script load error for {script_name}: {e}")
-                return 0
+    script = get_script_store().find(script_name)
+    if script is None:
+        # Script not found - this is normal for many cards
+        return 0
 
-    # Script not found - this is normal for many cards
-    return 0
+    try:
+        script_content, size = script
+        result = _lib.OCG_LoadScript(duel, script_content, size, name)
+        if result != 1:
+            logging.debug(f"[SCRIPT_READER] OCG_LoadScript returned {result} for {script_name}")
+        return 1 if result == 1 else 0
+    except Exception as e:
+        logging.warning(f"Script load error for {script_name}: {e}")
+        return 0
 
 
 @ffi.callback("void(void*, const char*, int)")
@@ -627,41 +719,20 @@ def preload_utility_scripts(lib, duel) -> bool:
     Returns:
         True if at least one utility script was loaded.
     """
-    # Verify scripts directory exists before attempting to load
-    verify_scripts_path()
-    script_path = get_scripts_path()
-
-    # Order matters - load in dependency order
-    utility_scripts = [
-        "constant.lua",
-        "utility.lua",
-        "archetype_setcode_constants.lua",
-        "proc_fusion.lua",
-        "proc_link.lua",
-        "proc_synchro.lua",
-        "proc_xyz.lua",
-        "proc_ritual.lua",
-        "proc_pendulum.lua",
-        "proc_normal.lua",
-        "proc_equip.lua",
-        "proc_gemini.lua",
-        "proc_spirit.lua",
-        "proc_union.lua",
-        "cards_specific_functions.lua",
-    ]
+    # Indexed once per process (verifies the scripts directory on first use)
+    store = get_script_store()
 
     loaded = 0
-    for script_name in utility_scripts:
-        full_path = script_path / script_name
-        if full_path.exists():
+    for script_name in UTILITY_SCRIPTS:
+        script = store.read(script_name)
+        if script is not None:
             try:
-                script_content = full_path.read_bytes()
-                script_name_bytes = script_name.encode("utf-8")
+                script_content, size = script
                 result = lib.OCG_LoadScript(
                     duel,
                     script_content,
-                    len(script_content),
-                    script_name_bytes
+                    size,
+                    script_name.encode("utf-8")
                 )
                 if result == 1:
                     loaded += 1
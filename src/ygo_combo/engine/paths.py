@@ -8,6 +8,7 @@ across the codebase.
 
 import os
 from pathlib import Path
+from typing import Optional
 
 # =============================================================================
 # PROJECT ROOT
@@ -116,6 +117,16 @@ def verify_scripts_path() -> bool:
     return True
 
 
+def get_scripts_pack_path() -> Optional[Path]:
+    """Get the prebuilt script pack from YGOPRO_SCRIPTS_PACK, if set.
+
+    When set, the engine loads scripts from this pack (see
+    engine/script_store.py) instead of YGOPRO_SCRIPTS_PATH.
+    """
+    env_path = os.environ.get("YGOPRO_SCRIPTS_PACK")
+    return Path(env_path) if env_path else None
+
+
 # =============================================================================
 # OUTPUT PATHS
 # =============================================================================
@@ -0,0 +1,326 @@
+"""
+In-memory Lua script store for the engine's script loaders.
+
+Every duel runs preload_utility_scripts() and py_script_reader() asks for
+each card script, and both used to stat and read files under
+YGOPRO_SCRIPTS_PATH each time. Since replay creates a duel per node, that
+is hundreds of syscalls per explored path. A ScriptStore indexes the
+scripts once per process and serves both loaders from memory:
+
+    DirectoryScriptStore   Lists the script directory once; each file is
+                           read on first use and kept in memory.
+    PackedScriptStore      One pre-built pack file, memory-mapped and served
+                           without copying. Workers on the same host share
+                           its pages through the OS page cache.
+
+get_script_store() uses the pack named by YGOPRO_SCRIPTS_PACK when set,
+otherwise the YGOPRO_SCRIPTS_PATH directory.
+
+Pack format (little-endian):
+    header:  MAGIC (8 bytes), entry count (uint32)
+    index:   per entry: name length (uint16), offset (uint64),
+             size (uint32), name (UTF-8, e.g. "official/c123.lua")
+    data:    script bytes at their offsets
+
+Build a pack ahead of time for worker fleets:
+    python scripts/pack_scripts.py -o build/scripts.pack
+    export YGOPRO_SCRIPTS_PACK=build/scripts.pack
+
+The pack is a snapshot: rebuild it after updating the scripts.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .bindings import ffi
+from .paths import get_scripts_pack_path, get_scripts_path, verify_scripts_path
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PACK_MAGIC = b"YGOSPK01"
+_PACK_HEADER = struct.Struct("<8sI")    # MAGIC, entry count
+_PACK_ENTRY = struct.Struct("<HQI")     # name length, offset, size
+
+# Subdirectory holding card scripts (c<passcode>.lua)
+CARD_SCRIPT_DIR = "official"
+
+# (buffer, size) accepted by OCG_LoadScript
+ScriptData = Tuple[Any, int]
+
+
+def _candidates(script_name: str) -> List[str]:
+    """Store paths py_script_reader tries for a requested script, in order."""
+    return [
+        f"{CARD_SCRIPT_DIR}/{script_name}",
+        f"{CARD_SCRIPT_DIR}/{script_name}.lua",
+        script_name,
+        f"{script_name}.lua",
+    ]
+
+
+class ScriptStore(ABC):
+    """Base class: name resolution shared by both backends.
+
+    Subclasses fill self._index (store path -> backend handle) and
+    implement _load().
+    """
+
+    def __init__(self):
+        self._index: Dict[str, Any] = {}
+        self._resolved: Dict[str, Optional[str]] = {}
+        self.loads = 0
+
+    def find(self, script_name: str) -> Optional[ScriptData]:
+        """Script the engine asked for by name, searched like the old reader.
+
+        Args:
+            script_name: Name passed to py_script_reader (e.g. "c123.lua").
+
+        Returns:
+            (buffer, size) for OCG_LoadScript, or None if not found.
+        """
+        try:
+            path = self._resolved[script_name]
+        except KeyError:
+            path = next((p for p in _candidates(script_name) if p in self._index), None)
+            self._resolved[script_name] = path
+        return None if path is None else self.read(path)
+
+    def read(self, path: str) -> Optional[ScriptData]:
+        """Script at an exact store path (e.g. "utility.lua"), or None."""
+        if path not in self._index:
+            return None
+        self.loads += 1
+        return self._load(path)
+
+    @abstractmethod
+    def _load(self, path: str) -> ScriptData:
+        """Backend read of an indexed store path."""
+
+    def names(self) -> List[str]:
+        """All store paths, sorted."""
+        return sorted(self._index)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class DirectoryScriptStore(ScriptStore):
+    """Scripts under a directory, listed once and cached after first read.
+
+    Only the top level (utility scripts) and CARD_SCRIPT_DIR are indexed,
+    which are the only places the engine loads scripts from.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        super().__init__()
+        self.root = Path(root)
+        for subdir in ("", CARD_SCRIPT_DIR):
+            prefix = f"{subdir}/" if subdir else ""
+            try:
+                entries = list(os.scandir(self.root / subdir))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_file():
+                    self._index[prefix + entry.name] = None     # Not read yet
+
+    def _load(self, path: str) -> ScriptData:
+        data = self._index[path]
+        if data is None:
+            data = (self.root / path).read_bytes()
+            self._index[path] = data
+        return data, len(data)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Bytes of script source held in memory."""
+        return sum(len(data) for data in self._index.values() if data is not None)
+
+
+class PackedScriptStore(ScriptStore):
+    """Scripts served from a memory-mapped pack built by pack_scripts()."""
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__()
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _PACK_HEADER.size:
+                raise ValueError(f"{self.path} is not a script pack")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mm = self._mmap
+        magic, count = _PACK_HEADER.unpack_from(mm, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{self.path} is not a script pack")
+
+        pos = _PACK_HEADER.size
+        for _ in range(count):
+            name_len, offset, size = _PACK_ENTRY.unpack_from(mm, pos)
+            pos += _PACK_ENTRY.size
+            name = mm[pos:pos + name_len].decode("utf-8")
+            pos += name_len
+            if offset + size > len(mm):
+                raise ValueError(f"{self.path} is truncated ({name})")
+            self._index[name] = (offset, size)
+
+        # One char[] over the whole mapping; scripts are pointers into it
+        self._buffer = ffi.from_buffer(mm)
+
+    def _load(self, path: str) -> ScriptData:
+        offset, size = self._index[path]
+        return self._buffer + offset, size
+
+    def read_bytes(self, path: str) -> bytes:
+        """Copy of a script's source (for inspection and tests)."""
+        offset, size = self._index[path]
+        return self._mmap[offset:offset + size]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the mapped pack."""
+        return len(self._mmap)
+
+
+def pack_scripts(scripts_path: Union[str, Path], output: Union[str, Path],
+                 card_codes: Optional[Iterable[int]] = None) -> int:
+    """Write the scripts under scripts_path into a pack file.
+
+    Args:
+        scripts_path: ygopro-core script directory.
+        output: Pack file to write (replaced atomically).
+        card_codes: Only pack these card scripts (plus every top-level
+            utility script). None packs all of CARD_SCRIPT_DIR.
+
+    Returns:
+        Number of scripts packed.
+    """
+    source = DirectoryScriptStore(scripts_path)
+    names = source.names()
+    if card_codes is not None:
+        wanted = {f"{CARD_SCRIPT_DIR}/c{code}.lua" for code in card_codes}
+        names = [n for n in names if not n.startswith(f"{CARD_SCRIPT_DIR}/") or n in wanted]
+
+    encoded = [name.encode("utf-8") for name in names]
+    offset = _PACK_HEADER.size + sum(_PACK_ENTRY.size + len(e) for e in encoded)
+    index = [_PACK_HEADER.pack(PACK_MAGIC, len(names))]
+    blobs = []
+    for name, name_bytes in zip(names, encoded):
+        data, size = source.read(name)
+        index.append(_PACK_ENTRY.pack(len(name_bytes), offset, size) + name_bytes)
+        blobs.append(data)
+        offset += size
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.writelines(index)
+        f.writelines(blobs)
+    os.replace(tmp, output)
+    return len(names)
+
+
+def library_card_codes() -> Set[int]:
+    """Passcodes a duel over the locked library can load scripts for.
+
+    The library's cards, plus every card card_placements() adds on its own
+    (the default hand and the HOLACTIE filler from config/constants.json).
+    """
+    from .duel_factory import card_placements
+    from .paths import LOCKED_LIBRARY_PATH
+
+    library = json.loads(LOCKED_LIBRARY_PATH.read_text())
+    codes = {int(code) for code in library.get("cards", {})}
+    codes.update(code for _, _, code, *_ in card_placements([], []))
+    return codes
+
+
+# =============================================================================
+# PROCESS-WIDE STORE
+# =============================================================================
+
+_store: Optional[ScriptStore] = None
+
+
+def get_script_store() -> ScriptStore:
+    """The process's script store, created on first use.
+
+    Uses the pack at YGOPRO_SCRIPTS_PACK if set, otherwise indexes the
+    YGOPRO_SCRIPTS_PATH directory (verified once).
+
+    Raises:
+        EnvironmentError, FileNotFoundError: If no scripts are configured.
+    """
+    global _store
+    if _store is None:
+        pack_path = get_scripts_pack_path()
+        if pack_path is not None:
+            _store = PackedScriptStore(pack_path)
+            logger.info(f"Script store: {len(_store)} scripts from pack {pack_path}")
+        else:
+            verify_scripts_path()
+            _store = DirectoryScriptStore(get_scripts_path())
+            logger.info(f"Script store: {len(_store)} scripts under {_store.root}")
+    return _store
+
+
+def set_script_store(store: Optional[ScriptStore]) -> None:
+    """Replace the process's script store (None: rebuild on next use)."""
+    global _store
+    _store = store
+
+
+def main():
+    """Command-line interface: build a script pack."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Pack ygopro-core Lua scripts into one memory-mappable file"
+    )
+    parser.add_argument("--output", "-o", type=str, required=True, help="Pack file to write")
+    parser.add_argument("--scripts", type=str, default=None,
+                        help="Script directory (default: YGOPRO_SCRIPTS_PATH)")
+    parser.add_argument("--library-only", action="store_true",
+                        help="Only pack card scripts for the locked library")
+    args = parser.parse_args()
+
+    scripts_path = Path(args.scripts) if args.scripts else get_scripts_path()
+    card_codes = None
+    if args.library_only:
+        card_codes = library_card_codes()
+
+    count = pack_scripts(scripts_path, args.output, card_codes)
+    size = Path(args.output).stat().st_size
+    print(f"Packed {count} scripts ({size / 2**20:.1f} MB) into {args.output}")
+    print(f"Use with: export YGOPRO_SCRIPTS_PACK={Path(args.output).resolve()}")
+    return 0
+
+
+__all__ = [
+    'PACK_MAGIC',
+    'ScriptStore',
+    'DirectoryScriptStore',
+    'PackedScriptStore',
+    'pack_scripts',
+    'library_card_codes',
+    'get_script_store',
+    'set_script_store',
+]
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -105,9 +105,22 @@ class BoardSignature:
     @classmethod
     def from_board_state(cls, board_state: Union[dict, BoardState]) -> "BoardSignature":
         """Convert existing board_state (dict or BoardState) to BoardSignature."""
-        # Convert BoardState to dict if needed
         if isinstance(board_state, BoardState):
-            board_state = board_state.to_dict()
+            # Codes only: skips to_dict(), which would render every card name
+            p0 = board_state.player0
+
+            def zone_codes(zone) -> FrozenSet[int]:
+                return frozenset(c.code for c in zone if c.code)
+
+            return cls(
+                monsters=zone_codes(p0.monsters),
+                spells=zone_codes(p0.spells),
+                graveyard=zone_codes(p0.graveyard),
+                hand=zone_codes(p0.hand),
+                banished=zone_codes(p0.banished),
+                extra_deck=zone_codes(p0.extra),
+                equips=frozenset(),     # BoardState carries no equip targets
+            )
         p0 = board_state.get("player0", {})
 
         def extract_codes(cards: list) -> FrozenSet[int]:
@@ -293,7 +306,17 @@ class IntermediateState:
             idle_data: Parsed MSG_IDLE data
             board_state: Current board state dict
         """
-        board = BoardSignature.from_board_state(board_state)
+        return cls.from_signature(BoardSignature.from_board_state(board_state), idle_data)
+
+    @classmethod
+    def from_signature(cls, board: BoardSignature, idle_data: dict) -> "IntermediateState":
+        """
+        Build intermediate state from an already captured board signature.
+
+        Args:
+            board: Board signature (e.g. from capture_board_signature)
+            idle_data: Parsed MSG_IDLE data
+        """
         actions = cls._extract_action_specs(idle_data)
         return cls(board=board, legal_actions=frozenset(a.spec for a in actions))
 
@@ -436,68 +459,12 @@ def evaluate_board_quality(sig: BoardSignature) -> dict:
     - score: numeric score
     - details: explanation
     """
-    config = _load_evaluation_config()
-    weights = config.get("score_weights", {})
-    thresholds = config.get("tier_thresholds", {"S": 100, "A": 70, "B": 40, "C": 20})
-
-    score = 0
-    details = []
-
-    boss_monsters = get_boss_monsters()
-    interaction_pieces = get_interaction_pieces()
-    fiendsmith_gy = get_fiendsmith_gy_targets()
-
-    # Check for boss monsters
-    bosses_on_field = sig.monsters & boss_monsters
-    if bosses_on_field:
-        boss_weight = weights.get("boss_monster", 50)
-        score += boss_weight * len(bosses_on_field)
-        details.append(f"Boss monsters: {len(bosses_on_field)}")
-
-    # Check for interaction pieces
-    interaction = sig.monsters & interaction_pieces
-    if interaction:
-        interaction_weight = weights.get("interaction_piece", 30)
-        score += interaction_weight * len(interaction)
-        details.append(f"Interaction pieces: {len(interaction)}")
-
-    # Check for equipped Link monsters (Fiendsmith combo indicator)
-    if sig.equips:
-        equip_weight = weights.get("equipped_link", 20)
-        score += equip_weight * len(sig.equips)
-        details.append(f"Equipped Links: {len(sig.equips)}")
-
-    # Monster count
-    monster_weight = weights.get("monster_on_field", 5)
-    score += monster_weight * len(sig.monsters)
-
-    # Graveyard setup (Fiendsmith likes GY)
-    fiendsmith_in_gy = len([c for c in sig.graveyard if c in fiendsmith_gy])
-    if fiendsmith_in_gy:
-        gy_weight = weights.get("fiendsmith_in_gy", 10)
-        score += gy_weight * fiendsmith_in_gy
-        details.append(f"Fiendsmith pieces in GY: {fiendsmith_in_gy}")
-
-    # Determine tier
-    if score >= thresholds.get("S", 100):
-        tier = "S"
-    elif score >= thresholds.get("A", 70):
-        tier = "A"
-    elif score >= thresholds.get("B", 40):
-        tier = "B"
-    elif score >= thresholds.get("C", 20):
-        tier = "C"
-    else:
-        tier = "brick"
-
-    return {
-        "tier": tier,
-        "score": score,
-        "monsters_on_field": len(sig.monsters),
-        "has_boss": bool(bosses_on_field),
-        "has_interaction": bool(interaction),
-        "details": details,
-    }
+    # Compiled once per process (see engine/evaluator.py)
+    try:
+        from .evaluator import get_evaluator
+    except ImportError:
+        from engine.evaluator import get_evaluator
+    return get_evaluator().evaluate(sig)
 
 
 # =============================================================================
@@ -508,8 +475,7 @@ def evaluate_endboard(board_state: Union[dict, BoardState]) -> int:
     """
     Simple additive scoring for terminal board evaluation.
 
-    Works with both dict and BoardState (converts BoardState to dict internally).
-    Higher score = better endboard.
+    Works with both dict and BoardState. Higher score = better endboard.
 
     Scoring:
     - D/D/D Wave High King Caesar: 100 pts
@@ -521,47 +487,13 @@ def evaluate_endboard(board_state: Union[dict, BoardState]) -> int:
     - Fiendsmith in GY: 10 pts each
     - Card in hand: 5 pts each
     """
-    if not board_state:
-        return 0
-
-    # Convert BoardState to dict if needed
-    if isinstance(board_state, BoardState):
-        board_state = board_state.to_dict()
-
-    score = 0
-    p0 = board_state.get("player0", {})
-
-    # Field monsters
-    for card in p0.get("monsters", []):
-        name = card.get("name", "")
-        if name == "D/D/D Wave High King Caesar":
-            score += 100
-        elif "Desirae" in name:
-            # Check for equip (ATK > base or equip cards present)
-            atk = card.get("atk", 0)
-            if atk > 2500:  # Has ATK boost from equip
-                score += 100
-            else:
-                score += 40
-        elif "Sequence" in name:
-            score += 50
-        elif "Fiendsmith" in name:
-            score += 30
-        else:
-            score += 10
-
-    # GY Fiendsmith count
-    for card in p0.get("graveyard", []):
-        if "Fiendsmith" in card.get("name", ""):
-            score += 10
-
-    # Hand resources
-    hand = p0.get("hand", [])
-    # Don't count dead cards (Holactie)
-    live_hand = [c for c in hand if "Holactie" not in c.get("name", "")]
-    score += len(live_hand) * 5
-
-    return score
+    # Scored by passcode; each card's name is classified once per process
+    # (see BoardEvaluator.score_endboard)
+    try:
+        from .evaluator import get_evaluator
+    except ImportError:
+        from engine.evaluator import get_evaluator
+    return get_evaluator().score_endboard(board_state)
 
 
 # =============================================================================
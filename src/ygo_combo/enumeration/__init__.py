@@ -20,6 +20,8 @@ from .parsers import (
     find_valid_tribute_combinations,
 )
 
+from .decoder import DECODERS, decode_messages
+
 from .sum_utils import (
     find_valid_sum_combinations,
     find_sum_combinations_flexible,
@@ -69,6 +71,8 @@ __all__ = [
     'parse_select_place', 'parse_select_unselect_card',
     'parse_select_option', 'parse_select_tribute', 'parse_select_sum',
     'find_valid_tribute_combinations',
+    # Zero-copy batch decoder
+    'DECODERS', 'decode_messages',
     # Response constants
     'IDLE_RESPONSE_SUMMON', 'IDLE_RESPONSE_SPSUMMON', 'IDLE_RESPONSE_REPOSITION',
     'IDLE_RESPONSE_MSET', 'IDLE_RESPONSE_SSET', 'IDLE_RESPONSE_ACTIVATE',
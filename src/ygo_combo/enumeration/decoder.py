@@ -0,0 +1,414 @@
+"""
+Zero-copy, table-driven decoder for OCG_DuelGetMessage buffers.
+
+The byte-stream parsers in parsers.py copy the engine buffer, wrap it in
+BytesIO and read every field through a helper call. During enumeration
+_get_messages runs after every OCG_DuelProcess, and most of what comes
+back is informational (hints, moves, chain notifications) that the search
+only skips. decode_messages() instead:
+
+    - works on a memoryview of the buffer (no copy of the whole batch)
+    - reads fields with precompiled struct.Struct layouts
+    - dispatches through DECODERS (message type -> decoder); only the
+      decision messages listed there are turned into dicts, everything
+      else is returned as (msg_type, None) without touching its body
+    - attaches SELECT_SUM debug payloads (raw hex) only when debug=True
+
+The dicts are the ones the parse_* functions produce, so the handlers
+work with either. TRACKING_DECODERS additionally decodes the board-changing
+informational messages (moves, draws, equips) for engine/board_tracker.py;
+pass it as decoders= only when a tracker consumes them.
+"""
+
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from ..engine.bindings import (
+        MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_CHAIN, MSG_SELECT_EFFECTYN,
+        MSG_SELECT_OPTION, MSG_SELECT_PLACE, MSG_SELECT_SUM, MSG_SELECT_TRIBUTE,
+        MSG_SELECT_UNSELECT_CARD, MSG_MOVE, MSG_DRAW, MSG_EQUIP, MSG_UNEQUIP,
+    )
+    from .parsers import verified_level
+except ImportError:
+    from engine.bindings import (
+        MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_CHAIN, MSG_SELECT_EFFECTYN,
+        MSG_SELECT_OPTION, MSG_SELECT_PLACE, MSG_SELECT_SUM, MSG_SELECT_TRIBUTE,
+        MSG_SELECT_UNSELECT_CARD, MSG_MOVE, MSG_DRAW, MSG_EQUIP, MSG_UNEQUIP,
+    )
+    from enumeration.parsers import verified_level
+
+
+# (msg_type, parsed dict or None)
+Message = Tuple[int, Optional[Dict[str, Any]]]
+
+# =============================================================================
+# LAYOUTS (little-endian, no padding)
+# =============================================================================
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_MSG_HEADER = struct.Struct("<IB")            # length (incl. type), type
+
+_IDLE_CARD = struct.Struct("<IBBI")           # code, con, loc, seq
+_IDLE_REPOS = struct.Struct("<IBBB")          # code, con, loc, seq (u8)
+_IDLE_ACTIVATE = struct.Struct("<IBBIQB")     # code, con, loc, seq, desc, mode
+_IDLE_FLAGS = struct.Struct("<BBB")           # to_bp, to_ep, can_shuffle
+
+_SELECT_CARD_HEADER = struct.Struct("<BBIII")        # player, cancelable, min, max, count
+_SELECT_CARD_ENTRY = struct.Struct("<IBBII")         # code, con, loc, seq, pos
+_SELECT_CHAIN_HEADER = struct.Struct("<BBBB")        # player, count, specount, forced
+_SELECT_PLACE = struct.Struct("<BBI")                # player, count, flag
+_UNSELECT_HEADER = struct.Struct("<BBBIII")          # player, finishable, cancelable, min, max, count
+_SELECT_OPTION_HEADER = struct.Struct("<BB")         # player, count
+_SELECT_OPTION_ENTRY = struct.Struct("<Q")           # desc
+_TRIBUTE_HEADER = struct.Struct("<BBBBB")            # player, cancelable, min, max, count
+_TRIBUTE_ENTRY = struct.Struct("<IBBBI")             # code, con, loc, seq, release_param
+_SUM_HEADER = struct.Struct("<BBIBBB")               # mode, player, target, min, max, must_count
+_SUM_ENTRY = struct.Struct("<IBBBI")                 # code, con, loc, seq, sum_param
+
+_LOC_INFO = struct.Struct("<BBII")                   # con, loc, seq, pos
+_MOVE = struct.Struct("<IBBIIBBIII")                # code, prev loc_info, cur loc_info, reason
+_DRAW_HEADER = struct.Struct("<BI")                  # player, count
+_DRAW_ENTRY = struct.Struct("<II")                   # code, position
+
+
+# =============================================================================
+# DECISION MESSAGE DECODERS
+# =============================================================================
+# Each takes the message body (memoryview, after the type byte) and returns
+# the dict the matching parse_* function builds.
+
+def _idle_cards(body, offset: int) -> Tuple[List[dict], int]:
+    (count,) = _U32.unpack_from(body, offset)
+    offset += 4
+    cards = []
+    for _ in range(count):
+        code, con, loc, seq = _IDLE_CARD.unpack_from(body, offset)
+        offset += _IDLE_CARD.size
+        cards.append({"code": code, "con": con, "loc": loc, "seq": seq})
+    return cards, offset
+
+
+def decode_idle(body) -> Dict[str, Any]:
+    """MSG_IDLE body (see parse_idle)."""
+    player = body[0]
+    summonable, offset = _idle_cards(body, 1)
+    spsummon, offset = _idle_cards(body, offset)
+
+    (count,) = _U32.unpack_from(body, offset)
+    offset += 4
+    repos = []
+    for _ in range(count):
+        code, con, loc, seq = _IDLE_REPOS.unpack_from(body, offset)
+        offset += _IDLE_REPOS.size
+        repos.append({"code": code, "con": con, "loc": loc, "seq": seq})
+
+    mset, offset = _idle_cards(body, offset)
+    sset, offset = _idle_cards(body, offset)
+
+    (count,) = _U32.unpack_from(body, offset)
+    offset += 4
+    activatable = []
+    for _ in range(count):
+        code, con, loc, seq, desc, mode = _IDLE_ACTIVATE.unpack_from(body, offset)
+        offset += _IDLE_ACTIVATE.size
+        activatable.append({"code": code, "con": con, "loc": loc, "seq": seq, "desc": desc, "mode": mode})
+
+    to_bp, to_ep, can_shuffle = _IDLE_FLAGS.unpack_from(body, offset)
+    return {
+        "player": player,
+        "summonable": summonable,
+        "spsummon": spsummon,
+        "repos": repos,
+        "mset": mset,
+        "sset": sset,
+        "activatable": activatable,
+        "to_bp": to_bp,
+        "to_ep": to_ep,
+        "can_shuffle": can_shuffle,
+    }
+
+
+def decode_select_card(body) -> Dict[str, Any]:
+    """MSG_SELECT_CARD body (see parse_select_card)."""
+    player, cancelable, min_select, max_select, count = _SELECT_CARD_HEADER.unpack_from(body, 0)
+    offset = _SELECT_CARD_HEADER.size
+    cards = []
+    for _ in range(count):
+        code, con, loc, seq, _pos = _SELECT_CARD_ENTRY.unpack_from(body, offset)
+        offset += _SELECT_CARD_ENTRY.size
+        cards.append({"code": code, "con": con, "loc": loc, "seq": seq})
+    return {
+        "player": player,
+        "cancelable": cancelable,
+        "min": min_select,
+        "max": max_select,
+        "cards": cards,
+    }
+
+
+def decode_select_chain(body) -> Dict[str, Any]:
+    """MSG_SELECT_CHAIN body (see parse_select_chain)."""
+    player, count, _specount, forced = _SELECT_CHAIN_HEADER.unpack_from(body, 0)
+    return {"player": player, "count": count, "forced": forced}
+
+
+def decode_select_place(body) -> Dict[str, Any]:
+    """MSG_SELECT_PLACE body (see parse_select_place)."""
+    player, count, flag = _SELECT_PLACE.unpack_from(body, 0)
+    return {"player": player, "count": count, "flag": flag}
+
+
+def _unselect_cards(body, offset: int, count: int) -> Tuple[List[dict], int]:
+    cards = []
+    for _ in range(count):
+        code, con, loc, seq, pos = _SELECT_CARD_ENTRY.unpack_from(body, offset)
+        offset += _SELECT_CARD_ENTRY.size
+        cards.append({"code": code, "con": con, "loc": loc, "seq": seq, "pos": pos})
+    return cards, offset
+
+
+def decode_select_unselect_card(body) -> Dict[str, Any]:
+    """MSG_SELECT_UNSELECT_CARD body (see parse_select_unselect_card)."""
+    player, finishable, cancelable, min_cards, max_cards, count = _UNSELECT_HEADER.unpack_from(body, 0)
+    select_cards, offset = _unselect_cards(body, _UNSELECT_HEADER.size, count)
+    (count,) = _U32.unpack_from(body, offset)
+    unselect_cards, _ = _unselect_cards(body, offset + 4, count)
+    return {
+        "player": player,
+        "finishable": finishable,
+        "cancelable": cancelable,
+        "min": min_cards,
+        "max": max_cards,
+        "select_cards": select_cards,
+        "unselect_cards": unselect_cards,
+    }
+
+
+def decode_select_option(body) -> Dict[str, Any]:
+    """MSG_SELECT_OPTION body (see parse_select_option)."""
+    player, count = _SELECT_OPTION_HEADER.unpack_from(body, 0)
+    offset = _SELECT_OPTION_HEADER.size
+    options = []
+    for i in range(count):
+        (desc,) = _SELECT_OPTION_ENTRY.unpack_from(body, offset)
+        offset += _SELECT_OPTION_ENTRY.size
+        options.append({"index": i, "desc": desc})
+    return {"player": player, "count": count, "options": options}
+
+
+def decode_select_tribute(body) -> Dict[str, Any]:
+    """MSG_SELECT_TRIBUTE body (see parse_select_tribute)."""
+    player, cancelable, min_tributes, max_tributes, count = _TRIBUTE_HEADER.unpack_from(body, 0)
+    offset = _TRIBUTE_HEADER.size
+    cards = []
+    for i in range(count):
+        code, controller, location, sequence, release_param = _TRIBUTE_ENTRY.unpack_from(body, offset)
+        offset += _TRIBUTE_ENTRY.size
+        cards.append({
+            'index': i,
+            'code': code,
+            'controller': controller,
+            'location': location,
+            'sequence': sequence,
+            'release_param': release_param,
+        })
+    return {
+        'player': player,
+        'cancelable': bool(cancelable),
+        'min': min_tributes,
+        'max': max_tributes,
+        'count': count,
+        'cards': cards,
+    }
+
+
+def _sum_cards(body, offset: int, count: int) -> Tuple[List[dict], int]:
+    """SELECT_SUM card entries (11-byte format, see _parse_sum_card_11byte)."""
+    cards = []
+    for i in range(count):
+        if offset + _SUM_ENTRY.size > len(body):
+            break
+        code, controller, location, sequence, sum_param = _SUM_ENTRY.unpack_from(body, offset)
+        offset += _SUM_ENTRY.size
+
+        level1 = sum_param & 0xFFFF
+        level2 = (sum_param >> 16) & 0xFFFF
+        level = level1 if 1 <= level1 <= 12 else 0
+        if level == 0:
+            level = verified_level(code)
+
+        cards.append({
+            'index': i,
+            'code': code,
+            'controller': controller,
+            'location': location,
+            'sequence': sequence,
+            'sum_param': sum_param,
+            'value': level,
+            'level': level,
+            'level2': level2 if 1 <= level2 <= 12 else level,
+        })
+    return cards, offset
+
+
+def decode_select_sum(body) -> Dict[str, Any]:
+    """MSG_SELECT_SUM body (see parse_select_sum, without debug fields)."""
+    try:
+        mode, player, target_sum, select_min, select_max, must_count = _SUM_HEADER.unpack_from(body, 0)
+        must_select, offset = _sum_cards(body, _SUM_HEADER.size, must_count)
+        can_count = body[offset]
+        can_select, _ = _sum_cards(body, offset + 1, can_count)
+    except (struct.error, IndexError) as e:
+        return {
+            'player': body[0] if len(body) > 0 else 0,
+            'select_mode': 0,
+            'target_sum': 0,
+            'min': 0,
+            'max': 0,
+            'must_count': 0,
+            'must_select': [],
+            'can_count': 0,
+            'can_select': [],
+            '_parse_error': str(e),
+        }
+    return {
+        'player': player,
+        'select_mode': mode,
+        'target_sum': target_sum,
+        'min': select_min,
+        'max': select_max,
+        'must_count': must_count,
+        'must_select': must_select,
+        'can_count': can_count,
+        'can_select': can_select,
+    }
+
+
+def decode_legacy_12(body) -> Dict[str, Any]:
+    """Message 12: raw body for _handle_legacy_message_12."""
+    return {"raw": bytes(body)}
+
+
+# =============================================================================
+# BOARD MESSAGE DECODERS
+# =============================================================================
+# Informational messages that change which cards are where. Locations are
+# (controller, location, sequence) tuples.
+
+def decode_move(body) -> Dict[str, Any]:
+    """MSG_MOVE: a card changed location."""
+    code, pcon, ploc, pseq, _ppos, ccon, cloc, cseq, _cpos, _reason = _MOVE.unpack_from(body, 0)
+    return {"code": code, "from": (pcon, ploc, pseq), "to": (ccon, cloc, cseq)}
+
+
+def decode_draw(body) -> Dict[str, Any]:
+    """MSG_DRAW: cards drawn to a player's hand."""
+    player, count = _DRAW_HEADER.unpack_from(body, 0)
+    offset = _DRAW_HEADER.size
+    codes = []
+    for _ in range(count):
+        code, _position = _DRAW_ENTRY.unpack_from(body, offset)
+        offset += _DRAW_ENTRY.size
+        codes.append(code)
+    return {"player": player, "codes": codes}
+
+
+def decode_equip(body) -> Dict[str, Any]:
+    """MSG_EQUIP: equip card and its target."""
+    con, loc, seq, _pos = _LOC_INFO.unpack_from(body, 0)
+    tcon, tloc, tseq, _tpos = _LOC_INFO.unpack_from(body, _LOC_INFO.size)
+    return {"card": (con, loc, seq), "target": (tcon, tloc, tseq)}
+
+
+def decode_unequip(body) -> Dict[str, Any]:
+    """MSG_UNEQUIP: equip card lost its target."""
+    con, loc, seq, _pos = _LOC_INFO.unpack_from(body, 0)
+    return {"card": (con, loc, seq)}
+
+
+# Message type -> decoder. Types not listed are returned as (type, None).
+DECODERS: Dict[int, Callable[[memoryview], Dict[str, Any]]] = {
+    MSG_IDLE: decode_idle,
+    MSG_SELECT_CARD: decode_select_card,
+    MSG_SELECT_CHAIN: decode_select_chain,
+    MSG_SELECT_PLACE: decode_select_place,
+    MSG_SELECT_UNSELECT_CARD: decode_select_unselect_card,
+    MSG_SELECT_OPTION: decode_select_option,
+    MSG_SELECT_SUM: decode_select_sum,
+    MSG_SELECT_TRIBUTE: decode_select_tribute,
+    MSG_SELECT_EFFECTYN: decode_legacy_12,
+}
+
+# DECODERS plus the board-changing informational messages
+TRACKING_DECODERS: Dict[int, Callable[[memoryview], Dict[str, Any]]] = {
+    **DECODERS,
+    MSG_MOVE: decode_move,
+    MSG_DRAW: decode_draw,
+    MSG_EQUIP: decode_equip,
+    MSG_UNEQUIP: decode_unequip,
+}
+
+
+# =============================================================================
+# BATCH DECODING
+# =============================================================================
+
+def decode_messages(buffer, debug: bool = False,
+                    decoders: Optional[Dict[int, Callable[[memoryview], Dict[str, Any]]]] = None) -> List[Message]:
+    """Split and decode one OCG_DuelGetMessage batch.
+
+    Args:
+        buffer: The batch (any buffer: ffi.buffer(buf, length), bytes, ...).
+            It is only read while decoding, never copied as a whole.
+        debug: Attach the raw body to SELECT_SUM dicts ("_raw_hex",
+            "_raw_len") for the handler's diagnostic logging.
+        decoders: Message type -> decoder table (default: DECODERS).
+
+    Returns:
+        (msg_type, data) per message, in order. data is None for message
+        types without a decoder.
+    """
+    view = memoryview(buffer)
+    size = len(view)
+    if decoders is None:
+        decoders = DECODERS
+    messages = []
+    pos = 0
+    while pos + _MSG_HEADER.size <= size:
+        msg_len, msg_type = _MSG_HEADER.unpack_from(view, pos)
+        if msg_len == 0:
+            break
+        end = pos + 4 + msg_len
+        decoder = decoders.get(msg_type)
+        if decoder is None:
+            messages.append((msg_type, None))
+        else:
+            body = view[pos + 5:end]
+            msg_data = decoder(body)
+            if debug and msg_type == MSG_SELECT_SUM:
+                msg_data["_raw_hex"] = body.hex()
+                msg_data["_raw_len"] = len(body)
+            messages.append((msg_type, msg_data))
+        pos = end
+    return messages
+
+
+__all__ = [
+    'DECODERS',
+    'TRACKING_DECODERS',
+    'decode_messages',
+    'decode_idle',
+    'decode_select_card',
+    'decode_select_chain',
+    'decode_select_place',
+    'decode_select_unselect_card',
+    'decode_select_option',
+    'decode_select_tribute',
+    'decode_select_sum',
+    'decode_move',
+    'decode_draw',
+    'decode_equip',
+    'decode_unequip',
+]
@@ -9,8 +9,20 @@ The mixin expects the following attributes/methods from the host class:
     Attributes:
         - lib: The CFFI library handle
         - dedupe_intermediate: bool - Whether to dedupe intermediate states
+        - idle_capture: str - "targeted" (capture_board_signature), "full"
+          (BoardState via _capture_board) or "incremental" (BoardTracker)
+          for the intermediate-state hash
+        - _trackers: mapping duel -> BoardTracker ("incremental" only)
+        - verify_interval: int - IDLE nodes between tracker cross-checks
+        - incremental_checks / incremental_mismatches: int - Cross-check counters
         - transposition_table: TranspositionTable instance
         - intermediate_states_pruned: int - Counter for pruned states
+        - shared_table: SharedTranspositionTable or None - Cross-worker table
+        - shared_states_pruned: int - Counter for states pruned by shared_table
+        - states_reexpanded: int - Counter for hits searched again with more depth
+        - max_depth: int - Depth limit of the search
+        - _subtrees: list - [best value, cut, best terminal] frame per IDLE
+          state being searched
         - verbose: bool - Enable verbose logging
         - prioritize_cards: set - Card codes to prioritize
         - prioritize_order: list - Order of prioritized cards
@@ -19,21 +31,31 @@ The mixin expects the following attributes/methods from the host class:
     Methods:
         - log(msg, depth): Log a message at given depth
         - _recurse(action_history): Continue enumeration with action history
+          (an ActionHistory; plain lists passed to the handlers are converted)
         - _record_terminal(action_history, reason): Record a terminal state
+          (PASS terminals are recorded after all sibling branches)
+        - _board_value(board_state, board_hash): Score of a terminal board
+        - _use_cached_result(action_history, result): Report a persistent
+          cache hit (CachedResult)
+        - _persist_subtree(state_hash, remaining, best, result): Record a
+          closed subtree in a persistent cache
         - _compute_select_card_context(select_data): Compute context hash
         - _mark_card_failed_at_context(context_hash, card_code): Mark card failed
 """
 
 import struct
+from dataclasses import replace
 from itertools import combinations
-from typing import List, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 # Import shared types
 try:
-    from ..types import Action
+    from ..types import Action, ActionHistory, CardText
     from ..engine.interface import get_card_name
-    from ..engine.state import IntermediateState
-    from ..engine.board_capture import capture_board_state
+    from ..engine.state import BoardSignature, IntermediateState
+    from ..engine.board_capture import (
+        capture_board_state, capture_board_signature, query_signature_zones, signature_from_zones,
+    )
     from ..engine.bindings import (
         MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_PLACE, MSG_SELECT_POSITION,
         MSG_SELECT_OPTION, MSG_SELECT_UNSELECT_CARD, MSG_SELECT_SUM,
@@ -49,10 +71,12 @@ try:
 except ImportError:
     # Fallback for direct execution (sys.path includes src/ygo_combo)
     # Note: Must import from src.ygo_combo.types, not types (collision with Python stdlib)
-    from src.ygo_combo.types import Action
+    from src.ygo_combo.types import Action, ActionHistory, CardText
     from engine.interface import get_card_name
-    from engine.state import IntermediateState
-    from engine.board_capture import capture_board_state
+    from engine.state import BoardSignature, IntermediateState
+    from engine.board_capture import (
+        capture_board_state, capture_board_signature, query_signature_zones, signature_from_zones,
+    )
     from engine.bindings import (
         MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_PLACE, MSG_SELECT_POSITION,
         MSG_SELECT_OPTION, MSG_SELECT_UNSELECT_CARD, MSG_SELECT_SUM,
@@ -67,6 +91,21 @@ except ImportError:
     from enumeration.parsers import find_valid_tribute_combinations
 
 
+def _card_text(template: str, *codes: int) -> CardText:
+    """Description naming cards; names are looked up when first read."""
+    return CardText(template, codes, get_card_name)
+
+
+def _extend(action_history, action: Action) -> ActionHistory:
+    """action_history followed by action, sharing the prefix."""
+    return ActionHistory.of(action_history).push(action)
+
+
+def _placeholders(count: int) -> str:
+    """Comma-separated CardText placeholders for count names."""
+    return ", ".join(["{}"] * count)
+
+
 class MessageHandlerMixin:
     """Mixin class providing message handling methods for EnumerationEngine.
 
@@ -86,36 +125,193 @@ class MessageHandlerMixin:
         - MSG_SELECT_TRIBUTE: Tribute selection
     """
 
-    def _handle_idle(self, duel, action_history: List[Action], idle_data: dict):
+    def _capture_board(self, lib, duel):
+        """Capture the board at the current node.
+
+        Hosts may override this to memoize the capture so the PASS terminal
+        of the same IDLE node can reuse it.
+        """
+        return capture_board_state(lib, duel)
+
+    def _capture_signature(self, lib, duel) -> BoardSignature:
+        """Board signature for the intermediate-state hash at MSG_IDLE.
+
+        "targeted" queries only the zones the signature hashes; "full" goes
+        through _capture_board (the BoardState path, for debugging). A
+        BoardState has no equip targets, so "full" takes them from the same
+        zone query "targeted" uses and all modes hash a board alike.
+        """
+        if self.idle_capture == "full":
+            board = BoardSignature.from_board_state(self._capture_board(lib, duel))
+            equips = signature_from_zones(*query_signature_zones(lib, duel)).equips
+            return replace(board, equips=equips)
+        return capture_board_signature(lib, duel)
+
+    def _incremental_state_hash(self, duel, idle_data: dict, depth: int) -> int:
+        """Intermediate-state hash from the duel's BoardTracker.
+
+        Equal to IntermediateState.from_signature(...).zobrist_hash(). The
+        zones are queried only to seed the tracker and, every
+        verify_interval IDLE nodes, to cross-check it (a mismatch is
+        counted, logged and the tracker re-synced).
+        """
+        tracker = self._trackers.get(duel)
+        if tracker is None:
+            # Duel not created by _create_duel: fall back to a targeted capture
+            state = IntermediateState.from_signature(capture_board_signature(self.lib, duel), idle_data)
+            return state.zobrist_hash()
+
+        if not tracker.seeded or (self.verify_interval
+                                  and tracker.nodes_since_check >= self.verify_interval):
+            zones, equipped = query_signature_zones(self.lib, duel)
+            if tracker.seeded:
+                self.incremental_checks += 1
+                captured = signature_from_zones(zones, equipped)
+                tracked = tracker.signature()
+                if tracked != captured:
+                    self.incremental_mismatches += 1
+                    self.log(f"INCREMENTAL HASH MISMATCH: tracked {tracked.to_dict()} "
+                             f"!= captured {captured.to_dict()}", depth)
+            tracker.reset(zones, equipped)
+        tracker.nodes_since_check += 1
+
+        specs = IntermediateState._extract_action_specs(idle_data)
+        return tracker.hash() ^ tracker.hasher.hash_actions({a.spec for a in specs})
+
+    def _idle_state_hash(self, duel, idle_data: dict, depth: int) -> int:
+        """Intermediate-state hash (board + available actions) at MSG_IDLE."""
+        if self.idle_capture == "incremental":
+            return self._incremental_state_hash(duel, idle_data, depth)
+        state = IntermediateState.from_signature(self._capture_signature(self.lib, duel), idle_data)
+        return state.zobrist_hash()
+
+    def _prune_intermediate(self, state_hash: int, depth: int, action_history=None) -> bool:
+        """Whether state_hash was already explored; records it if not.
+
+        Checks the local transposition table, then the cross-worker table.
+        An entry in either only counts if it was searched with at least
+        the depth left here (TranspositionEntry.covers); otherwise the
+        state is expanded again, so a state first met near the depth limit
+        is searched in full once it is reached higher up the tree.
+
+        A persistent cache hit reports the best board an earlier run found
+        below the state (_use_cached_result), reached via action_history.
+        """
+        remaining = self.max_depth - depth
+        keeps_results = self.shared_table is not None and self.shared_table.keeps_results
+
+        # Check transposition table
+        cached = self.transposition_table.lookup(state_hash)
+        if cached is not None:
+            if cached.covers(remaining):
+                self.intermediate_states_pruned += 1
+                self.log(f"PRUNED: duplicate intermediate state at depth {depth}", depth)
+                best = self.shared_table.result_offset(state_hash) if keeps_results else None
+                self._note_subtree(cached.best_terminal_value, cached.remaining_depth is not None, best)
+                return True  # Already explored from this state
+            self.states_reexpanded += 1
+            self.log(f"RE-EXPAND: state searched with {cached.remaining_depth} actions left, "
+                     f"now {remaining}", depth)
+
+        # Check the cross-worker table. The shared-memory table records the
+        # state (or raises its budget) when it does not cover this one; a
+        # persistent cache is only written when a subtree closes
+        if self.shared_table is not None:
+            if keeps_results:
+                result = self.shared_table.lookup(state_hash, remaining)
+                hit = result is not None
+            else:
+                result, hit = None, self.shared_table.probe(state_hash, remaining)
+            if hit:
+                self.intermediate_states_pruned += 1
+                self.shared_states_pruned += 1
+                self.log(f"PRUNED: state explored by another hand/worker/run at depth {depth}", depth)
+                if result is None:
+                    self._note_subtree(float("-inf"), True)
+                else:
+                    self._use_cached_result(action_history, result)
+                return True
+
+        # Store in transposition table (provisional until _close_subtree)
+        self.transposition_table.store(state_hash, TranspositionEntry(
+            state_hash=state_hash,
+            best_terminal_hash="",
+            best_terminal_value=0.0,
+            creation_depth=depth,
+            visit_count=1,
+            remaining_depth=remaining,
+        ))
+        return False
+
+    def _note_subtree(self, value: float, cut: bool = False, result=None):
+        """Fold a terminal value (and whether a limit cut the search) into
+        the innermost IDLE state being searched.
+
+        result is the terminal behind value, for the persistent cache: a
+        TerminalState, or the offset of a result it already holds.
+        """
+        if self._subtrees:
+            frame = self._subtrees[-1]
+            if value > frame[0]:
+                frame[0] = value
+                frame[2] = result
+            if cut:
+                frame[1] = True
+
+    def _mark_cut(self):
+        """Note that the search below the current IDLE state stopped at a limit."""
+        if self._subtrees:
+            self._subtrees[-1][1] = True
+
+    def _close_subtree(self, state_hash: int, depth: int, best: float, cut: bool, result=None):
+        """Record what searching below state_hash found, then pass it up.
+
+        The entry keeps the best terminal value reached and the depth
+        budget it was searched with, or None when no limit cut it (so it
+        covers any later budget). A persistent cache also keeps the best
+        terminal (result).
+        """
+        remaining = self.max_depth - depth if cut else None
+        self.transposition_table.store(state_hash, TranspositionEntry(
+            state_hash=state_hash,
+            best_terminal_hash="",
+            best_terminal_value=best,
+            creation_depth=depth,
+            visit_count=1,
+            remaining_depth=remaining,
+        ))
+        if self.shared_table is not None and self.shared_table.keeps_results:
+            self._persist_subtree(state_hash, remaining, best, result)
+        self._note_subtree(best, cut, result)
+
+    def _handle_idle(self, duel, action_history: ActionHistory, idle_data: dict):
         """Handle MSG_IDLE - branch on all actions + PASS.
 
         With intermediate state pruning enabled, we check if this exact game state
         (board + available actions) has been explored before. If so, we skip it
         since all future paths from this state are identical.
         """
-        depth = len(action_history)
-
         # Intermediate state pruning using transposition table
         if self.dedupe_intermediate:
-            # Compute intermediate state hash (Zobrist for O(1) lookups)
-            state = IntermediateState.from_engine(self.lib, duel, idle_data, capture_board_state)
-            state_hash = state.zobrist_hash()
-
-            # Check transposition table
-            cached = self.transposition_table.lookup(state_hash)
-            if cached is not None:
-                self.intermediate_states_pruned += 1
-                self.log(f"PRUNED: duplicate intermediate state at depth {depth}", depth)
-                return  # Already explored from this state
-
-            # Store in transposition table
-            self.transposition_table.store(state_hash, TranspositionEntry(
-                state_hash=state_hash,
-                best_terminal_hash="",
-                best_terminal_value=0.0,
-                creation_depth=depth,
-                visit_count=1,
-            ))
+            depth = len(action_history)
+            state_hash = self._idle_state_hash(duel, idle_data, depth)
+            if self._prune_intermediate(state_hash, depth, action_history):
+                return
+
+            frame = [float("-inf"), False, None]
+            self._subtrees.append(frame)
+            try:
+                self._branch_idle(duel, action_history, idle_data)
+            finally:
+                self._subtrees.pop()
+            self._close_subtree(state_hash, depth, *frame)
+            return
+
+        self._branch_idle(duel, action_history, idle_data)
+
+    def _branch_idle(self, duel, action_history: ActionHistory, idle_data: dict):
+        """Branch on every IDLE action; PASS is recorded as a terminal last."""
+        depth = len(action_history)
 
         self.log(f"IDLE: {len(idle_data.get('activatable', []))} activatable, "
                  f"{len(idle_data.get('spsummon', []))} spsummon", depth)
@@ -123,7 +319,6 @@ class MessageHandlerMixin:
         # Enumerate all activatable effects
         for i, card in enumerate(idle_data.get("activatable", [])):
             code = card["code"]
-            name = get_card_name(code)
             loc = card.get("loc", 0)
             desc = card.get("desc", 0)
             effect_idx = desc & 0xF
@@ -136,18 +331,18 @@ class MessageHandlerMixin:
                 message_type=MSG_IDLE,
                 response_value=value,
                 response_bytes=response,
-                description=f"Activate {name} ({loc_name} eff{effect_idx})",
+                description=_card_text(f"Activate {{}} ({loc_name} eff{effect_idx})", code),
                 card_code=code,
-                card_name=name,
+                card_name=_card_text("{}", code),
             )
 
-            self.log(f"Branch: Activate {name} ({loc_name} eff{effect_idx}) (idx {i})", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: {action.description} (idx {i})", depth)
+            self._recurse(_extend(action_history, action))
 
         # Enumerate special summons
         for i, card in enumerate(idle_data.get("spsummon", [])):
             code = card["code"]
-            name = get_card_name(code)
             value = (i << 16) | 1
             response = struct.pack("<I", value)
 
@@ -156,18 +351,18 @@ class MessageHandlerMixin:
                 message_type=MSG_IDLE,
                 response_value=value,
                 response_bytes=response,
-                description=f"Special Summon {name}",
+                description=_card_text("Special Summon {}", code),
                 card_code=code,
-                card_name=name,
+                card_name=_card_text("{}", code),
             )
 
-            self.log(f"Branch: SpSummon {name} (idx {i})", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: SpSummon {action.card_name} (idx {i})", depth)
+            self._recurse(_extend(action_history, action))
 
         # Enumerate normal summons
         for i, card in enumerate(idle_data.get("summonable", [])):
             code = card["code"]
-            name = get_card_name(code)
             value = (i << 16) | 0
             response = struct.pack("<I", value)
 
@@ -176,13 +371,14 @@ class MessageHandlerMixin:
                 message_type=MSG_IDLE,
                 response_value=value,
                 response_bytes=response,
-                description=f"Normal Summon {name}",
+                description=_card_text("Normal Summon {}", code),
                 card_code=code,
-                card_name=name,
+                card_name=_card_text("{}", code),
             )
 
-            self.log(f"Branch: Summon {name} (idx {i})", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: Summon {action.card_name} (idx {i})", depth)
+            self._recurse(_extend(action_history, action))
 
         # PASS option (terminal)
         if idle_data.get("to_ep"):
@@ -196,9 +392,9 @@ class MessageHandlerMixin:
             )
 
             self.log(f"Branch: PASS (terminal)", depth)
-            self._record_terminal(action_history + [action], "PASS")
+            self._record_terminal(_extend(action_history, action), "PASS")
 
-    def _handle_select_card(self, duel, action_history: List[Action], select_data: dict):
+    def _handle_select_card(self, duel, action_history: ActionHistory, select_data: dict):
         """Handle MSG_SELECT_CARD - branch on unique card codes only.
 
         Optimization: Selecting Holactie #1 vs Holactie #2 produces identical outcomes,
@@ -220,17 +416,11 @@ class MessageHandlerMixin:
         # Compute context hash for this SELECT_CARD prompt
         context_hash = self._compute_select_card_context(select_data)
 
-        # Find cards that led to SELECT_SUM_CANCEL in this path
-        failed_codes = set()
-        for i in range(len(action_history) - 1):
-            action = action_history[i]
-            next_action = action_history[i + 1]
-            if (action.action_type == "SELECT_CARD" and
-                next_action.action_type == "SELECT_SUM_CANCEL" and
-                action.card_code is not None):
-                failed_codes.add(action.card_code)
-
-        if failed_codes:
+        # Cards that led to SELECT_SUM_CANCEL in this path (cached on the history)
+        action_history = ActionHistory.of(action_history)
+        failed_codes = action_history.failed_sum_codes
+
+        if failed_codes and self.verbose:
             failed_names = [get_card_name(c) for c in failed_codes]
             self.log(f"  Excluding failed SELECT_SUM cards: {failed_names}", depth)
 
@@ -260,7 +450,6 @@ class MessageHandlerMixin:
                 unique_cards.sort(key=priority_key)
 
             for i, code in unique_cards:
-                name = get_card_name(code)
                 indices, response = build_select_card_response([i])
 
                 action = Action(
@@ -268,14 +457,15 @@ class MessageHandlerMixin:
                     message_type=MSG_SELECT_CARD,
                     response_value=indices,
                     response_bytes=response,
-                    description=f"Select {name}",
+                    description=_card_text("Select {}", code),
                     card_code=code,
-                    card_name=name,
+                    card_name=_card_text("{}", code),
                     context_hash=context_hash,
                 )
 
-                self.log(f"Branch: Select {name} (idx {i}, {len(unique_cards)} unique)", depth)
-                self._recurse(action_history + [action])
+                if self.verbose:
+                    self.log(f"Branch: {action.description} (idx {i}, {len(unique_cards)} unique)", depth)
+                self._recurse(_extend(action_history, action))
         else:
             # Multi-select: enumerate combinations of unique card codes
             code_to_indices = {}
@@ -293,18 +483,18 @@ class MessageHandlerMixin:
                 for code_combo in combinations(unique_codes, r):
                     combo = [code_to_indices[code][0] for code in code_combo]
                     indices, response = build_select_card_response(combo)
-                    names = [get_card_name(code) for code in code_combo]
 
                     action = Action(
                         action_type="SELECT_CARD",
                         message_type=MSG_SELECT_CARD,
                         response_value=combo,
                         response_bytes=response,
-                        description=f"Select {', '.join(names)}",
+                        description=_card_text("Select " + _placeholders(len(code_combo)), *code_combo),
                     )
 
-                    self.log(f"Branch: Select {names}", depth)
-                    self._recurse(action_history + [action])
+                    if self.verbose:
+                        self.log(f"Branch: Select {[get_card_name(code) for code in code_combo]}", depth)
+                    self._recurse(_extend(action_history, action))
 
     def _handle_select_place(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_PLACE - select zone for card."""
@@ -337,7 +527,7 @@ class MessageHandlerMixin:
             response_bytes=response,
             description=f"Select zone ({location:02x}, {sequence})",
         )
-        self._recurse(action_history + [action])
+        self._recurse(_extend(action_history, action))
 
     def _handle_select_position(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_POSITION - always select ATK.
@@ -353,7 +543,7 @@ class MessageHandlerMixin:
             response_bytes=response,
             description="Position: ATK (auto)",
         )
-        self._recurse(action_history + [action])
+        self._recurse(_extend(action_history, action))
 
     def _handle_yes_no(self, duel, action_history, msg_data, msg_type):
         """Handle yes/no prompts - branch on both options."""
@@ -369,7 +559,7 @@ class MessageHandlerMixin:
                 description=f"Choose: {choice_name}",
             )
             self.log(f"Branch: {choice_name}", depth)
-            self._recurse(action_history + [action])
+            self._recurse(_extend(action_history, action))
 
     def _handle_select_option(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_OPTION - select from multiple options."""
@@ -390,7 +580,7 @@ class MessageHandlerMixin:
                 description=f"Option {opt} (desc={desc})",
             )
             self.log(f"Branch: Option {opt}", depth)
-            self._recurse(action_history + [action])
+            self._recurse(_extend(action_history, action))
 
     def _handle_select_unselect_card(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_UNSELECT_CARD - select/unselect cards.
@@ -416,7 +606,7 @@ class MessageHandlerMixin:
                 description="Finish selection",
             )
             self.log(f"Branch: Finish selection", depth)
-            self._recurse(action_history + [action])
+            self._recurse(_extend(action_history, action))
 
         # Enumerate selectable cards - deduplicate by card code
         seen_codes = set()
@@ -426,7 +616,6 @@ class MessageHandlerMixin:
                 continue
             seen_codes.add(code)
 
-            name = get_card_name(code)
             # CORRECT format per ygopro-core playerop.cpp:439-450:
             # returns.at<int32_t>(0) = count (must be 1 for single selection)
             # returns.at<int32_t>(1) = selected index
@@ -436,12 +625,13 @@ class MessageHandlerMixin:
                 message_type=MSG_SELECT_UNSELECT_CARD,
                 response_value=i,
                 response_bytes=response,
-                description=f"Select {name}",
+                description=_card_text("Select {}", code),
                 card_code=code,
-                card_name=name,
+                card_name=_card_text("{}", code),
             )
-            self.log(f"Branch: Select {name} ({len(seen_codes)} unique)", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: {action.description} ({len(seen_codes)} unique)", depth)
+            self._recurse(_extend(action_history, action))
 
     def _handle_select_sum(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_SUM - select cards whose levels sum to target.
@@ -497,16 +687,17 @@ class MessageHandlerMixin:
         if "_parse_error" in msg_data:
             self.log(f"  PARSE ERROR: {msg_data['_parse_error']}", depth)
 
-        # === DEBUG: Always show card info for SELECT_SUM ===
-        self.log(f"  MUST_SELECT ({len(must_select)} cards):", depth)
-        for i, card in enumerate(must_select):
-            name = get_card_name(card.get("code", 0))
-            self.log(f"    [{i}]: {name} (code={card.get('code',0)}) level={card.get('level',0)} value={card.get('value',0)} sum_param=0x{card.get('sum_param',0):08x}", depth)
+        # === DEBUG: Show card info for SELECT_SUM ===
+        if self.verbose:
+            self.log(f"  MUST_SELECT ({len(must_select)} cards):", depth)
+            for i, card in enumerate(must_select):
+                name = get_card_name(card.get("code", 0))
+                self.log(f"    [{i}]: {name} (code={card.get('code',0)}) level={card.get('level',0)} value={card.get('value',0)} sum_param=0x{card.get('sum_param',0):08x}", depth)
 
-        self.log(f"  CAN_SELECT ({len(can_select)} cards):", depth)
-        for i, card in enumerate(can_select):
-            name = get_card_name(card.get("code", 0))
-            self.log(f"    [{i}]: {name} (code={card.get('code',0)}) level={card.get('level',0)} value={card.get('value',0)} sum_param=0x{card.get('sum_param',0):08x}", depth)
+            self.log(f"  CAN_SELECT ({len(can_select)} cards):", depth)
+            for i, card in enumerate(can_select):
+                name = get_card_name(card.get("code", 0))
+                self.log(f"    [{i}]: {name} (code={card.get('code',0)}) level={card.get('level',0)} value={card.get('value',0)} sum_param=0x{card.get('sum_param',0):08x}", depth)
 
         # === DEBUG: Show sum of all available card values ===
         all_values = [c.get('value', 0) for c in can_select]
@@ -514,18 +705,16 @@ class MessageHandlerMixin:
 
         # Branch 1: Cancel the selection
         # Mark the preceding SELECT_CARD choice as failed at its context
-        last_select_card = None
-        for action in reversed(action_history):
-            if action.action_type == "SELECT_CARD" and action.card_code is not None:
-                last_select_card = action
-                break
+        action_history = ActionHistory.of(action_history)
+        last_select_card = action_history.last_select_card
 
         if last_select_card and last_select_card.context_hash is not None:
             self._mark_card_failed_at_context(
                 last_select_card.context_hash,
                 last_select_card.card_code
             )
-            self.log(f"  Marked {last_select_card.card_name} as failed at context {last_select_card.context_hash}", depth)
+            if self.verbose:
+                self.log(f"  Marked {last_select_card.card_name} as failed at context {last_select_card.context_hash}", depth)
 
         cancel_response = struct.pack("<i", -1)
         cancel_action = Action(
@@ -536,7 +725,7 @@ class MessageHandlerMixin:
             description="Cancel sum selection",
         )
         self.log(f"Branch: Cancel sum selection", depth)
-        self._recurse(action_history + [cancel_action])
+        self._recurse(_extend(action_history, cancel_action))
 
         # Branch 2+: Find and explore all valid sum combinations
         actual_target = target_sum
@@ -602,9 +791,11 @@ class MessageHandlerMixin:
                 self.log(f"  SELECT_SUM response ({len(response)} bytes): {hex_resp}", depth)
                 self.log(f"  Indices: {full_indices} (can_select has {len(can_select)} cards)", depth)
 
-            card_names = [get_card_name(can_select[i].get("code", 0)) for i in combo_indices]
             total_sum = sum(can_select[i].get("value", 0) for i in combo_indices)
-            desc = f"Sum select: {', '.join(card_names)} (sum={total_sum})"
+            desc = _card_text(
+                f"Sum select: {_placeholders(len(combo_indices))} (sum={total_sum})",
+                *(can_select[i].get("code", 0) for i in combo_indices),
+            )
 
             action = Action(
                 action_type="SELECT_SUM",
@@ -614,8 +805,9 @@ class MessageHandlerMixin:
                 description=desc,
             )
 
-            self.log(f"Branch: {desc}", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: {action.description}", depth)
+            self._recurse(_extend(action_history, action))
 
         # Fallback if no valid combinations found
         if not valid_combos and can_select:
@@ -631,7 +823,7 @@ class MessageHandlerMixin:
                 response_bytes=fallback_response,
                 description="Sum select fallback: card 0",
             )
-            self._recurse(action_history + [fallback_action])
+            self._recurse(_extend(action_history, fallback_action))
 
     def _handle_select_tribute(self, duel, action_history, msg_data):
         """Handle MSG_SELECT_TRIBUTE - enumerate all valid tribute combinations."""
@@ -662,8 +854,10 @@ class MessageHandlerMixin:
             seen_code_combos.add(combo_codes)
 
             response = build_select_tribute_response(combo)
-            card_names = [get_card_name(cards[i].get("code", 0)) for i in combo]
-            desc = f"Tribute {len(combo)} card(s): {', '.join(card_names)}"
+            desc = _card_text(
+                f"Tribute {len(combo)} card(s): {_placeholders(len(combo))}",
+                *(cards[i].get("code", 0) for i in combo),
+            )
 
             action = Action(
                 action_type="SELECT_TRIBUTE",
@@ -673,8 +867,9 @@ class MessageHandlerMixin:
                 description=desc,
             )
 
-            self.log(f"Branch: {desc}", depth)
-            self._recurse(action_history + [action])
+            if self.verbose:
+                self.log(f"Branch: {action.description}", depth)
+            self._recurse(_extend(action_history, action))
 
         # Cancel option
         if cancelable:
@@ -687,7 +882,7 @@ class MessageHandlerMixin:
                 description="Cancel tribute",
             )
             self.log(f"Branch: Cancel tribute", depth)
-            self._recurse(action_history + [cancel_action])
+            self._recurse(_extend(action_history, cancel_action))
 
         # Fallback
         if not valid_combos and not cancelable and cards:
@@ -701,7 +896,7 @@ class MessageHandlerMixin:
                 description=f"Fallback: tribute first {len(fallback_indices)} cards",
             )
             self.log(f"Branch: Fallback tribute", depth)
-            self._recurse(action_history + [fallback_action])
+            self._recurse(_extend(action_history, fallback_action))
 
     def _handle_legacy_message_12(self, duel, action_history, msg_data):
         """Handle legacy message type 12.
@@ -723,7 +918,7 @@ class MessageHandlerMixin:
                 description=f"Legacy choice: {choice_name}",
             )
             self.log(f"Branch: {choice_name}", depth)
-            self._recurse(action_history + [action])
+            self._recurse(_extend(action_history, action))
 
 
 __all__ = ['MessageHandlerMixin']
@@ -301,6 +301,26 @@ def _get_card_validator() -> CardValidator:
     return _card_validator
 
 
+def verified_level(code: int) -> int:
+    """Level (or rank / link rating) of a card from verified_cards.json.
+
+    Fallback for SELECT_SUM entries whose sum_param is missing.
+
+    Returns:
+        The value, or 0 if the card or the file is not available.
+    """
+    try:
+        verified = _get_card_validator().get_card(code)
+    except FileNotFoundError:
+        # verified_cards.json not found - use sum_param as-is
+        return 0
+    if verified:
+        for key in ('level', 'rank', 'link_rating'):
+            if key in verified:
+                return verified[key]
+    return 0
+
+
 def _parse_sum_card_11byte(data: bytes, offset: int, index: int) -> Tuple[dict, int]:
     """Parse a single card entry from MSG_SELECT_SUM (11-byte format).
 
@@ -334,18 +354,7 @@ def _parse_sum_card_11byte(data: bytes, offset: int, index: int) -> Tuple[dict,
 
     # If sum_param is 0 or invalid, try to look up from verified cards
     if effective_level == 0:
-        try:
-            validator = _get_card_validator()
-            verified = validator.get_card(code)
-            if verified and 'level' in verified:
-                effective_level = verified['level']
-            elif verified and 'rank' in verified:
-                effective_level = verified['rank']  # For Xyz monsters
-            elif verified and 'link_rating' in verified:
-                effective_level = verified['link_rating']  # For Link monsters
-        except FileNotFoundError:
-            # verified_cards.json not found - use sum_param as-is
-            pass
+        effective_level = verified_level(code)
 
     card = {
         'index': index,
@@ -404,18 +413,7 @@ def _parse_sum_card_18byte(data: bytes, offset: int, index: int) -> Tuple[dict,
 
     # If sum_param is 0 or invalid, try to look up from verified cards
     if level == 0 or level > 12:
-        try:
-            validator = _get_card_validator()
-            verified = validator.get_card(code)
-            if verified and 'level' in verified:
-                level = verified['level']
-            elif verified and 'rank' in verified:
-                level = verified['rank']  # For Xyz monsters
-            elif verified and 'link_rating' in verified:
-                level = verified['link_rating']  # For Link monsters
-        except FileNotFoundError:
-            # verified_cards.json not found - use sum_param as-is
-            pass
+        level = verified_level(code) or level
 
     card = {
         'index': index,
@@ -465,18 +463,7 @@ def _parse_sum_card_16byte(data: bytes, offset: int, index: int) -> Tuple[dict,
 
     # If sum_param is 0 or invalid, try to look up from verified cards
     if level == 0 or level > 12:
-        try:
-            validator = _get_card_validator()
-            verified = validator.get_card(code)
-            if verified and 'level' in verified:
-                level = verified['level']
-            elif verified and 'rank' in verified:
-                level = verified['rank']
-            elif verified and 'link_rating' in verified:
-                level = verified['link_rating']
-        except FileNotFoundError:
-            # verified_cards.json not found - use sum_param as-is
-            pass
+        level = verified_level(code) or level
 
     card = {
         'index': index,
@@ -495,7 +482,7 @@ def _parse_sum_card_16byte(data: bytes, offset: int, index: int) -> Tuple[dict,
     return card, offset + 16
 
 
-def parse_select_sum(data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+def parse_select_sum(data: Union[bytes, BinaryIO], debug: bool = False) -> Dict[str, Any]:
     """Parse MSG_SELECT_SUM message for material/card selection.
 
     CORRECT Format per ygopro-core playerop.cpp:658-685 and yugioh-ai reference:
@@ -520,7 +507,8 @@ def parse_select_sum(data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
       - Low 16 bits: primary level/value (op1)
       - High 16 bits: secondary level (op2, for variable-level cards)
 
-    Returns dict with parsed data for _handle_select_sum.
+    Returns dict with parsed data for _handle_select_sum. With debug=True
+    the raw message is included as '_raw_hex' / '_raw_len'.
     """
     raw_data = data if isinstance(data, bytes) else data.read()
 
@@ -553,7 +541,7 @@ def parse_select_sum(data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
                 card, offset = _parse_sum_card_11byte(raw_data, offset, i)
                 can_select.append(card)
 
-        return {
+        result = {
             'player': player,
             'select_mode': mode,
             'target_sum': target_sum,
@@ -563,13 +551,15 @@ def parse_select_sum(data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
             'must_select': must_select,
             'can_count': can_count,
             'can_select': can_select,
-            '_raw_hex': raw_data.hex(),  # DEBUG: include for analysis
-            '_raw_len': len(raw_data),
         }
+        if debug:
+            result['_raw_hex'] = raw_data.hex()
+            result['_raw_len'] = len(raw_data)
+        return result
 
     except Exception as e:
         # Return error info for debugging
-        return {
+        result = {
             'player': raw_data[0] if len(raw_data) > 0 else 0,
             'select_mode': 0,
             'target_sum': 0,
@@ -580,5 +570,7 @@ def parse_select_sum(data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
             'can_count': 0,
             'can_select': [],
             '_parse_error': str(e),
-            '_raw_hex': raw_data.hex() if raw_data else '',
         }
+        if debug:
+            result['_raw_hex'] = raw_data.hex() if raw_data else ''
+        return result
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Fork-based duel snapshotting for combo enumeration.
+
+ygopro-core has no save/restore, so EnumerationEngine reaches every node by
+forward replay. On POSIX systems os.fork() gives a copy-on-write snapshot of
+the whole process, including the engine's duel memory. At MSG_IDLE and
+MSG_SELECT_CARD branch points ForkEnumerationEngine forks one child process
+per alternative. Each child answers the prompt on its own copy of the
+already-advanced duel and explores that subtree without replaying.
+
+Results stream back to the parent over a pipe as length-prefixed pickles:
+    ("terminal", TerminalState)     - terminal kept by the child
+    ("states", [(hash, depth, remaining, best)])
+                                    - transposition entries the child stored
+    ("done", counters)              - counter deltas, always sent last
+    ("error", traceback)            - child failed, its subtree is lost
+
+Concurrency is bounded by a semaphore shared by the whole process tree.
+Every forked child holds a slot; when none is free the alternative is
+explored in-process instead, so at most max_forks + 1 processes (the
+children plus the root) are alive at any time.
+
+Differences from the replay backend:
+    - Concurrent siblings cannot see each other's transposition entries, so
+      some states are explored twice. Terminals are deduplicated again in
+      the parent, so the set of unique boards is unchanged.
+    - MAX_PATHS is enforced per process and is therefore approximate.
+    - A state whose children were forked is recorded as cut off by the
+      depth limit (its children report back asynchronously), so a deeper
+      enumerate_with_depth_limit call searches it again.
+    - deepen() does not fork: the nodes it cuts off must be kept in the
+      calling process.
+    - Terminals arrive in completion order, not DFS order.
+
+Usage:
+    engine = ForkEnumerationEngine(lib, main_deck, extra_deck, max_forks=8)
+    terminals = engine.enumerate_from_hand(hand)
+"""
+
+import logging
+import multiprocessing as mp
+import os
+import pickle
+import select
+import struct
+import sys
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from . import combo_enumeration as ce
+from .combo_enumeration import EnumerationEngine
+from .engine.bindings import MSG_IDLE, MSG_SELECT_CARD
+from .search.compact_transposition import CompactTranspositionTable
+from .search.transposition import TranspositionEntry, TranspositionTable
+from .types import ActionHistory, TerminalState
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Search backends selectable from the CLI (--snapshot-mode)
+SNAPSHOT_MODES = ("replay", "fork")
+DEFAULT_SNAPSHOT_MODE = "replay"
+
+# Prompts whose alternatives are explored in forked children
+FORK_MESSAGE_TYPES = frozenset({MSG_IDLE, MSG_SELECT_CARD})
+
+# Counters summed from children into their parent
+_MERGED_COUNTERS = (
+    "paths_explored",
+    "intermediate_states_pruned",
+    "duplicate_boards_skipped",
+    "duels_created",
+    "actions_replayed",
+    "forks_created",
+    "forks_failed",
+)
+
+_RECORD_HEADER = struct.Struct("<I")
+_READ_CHUNK = 1 << 16
+
+
+class _JournalingMixin:
+    """Transposition table that records stored keys for the parent process."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.journal: Optional[List[tuple]] = None  # Enabled in forked children
+
+    def store(self, state_hash, entry: TranspositionEntry):
+        super().store(state_hash, entry)
+        if self.journal is not None:
+            self.journal.append((state_hash, entry.creation_depth,
+                                 entry.remaining_depth, entry.best_terminal_value))
+
+
+class _JournalingTable(_JournalingMixin, TranspositionTable):
+    """Journaling TranspositionTable (transposition_backend="dict")."""
+
+
+class _JournalingCompactTable(_JournalingMixin, CompactTranspositionTable):
+    """Journaling CompactTranspositionTable (transposition_backend="compact")."""
+
+
+@dataclass
+class _ForkedChild:
+    """Parent-side handle for a forked subtree."""
+    pid: int
+    fd: int
+    buffer: bytearray = field(default_factory=bytearray)
+
+
+# =============================================================================
+# FORK ENUMERATION ENGINE
+# =============================================================================
+
+class ForkEnumerationEngine(EnumerationEngine):
+    """EnumerationEngine that snapshots branch points with os.fork().
+
+    Args:
+        lib, main_deck, extra_deck: As for EnumerationEngine.
+        max_forks: Maximum concurrently running forked children across the
+            whole process tree (default: CPU count).
+        max_fork_depth: Deepest node depth that still forks (None = no
+            limit). Deeper nodes fall back to replay.
+        **kwargs: Passed through to EnumerationEngine.
+    """
+
+    def __init__(self, lib, main_deck, extra_deck, max_forks: Optional[int] = None,
+                 max_fork_depth: Optional[int] = None, **kwargs):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("snapshot mode 'fork' requires os.fork() (POSIX only)")
+        super().__init__(lib, main_deck, extra_deck, **kwargs)
+
+        self.max_forks = max_forks or os.cpu_count() or 1
+        self.max_fork_depth = max_fork_depth
+        self.forks_created = 0
+        self.forks_failed = 0
+
+        self._fork_slots = None                         # Shared semaphore (set per run)
+        self._children: Dict[int, _ForkedChild] = {}    # read fd -> child
+        self._result_fd: Optional[int] = None           # Set in forked children
+
+    def _new_transposition_table(self):
+        if self.transposition_backend == "compact":
+            return _JournalingCompactTable(max_size=1_000_000, eviction_policy=self.eviction_policy)
+        return _JournalingTable(max_size=1_000_000, eviction_policy=self.eviction_policy)
+
+    def replay_stats(self) -> Dict[str, Any]:
+        stats = super().replay_stats()
+        stats["snapshot_mode"] = "fork"
+        stats["forks_created"] = self.forks_created
+        stats["forks_failed"] = self.forks_failed
+        return stats
+
+    def _run_search(self):
+        self.forks_created = 0
+        self.forks_failed = 0
+        self._fork_slots = mp.Semaphore(self.max_forks)
+        try:
+            super()._run_search()
+        finally:
+            self._wait_for_children()
+            self._fork_slots = None
+
+    # =========================================================================
+    # BRANCHING
+    # =========================================================================
+
+    def _recurse(self, action_history: ActionHistory):
+        """Explore a child, forking when the parent sits at a branch point."""
+        depth = len(action_history)
+        node = self._spine[-1] if self._spine else None
+        parent_duel = node.duel if node is not None else None
+
+        if (parent_duel is None
+                or self._frontier_depth is not None
+                or self._deadline is not None
+                or self.cutoffs is not None or self._deepening
+                or action_history[-1].message_type not in FORK_MESSAGE_TYPES
+                or (self.max_fork_depth is not None and depth - 1 > self.max_fork_depth)
+                or depth >= self.max_depth):
+            super()._recurse(action_history)
+            return
+
+        if ce._shutdown_requested or self.paths_explored >= self.max_paths:
+            return
+
+        self._poll_children(block=False)
+        if not self._fork_slots.acquire(block=False):
+            # No slot free: explore here, as the replay backend would
+            super()._recurse(action_history)
+            return
+
+        # The child's subtree is merged later, outside this state's frame
+        self._mark_cut()
+        self._fork_child(action_history, parent_duel)
+
+    def _fork_child(self, action_history: ActionHistory, parent_duel):
+        """Fork a process that explores action_history from parent_duel.
+
+        The caller has acquired a fork slot; the child releases it when
+        reaped (or here, if fork() fails).
+        """
+        read_fd, write_fd = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        try:
+            pid = os.fork()
+        except OSError as e:
+            os.close(read_fd)
+            os.close(write_fd)
+            self._fork_slots.release()
+            self.forks_failed += 1
+            self.log(f"fork() failed ({e}), replaying instead", len(action_history))
+            self._enumerate_recursive(action_history)
+            return
+
+        if pid == 0:
+            os.close(read_fd)
+            self._run_child(action_history, parent_duel, write_fd)  # Never returns
+
+        os.close(write_fd)
+        self.forks_created += 1
+        self._children[read_fd] = _ForkedChild(pid=pid, fd=read_fd)
+
+    def _run_child(self, action_history: ActionHistory, duel, write_fd: int):
+        """Body of a forked child. Exits the process when done."""
+        exit_code = 0
+        try:
+            # The duel is our copy-on-write snapshot; the parent keeps its own
+            self._spine[-1].duel = None
+            self._children = {}
+            self._result_fd = write_fd
+            baseline = {name: getattr(self, name) for name in _MERGED_COUNTERS}
+            self.transposition_table.journal = []
+
+            action = action_history[-1]
+            self.lib.OCG_DuelSetResponse(duel, action.response_bytes, len(action.response_bytes))
+            self._enumerate_recursive(action_history, duel)
+            self._wait_for_children()
+
+            self._flush_states()
+            counters = {name: getattr(self, name) - baseline[name] for name in _MERGED_COUNTERS}
+            counters["max_depth_seen"] = self.max_depth_seen
+            self._send(("done", counters))
+        except BaseException:
+            exit_code = 1
+            try:
+                self._send(("error", traceback.format_exc()))
+            except OSError:
+                pass
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(exit_code)
+
+    # =========================================================================
+    # RESULT STREAMING (child side)
+    # =========================================================================
+
+    def _send(self, record):
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        view = memoryview(_RECORD_HEADER.pack(len(payload)) + payload)
+        while view:
+            written = os.write(self._result_fd, view)
+            view = view[written:]
+
+    def _flush_states(self):
+        journal = self.transposition_table.journal
+        if journal:
+            self._send(("states", journal))
+            self.transposition_table.journal = []
+
+    def _record_terminal(self, action_history: ActionHistory, reason: str, duel=None):
+        recorded = len(self.terminals)
+        super()._record_terminal(action_history, reason, duel=duel)
+        if self._result_fd is not None and len(self.terminals) > recorded:
+            self._flush_states()
+            self._send(("terminal", self.terminals[-1]))
+
+    # =========================================================================
+    # RESULT COLLECTION (parent side)
+    # =========================================================================
+
+    def _poll_children(self, block: bool):
+        """Read whatever forked children have sent.
+
+        Args:
+            block: Wait until at least one child has data or has exited.
+        """
+        if not self._children:
+            return
+        ready, _, _ = select.select(list(self._children), [], [], None if block else 0)
+        for fd in ready:
+            self._read_child(self._children[fd])
+
+    def _wait_for_children(self):
+        """Collect every outstanding child of this process."""
+        while self._children:
+            self._poll_children(block=True)
+
+    def _read_child(self, child: _ForkedChild):
+        """Read one chunk from a child's pipe, reaping it at EOF."""
+        chunk = os.read(child.fd, _READ_CHUNK)
+        if chunk:
+            child.buffer += chunk
+            self._consume_records(child)
+            return
+
+        os.close(child.fd)
+        del self._children[child.fd]
+        _, status = os.waitpid(child.pid, 0)
+        self._fork_slots.release()
+        if status != 0:
+            logger.warning(f"Forked enumeration child {child.pid} exited with status {status}")
+
+    def _consume_records(self, child: _ForkedChild):
+        buffer = child.buffer
+        offset = 0
+        header = _RECORD_HEADER.size
+        while len(buffer) - offset >= header:
+            (length,) = _RECORD_HEADER.unpack_from(buffer, offset)
+            if len(buffer) - offset - header < length:
+                break
+            start = offset + header
+            self._merge_record(pickle.loads(buffer[start:start + length]))
+            offset = start + length
+        del buffer[:offset]
+
+    def _merge_record(self, record):
+        kind, payload = record
+        if kind == "terminal":
+            self._accept_terminal(payload)
+        elif kind == "states":
+            for state_hash, depth, remaining, best in payload:
+                # A child stores a state when it starts and again when its
+                # subtree is done; a completed subtree replaces either
+                if state_hash not in self.transposition_table or remaining is None:
+                    self.transposition_table.store(state_hash, TranspositionEntry(
+                        state_hash=state_hash,
+                        best_terminal_hash="",
+                        best_terminal_value=best,
+                        creation_depth=depth,
+                        visit_count=1,
+                        remaining_depth=remaining,
+                    ))
+        elif kind == "done":
+            for name in _MERGED_COUNTERS:
+                setattr(self, name, getattr(self, name) + payload[name])
+            self.max_depth_seen = max(self.max_depth_seen, payload["max_depth_seen"])
+        elif kind == "error":
+            logger.warning(f"Forked enumeration child failed:\n{payload}")
+
+    def _accept_terminal(self, terminal: TerminalState):
+        """Record a terminal found by a child, deduplicating against ours."""
+        board_hash = terminal.board_hash
+        if board_hash is not None:
+            self.terminal_boards.setdefault(board_hash, []).append(terminal.history)
+            if self.dedupe_boards:
+                if board_hash in self.seen_board_sigs:
+                    self.duplicate_boards_skipped += 1
+                    return
+                self.seen_board_sigs.add(board_hash)
+
+        self.terminals.append(terminal)
+        if self._result_fd is not None:
+            self._flush_states()
+            self._send(("terminal", terminal))
+
+
+__all__ = [
+    'SNAPSHOT_MODES',
+    'DEFAULT_SNAPSHOT_MODE',
+    'FORK_MESSAGE_TYPES',
+    'ForkEnumerationEngine',
+]
@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo tree search over IDLE decisions.
+
+Best-first and beam search rank nodes by the board they are sitting on,
+which says little about where a 25-action line is going. MCTSEngine
+estimates that instead: it samples lines to the end (rollouts) and keeps
+visit and value statistics per IDLE node, steering later iterations (UCT)
+towards the nodes whose rollouts scored best.
+
+Each iteration:
+
+    1. Select: from the root, follow the child with the best UCT value
+       (mean rollout value normalized to the values seen so far, plus
+       exploration * sqrt(ln N_parent / N_child)); unvisited children
+       come first, best scorer prior first.
+    2. Expand: the first time a visited leaf is selected, branch on all of
+       its IDLE actions exactly as BestFirstEngine expands a node. The
+       SELECT_* prompts after each action are followed depth-first and
+       every IDLE node reached becomes a child (its PASS terminal is
+       recorded as usual).
+    3. Roll out: from the new leaf, play one random line to PASS,
+       DUEL_END or MAX_DEPTH. Every prompt is answered by the rollout
+       policy: "random" (uniform) or "roles" (actions weighted by the
+       CardRole of their card, see cards/roles.py).
+    4. Back up: the rollout terminal's evaluate_board_quality score is
+       added to every node on the path.
+
+Statistics live in a node table keyed by intermediate-state Zobrist hash
+(board + available actions, as in the transposition table), so lines that
+transpose into the same state share one node. A node whose children are
+all exhausted is exhausted itself; the search stops early once the root
+is.
+
+The search is anytime: stop it with an iteration budget, a time budget,
+MAX_PATHS or any StoppingCondition, and best_terminal is the best board
+found so far. Every improvement is appended to self.curve. With
+rollout_workers > 1 each iteration selects a batch of leaves (virtual
+loss keeps them apart) and rolls them out in a forked process pool.
+
+Usage:
+    engine = MCTSEngine(lib, main_deck, extra_deck, iterations=5000,
+                        rollout_policy="roles", rollout_workers=8)
+    engine.enumerate_from_hand(hand)
+    print(engine.best_tier, engine.best_terminal.action_sequence)
+"""
+
+import logging
+import math
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import combo_enumeration as ce
+from .best_first import BestFirstEngine
+from .cards.roles import CardRole, CardRoleClassifier, create_fiendsmith_classifier
+from .combo_enumeration import _SpineNode
+from .engine.board_bits import BoardBits
+from .types import Action, ActionHistory, TerminalState
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# How rollouts pick among the alternatives at each prompt (CLI --rollout-policy)
+ROLLOUT_POLICIES = ("random", "roles")
+DEFAULT_ROLLOUT_POLICY = "random"
+
+DEFAULT_ITERATIONS = 1000
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+
+# =============================================================================
+# NODE TABLE
+# =============================================================================
+
+@dataclass
+class MCTSNode:
+    """Search statistics for one intermediate state.
+
+    Shared by every line that reaches the state; history is the first one
+    found and is what expansions and rollouts replay.
+    """
+    history: ActionHistory
+    prior: float                          # Scorer value (orders unvisited children)
+    board_value: float                    # Score of passing here
+    visits: int = 0
+    value_sum: float = 0.0
+    best_value: float = float("-inf")
+    virtual: int = 0                      # Pending rollouts in the current batch
+    children: Optional[List[int]] = None  # Child state hashes, None until expanded
+    exhausted: bool = False               # Expanded and every child exhausted
+
+    @property
+    def mean_value(self) -> float:
+        return self.value_sum / self.visits if self.visits else 0.0
+
+
+# =============================================================================
+# MCTS ENGINE
+# =============================================================================
+
+class MCTSEngine(BestFirstEngine):
+    """UCT search over IDLE nodes with rollouts to the end of the turn.
+
+    Args:
+        lib, main_deck, extra_deck: As for EnumerationEngine.
+        iterations: Rollouts to run (None = until another budget ends the
+            search).
+        time_budget: Wall-clock seconds to search (None = no limit).
+        exploration: UCT exploration constant.
+        rollout_policy: One of ROLLOUT_POLICIES.
+        classifier: CardRoleClassifier for the "roles" policy (default:
+            the Fiendsmith classifier).
+        rollout_workers: Rollouts run in parallel per batch (1 = in this
+            process, no pool).
+        seed: Seed for selection tie-breaks and rollouts.
+        **kwargs: Passed through to BestFirstEngine (scorer,
+            stopping_conditions, evaluator, ...). The scorer supplies the
+            prior that orders unvisited children.
+    """
+
+    search_mode = "mcts"
+
+    # Rollout weight of an action by the role of its card ("roles" policy)
+    ROLE_WEIGHTS = {CardRole.PAYOFF: 8.0, CardRole.EXTENDER: 4.0, CardRole.STARTER: 4.0}
+    DEFAULT_WEIGHT = 1.0
+    PASS_WEIGHT = 1.0
+
+    def __init__(self, lib, main_deck, extra_deck,
+                 iterations: Optional[int] = DEFAULT_ITERATIONS,
+                 time_budget: Optional[float] = None,
+                 exploration: float = DEFAULT_EXPLORATION,
+                 rollout_policy: str = DEFAULT_ROLLOUT_POLICY,
+                 classifier: Optional[CardRoleClassifier] = None,
+                 rollout_workers: int = 1,
+                 seed: Optional[int] = None, **kwargs):
+        if rollout_policy not in ROLLOUT_POLICIES:
+            raise ValueError(f"Unknown rollout_policy {rollout_policy!r}, expected one of {ROLLOUT_POLICIES}")
+        if iterations is not None and iterations < 1:
+            raise ValueError(f"iterations must be >= 1, got {iterations}")
+        if rollout_workers < 1:
+            raise ValueError(f"rollout_workers must be >= 1, got {rollout_workers}")
+        super().__init__(lib, main_deck, extra_deck, **kwargs)
+
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy
+        self.classifier = classifier
+        if rollout_policy == "roles" and classifier is None:
+            self.classifier = create_fiendsmith_classifier()
+        self.rollout_workers = rollout_workers
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._role_weights: Dict[int, float] = {}   # passcode -> rollout weight
+
+        self.nodes: Dict[int, MCTSNode] = {}    # Intermediate-state hash -> node
+        self._root: Optional[MCTSNode] = None
+        self._collected: List[Tuple[int, ActionHistory, Any]] = []  # IDLE nodes met while expanding
+        self._rolling_out = False
+        self._candidates: List[Tuple[ActionHistory, Optional[str]]] = []
+        self._rollout_end: Optional[str] = None
+        self._value_min: Optional[float] = None
+        self._value_max: Optional[float] = None
+
+        self.iterations_done = 0
+        self.rollouts = 0
+        self.best_terminal: Optional[TerminalState] = None
+        self.curve: List[Dict[str, Any]] = []
+        self._started = 0.0
+
+    def _reset_for_hand(self, starting_hand, prefix=None):
+        super()._reset_for_hand(starting_hand, prefix)
+        self.nodes = {}
+        self._root = None
+        self._value_min = self._value_max = None
+        self.iterations_done = 0
+        self.rollouts = 0
+        self.best_terminal = None
+        self.curve = []
+        self._started = time.monotonic()
+
+    def replay_stats(self) -> Dict[str, Any]:
+        stats = super().replay_stats()
+        stats["iterations"] = self.iterations_done
+        stats["rollouts"] = self.rollouts
+        stats["tree_nodes"] = len(self.nodes)
+        stats["rollout_policy"] = self.rollout_policy
+        stats["rollout_workers"] = self.rollout_workers
+        return stats
+
+    # =========================================================================
+    # SEARCH LOOP
+    # =========================================================================
+
+    def _run_search(self):
+        """Collect the root's IDLE nodes, then iterate until a budget runs out."""
+        self._expand_depth = None
+        self._collected = []
+        self._enumerate_recursive(ActionHistory.from_actions(self._root_prefix))
+        # Synthetic root over the IDLE nodes the root prefix leads to (usually one)
+        self._root = MCTSNode(ActionHistory.from_actions(self._root_prefix), prior=0.0, board_value=0.0)
+        self._root.children = self._adopt_children(self._collected, exclude=None)
+        self._root.exhausted = not self._root.children
+
+        stop_at = time.monotonic() + self.time_budget if self.time_budget else None
+        pool = self._open_pool() if self.rollout_workers > 1 else None
+        try:
+            while self.stopped_reason is None:
+                if self._root.exhausted:
+                    self.stopped_reason = "tree_exhausted"
+                elif self.iterations is not None and self.iterations_done >= self.iterations:
+                    self.stopped_reason = "iterations"
+                elif stop_at is not None and time.monotonic() >= stop_at:
+                    self.stopped_reason = "time_budget"
+                elif self._should_stop():
+                    self.stopped_reason = self.stopped_reason or "max_paths"
+                else:
+                    self._run_batch(pool)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        logger.info(f"MCTS stopped ({self.stopped_reason}): {self.iterations_done} iterations, "
+                    f"{len(self.nodes)} nodes, best {self.best_tier} ({self.best_score:.0f})")
+
+    def _run_batch(self, pool):
+        """Select, expand and roll out one batch of leaves, then back up."""
+        size = self.rollout_workers
+        if self.iterations is not None:
+            size = min(size, self.iterations - self.iterations_done)
+
+        batch = []
+        for _ in range(size):
+            if self._root.exhausted:
+                break
+            path, leaf_value = self._select()
+            for node in path:
+                node.virtual += 1
+            batch.append((path, leaf_value))
+
+        rollouts = [path[-1].history for path, value in batch if value is None]
+        if pool is not None and len(rollouts) > 1:
+            values = iter(self._pooled_rollouts(pool, rollouts))
+        else:
+            values = iter([self._rollout(history) for history in rollouts])
+
+        for path, value in batch:
+            if value is None:
+                value = next(values)
+                self.rollouts += 1
+                if value is None:
+                    # Dead end (no answerable prompt): score the leaf itself
+                    value = path[-1].board_value
+            self._backpropagate(path, value)
+            self.iterations_done += 1
+
+    # =========================================================================
+    # SELECTION / EXPANSION / BACKUP
+    # =========================================================================
+
+    def _select(self) -> Tuple[List[MCTSNode], Optional[float]]:
+        """Walk down by UCT and expand the leaf if it has been visited.
+
+        Returns:
+            (path from the root, value) where value is None if the leaf
+            needs a rollout, or the value to back up for an exhausted leaf.
+        """
+        node = self._root
+        path = [node]
+        on_path = set()
+        while True:
+            if node.children is None:
+                if node.visits + node.virtual == 0:
+                    return path, None
+                self._expand_node(node)
+
+            live = [h for h in node.children if h not in on_path and not self.nodes[h].exhausted]
+            if not live:
+                # Every line from here has been searched (or loops back)
+                node.exhausted = True
+                return path, max(node.best_value, node.board_value)
+
+            fresh = [h for h in live if self.nodes[h].visits + self.nodes[h].virtual == 0]
+            if fresh:
+                child = max(fresh, key=lambda h: self.nodes[h].prior)
+            else:
+                log_n = math.log(node.visits + node.virtual)
+                child = max(live, key=lambda h: self._uct(self.nodes[h], log_n))
+            on_path.add(child)
+            node = self.nodes[child]
+            path.append(node)
+
+    def _uct(self, node: MCTSNode, log_n: float) -> float:
+        """UCT value; pending (virtual) visits count as the worst value seen."""
+        n = node.visits + node.virtual
+        if self._value_min is None:
+            # Nothing backed up yet (only pending visits)
+            return self.exploration * math.sqrt(log_n / n)
+        span = (self._value_max - self._value_min) or 1.0
+        exploit = (node.value_sum - self._value_min * node.visits) / span / n
+        return exploit + self.exploration * math.sqrt(log_n / n)
+
+    def _expand_node(self, node: MCTSNode):
+        """Branch on every IDLE action of node and link the IDLE nodes reached."""
+        self._collected = []
+        self._expand(node.history)
+        node.children = self._adopt_children(self._collected, exclude=node)
+
+    def _adopt_children(self, collected, exclude: Optional[MCTSNode]) -> List[int]:
+        """Child hashes for collected IDLE nodes, adding new ones to the table."""
+        children = []
+        for state_hash, history, sig in collected:
+            node = self.nodes.get(state_hash)
+            if node is None:
+                node = self.nodes[state_hash] = MCTSNode(
+                    history, prior=self.scorer(sig), board_value=self.evaluator.evaluate(sig)["score"])
+            if node is not exclude and state_hash not in children:
+                children.append(state_hash)
+        self._collected = []
+        return children
+
+    def _backpropagate(self, path: List[MCTSNode], value: float):
+        if self._value_min is None:
+            self._value_min = self._value_max = value
+        self._value_min = min(self._value_min, value)
+        self._value_max = max(self._value_max, value)
+
+        for node in reversed(path):
+            node.virtual -= 1
+            node.visits += 1
+            node.value_sum += value
+            node.best_value = max(node.best_value, value)
+            if node.children and not node.exhausted:
+                node.exhausted = all(self.nodes[h].exhausted for h in node.children)
+
+    def principal_line(self) -> List[ActionHistory]:
+        """Histories of the most visited child at each level from the root."""
+        line = []
+        node, seen = self._root, set()
+        while node is not None and node.children:
+            visited = [h for h in node.children if h not in seen and self.nodes[h].visits]
+            if not visited:
+                break
+            best = max(visited, key=lambda h: self.nodes[h].visits)
+            seen.add(best)
+            node = self.nodes[best]
+            line.append(node.history)
+        return line
+
+    # =========================================================================
+    # ENGINE HOOKS
+    # =========================================================================
+
+    def _handle_idle(self, duel, action_history: ActionHistory, idle_data: dict):
+        """Branch when expanding or rolling out; otherwise collect the IDLE node as a child."""
+        depth = len(action_history)
+        if self._rolling_out or depth == self._expand_depth:
+            self._expand_depth = None
+            self._branch_idle(duel, action_history, idle_data)
+            return
+
+        sig, state_hash = self._idle_board(duel, idle_data, depth)
+        self._collected.append((state_hash, ActionHistory.of(action_history), sig))
+
+    def _recurse(self, action_history: ActionHistory):
+        if self._rolling_out:
+            self._candidates.append((action_history, None))
+            return
+        super()._recurse(action_history)
+
+    def _record_terminal(self, action_history: ActionHistory, reason: str, duel=None):
+        if self._rolling_out:
+            if reason == "PASS":
+                self._candidates.append((action_history, reason))
+            else:
+                self._rollout_end = reason
+            return
+        super()._record_terminal(action_history, reason, duel=duel)
+
+    def _score_terminal(self, terminal: TerminalState):
+        """Track the best terminal and note each improvement on the curve."""
+        best = self.best_score
+        super()._score_terminal(terminal)
+        if self.best_terminal is None or self.best_score > best:
+            self.best_terminal = terminal
+            self.curve.append({
+                "iteration": self.iterations_done,
+                "paths": self.paths_explored,
+                "seconds": round(time.monotonic() - self._started, 3),
+                "best_score": self.best_score,
+                "best_tier": self.best_tier,
+            })
+
+    # =========================================================================
+    # ROLLOUTS
+    # =========================================================================
+
+    def _rollout(self, action_history: ActionHistory) -> Optional[float]:
+        """Play one policy line from an IDLE node to the end; return its score.
+
+        Each prompt is explored with the normal handlers, which only
+        collect their alternatives (_recurse / _record_terminal) while
+        _rolling_out is set; the policy picks one and it is answered on the
+        same duel. Returns None if the line hits a prompt with no
+        alternatives.
+        """
+        duel = self._replay_to(action_history)
+        if duel is None:
+            return None
+
+        node = _SpineNode(duel)
+        self._spine.append(node)
+        self._rolling_out = True
+        try:
+            history = ActionHistory.of(action_history)
+            while True:
+                if len(history) >= self.max_depth:
+                    return self._finish_rollout(history, "MAX_DEPTH", duel)
+                node.board = None
+                self._candidates = []
+                self._rollout_end = None
+                self._explore_from_state(duel, history)
+                if self._rollout_end is not None:
+                    return self._finish_rollout(history, self._rollout_end, duel)
+                if not self._candidates:
+                    return None
+
+                history, reason = self._pick(self._candidates)
+                if reason == "PASS":
+                    return self._finish_rollout(history, reason, duel)
+                action = history[-1]
+                self.lib.OCG_DuelSetResponse(duel, action.response_bytes, len(action.response_bytes))
+                self.paths_explored += 1
+                self.max_depth_seen = max(self.max_depth_seen, len(history))
+        finally:
+            self._rolling_out = False
+            self._candidates = []
+            self._spine.pop()
+            self.lib.OCG_DestroyDuel(duel)
+
+    def _finish_rollout(self, action_history: ActionHistory, reason: str, duel) -> float:
+        """Record the rollout's terminal and return its board score."""
+        self._rolling_out = False
+        board = self._capture_board(self.lib, duel)   # Memoized: the PASS terminal reuses it
+        self._record_terminal(action_history, reason, duel=None if reason == "PASS" else duel)
+        bits = BoardBits.from_board_state(board)
+        return self.evaluator.evaluate_board(bits, bits.zobrist_hash())["score"]
+
+    def _pick(self, candidates: Sequence[Tuple[ActionHistory, Optional[str]]]):
+        if self.rollout_policy == "random":
+            return self.rng.choice(candidates)
+        weights = [self.PASS_WEIGHT if reason == "PASS" else self._action_weight(history[-1])
+                   for history, reason in candidates]
+        return self.rng.choices(candidates, weights)[0]
+
+    def _action_weight(self, action: Action) -> float:
+        code = action.card_code
+        if not code:
+            return self.DEFAULT_WEIGHT
+        weight = self._role_weights.get(code)
+        if weight is None:
+            role = self.classifier.get_role(code)
+            weight = self._role_weights[code] = self.ROLE_WEIGHTS.get(role, self.DEFAULT_WEIGHT)
+        return weight
+
+    # =========================================================================
+    # PARALLEL ROLLOUTS
+    # =========================================================================
+
+    def _open_pool(self):
+        """Fork rollout_workers processes, each with its own copy of this engine's setup."""
+        context = multiprocessing.get_context("fork")
+        return context.Pool(processes=self.rollout_workers, initializer=_rollout_worker_init,
+                            initargs=(self.rollout_engine,))
+
+    def rollout_engine(self) -> "MCTSEngine":
+        """A fresh engine configured like this one, for a rollout worker."""
+        return type(self)(
+            self.lib, self.main_deck, self.extra_deck, verbose=False,
+            dedupe_boards=False, replay_mode=self.replay_mode, idle_capture=self.idle_capture,
+            evaluator=self.evaluator, scorer=self.scorer, rollout_policy=self.rollout_policy,
+            classifier=self.classifier, max_depth=self.max_depth, max_paths=self.max_paths,
+        )
+
+    def _pooled_rollouts(self, pool, histories: List[ActionHistory]) -> List[Optional[float]]:
+        tasks = [(self._starting_hand, history.to_list(), self.rng.getrandbits(32))
+                 for history in histories]
+        values = []
+        for value, paths, terminals in pool.map(_rollout_worker, tasks):
+            self.paths_explored += paths
+            for terminal in terminals:
+                self._adopt_terminal(terminal)
+            values.append(value)
+        return values
+
+    def rollout_task(self, starting_hand: List[int], actions: List[Action],
+                     seed: int) -> Tuple[Optional[float], int, List[TerminalState]]:
+        """Run one rollout for a worker: (value, paths explored, terminals)."""
+        self._reset_for_hand(starting_hand)
+        self.rng.seed(seed)
+        value = self._rollout(ActionHistory.from_actions(actions))
+        return value, self.paths_explored, self.terminals
+
+    def _adopt_terminal(self, terminal: TerminalState):
+        """Record a terminal found by a rollout worker, deduplicated like _record_terminal."""
+        self.max_depth_seen = max(self.max_depth_seen, terminal.depth)
+        if terminal.board_hash is not None:
+            self.terminal_boards.setdefault(terminal.board_hash, []).append(terminal.action_sequence)
+            if self.dedupe_boards:
+                if terminal.board_hash in self.seen_board_sigs:
+                    self.duplicate_boards_skipped += 1
+                    return
+                self.seen_board_sigs.add(terminal.board_hash)
+        self.terminals.append(terminal)
+        self._score_terminal(terminal)
+
+
+# Rollout worker state (one engine per forked process)
+_worker_engine: Optional[MCTSEngine] = None
+
+
+def _rollout_worker_init(engine_factory: Callable[[], MCTSEngine]):
+    global _worker_engine
+    _worker_engine = engine_factory()
+
+
+def _rollout_worker(task):
+    starting_hand, actions, seed = task
+    return _worker_engine.rollout_task(starting_hand, actions, seed)
+
+
+__all__ = [
+    'ROLLOUT_POLICIES',
+    'DEFAULT_ROLLOUT_POLICY',
+    'DEFAULT_ITERATIONS',
+    'DEFAULT_EXPLORATION',
+    'MCTSNode',
+    'MCTSEngine',
+]
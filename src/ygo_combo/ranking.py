@@ -31,7 +31,9 @@ from typing import List, Dict, Any, Optional, Callable, Tuple, Union
 from enum import Enum
 
 from .types import TerminalState, Action
-from .engine.state import BoardSignature, evaluate_board_quality
+from .engine.state import BoardSignature
+from .engine.board_bits import dedupe_terminals
+from .engine.evaluator import get_evaluator
 from .engine.board_types import BoardState
 
 
@@ -168,9 +170,11 @@ class ComboRanker:
         hand = player_data.get("hand", [])
         graveyard = player_data.get("graveyard", [])
 
-        # Calculate board power using existing evaluation
-        sig = self._board_state_to_signature(board_state)
-        eval_result = evaluate_board_quality(sig)
+        # Calculate board power; boards already scored are found by Zobrist hash
+        board = board_state if isinstance(board_state, BoardState) \
+            else self._board_state_to_signature(board_state)
+        board_hash = terminal.board_hash if isinstance(terminal.board_hash, int) else None
+        eval_result = get_evaluator().evaluate_board(board, board_hash)
         board_power = eval_result["score"]
         tier = eval_result["tier"]
 
@@ -561,6 +565,7 @@ class ComboRanker:
 
 def rank_terminals(
     terminals: List[TerminalState],
+    unique_boards: bool = False,
     **ranker_kwargs
 ) -> Tuple[List[ComboScore], ComboRanker]:
     """
@@ -568,11 +573,15 @@ def rank_terminals(
 
     Args:
         terminals: List of terminal states to rank
+        unique_boards: Score only the first terminal reaching each end
+            board (compared as bitsets, see dedupe_terminals)
         **ranker_kwargs: Arguments passed to ComboRanker constructor
 
     Returns:
         Tuple of (sorted scores, ranker instance)
     """
+    if unique_boards:
+        terminals = dedupe_terminals(terminals)
     ranker = ComboRanker(**ranker_kwargs)
     scores = ranker.score_all(terminals)
     sorted_scores = ranker.sort_by(scores, SortKey.OVERALL)
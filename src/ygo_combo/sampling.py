@@ -89,6 +89,25 @@ class HandComposition:
 
         return score
 
+    def search_cost(self) -> float:
+        """
+        Relative cost of exhaustively searching a hand of this composition.
+
+        Used to schedule expensive hands first in parallel enumeration.
+        Every starter opens several lines and extenders multiply them, so
+        the search tree grows roughly geometrically with engine cards.
+        Unplayable hands end after a handful of nodes.
+        """
+        if not self.is_playable():
+            return 1.0
+
+        cost = 4.0 ** self.starters * 2.0 ** min(self.extenders, 3)
+
+        # Payoffs and utilities add a few branches to each line
+        cost *= 1.0 + 0.25 * (self.payoffs + self.utilities)
+
+        return cost
+
     def stratum_key(self) -> str:
         """String key for stratum grouping."""
         return f"S{self.starters}E{self.extenders}P{self.payoffs}U{self.utilities}G{self.garnets}X{self.unknowns}"
@@ -216,6 +235,10 @@ class StratifiedSampler:
             unknowns=counts.get(CardRole.UNKNOWN, 0),
         )
 
+    def search_cost(self, hand: Tuple[int, ...]) -> float:
+        """Relative search cost of a hand, predicted from its stratum."""
+        return self._classify_hand(hand).search_cost()
+
     def _build_strata(self) -> Dict[str, Stratum]:
         """Build strata by enumerating all hands and grouping by composition."""
         strata: Dict[str, Stratum] = {}
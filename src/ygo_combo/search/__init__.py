@@ -4,7 +4,11 @@ Search algorithms for combo enumeration.
 This module provides:
 - Iterative deepening search (iddfs.py)
 - Transposition table for memoization (transposition.py)
+- Compact array-backed transposition table (compact_transposition.py)
+- Shared-memory transposition table across workers (shared_transposition.py)
+- Persistent transposition cache across runs (persistent_transposition.py)
 - Parallel search across hands (parallel.py)
+- Node scorers for best-first and beam search (scorers.py)
 """
 
 from .iddfs import (
@@ -18,13 +22,37 @@ from .iddfs import (
     PathBudgetExhausted,
     AnyTerminalFound,
     IterativeDeepeningSearch,
+    FrontierDeepeningSearch,
 )
 
 from .transposition import (
+    EVICTION_POLICIES,
     TranspositionEntry,
     TranspositionTable,
 )
 
+from .compact_transposition import (
+    CompactTranspositionTable,
+)
+
+from .shared_transposition import (
+    SharedTranspositionTable,
+)
+
+from .persistent_transposition import (
+    PersistentTranspositionTable,
+    library_fingerprint,
+)
+
+from .scorers import (
+    SCORERS,
+    DEFAULT_SCORER,
+    BoardQualityScorer,
+    RoleProgressScorer,
+    LearnedScorer,
+    make_scorer,
+)
+
 from .parallel import (
     ParallelConfig,
     ComboResult,
@@ -47,9 +75,22 @@ __all__ = [
     'PathBudgetExhausted',
     'AnyTerminalFound',
     'IterativeDeepeningSearch',
+    'FrontierDeepeningSearch',
     # Transposition
+    'EVICTION_POLICIES',
     'TranspositionEntry',
     'TranspositionTable',
+    'CompactTranspositionTable',
+    'SharedTranspositionTable',
+    'PersistentTranspositionTable',
+    'library_fingerprint',
+    # Scorers
+    'SCORERS',
+    'DEFAULT_SCORER',
+    'BoardQualityScorer',
+    'RoleProgressScorer',
+    'LearnedScorer',
+    'make_scorer',
     # Parallel
     'ParallelConfig',
     'ComboResult',
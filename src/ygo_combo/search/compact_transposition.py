@@ -0,0 +1,391 @@
+"""
+Compact array-backed transposition table.
+
+TranspositionTable keeps a dict of TranspositionEntry dataclasses: a boxed
+key, a dataclass instance with its own __dict__, and five boxed fields per
+entry, which costs a few hundred bytes per state. CompactTranspositionTable
+stores the same information in parallel typed columns with open addressing:
+
+    keys       array('Q')  uint64   state hash (strings folded to 64 bits)
+    values     array('f')  float32  best_terminal_value
+    depths     array('B')  uint8    creation_depth + 1 (0 = empty slot)
+    visits     array('H')  uint16   visit_count (saturating)
+    remaining  array('B')  uint8    remaining_depth + 1 (0 = None, subtree complete)
+
+That is 16 bytes per slot; at the maximum load factor of MAX_LOAD the table
+costs 24 bytes per entry and never grows past its initial allocation.
+
+Differences from TranspositionTable:
+    - lookup() returns a fresh TranspositionEntry view. Mutating it does not
+      change the table (visit_count is already incremented in place).
+    - best_terminal_hash is not stored; views carry "".
+    - Depths (creation and remaining) are clamped to MAX_STORED_DEPTH and
+      visits to MAX_VISITS. A clamped remaining depth only under-reports
+      the search, so it can cause a re-search but never a wrong prune.
+    - String hashes are folded with BLAKE2b, so two strings can collide.
+
+Replacement policies (see COMPACT_EVICTION_POLICIES):
+    depth_bucketed - A store into a full table drops the shallowest entry
+                     (fewest visits within a depth) among the PROBE_WINDOW
+                     slots from the new key's home slot, then closes the
+                     gap by backward shifting. O(1) per store; the victim
+                     is only the shallowest nearby, not table-wide.
+    sorted         - As TranspositionTable's "sorted": drop the shallowest
+                     EVICT_FRACTION of the table and rehash the survivors.
+                     O(capacity) pause whenever the table fills.
+The other TranspositionTable policies need per-entry links and are not
+offered.
+
+Usage:
+    tt = CompactTranspositionTable(max_size=1_000_000)   # ~24 MB
+    if tt.lookup(state_hash) is None:
+        tt.store(state_hash, entry)
+"""
+
+import math
+import time
+from array import array
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from .shared_transposition import _key64
+from .transposition import DEFAULT_EVICTION_POLICY, TranspositionEntry
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Entries / slots at which eviction triggers (16 bytes per slot / 0.6667 = 24)
+MAX_LOAD = 0.6667
+
+MAX_STORED_DEPTH = 254      # uint8 column holds depth + 1
+MAX_VISITS = 0xFFFF         # uint16 column saturates here
+
+# Fraction of entries dropped per eviction round (as the "sorted" policy)
+EVICT_FRACTION = 0.10
+
+# Slots from the home slot searched for a victim ("depth_bucketed" policy)
+PROBE_WINDOW = 8
+
+COMPACT_EVICTION_POLICIES = ("depth_bucketed", "sorted")
+
+
+def _pack_remaining(remaining_depth: Optional[int]) -> int:
+    """remaining column value: 0 for None, else the clamped depth + 1."""
+    if remaining_depth is None:
+        return 0
+    return min(max(remaining_depth, 0), MAX_STORED_DEPTH) + 1
+
+
+def _unpack_remaining(stored: int) -> Optional[int]:
+    return stored - 1 if stored else None
+
+
+class CompactTranspositionTable:
+    """
+    Fixed-memory transposition table with the TranspositionTable API.
+
+    Attributes:
+        max_size: Maximum number of entries before eviction
+        eviction_policy: Replacement policy (see COMPACT_EVICTION_POLICIES)
+        capacity: Number of slots (max_size / MAX_LOAD)
+        hits: Number of successful lookups
+        misses: Number of failed lookups
+    """
+
+    def __init__(self, max_size: int = 1_000_000,
+                 eviction_policy: str = DEFAULT_EVICTION_POLICY):
+        """
+        Initialize the table.
+
+        Args:
+            max_size: Maximum entries before eviction triggers.
+                     Memory is allocated up front: 24 bytes per entry.
+            eviction_policy: One of COMPACT_EVICTION_POLICIES.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if eviction_policy not in COMPACT_EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction_policy {eviction_policy!r}, "
+                             f"expected one of {COMPACT_EVICTION_POLICIES}")
+        self.max_size = max_size
+        self.eviction_policy = eviction_policy
+        self.capacity = max(2, math.ceil(max_size / MAX_LOAD))
+        self._allocate()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_entries = 0
+        self.stores = 0
+        self.overwrites = 0
+        # Eviction pause times (seconds)
+        self.eviction_pause_total = 0.0
+        self.eviction_pause_max = 0.0
+
+    def _allocate(self):
+        """(Re)allocate zeroed columns and reset occupancy."""
+        self._keys = array("Q", [0]) * self.capacity
+        self._values = array("f", [0.0]) * self.capacity
+        self._depths = array("B", [0]) * self.capacity
+        self._visits = array("H", [0]) * self.capacity
+        self._remaining = array("B", [0]) * self.capacity
+        self._size = 0
+        self._depth_counts = [0] * (MAX_STORED_DEPTH + 2)   # Indexed by stored depth
+
+    def _slot(self, key: int) -> int:
+        """Slot holding key, or the empty slot where it would be inserted."""
+        keys = self._keys
+        depths = self._depths
+        capacity = self.capacity
+        i = key % capacity
+        while depths[i] and keys[i] != key:
+            i += 1
+            if i == capacity:
+                i = 0
+        return i
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the columns."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self._keys, self._values, self._depths, self._visits, self._remaining)
+        )
+
+    def lookup(self, state_hash: Union[int, str]) -> Optional[TranspositionEntry]:
+        """
+        Check if state has been explored.
+
+        Args:
+            state_hash: Zobrist hash (int) or MD5 hash (str) of the state.
+
+        Returns:
+            TranspositionEntry view if found, None otherwise.
+            Note: visit_count is incremented on hit.
+        """
+        i = self._slot(_key64(state_hash))
+        stored_depth = self._depths[i]
+        if not stored_depth:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        visits = self._visits[i]
+        if visits < MAX_VISITS:
+            visits += 1
+            self._visits[i] = visits
+        return TranspositionEntry(
+            state_hash=state_hash,
+            best_terminal_hash="",
+            best_terminal_value=self._values[i],
+            creation_depth=stored_depth - 1,
+            visit_count=visits,
+            remaining_depth=_unpack_remaining(self._remaining[i]),
+        )
+
+    def store(self, state_hash: Union[int, str], entry: TranspositionEntry):
+        """
+        Store result for a state.
+
+        Args:
+            state_hash: Zobrist hash (int) or MD5 hash (str) of the state.
+            entry: TranspositionEntry to store.
+        """
+        self.stores += 1
+        key = _key64(state_hash)
+        i = self._slot(key)
+        old_depth = self._depths[i]
+        if old_depth:
+            self.overwrites += 1
+            self._depth_counts[old_depth] -= 1
+        else:
+            if self._size >= self.max_size:
+                self._evict(key)
+                i = self._slot(key)
+            self._size += 1
+
+        stored_depth = min(max(entry.creation_depth, 0), MAX_STORED_DEPTH) + 1
+        self._keys[i] = key
+        self._values[i] = entry.best_terminal_value
+        self._depths[i] = stored_depth
+        self._visits[i] = min(max(entry.visit_count, 0), MAX_VISITS)
+        self._remaining[i] = _pack_remaining(entry.remaining_depth)
+        self._depth_counts[stored_depth] += 1
+
+    def _evict(self, key: int):
+        """Make room for key in a full table, recording the pause."""
+        if not self._size:
+            return
+        start = time.perf_counter()
+        self.evictions += 1
+        if self.eviction_policy == "depth_bucketed":
+            self._evict_window(key)
+        else:
+            self._evict_sorted()
+        self._record_pause(time.perf_counter() - start)
+
+    def _record_pause(self, seconds: float):
+        self.eviction_pause_total += seconds
+        if seconds > self.eviction_pause_max:
+            self.eviction_pause_max = seconds
+
+    def _evict_window(self, key: int):
+        """Drop the shallowest entry near key's home slot."""
+        depths, visits, capacity = self._depths, self._visits, self.capacity
+        i = key % capacity
+        victim, scanned = -1, 0
+        # The table is non-empty, so this finds an entry past an empty window
+        while scanned < PROBE_WINDOW or victim < 0:
+            if depths[i] and (victim < 0 or (depths[i], visits[i]) < (depths[victim], visits[victim])):
+                victim = i
+            scanned += 1
+            i = i + 1 if i + 1 < capacity else 0
+        self._delete_slot(victim)
+        self.evicted_entries += 1
+
+    def _delete_slot(self, j: int):
+        """Empty slot j, shifting later entries of its cluster back so every
+        remaining key is still reachable from its home slot."""
+        keys, depths, capacity = self._keys, self._depths, self.capacity
+        columns = (keys, self._values, depths, self._visits, self._remaining)
+        self._depth_counts[depths[j]] -= 1
+        self._size -= 1
+        k = j
+        while True:
+            depths[j] = 0
+            while True:
+                k = k + 1 if k + 1 < capacity else 0
+                if not depths[k]:
+                    return
+                home = keys[k] % capacity
+                # The entry at k may move to j unless its home is in (j, k]
+                if (j < k and not j < home <= k) or (j > k and k < home <= j):
+                    break
+            for column in columns:
+                column[j] = column[k]
+            j = k
+
+    def _evict_sorted(self):
+        """
+        Remove least valuable entries when full.
+
+        Same order as TranspositionTable's "sorted" policy: shallowest
+        creation_depth first, lowest visit_count within a depth,
+        EVICT_FRACTION of the entries per round. The per-depth counts pick the cut depth without sorting the
+        table; only entries at the cut depth are ranked by visits. Survivors
+        are rehashed into fresh columns, so no tombstones are needed.
+        """
+        to_remove = max(1, int(self._size * EVICT_FRACTION))
+
+        # Shallowest depth whose cumulative count reaches to_remove
+        cut_depth, below = 1, 0
+        while below + self._depth_counts[cut_depth] < to_remove:
+            below += self._depth_counts[cut_depth]
+            cut_depth += 1
+
+        depths, visits = self._depths, self._visits
+        at_cut = sorted(
+            (visits[i], i) for i in range(self.capacity) if depths[i] == cut_depth
+        )
+        dropped = {i for _, i in at_cut[:to_remove - below]}
+
+        old = (self._keys, self._values, depths, visits, self._remaining)
+        self._allocate()
+        self.evicted_entries += to_remove
+        for i in range(len(depths)):
+            stored_depth = depths[i]
+            if stored_depth > cut_depth or (stored_depth == cut_depth and i not in dropped):
+                self._insert_raw(old[0][i], old[1][i], stored_depth, old[3][i], old[4][i])
+
+    def _insert_raw(self, key: int, value: float, stored_depth: int, visits: int, remaining: int):
+        """Place a column tuple in an empty slot (used when rehashing)."""
+        i = self._slot(key)
+        self._keys[i] = key
+        self._values[i] = value
+        self._depths[i] = stored_depth
+        self._visits[i] = visits
+        self._remaining[i] = remaining
+        self._depth_counts[stored_depth] += 1
+        self._size += 1
+
+    def items(self) -> Iterator[Tuple[int, TranspositionEntry]]:
+        """Iterate (64-bit key, TranspositionEntry view) pairs."""
+        keys, values, depths, visits = self._keys, self._values, self._depths, self._visits
+        for i in range(self.capacity):
+            if depths[i]:
+                yield keys[i], TranspositionEntry(
+                    state_hash=keys[i],
+                    best_terminal_hash="",
+                    best_terminal_value=values[i],
+                    creation_depth=depths[i] - 1,
+                    visit_count=visits[i],
+                    remaining_depth=_unpack_remaining(self._remaining[i]),
+                )
+
+    def clear(self):
+        """Clear all entries and reset statistics."""
+        self._allocate()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_entries = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.eviction_pause_total = 0.0
+        self.eviction_pause_max = 0.0
+
+    def stats(self) -> dict:
+        """
+        Return cache statistics.
+
+        Returns:
+            Same keys as TranspositionTable.stats(), plus capacity and nbytes.
+        """
+        total = self.hits + self.misses
+        depth_counts: Dict[int, int] = {
+            stored_depth - 1: count
+            for stored_depth, count in enumerate(self._depth_counts)
+            if count
+        }
+        return {
+            "size": self._size,
+            "max_size": self.max_size,
+            "capacity": self.capacity,
+            "nbytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "evictions": self.evictions,
+            "evicted_entries": self.evicted_entries,
+            "eviction_policy": self.eviction_policy,
+            "eviction_pause_total_ms": self.eviction_pause_total * 1000,
+            "eviction_pause_max_ms": self.eviction_pause_max * 1000,
+            "eviction_pause_avg_ms": (
+                self.eviction_pause_total * 1000 / self.evictions if self.evictions else 0.0
+            ),
+            "depth_distribution": depth_counts,
+            "avg_depth": (
+                sum(d * c for d, c in depth_counts.items()) / self._size
+                if self._size else 0.0
+            ),
+            "max_visits": max(self._visits) if self._size else 0,
+            # Empty slots hold 0 visits, so the column sum is the entry sum
+            "avg_visits": sum(self._visits) / self._size if self._size else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """Return number of entries in the table."""
+        return self._size
+
+    def __contains__(self, state_hash: Union[int, str]) -> bool:
+        """Check if a hash exists in the table (without updating stats)."""
+        return bool(self._depths[self._slot(_key64(state_hash))])
+
+
+__all__ = [
+    'MAX_LOAD',
+    'COMPACT_EVICTION_POLICIES',
+    'CompactTranspositionTable',
+]
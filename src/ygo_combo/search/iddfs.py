@@ -29,9 +29,16 @@ Architecture:
         4. Check stopping conditions (target found, timeout, etc.)
         5. If not stopped, continue to next depth
 
-    Transposition table persists across iterations, providing:
-    - Faster re-exploration of shallow states
-    - Pruning of already-explored branches
+    Transposition table persists across iterations (engines with
+    enumerate_with_depth_limit). Each entry records the depth budget its
+    state was searched with (TranspositionEntry.remaining_depth):
+    - States whose whole subtree fit under the old limit are pruned
+    - States cut off by the old limit are expanded again, since they now
+      have more depth left; DepthResult.states_reexpanded counts them
+
+    FrontierDeepeningSearch skips the walk down from the root: it keeps
+    the nodes cut off at the previous limit and only searches below them
+    (falling back to a re-search when there are more than max_frontier).
 """
 
 from dataclasses import dataclass, field
@@ -64,6 +71,11 @@ class SearchConfig:
         require_boss: Only count terminals with boss monsters.
         early_stop_on_any: Stop on first terminal at any depth.
         verbose: Print progress updates.
+        starting_hand: Hand passed to enumerate_with_depth_limit (None = the
+            hand the engine last enumerated).
+        max_frontier: Most cut-off nodes FrontierDeepeningSearch keeps for
+            the next depth (None = no cap). A bigger frontier is dropped
+            and the next depth is re-searched from the root.
     """
     max_depth: int = 25
     min_depth: int = 1
@@ -76,6 +88,8 @@ class SearchConfig:
     require_boss: bool = False
     early_stop_on_any: bool = False
     verbose: bool = True
+    starting_hand: Optional[List[int]] = None
+    max_frontier: Optional[int] = None
 
 
 @dataclass
@@ -92,6 +106,17 @@ class DepthResult:
         paths_explored: Paths explored in this iteration.
         duration_seconds: Time spent on this depth.
         new_terminals: List of new terminal hashes found.
+        states_pruned: Transposition hits skipped in this iteration.
+        states_reexpanded: Hits searched again because the old entry was
+            cut off with less depth left.
+        research_seconds: Time spent walking back down to the previous
+            depth limit (FrontierDeepeningSearch: prefix replay, or the
+            whole re-search above the old limit).
+        expansion_seconds: Time spent searching below the previous limit
+            (FrontierDeepeningSearch only).
+        resumed: Whether this depth continued from the previous frontier.
+        frontier_size: Cut-off nodes kept for the next depth (None = the
+            frontier was over max_frontier and dropped).
     """
     depth: int
     terminals_found: int
@@ -101,6 +126,12 @@ class DepthResult:
     paths_explored: int
     duration_seconds: float
     new_terminals: List[str] = field(default_factory=list)
+    states_pruned: int = 0
+    states_reexpanded: int = 0
+    research_seconds: float = 0.0
+    expansion_seconds: float = 0.0
+    resumed: bool = False
+    frontier_size: Optional[int] = None
 
 
 @dataclass
@@ -327,7 +358,8 @@ class IterativeDeepeningSearch:
                 logger.info(
                     f"  Depth {depth}: {depth_result.terminals_found} new terminals, "
                     f"best={depth_result.best_tier} ({depth_result.best_score:.0f}), "
-                    f"{depth_result.paths_explored} paths, {depth_duration:.1f}s"
+                    f"{depth_result.paths_explored} paths, {depth_result.states_pruned} pruned, "
+                    f"{depth_result.states_reexpanded} re-expanded, {depth_duration:.1f}s"
                 )
 
             # Check stopping conditions
@@ -370,16 +402,13 @@ class IterativeDeepeningSearch:
         """
         Run enumeration at a specific depth limit.
 
-        The engine's transposition table is preserved, so previously
-        explored states will be skipped (hit in cache).
+        The engine's transposition table is preserved, so states already
+        searched with enough depth will be skipped (hit in cache).
         """
-        pre_terminal_count = len(self.all_terminal_hashes)
-        pre_paths = getattr(self.engine, 'paths_explored', 0)
-
-        # Run enumeration with depth limit
+        # Run enumeration with depth limit (engine counters restart per run)
         terminals = self._run_engine_at_depth(depth)
 
-        post_paths = getattr(self.engine, 'paths_explored', 0)
+        paths = getattr(self.engine, 'paths_explored', 0)
 
         # Process results
         new_terminals = []
@@ -421,9 +450,11 @@ class IterativeDeepeningSearch:
             terminals_total=len(self.all_terminal_hashes),
             best_score=best_score,
             best_tier=best_tier,
-            paths_explored=post_paths - pre_paths,
+            paths_explored=paths,
             duration_seconds=0.0,  # Filled in by caller
             new_terminals=new_terminals,
+            states_pruned=getattr(self.engine, 'intermediate_states_pruned', 0),
+            states_reexpanded=getattr(self.engine, 'states_reexpanded', 0),
         )
 
     def _run_engine_at_depth(self, depth: int) -> List[Dict[str, Any]]:
@@ -435,8 +466,12 @@ class IterativeDeepeningSearch:
         """
         # Try the preferred method first
         if hasattr(self.engine, 'enumerate_with_depth_limit'):
-            terminals = self.engine.enumerate_with_depth_limit(depth)
-            return [t.to_dict() if hasattr(t, 'to_dict') else t for t in terminals]
+            if self.config.starting_hand is not None:
+                terminals = self.engine.enumerate_with_depth_limit(
+                    depth, starting_hand=self.config.starting_hand)
+            else:
+                terminals = self.engine.enumerate_with_depth_limit(depth)
+            return [_terminal_record(t) for t in terminals]
 
         # Fallback: set max_depth and run
         if hasattr(self.engine, 'max_depth'):
@@ -458,7 +493,7 @@ class IterativeDeepeningSearch:
             self.engine.max_depth = old_depth
 
             terminals = getattr(self.engine, 'terminals', [])
-            return [t.to_dict() if hasattr(t, 'to_dict') else t for t in terminals]
+            return [_terminal_record(t) for t in terminals]
 
         # No compatible interface found
         raise NotImplementedError(
@@ -478,6 +513,92 @@ class IterativeDeepeningSearch:
         return sum(1 for t in self.best_terminals if t.get("has_boss", False))
 
 
+class FrontierDeepeningSearch(IterativeDeepeningSearch):
+    """
+    Iterative deepening that continues from the previous depth's frontier.
+
+    IterativeDeepeningSearch walks down from the root at every depth, so
+    each iteration pays again for every node above the new level. This
+    variant keeps the nodes cut off at the previous limit (ActionHistory
+    prefixes, sharing their common parts) and at the next depth only
+    replays each prefix and searches below it (EnumerationEngine.deepen).
+
+    When more than config.max_frontier nodes are cut, the frontier is
+    dropped and the next depth is re-searched from the root, expanding
+    the old limit's nodes as they are reached (and collecting a new
+    frontier if it fits). DepthResult records the time split between the
+    walk back down (research_seconds) and the new level (expansion_seconds).
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], Any],  # Returns EnumerationEngine
+        config: SearchConfig,
+    ):
+        super().__init__(engine_factory, config)
+        self.frontier: Optional[List[Any]] = None   # Nodes cut at the previous depth
+        self._previous_depth: Optional[int] = None
+        self._resumed = False
+
+    def _search_at_depth(self, depth: int) -> DepthResult:
+        result = super()._search_at_depth(depth)
+        result.research_seconds = self.engine.research_seconds
+        result.expansion_seconds = self.engine.expansion_seconds
+        result.resumed = self._resumed
+        result.frontier_size = None if self.frontier is None else len(self.frontier)
+        if self.config.verbose:
+            logger.info(
+                f"  Depth {depth}: {'frontier' if result.resumed else 're-search'}, "
+                f"{result.research_seconds:.1f}s re-search / {result.expansion_seconds:.1f}s new, "
+                f"{result.frontier_size if result.frontier_size is not None else 'dropped'} kept"
+            )
+        return result
+
+    def _run_engine_at_depth(self, depth: int) -> List[Dict[str, Any]]:
+        """Run engine.deepen from the kept frontier (or re-search without one)."""
+        if not hasattr(self.engine, 'deepen'):
+            raise NotImplementedError(
+                "FrontierDeepeningSearch needs an engine with deepen(). "
+                "See combo_enumeration.py for required interface."
+            )
+        if self.config.starting_hand is not None:
+            kwargs = {"starting_hand": self.config.starting_hand}
+        else:
+            kwargs = {}
+        previous = self._previous_depth
+        if previous is None:
+            previous = max(depth - self.config.depth_step, 0)
+
+        self._resumed = self.frontier is not None
+        terminals = self.engine.deepen(
+            depth,
+            frontier=self.frontier,
+            previous_depth=previous,
+            max_frontier=self.config.max_frontier,
+            **kwargs,
+        )
+        self.frontier = self.engine.cutoffs
+        self._previous_depth = depth
+        return [_terminal_record(t) for t in terminals]
+
+
+def _terminal_record(terminal) -> Dict[str, Any]:
+    """Terminal as a dict, with score, tier and has_boss from the evaluator."""
+    if not hasattr(terminal, 'to_dict'):
+        return terminal
+    record = terminal.to_dict()
+    if terminal.board_state:
+        try:
+            from ..engine.evaluator import get_evaluator
+        except ImportError:
+            from engine.evaluator import get_evaluator
+        result = get_evaluator().evaluate_board(terminal.board_state, terminal.board_hash)
+        record["score"] = result["score"]
+        record["tier"] = result["tier"]
+        record["has_boss"] = result["has_boss"]
+    return record
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -555,7 +676,8 @@ def create_depth_limited_engine(
 
     This is a helper for integration with combo_enumeration.py.
     The transposition table can be passed in to preserve state
-    across iterations.
+    across iterations (IterativeDeepeningSearch already keeps the
+    engine's own table between enumerate_with_depth_limit calls).
 
     Args:
         lib: OCG library handle.
@@ -578,11 +700,9 @@ def create_depth_limited_engine(
         verbose=False,
         dedupe_boards=True,
         dedupe_intermediate=True,
+        max_depth=max_depth,
     )
 
-    # Override max depth
-    engine.max_depth = max_depth
-
     # Use provided transposition table if given
     if transposition_table is not None:
         engine.transposition_table = transposition_table
@@ -23,22 +23,47 @@ Architecture:
         - Merges results from all workers
 
     Worker Process:
-        - Receives batch of starting hands
+        - Receives a work unit (batch of starting hands, or one hand's prefix)
         - For each hand: run DFS enumeration
         - Returns list of discovered combos
+
+    Scheduling:
+        - Hands are ordered by predicted cost (ParallelConfig.hand_cost)
+        - Units are fed to the pool a few at a time and collected in
+          completion order
+        - A hand that exceeds straggler_seconds donates its unexplored
+          subtrees as prefix units, which idle workers pick up next
+
+    Transposition sharing (optional):
+        - shared_table_entries: a shared-memory table for this run
+        - tt_cache_path: a memory-mapped file reused by later runs
+
+    Intra-hand splitting (fewer hands than workers, e.g. a fixed hand):
+        - One worker expands the hand to a frontier of action-history prefixes
+        - Each prefix is a work unit enumerated by any worker
+        - Unit results are merged back into one ComboResult per hand
 """
 
 import multiprocessing as mp
 from multiprocessing import Pool, Manager
 from dataclasses import dataclass, field, asdict
-from typing import List, Tuple, Dict, Any, Optional, FrozenSet, Callable, Set
+from typing import List, Tuple, Dict, Any, Optional, FrozenSet, Callable, Set, Iterator
 from itertools import combinations
 from pathlib import Path
 from datetime import datetime, timezone
+from collections import deque
+from contextlib import contextmanager
 import time
 import json
 import gzip
 import logging
+import os
+import queue
+
+from .shared_transposition import SharedTranspositionTable, _SlotTable
+from .persistent_transposition import (
+    DEFAULT_CACHE_ENTRIES, PersistentTranspositionTable, library_fingerprint,
+)
 
 # Configure logging for main process
 logging.basicConfig(
@@ -70,6 +95,31 @@ class ParallelConfig:
         resume: Whether to resume from existing checkpoint (default: True).
         save_results: Whether to include full ComboResult in checkpoint (default: False).
         fixed_hands: Optional list of specific hands to enumerate (bypasses C(n,k) generation).
+        split_depth: Split each hand's search tree into action-history prefixes of
+            this length and spread them across workers. None = automatic (adaptive
+            depth, only when there are fewer hands than workers); 0 = never split.
+        split_units_per_worker: Target prefix work units per worker when the
+            split depth is chosen automatically (default: 4).
+        hand_cost: Optional callable predicting the relative search cost of a
+            hand (e.g. StratifiedSampler.search_cost). Expensive hands are
+            scheduled first and in smaller work units.
+        straggler_seconds: Time budget per hand (or prefix) in a worker. When
+            it runs out, the unexplored subtrees are handed back as prefix
+            work units for idle workers (None or 0 = never split stragglers).
+        max_in_flight: Work units queued in the pool at once (default: twice
+            num_workers). Donated subtrees jump ahead of everything not yet
+            queued.
+        shared_table_entries: Slots in a shared-memory transposition table
+            consulted by every worker across hands (16 bytes per slot;
+            0 = disabled). States explored by one hand are pruned for all
+            others, so each terminal is credited to the first hand that
+            reaches it; the set of unique terminals is unchanged.
+        tt_cache_path: Persistent transposition cache file used as the
+            shared table instead (see persistent_transposition). States
+            explored by earlier runs with the same library fingerprint are
+            pruned and report the best board found below them (a "CACHED"
+            terminal). Sized by shared_table_entries when the file is
+            (re)created.
     """
     deck: List[int]
     hand_size: int = 5
@@ -84,6 +134,13 @@ class ParallelConfig:
     resume: bool = True
     save_results: bool = False
     fixed_hands: Optional[List[Tuple[int, ...]]] = None
+    split_depth: Optional[int] = None
+    split_units_per_worker: int = 4
+    hand_cost: Optional[Callable[[Tuple[int, ...]], float]] = None
+    straggler_seconds: Optional[float] = 60.0
+    max_in_flight: Optional[int] = None
+    shared_table_entries: int = 0
+    tt_cache_path: Optional[Path] = None
 
     def __post_init__(self):
         if self.num_workers is None:
@@ -116,6 +173,13 @@ class ComboResult:
         paths_explored: Number of action paths explored.
         depth_reached: Maximum depth reached during search.
         duration_ms: Time spent on this hand in milliseconds.
+        duels_created: Engine duels created for this hand (replay cost).
+        intermediate_states_pruned: Transposition table hits for this hand.
+        work_units: Prefix work units the hand was split into (1 = not split).
+        worker_id: PID of the worker that produced the result.
+        shared_table_hits: Shared transposition table hits (states pruned
+            because another hand or worker explored them).
+        shared_table_misses: Shared transposition table misses.
     """
     hand: Tuple[int, ...]
     terminal_boards: List[str]
@@ -123,6 +187,12 @@ class ComboResult:
     paths_explored: int
     depth_reached: int
     duration_ms: float
+    duels_created: int = 0
+    intermediate_states_pruned: int = 0
+    work_units: int = 1
+    worker_id: int = 0
+    shared_table_hits: int = 0
+    shared_table_misses: int = 0
 
 
 @dataclass
@@ -136,8 +206,11 @@ class ParallelResult:
         best_hand: Hand that produced the highest-scoring board.
         best_score: Highest board evaluation score.
         duration_seconds: Total wall-clock time.
-        worker_stats: Per-worker statistics.
+        worker_stats: Per-worker statistics keyed by worker PID (work units,
+            paths, shared transposition table hits/misses).
         terminal_distribution: Count of terminals per hand (histogram).
+        total_duels_created: Engine duels created across all hands.
+        total_states_pruned: Transposition table hits across all hands.
     """
     total_hands: int
     total_terminals: int
@@ -147,6 +220,8 @@ class ParallelResult:
     duration_seconds: float
     worker_stats: Dict[int, Dict[str, Any]]
     terminal_distribution: Dict[int, int] = field(default_factory=dict)
+    total_duels_created: int = 0
+    total_states_pruned: int = 0
 
 
 # =============================================================================
@@ -286,24 +361,37 @@ def load_parallel_checkpoint(path: Path) -> ParallelCheckpoint:
 _worker_deck: List[int] = []
 _worker_max_depth: int = 25
 _worker_max_paths: int = 0
+_worker_time_budget: Optional[float] = None
+_worker_shared_table = None
 _worker_engine_initialized: bool = False
 _worker_lib = None
 _worker_ffi = None
 _worker_card_db_initialized: bool = False
 
 
-def _worker_init(deck: List[int], max_depth: int, max_paths: int):
+def _worker_init(deck: List[int], max_depth: int, max_paths: int,
+                 time_budget: Optional[float] = None,
+                 shared_table_name: Optional[str] = None,
+                 shared_table_path: Optional[str] = None):
     """Initialize worker process with shared configuration.
 
     Called once per worker at pool creation time.
     Stores configuration in global variables accessible to worker function.
     """
-    global _worker_deck, _worker_max_depth, _worker_max_paths
-    global _worker_engine_initialized
+    global _worker_deck, _worker_max_depth, _worker_max_paths, _worker_time_budget
+    global _worker_shared_table, _worker_engine_initialized
 
     _worker_deck = deck
     _worker_max_depth = max_depth
     _worker_max_paths = max_paths
+    _worker_time_budget = time_budget
+    _worker_shared_table = None
+    if shared_table_path:
+        from .persistent_transposition import PersistentTranspositionTable
+        _worker_shared_table = PersistentTranspositionTable.attach(shared_table_path)
+    elif shared_table_name:
+        from .shared_transposition import SharedTranspositionTable
+        _worker_shared_table = SharedTranspositionTable.attach(shared_table_name)
     _worker_engine_initialized = False
 
 
@@ -332,17 +420,43 @@ def _init_worker_engine():
     _worker_engine_initialized = True
 
 
-def _enumerate_hand(hand: Tuple[int, ...]) -> ComboResult:
-    """Enumerate all combos from a single starting hand.
+def _combo_result(hand: Tuple[int, ...], result: Dict[str, Any], duration_ms: float) -> ComboResult:
+    """Build a ComboResult from a combo_enumeration worker result dict."""
+    return ComboResult(
+        hand=hand,
+        terminal_boards=result.get("terminal_hashes", []),
+        best_score=result.get("best_score", 0.0),
+        paths_explored=result.get("paths_explored", 0),
+        depth_reached=result.get("max_depth_reached", 0),
+        duration_ms=duration_ms,
+        duels_created=result.get("replay_stats", {}).get("duels_created", 0),
+        intermediate_states_pruned=result.get("intermediate_states_pruned", 0),
+        worker_id=os.getpid(),
+    )
 
-    This is the core worker function. It initializes the engine if needed,
-    then runs DFS enumeration from the given hand.
 
-    Args:
-        hand: Tuple of card passcodes representing the starting hand.
+def _empty_result(hand: Tuple[int, ...], duration_ms: float = 0.0) -> ComboResult:
+    """ComboResult for a hand (or work unit) whose enumeration failed."""
+    return ComboResult(
+        hand=hand,
+        terminal_boards=[],
+        best_score=0.0,
+        paths_explored=0,
+        depth_reached=0,
+        duration_ms=duration_ms,
+    )
+
+
+def _run_enumeration(
+    hand: Tuple[int, ...],
+    prefix: Optional[list] = None,
+    time_budget: Optional[float] = None,
+) -> Tuple[ComboResult, List[list]]:
+    """Enumerate a hand (or the subtree below prefix) in this worker.
 
     Returns:
-        ComboResult with discovered terminals and statistics.
+        (result, donated): the ComboResult and the prefixes left unexplored
+        when time_budget ran out (empty if the search finished).
     """
     import time
     start_time = time.perf_counter()
@@ -350,6 +464,9 @@ def _enumerate_hand(hand: Tuple[int, ...]) -> ComboResult:
     # Lazy engine initialization
     _init_worker_engine()
 
+    shared = _worker_shared_table
+    shared_before = (shared.hits, shared.misses) if shared is not None else (0, 0)
+
     try:
         # Import enumeration logic (use relative import within package)
         from ..combo_enumeration import enumerate_from_hand
@@ -360,30 +477,110 @@ def _enumerate_hand(hand: Tuple[int, ...]) -> ComboResult:
             deck=_worker_deck,
             max_depth=_worker_max_depth,
             max_paths=_worker_max_paths,
+            prefix=prefix,
+            time_budget=time_budget,
+            shared_table=shared,
         )
 
         duration_ms = (time.perf_counter() - start_time) * 1000
-
-        return ComboResult(
-            hand=hand,
-            terminal_boards=result.get("terminal_hashes", []),
-            best_score=result.get("best_score", 0.0),
-            paths_explored=result.get("paths_explored", 0),
-            depth_reached=result.get("max_depth_reached", 0),
-            duration_ms=duration_ms,
-        )
+        combo = _combo_result(hand, result, duration_ms)
+        if shared is not None:
+            combo.shared_table_hits = shared.hits - shared_before[0]
+            combo.shared_table_misses = shared.misses - shared_before[1]
+        return combo, result.get("frontier", [])
 
     except Exception as e:
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.warning(f"Error enumerating hand {hand}: {e}")
-        return ComboResult(
-            hand=hand,
-            terminal_boards=[],
-            best_score=0.0,
-            paths_explored=0,
-            depth_reached=0,
-            duration_ms=duration_ms,
-        )
+        return _empty_result(hand, duration_ms), []
+
+
+def _enumerate_hand(hand: Tuple[int, ...], prefix: Optional[list] = None) -> ComboResult:
+    """Enumerate all combos from a single starting hand.
+
+    This is the core worker function. It initializes the engine if needed,
+    then runs DFS enumeration from the given hand.
+
+    Args:
+        hand: Tuple of card passcodes representing the starting hand.
+        prefix: Optional action-history prefix (a work unit from
+            _expand_hand); only the subtree below it is enumerated.
+
+    Returns:
+        ComboResult with discovered terminals and statistics.
+    """
+    result, _ = _run_enumeration(hand, prefix)
+    return result
+
+
+def _expand_hand(
+    hand: Tuple[int, ...],
+    split_depth: Optional[int],
+    min_units: int,
+) -> Tuple[ComboResult, List[list]]:
+    """Expand a hand to a frontier of prefix work units.
+
+    Args:
+        hand: Starting hand to split.
+        split_depth: Fixed frontier depth (None = adaptive).
+        min_units: Target number of prefixes for the adaptive split.
+
+    Returns:
+        (result, frontier): the ComboResult for the tree above the cut and
+        the action-history prefixes still to be enumerated.
+    """
+    start_time = time.perf_counter()
+    _init_worker_engine()
+
+    from ..combo_enumeration import expand_frontier
+
+    result = expand_frontier(
+        hand=hand,
+        deck=_worker_deck,
+        max_depth=_worker_max_depth,
+        max_paths=_worker_max_paths,
+        split_depth=split_depth,
+        min_units=min_units,
+    )
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    return _combo_result(hand, result, duration_ms), result["frontier"]
+
+
+def merge_hand_results(
+    hand: Tuple[int, ...],
+    parts: List[ComboResult],
+    duration_ms: float,
+) -> ComboResult:
+    """Merge the results of one hand's work units into a single ComboResult.
+
+    Terminal hashes are unioned (first-seen order), counters are summed and
+    best score / depth take the maximum.
+
+    Args:
+        hand: The starting hand all parts belong to.
+        parts: Result of the first piece of work on the hand (frontier
+            expansion, or the run that donated its subtrees) followed by
+            one result per prefix work unit.
+        duration_ms: Wall-clock time for the whole hand.
+
+    Returns:
+        Combined ComboResult with work_units = len(parts) - 1.
+    """
+    terminals = dict.fromkeys(h for part in parts for h in part.terminal_boards)
+    return ComboResult(
+        hand=hand,
+        terminal_boards=list(terminals),
+        best_score=max((p.best_score for p in parts), default=0.0),
+        paths_explored=sum(p.paths_explored for p in parts),
+        depth_reached=max((p.depth_reached for p in parts), default=0),
+        duration_ms=duration_ms,
+        duels_created=sum(p.duels_created for p in parts),
+        intermediate_states_pruned=sum(p.intermediate_states_pruned for p in parts),
+        work_units=len(parts) - 1,
+        worker_id=parts[0].worker_id if parts else 0,
+        shared_table_hits=sum(p.shared_table_hits for p in parts),
+        shared_table_misses=sum(p.shared_table_misses for p in parts),
+    )
 
 
 def _worker_batch(hands: List[Tuple[int, ...]]) -> List[ComboResult]:
@@ -398,6 +595,198 @@ def _worker_batch(hands: List[Tuple[int, ...]]) -> List[ComboResult]:
     return [_enumerate_hand(hand) for hand in hands]
 
 
+# =============================================================================
+# WORK SCHEDULING
+# =============================================================================
+
+@dataclass
+class WorkUnit:
+    """A piece of work for one pool task.
+
+    Attributes:
+        hands: Starting hands enumerated by this unit.
+        prefix: Action-history prefix (single-hand units only); only the
+            subtree below it is enumerated.
+        split_units: If > 0, expand the (single) hand to a frontier of
+            about this many prefixes instead of enumerating it.
+        split_depth: Fixed frontier depth for split_units (None = adaptive).
+        cost: Estimated relative cost, used for ordering.
+    """
+    hands: List[Tuple[int, ...]]
+    prefix: Optional[list] = None
+    split_units: int = 0
+    split_depth: Optional[int] = None
+    cost: float = 1.0
+
+
+def _run_work_unit(unit: WorkUnit) -> List[Tuple[ComboResult, List[list]]]:
+    """Worker entry point: run a WorkUnit.
+
+    Returns:
+        One (result, frontier) pair per hand. frontier holds the prefixes
+        still to be enumerated: the expansion frontier of a split unit, or
+        the subtrees donated by a hand that exceeded the straggler budget.
+    """
+    if unit.split_units:
+        return [_expand_hand(unit.hands[0], unit.split_depth, unit.split_units)]
+    return [_run_enumeration(hand, unit.prefix, _worker_time_budget) for hand in unit.hands]
+
+
+def _should_split(config: ParallelConfig, remaining_hands: int) -> bool:
+    """Whether hands are split into prefix work units (see ParallelConfig.split_depth)."""
+    if config.split_depth == 0:
+        return False
+    if config.split_depth is not None:
+        return True
+    return config.num_workers > 1 and remaining_hands < config.num_workers
+
+
+def plan_work_units(hands: List[Tuple[int, ...]], config: ParallelConfig) -> List[WorkUnit]:
+    """Group hands into work units, most expensive first.
+
+    Hands are ordered by config.hand_cost (descending, stable) so long
+    searches start early instead of forming the tail of the run. Units hold
+    at most config.batch_size hands and roughly the cost of batch_size
+    average hands, so expensive hands travel alone while cheap ones share
+    a task. When hands are split (see ParallelConfig.split_depth) every
+    hand becomes its own frontier-expansion unit.
+
+    Args:
+        hands: Hands still to be enumerated.
+        config: Parallel configuration.
+
+    Returns:
+        Work units in submission order.
+    """
+    if not hands:
+        return []
+
+    if _should_split(config, len(hands)):
+        min_units = max(1, config.num_workers * config.split_units_per_worker // len(hands))
+        return [
+            WorkUnit(hands=[hand], split_units=min_units, split_depth=config.split_depth)
+            for hand in hands
+        ]
+
+    if config.hand_cost is None:
+        costs = [1.0] * len(hands)
+        ordered = list(zip(hands, costs))
+    else:
+        ordered = sorted(
+            ((hand, float(config.hand_cost(hand))) for hand in hands),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    budget = config.batch_size * sum(cost for _, cost in ordered) / len(ordered)
+
+    units: List[WorkUnit] = []
+    batch: List[Tuple[int, ...]] = []
+    batch_cost = 0.0
+    for hand, cost in ordered:
+        if batch and (len(batch) >= config.batch_size or batch_cost + cost > budget):
+            units.append(WorkUnit(hands=batch, cost=batch_cost))
+            batch, batch_cost = [], 0.0
+        batch.append(hand)
+        batch_cost += cost
+    if batch:
+        units.append(WorkUnit(hands=batch, cost=batch_cost))
+    return units
+
+
+@dataclass
+class _PendingHand:
+    """A hand whose search is spread over several work units."""
+    started: float
+    parts: List[ComboResult] = field(default_factory=list)
+    outstanding: int = 0
+
+
+def _record_worker_stats(worker_stats: Dict[int, Dict[str, Any]], result: ComboResult):
+    """Accumulate one unit's result into the per-worker statistics."""
+    stats = worker_stats.setdefault(result.worker_id, {
+        "work_units": 0,
+        "paths_explored": 0,
+        "duration_ms": 0.0,
+        "shared_table_hits": 0,
+        "shared_table_misses": 0,
+    })
+    stats["work_units"] += 1
+    stats["paths_explored"] += result.paths_explored
+    stats["duration_ms"] += result.duration_ms
+    stats["shared_table_hits"] += result.shared_table_hits
+    stats["shared_table_misses"] += result.shared_table_misses
+
+
+def _iter_scheduled_results(
+    pool,
+    units: List[WorkUnit],
+    config: ParallelConfig,
+    worker_stats: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> Iterator[List[ComboResult]]:
+    """Run work units on the pool and yield finished hands in completion order.
+
+    At most config.max_in_flight units are queued in the pool at once, so
+    the parent decides what runs next. Prefixes returned by a unit (from a
+    frontier expansion, or donated by a straggler that ran out of its time
+    budget) become new single-hand units at the front of the queue: they
+    are picked up by the next idle workers ahead of untouched hands. A hand
+    is yielded, merged, once all of its units have finished.
+    """
+    todo = deque(units)
+    finished_units: "queue.Queue" = queue.Queue()
+    pending: Dict[Tuple[int, ...], _PendingHand] = {}
+    in_flight = 0
+    max_in_flight = config.max_in_flight or config.num_workers * 2
+
+    def submit(unit: WorkUnit):
+        pool.apply_async(
+            _run_work_unit, (unit,),
+            callback=lambda outcomes: finished_units.put((unit, outcomes)),
+            error_callback=lambda error: finished_units.put((unit, error)),
+        )
+
+    while todo or in_flight:
+        while todo and in_flight < max_in_flight:
+            submit(todo.popleft())
+            in_flight += 1
+
+        unit, outcomes = finished_units.get()
+        in_flight -= 1
+        if isinstance(outcomes, BaseException):
+            logger.warning(f"Work unit for {len(unit.hands)} hand(s) failed: {outcomes}")
+            outcomes = [(_empty_result(hand), []) for hand in unit.hands]
+
+        done: List[ComboResult] = []
+        for result, frontier in outcomes:
+            if worker_stats is not None:
+                _record_worker_stats(worker_stats, result)
+            hand = result.hand
+            split = pending.get(hand)
+            if split is None:
+                if not frontier and not unit.split_units:
+                    done.append(result)  # Whole hand finished in one unit
+                    continue
+                split = pending[hand] = _PendingHand(
+                    started=time.perf_counter() - result.duration_ms / 1000
+                )
+            else:
+                split.outstanding -= 1
+
+            split.parts.append(result)
+            for prefix in reversed(frontier):
+                todo.appendleft(WorkUnit(hands=[hand], prefix=prefix, cost=unit.cost))
+            split.outstanding += len(frontier)
+
+            if split.outstanding == 0:
+                duration_ms = (time.perf_counter() - split.started) * 1000
+                done.append(merge_hand_results(hand, split.parts, duration_ms))
+                del pending[hand]
+
+        if done:
+            yield done
+
+
 # =============================================================================
 # MAIN PARALLEL ENUMERATION
 # =============================================================================
@@ -450,6 +839,8 @@ def parallel_enumerate(config: ParallelConfig) -> ParallelResult:
     terminal_counts: Dict[int, int] = {}
     completed_hands: Set[Tuple[int, ...]] = set()
     all_results: List[ComboResult] = []
+    total_duels_created = 0
+    total_states_pruned = 0
 
     # Try to load existing checkpoint
     config_hash = _config_hash(config) if config.checkpoint_path else ""
@@ -505,11 +896,18 @@ def parallel_enumerate(config: ParallelConfig) -> ParallelResult:
 
     logger.info(f"Remaining hands to process: {remaining_hands:,}")
 
-    # Split into batches
-    batches = []
-    for i in range(0, remaining_hands, config.batch_size):
-        batches.append(hands_to_process[i:i + config.batch_size])
-    logger.info(f"Split into {len(batches):,} batches of ~{config.batch_size} hands")
+    # Plan work units (expensive hands first, or one frontier expansion per hand)
+    units = plan_work_units(hands_to_process, config)
+    if _should_split(config, remaining_hands):
+        logger.info(
+            f"Splitting each hand's search tree across workers "
+            f"(split depth: {config.split_depth or 'auto'})"
+        )
+    else:
+        logger.info(f"Split into {len(units):,} work units of up to {config.batch_size} hands"
+                    f"{' (cost-ordered)' if config.hand_cost else ''}")
+    if config.straggler_seconds:
+        logger.info(f"Hands running over {config.straggler_seconds:.0f}s donate their remaining subtrees")
 
     # Create process pool with initializer
     logger.info(f"Starting {config.num_workers} worker processes")
@@ -518,30 +916,26 @@ def parallel_enumerate(config: ParallelConfig) -> ParallelResult:
     hands_since_checkpoint = 0
     last_checkpoint_time = time.perf_counter()
 
-    with Pool(
+    with _shared_table(config) as shared_table, Pool(
         processes=config.num_workers,
         initializer=_worker_init,
-        initargs=(config.deck, config.max_depth, config.max_paths_per_hand),
+        initargs=(config.deck, config.max_depth, config.max_paths_per_hand,
+                  config.straggler_seconds, *_shared_table_location(shared_table)),
     ) as pool:
 
-        # Submit all batches
-        async_results = []
-        for batch in batches:
-            async_results.append(pool.apply_async(_worker_batch, (batch,)))
-
-        # Collect results with progress tracking
+        # Collect results in completion order with progress tracking
         completed = len(completed_hands)
         last_progress = time.perf_counter()
 
-        for async_result in async_results:
-            batch_results = async_result.get()  # Blocks until batch complete
-
+        for batch_results in _iter_scheduled_results(pool, units, config, worker_stats):
             # Process batch results
             for result in batch_results:
                 all_results.append(result)
                 completed_hands.add(result.hand)
                 all_terminals.update(result.terminal_boards)
                 total_paths += result.paths_explored
+                total_duels_created += result.duels_created
+                total_states_pruned += result.intermediate_states_pruned
 
                 # Track best hand
                 if result.best_score > best_score:
@@ -608,6 +1002,14 @@ def parallel_enumerate(config: ParallelConfig) -> ParallelResult:
     logger.info(f"Completed {total_hands:,} hands in {duration:.1f}s")
     logger.info(f"Unique terminals: {len(all_terminals):,}")
     logger.info(f"Total paths explored: {total_paths:,}")
+    logger.info(f"Duels created: {total_duels_created:,} "
+                f"({total_duels_created / max(total_paths, 1):.2f} per path)")
+    logger.info(f"Intermediate states pruned: {total_states_pruned:,}")
+    if config.shared_table_entries or config.tt_cache_path:
+        shared_hits = sum(w["shared_table_hits"] for w in worker_stats.values())
+        shared_probes = shared_hits + sum(w["shared_table_misses"] for w in worker_stats.values())
+        logger.info(f"Shared transposition table: {shared_hits:,} hits "
+                    f"({shared_hits / max(shared_probes, 1):.1%} of {shared_probes:,} probes)")
     logger.info(f"Best score: {best_score:.1f}")
 
     return ParallelResult(
@@ -619,9 +1021,61 @@ def parallel_enumerate(config: ParallelConfig) -> ParallelResult:
         duration_seconds=duration,
         worker_stats=worker_stats,
         terminal_distribution=terminal_counts,
+        total_duels_created=total_duels_created,
+        total_states_pruned=total_states_pruned,
     )
 
 
+@contextmanager
+def _shared_table(config: ParallelConfig) -> Iterator[Optional[_SlotTable]]:
+    """Open the cross-worker transposition table for one run (None if disabled).
+
+    A persistent cache (config.tt_cache_path) outlives the run and is only
+    marked reusable if the run completes; a shared-memory table is
+    destroyed at the end.
+    """
+    if config.tt_cache_path:
+        fingerprint = library_fingerprint(extra={
+            "deck": sorted(config.deck),
+            "max_depth": config.max_depth,
+            "max_paths_per_hand": config.max_paths_per_hand,
+        })
+        table = PersistentTranspositionTable.open(
+            config.tt_cache_path, fingerprint,
+            capacity=config.shared_table_entries or DEFAULT_CACHE_ENTRIES,
+        )
+        logger.info(f"Transposition cache {table.path}: {table.capacity:,} slots "
+                    f"({table.nbytes / (1 << 20):.0f} MB), {table.warm_entries:,} warm entries")
+        completed = False
+        try:
+            yield table
+            completed = True
+        finally:
+            table.close(clean=completed)
+        return
+
+    if config.shared_table_entries <= 0:
+        yield None
+        return
+
+    table = SharedTranspositionTable.create(config.shared_table_entries)
+    logger.info(f"Shared transposition table: {table.capacity:,} slots "
+                f"({table.nbytes / (1 << 20):.0f} MB)")
+    try:
+        yield table
+    finally:
+        table.unlink()
+
+
+def _shared_table_location(table: Optional[_SlotTable]) -> Tuple[Optional[str], Optional[str]]:
+    """(shared_table_name, shared_table_path) worker init arguments for table."""
+    if isinstance(table, PersistentTranspositionTable):
+        return None, str(table.path)
+    if isinstance(table, SharedTranspositionTable):
+        return table.name, None
+    return None, None
+
+
 def _save_checkpoint_state(
     config: ParallelConfig,
     config_hash: str,
@@ -653,6 +1107,10 @@ def _save_checkpoint_state(
                 "paths_explored": r.paths_explored,
                 "depth_reached": r.depth_reached,
                 "duration_ms": r.duration_ms,
+                "duels_created": r.duels_created,
+                "intermediate_states_pruned": r.intermediate_states_pruned,
+                "work_units": r.work_units,
+                "shared_table_hits": r.shared_table_hits,
             }
             for r in results
         ] if save_results and results else None,
@@ -783,6 +1241,20 @@ def main():
         action="store_true",
         help="Resume from existing checkpoint"
     )
+    parser.add_argument(
+        "--shared-table-entries",
+        type=int,
+        default=0,
+        help="Slots in the cross-worker shared transposition table, 16 bytes each "
+             "(default: 0 = disabled)"
+    )
+    parser.add_argument(
+        "--tt-cache",
+        type=Path,
+        default=None,
+        help="Persistent transposition cache file reused across runs with the same "
+             "library fingerprint (replaces the shared-memory table)"
+    )
 
     args = parser.parse_args()
 
@@ -816,6 +1288,8 @@ def main():
         checkpoint_path=args.checkpoint,
         checkpoint_interval=args.checkpoint_interval,
         resume=args.resume,
+        shared_table_entries=args.shared_table_entries,
+        tt_cache_path=args.tt_cache,
     )
 
     # Run enumeration
@@ -0,0 +1,426 @@
+"""
+Persistent on-disk transposition cache reused across runs.
+
+Every enumeration starts with an empty TranspositionTable, so nightly
+re-runs over the same locked library rediscover the same intermediate
+states. PersistentTranspositionTable keeps the SharedTranspositionTable
+slot layout in a memory-mapped file instead of a shared memory segment:
+later runs (and other hands) start warm, and pool workers that attach()
+to the same file share it exactly like the shared-memory table.
+
+Unlike the shared-memory table, an entry is written when the state's
+subtree closes (record()), not when the state is first reached, and keeps
+what the search found below it: the depth budget it was searched with
+and its best terminal board. A hit (lookup()) returns that result, so a
+warm run still reports the best board below every state it prunes.
+
+Layout (all little-endian uint64):
+    header: MAGIC, capacity, state, fingerprint (4 words)
+    slots:  capacity x (check, data), as in shared_transposition
+            data = budget | (result offset + 1) << 16
+            budget = remaining depth + 1, or _COMPLETE when no depth
+            limit cut the subtree
+    <path>.results: one JSON line per best board, {"value", "board_hash",
+            "board_state"}, addressed by byte offset (0 in the offset field
+            = no board was reached below the state)
+
+The fingerprint (library_fingerprint()) hashes everything that decides
+which states are reachable and how they hash: locked_library.json, the
+Lua scripts it loads, the Zobrist key tables, and the search limits. The
+file is discarded and recreated whenever the fingerprint differs, the
+header is unreadable, or the previous run did not close it cleanly.
+
+Caveats:
+    - Subtrees closed after the search stopped early (max_paths or a
+      shutdown) are not recorded. An interrupted run never marks the file
+      clean, so the next open() discards it.
+    - Below a state an earlier run explored, a warm run reports only the
+      best board, as a "CACHED" terminal whose action sequence ends at the
+      state; the full line is in the earlier run's output.
+    - One parent process per file at a time (its pool workers may attach).
+
+Usage:
+    fingerprint = library_fingerprint(extra={"max_depth": 25})
+    table = PersistentTranspositionTable.open("cache/tt.bin", fingerprint)
+    engine = EnumerationEngine(lib, main, extra, shared_table=table)
+    ...
+    table.close()        # Marks the file clean for the next run
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from .shared_transposition import PROBE_LIMIT, _SLOT_WORDS, _WORD, _SlotTable, _key64
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+_MAGIC = 0x59474F5454463033         # "YGOTTF03"
+_HEADER = struct.Struct("<QQQ32s")  # MAGIC, capacity, state, fingerprint
+_HEADER_WORDS = _HEADER.size // _WORD
+_STATE_OPEN = 0                     # In use, or the last run crashed
+_STATE_CLEAN = 1                    # Closed after a completed run
+
+DEFAULT_CACHE_ENTRIES = 1 << 22     # 64 MB
+
+_BUDGET_BITS = 16
+_BUDGET_MASK = (1 << _BUDGET_BITS) - 1
+_COMPLETE = _BUDGET_MASK            # Subtree searched without a depth cut
+
+# Zobrist probes folded into the fingerprint: if the key tables change (or
+# are not reproducible between processes), cached keys are meaningless
+_ZOBRIST_CANARIES = ("fingerprint:action", "normal_summon_used")
+
+
+def library_fingerprint(library_path: Optional[Path] = None,
+                        scripts_path: Optional[Path] = None,
+                        extra: Optional[Dict[str, Any]] = None) -> str:
+    """Fingerprint of everything a cached state depends on.
+
+    Args:
+        library_path: Locked library JSON (default: LOCKED_LIBRARY_PATH).
+        scripts_path: ygopro-core script directory (default: from
+            YGOPRO_SCRIPTS_PATH; omitted from the hash if unset).
+        extra: Additional JSON-serializable settings that change the search,
+            e.g. deck list and depth/path limits.
+
+    Returns:
+        64-character hex digest.
+    """
+    from ..engine.paths import LOCKED_LIBRARY_PATH, get_scripts_path
+    from ..engine.interface import UTILITY_SCRIPTS
+    from ..utils.hashing import BOARD_HASH_LAYOUT, CardState, get_hasher
+
+    library_path = Path(library_path or LOCKED_LIBRARY_PATH)
+    library_bytes = library_path.read_bytes()
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(b"library\0" + library_bytes)
+
+    if scripts_path is None:
+        try:
+            scripts_path = get_scripts_path()
+        except EnvironmentError:
+            scripts_path = None
+    if scripts_path is not None:
+        codes = sorted(int(code) for code in json.loads(library_bytes).get("cards", {}))
+        names = list(UTILITY_SCRIPTS) + [f"official/c{code}.lua" for code in codes]
+        for name in names:
+            script = Path(scripts_path) / name
+            digest.update(f"script\0{name}\0".encode())
+            digest.update(script.read_bytes() if script.exists() else b"<missing>")
+
+    hasher = get_hasher()
+    digest.update(f"zobrist\0{BOARD_HASH_LAYOUT}\0".encode())
+    digest.update(hasher._get_card_key(CardState(0, 0, 0, 0, 0)).to_bytes(8, "little"))
+    digest.update(hasher._get_action_key(_ZOBRIST_CANARIES[0]).to_bytes(8, "little"))
+    digest.update(hasher._get_resource_key(_ZOBRIST_CANARIES[1]).to_bytes(8, "little"))
+
+    digest.update(b"extra\0" + json.dumps(extra or {}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class CachedResult(NamedTuple):
+    """What an earlier search found below a state (see lookup())."""
+    value: float                        # Best terminal value (-inf if none)
+    complete: bool                      # No depth limit cut the subtree
+    board_hash: Optional[int]           # Best terminal board, if any
+    board_state: Optional[Dict[str, Any]]
+    offset: Optional[int]               # Result record (pass to record())
+
+
+class PersistentTranspositionTable(_SlotTable):
+    """Transposition set in a memory-mapped file, shared across runs.
+
+    Use open() in the process that owns the run and attach() in its pool
+    workers; do not call the constructor directly.
+
+    Attributes:
+        path: Backing file.
+        capacity: Number of slots (a power of two).
+        warm_entries: Occupied slots when the file was opened (0 if new).
+        invalidated: Why an existing file was discarded, or None.
+        hits, misses, stores, replacements: Counters for this process only.
+    """
+
+    keeps_results = True
+
+    def __init__(self, path: Path, file, mm: mmap.mmap, owner: bool):
+        self.path = path
+        self._file = file
+        self._mmap = mm
+        self._owner = owner
+        self.warm_entries = 0
+        self.invalidated: Optional[str] = None
+        self._results = None                        # Opened per process (see _results_file)
+        self._results_pid: Optional[int] = None
+        self._written: Dict[int, int] = {}          # board_hash -> result offset
+
+        magic = capacity = size = 0
+        if len(mm) >= _HEADER.size:
+            magic, capacity, _, _ = _HEADER.unpack_from(mm, 0)
+            size = (_HEADER_WORDS + _SLOT_WORDS * capacity) * _WORD
+        if magic != _MAGIC or len(mm) < size:
+            mm.close()
+            file.close()
+            raise ValueError(f"{path} is not a transposition cache")
+        super().__init__(memoryview(mm)[:size].cast("Q"), _HEADER_WORDS)
+
+    @classmethod
+    def _map(cls, path: Path, owner: bool) -> "PersistentTranspositionTable":
+        file = open(path, "r+b")
+        try:
+            mm = mmap.mmap(file.fileno(), 0)
+        except (OSError, ValueError):
+            file.close()
+            raise
+        return cls(path, file, mm, owner)
+
+    @classmethod
+    def open(cls, path: Union[str, Path], fingerprint: str,
+             capacity: int = DEFAULT_CACHE_ENTRIES) -> "PersistentTranspositionTable":
+        """Open the cache at path, recreating it if it is stale.
+
+        Args:
+            path: Backing file (created with its parent directories).
+            fingerprint: library_fingerprint() of this run.
+            capacity: Slots for a new file (rounded up to a power of two).
+                An existing valid file keeps its own capacity.
+        """
+        path = Path(path)
+        expected = bytes.fromhex(fingerprint)
+        reason = "new cache"
+
+        if path.exists():
+            try:
+                table = cls._map(path, owner=True)
+            except (OSError, ValueError) as e:
+                table, reason = None, f"unreadable ({e})"
+            if table is not None:
+                _, _, state, stored = _HEADER.unpack_from(table._mmap, 0)
+                if stored != expected:
+                    reason = "library fingerprint changed"
+                elif state != _STATE_CLEAN:
+                    reason = "previous run did not finish"
+                elif not _results_path(path).exists():
+                    reason = "results file missing"
+                else:
+                    table.warm_entries = len(table)
+                    table._set_state(_STATE_OPEN)
+                    logger.info(f"Transposition cache {path}: {table.warm_entries:,} warm entries")
+                    return table
+                table._release()
+
+        cls._create(path, expected, capacity)
+        table = cls._map(path, owner=True)
+        if reason != "new cache":
+            table.invalidated = reason
+            logger.info(f"Transposition cache {path} invalidated: {reason}")
+        return table
+
+    @staticmethod
+    def _create(path: Path, fingerprint: bytes, capacity: int):
+        """Write a zeroed cache file atomically."""
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        capacity = 1 << (capacity - 1).bit_length()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        _results_path(path).write_bytes(b"")
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, capacity, _STATE_OPEN, fingerprint))
+            f.truncate(_HEADER.size + _SLOT_WORDS * _WORD * capacity)  # Sparse zeros
+        os.replace(tmp, path)
+
+    @classmethod
+    def attach(cls, path: Union[str, Path]) -> "PersistentTranspositionTable":
+        """Map a cache opened by another process (pool workers)."""
+        return cls._map(Path(path), owner=False)
+
+    def probe(self, state_hash: Union[int, str], remaining: int) -> bool:
+        """Whether state_hash was recorded with at least remaining actions left.
+
+        Read-only: entries are written by record() when a subtree closes.
+        """
+        return self._find(_key64(state_hash), remaining) is not None
+
+    def lookup(self, state_hash: Union[int, str], remaining: int) -> Optional[CachedResult]:
+        """What was found below state_hash, if it was searched with at
+        least remaining actions left (TranspositionEntry.covers)."""
+        data = self._find(_key64(state_hash), remaining)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        budget, offset = data & _BUDGET_MASK, (data >> _BUDGET_BITS) - 1
+        if offset < 0:
+            return CachedResult(float("-inf"), budget == _COMPLETE, None, None, None)
+        record = self._read_result(offset)
+        return CachedResult(record["value"], budget == _COMPLETE,
+                            record["board_hash"], record["board_state"], offset)
+
+    def result_offset(self, state_hash: Union[int, str]) -> Optional[int]:
+        """Result record of state_hash whatever its budget (None if absent or empty)."""
+        data = self._find(_key64(state_hash), 0)
+        if data is None or data >> _BUDGET_BITS == 0:
+            return None
+        return (data >> _BUDGET_BITS) - 1
+
+    def _find(self, key: int, remaining: int) -> Optional[int]:
+        """Data word of key if its budget covers remaining."""
+        words = self._words
+        for i in range(PROBE_LIMIT):
+            slot = self._base + _SLOT_WORDS * ((key + i) & self._mask)
+            slot_data = words[slot + 1]
+            if slot_data == 0:
+                return None
+            if words[slot] ^ slot_data == key:
+                budget = slot_data & _BUDGET_MASK
+                if budget == _COMPLETE or budget > remaining:
+                    return slot_data
+                return None
+        return None
+
+    def record(self, state_hash: Union[int, str], remaining: Optional[int],
+               value: float, result: Any = None):
+        """Record what searching below a state found.
+
+        Args:
+            state_hash: Zobrist hash (int) or string hash of the state.
+            remaining: Depth budget the subtree was searched with, or None
+                if no depth limit cut it.
+            value: Best terminal value below the state.
+            result: Best terminal: an object with board_hash and
+                board_state (e.g. TerminalState), the offset of a
+                CachedResult, or None.
+        """
+        if isinstance(result, int):
+            offset = result
+        elif result is not None and result.board_hash is not None:
+            offset = self._write_result(value, result)
+        else:
+            offset = -1
+        budget = _COMPLETE if remaining is None else min(remaining + 1, _COMPLETE - 1)
+        data = budget | (offset + 1) << _BUDGET_BITS
+
+        key = _key64(state_hash)
+        words = self._words
+        victim = victim_budget = None
+        for i in range(PROBE_LIMIT):
+            slot = self._base + _SLOT_WORDS * ((key + i) & self._mask)
+            slot_data = words[slot + 1]
+            if slot_data == 0:
+                victim, victim_budget = slot, 0
+                break
+            if words[slot] ^ slot_data == key:
+                if slot_data & _BUDGET_MASK > budget:
+                    return      # Already recorded with a bigger budget
+                victim, victim_budget = slot, 0
+                break
+            if victim is None or slot_data & _BUDGET_MASK < victim_budget:
+                victim, victim_budget = slot, slot_data & _BUDGET_MASK
+
+        self.stores += 1
+        if victim_budget != 0:
+            self.replacements += 1
+        words[victim + 1] = data
+        words[victim] = key ^ data
+
+    def _results_file(self):
+        """Results file opened in append mode by this process.
+
+        Forked workers reopen it, so each process appends through its own
+        file position and tell() gives the end of its own write.
+        """
+        if self._results_pid != os.getpid():
+            self._results = open(_results_path(self.path), "a+b")
+            self._results_pid = os.getpid()
+            self._written = {}
+        return self._results
+
+    def _write_result(self, value: float, terminal) -> int:
+        """Append a best-board record (once per board) and return its offset."""
+        offset = self._written.get(terminal.board_hash)
+        if offset is not None:
+            return offset
+        board = terminal.board_state
+        line = json.dumps({
+            "value": value,
+            "board_hash": terminal.board_hash,
+            "board_state": board.to_dict() if hasattr(board, "to_dict") else board,
+        }).encode() + b"\n"
+        f = self._results_file()
+        f.write(line)
+        f.flush()
+        offset = self._written[terminal.board_hash] = f.tell() - len(line)
+        return offset
+
+    def _read_result(self, offset: int) -> Dict[str, Any]:
+        f = self._results_file()
+        f.seek(offset)
+        return json.loads(f.readline())
+
+    def _set_state(self, state: int):
+        struct.pack_into("<Q", self._mmap, 2 * _WORD, state)
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for this process, plus warm-start information."""
+        stats = super().stats()
+        stats["warm_entries"] = self.warm_entries
+        stats["invalidated"] = self.invalidated
+        return stats
+
+    def flush(self):
+        """Write dirty pages back to the file."""
+        if self._words is not None:
+            self._mmap.flush()
+
+    def close(self, clean: bool = True):
+        """Unmap the file.
+
+        Args:
+            clean: Owner only. Mark the cache reusable by the next run; pass
+                False when the run did not complete so the next open()
+                discards it.
+        """
+        if self._words is None:
+            return
+        if self._owner and clean:
+            self._mmap.flush()
+            self._set_state(_STATE_CLEAN)
+        self.flush()
+        self._release()
+
+    def _release(self):
+        if self._results is not None and self._results_pid == os.getpid():
+            self._results.close()
+        self._results = None
+        self._words.release()
+        self._words = None
+        self._mmap.close()
+        self._file.close()
+
+    def __getstate__(self):
+        raise TypeError("PersistentTranspositionTable cannot be pickled; attach() by path instead")
+
+
+def _results_path(path: Path) -> Path:
+    return path.with_name(path.name + ".results")
+
+
+__all__ = [
+    'CachedResult',
+    'DEFAULT_CACHE_ENTRIES',
+    'PersistentTranspositionTable',
+    'library_fingerprint',
+]
@@ -0,0 +1,116 @@
+"""
+Node scorers for heuristic search.
+
+BestFirstEngine and BeamSearchEngine rank IDLE nodes with a scorer: any
+callable taking the node's BoardSignature and returning a float (higher is
+better). Three are provided:
+
+    BoardQualityScorer  - evaluate_board_quality score (config/evaluation_config.json)
+    RoleProgressScorer  - combo progress by card role (cards/roles.py): payoffs
+                          and extenders on the field, starters and extenders
+                          already spent to the GY or banished
+    LearnedScorer       - a trained model applied to StateEncoder features
+                          (encoding/ml.py)
+
+Usage:
+    scorer = make_scorer("roles")
+    engine = BeamSearchEngine(lib, main_deck, extra_deck, scorer=scorer)
+"""
+
+from typing import Callable, Dict, List, Optional
+
+try:
+    from ..cards.roles import CardRole, CardRoleClassifier, create_fiendsmith_classifier
+    from ..encoding.ml import StateEncoder
+    from ..engine.evaluator import BoardEvaluator, get_evaluator
+    from ..engine.state import BoardSignature
+except ImportError:
+    from cards.roles import CardRole, CardRoleClassifier, create_fiendsmith_classifier
+    from encoding.ml import StateEncoder
+    from engine.evaluator import BoardEvaluator, get_evaluator
+    from engine.state import BoardSignature
+
+
+# Scorers selectable by name (CLI --scorer); LearnedScorer needs a model
+SCORERS = ("board", "roles")
+DEFAULT_SCORER = "board"
+
+
+class BoardQualityScorer:
+    """Score a board with the compiled evaluation config."""
+
+    def __init__(self, evaluator: Optional[BoardEvaluator] = None):
+        self.evaluator = evaluator or get_evaluator()
+
+    def __call__(self, sig: BoardSignature) -> float:
+        return self.evaluator.evaluate(sig)["score"]
+
+
+class RoleProgressScorer:
+    """Score how far a combo has progressed from the roles of its cards.
+
+    Field monsters count by FIELD_WEIGHTS, cards in the GY or banished by
+    SPENT_WEIGHTS (a used starter or extender means the line has moved on).
+    """
+
+    FIELD_WEIGHTS = {CardRole.PAYOFF: 30.0, CardRole.EXTENDER: 10.0, CardRole.STARTER: 5.0}
+    SPENT_WEIGHTS = {CardRole.STARTER: 5.0, CardRole.EXTENDER: 5.0}
+
+    def __init__(self, classifier: Optional[CardRoleClassifier] = None):
+        self.classifier = classifier or create_fiendsmith_classifier()
+        self._field: Dict[int, float] = {}   # passcode -> field weight
+        self._spent: Dict[int, float] = {}   # passcode -> spent weight
+
+    def _weights(self, code: int):
+        field = self._field.get(code)
+        if field is None:
+            role = self.classifier.get_role(code)
+            field = self._field[code] = self.FIELD_WEIGHTS.get(role, 0.0)
+            self._spent[code] = self.SPENT_WEIGHTS.get(role, 0.0)
+        return field, self._spent[code]
+
+    def __call__(self, sig: BoardSignature) -> float:
+        score = 0.0
+        for code in sig.monsters:
+            score += self._weights(code)[0]
+        for code in sig.graveyard | sig.banished:
+            score += self._weights(code)[1]
+        return score
+
+
+class LearnedScorer:
+    """Score a board with a trained model.
+
+    Args:
+        model: Callable taking the StateEncoder feature dict
+            ({"card_features": [...], "global_features": [...]}) and
+            returning a float.
+        encoder: StateEncoder to use (default config if None).
+    """
+
+    def __init__(self, model: Callable[[Dict[str, List[float]]], float],
+                 encoder: Optional[StateEncoder] = None):
+        self.model = model
+        self.encoder = encoder or StateEncoder()
+
+    def __call__(self, sig: BoardSignature) -> float:
+        return float(self.model(self.encoder.encode_board_signature(sig)))
+
+
+def make_scorer(name: str, evaluator: Optional[BoardEvaluator] = None) -> Callable[[BoardSignature], float]:
+    """Build one of the named SCORERS."""
+    if name == "board":
+        return BoardQualityScorer(evaluator)
+    if name == "roles":
+        return RoleProgressScorer()
+    raise ValueError(f"Unknown scorer {name!r}, expected one of {SCORERS}")
+
+
+__all__ = [
+    'SCORERS',
+    'DEFAULT_SCORER',
+    'BoardQualityScorer',
+    'RoleProgressScorer',
+    'LearnedScorer',
+    'make_scorer',
+]
@@ -0,0 +1,250 @@
+"""
+Shared-memory transposition table for cross-worker state deduplication.
+
+TranspositionTable lives inside one engine and is reset for every hand, so
+identical intermediate states reached from different starting hands are
+re-explored by every worker. SharedTranspositionTable is a fixed-capacity
+open-addressing hash set in a multiprocessing.shared_memory segment that
+every worker (and forked child) can consult.
+
+Layout (all little-endian uint64):
+    header: MAGIC, capacity
+    slots:  capacity x (check, data)
+            data  = remaining depth + 1 (0 = empty slot)
+            check = key ^ data
+
+Entries keep the depth budget (actions left before the depth limit) the
+state was reached with. A probe only counts as a hit if that budget covers
+the probe's, the rule TranspositionEntry.covers applies locally: reached
+higher up the tree (or under a deeper limit) the state has a bigger
+subtree than the one that was explored. The slot is then rewritten with
+the bigger budget and the state is searched again.
+
+Writers do not lock. A slot is two separate 8-byte stores, so a concurrent
+reader can observe a torn slot; the check word (lockless hashing, as in
+chess engines) makes a torn slot fail verification and read as a miss.
+Concurrent writers may overwrite each other's entries. Both cases only lose
+pruning opportunities, never correctness beyond ordinary hash collisions.
+
+Keys are 64-bit Zobrist hashes. String hashes are folded to 64 bits with
+BLAKE2b. Only workers that share the parent's key tables (fork-started pool
+workers do) produce comparable keys.
+
+Usage:
+    table = SharedTranspositionTable.create(1 << 22)   # Parent, 64 MB
+    worker_table = SharedTranspositionTable.attach(table.name)
+    if worker_table.probe(state_hash, max_depth - depth):
+        ...  # Explored elsewhere, prune
+    table.unlink()
+"""
+
+import hashlib
+import struct
+from multiprocessing import shared_memory
+from typing import Dict, Union
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+_MAGIC = 0x59474F5454303031         # "YGOTT001"
+_HEADER_WORDS = 2                   # MAGIC, capacity
+_SLOT_WORDS = 2                     # check, data
+_WORD = 8
+_MASK64 = (1 << 64) - 1
+
+# Slots inspected per probe before replacing the shallowest entry
+PROBE_LIMIT = 8
+
+
+def _key64(state_hash: Union[int, str]) -> int:
+    """Fold a state hash to a 64-bit table key."""
+    if isinstance(state_hash, int):
+        return state_hash & _MASK64
+    digest = hashlib.blake2b(str(state_hash).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class _SlotTable:
+    """Open-addressing (check, data) slots over a uint64 word view.
+
+    Holds the probing logic shared by every table backed by raw memory;
+    subclasses own the storage and its header.
+
+    Attributes:
+        capacity: Number of slots (a power of two).
+        hits, misses, stores, replacements: Counters for this process only.
+        reexpanded: Misses on a present state recorded with a smaller budget.
+    """
+
+    # Whether entries carry search results (record() / lookup()) rather
+    # than being recorded by probe()
+    keeps_results = False
+
+    def __init__(self, words: memoryview, header_words: int):
+        self._words = words
+        self._base = header_words
+        self.capacity = (len(words) - header_words) // _SLOT_WORDS
+        self._mask = self.capacity - 1
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+        self.reexpanded = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of memory used by the table."""
+        return self._words.nbytes
+
+    def probe(self, state_hash: Union[int, str], remaining: int) -> bool:
+        """Look up a state and record it if absent.
+
+        Args:
+            state_hash: Zobrist hash (int) or string hash of the state.
+            remaining: Actions left before the depth limit where the state
+                was reached. When the probe window is full, the entry with
+                the smallest budget is replaced.
+
+        Returns:
+            True if the state was already present with at least remaining
+            actions left (explored elsewhere). An entry with a smaller
+            budget is raised to remaining and the probe counts as a miss.
+        """
+        key = _key64(state_hash)
+        words = self._words
+        base = self._base
+        data = remaining + 1
+
+        # Slots are never emptied, so a present key sits before the first
+        # empty slot of its window
+        victim = victim_data = None
+        for i in range(PROBE_LIMIT):
+            slot = base + _SLOT_WORDS * ((key + i) & self._mask)
+            slot_data = words[slot + 1]
+            if slot_data == 0:
+                victim, victim_data = slot, 0
+                break
+            if words[slot] ^ slot_data == key:
+                if slot_data >= data:
+                    self.hits += 1
+                    return True
+                victim, victim_data = slot, 0    # Explored with less depth left
+                self.reexpanded += 1
+                break
+            if victim is None or slot_data < victim_data:
+                victim, victim_data = slot, slot_data
+
+        self.misses += 1
+        self.stores += 1
+        if victim_data != 0:
+            self.replacements += 1
+        words[victim + 1] = data
+        words[victim] = key ^ data
+        return False
+
+    def __contains__(self, state_hash: Union[int, str]) -> bool:
+        """Check for a state without recording it or updating counters."""
+        key = _key64(state_hash)
+        words = self._words
+        for i in range(PROBE_LIMIT):
+            slot = self._base + _SLOT_WORDS * ((key + i) & self._mask)
+            slot_data = words[slot + 1]
+            if slot_data == 0:
+                return False
+            if words[slot] ^ slot_data == key:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        """Number of occupied slots (scans the whole table)."""
+        words = self._words
+        return sum(
+            1 for slot in range(self._base + 1, len(words), _SLOT_WORDS)
+            if words[slot]
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "reexpanded": self.reexpanded,
+        }
+
+
+class SharedTranspositionTable(_SlotTable):
+    """Bounded, lock-free transposition set shared between processes.
+
+    Use create() in the parent and attach() in workers; do not call the
+    constructor directly.
+
+    Attributes:
+        name: Shared memory segment name (pass to attach()).
+        capacity: Number of slots (a power of two).
+        hits, misses, stores, replacements: Counters for this process only.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+
+        header = struct.unpack_from("<QQ", shm.buf, 0)
+        if header[0] != _MAGIC:
+            raise ValueError(f"Shared memory segment {shm.name!r} is not a transposition table")
+        size = (_HEADER_WORDS + _SLOT_WORDS * header[1]) * _WORD
+        super().__init__(shm.buf[:size].cast("Q"), _HEADER_WORDS)
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedTranspositionTable":
+        """Allocate a new zeroed table with at least capacity slots."""
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        capacity = 1 << (capacity - 1).bit_length()  # Round up to a power of two
+
+        size = (_HEADER_WORDS + _SLOT_WORDS * capacity) * _WORD
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shm.buf[:size] = bytes(size)
+        struct.pack_into("<QQ", shm.buf, 0, _MAGIC, capacity)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTranspositionTable":
+        """Attach to a table created by another process.
+
+        Meant for pool workers of the creating process, which share its
+        resource tracker; only the creator unlinks the segment.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self):
+        """Detach this process from the segment."""
+        if self._words is not None:
+            self._words.release()
+            self._words = None
+            self._shm.close()
+
+    def unlink(self):
+        """Detach and destroy the segment (creator only)."""
+        self.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __getstate__(self):
+        raise TypeError("SharedTranspositionTable cannot be pickled; attach() by name instead")
+
+
+__all__ = [
+    'PROBE_LIMIT',
+    'SharedTranspositionTable',
+]
@@ -3,12 +3,33 @@ Transposition table for memoizing explored states.
 
 Uses Zobrist hashing for O(1) incremental updates when available,
 with fallback to string hashes for backwards compatibility.
+
+Replacement policies (see EVICTION_POLICIES):
+    depth_bucketed - Entries are kept in per-creation_depth FIFO buckets.
+                     A full table drops the oldest entry of the shallowest
+                     bucket: O(1) per store.
+    two_tier       - Chess-engine style. Each key hashes to a bucket of two
+                     slots: depth-preferred (kept unless a deeper or equal
+                     entry arrives, which demotes it) and always-replace.
+                     O(1) per store; collisions can evict before the table
+                     is full.
+    clock          - CLOCK approximation of LRU over a ring of keys. Entries
+                     looked up since the hand last passed get a second
+                     chance. O(1) amortized; a sweep can pass every entry
+                     once.
+    sorted         - Original policy: sort the whole table by
+                     (creation_depth, visit_count) and drop the bottom 10%.
+                     O(n log n) pause whenever the table fills.
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 import time
 
+EVICTION_POLICIES = ("depth_bucketed", "two_tier", "clock", "sorted")
+DEFAULT_EVICTION_POLICY = "depth_bucketed"
+
 
 @dataclass
 class TranspositionEntry:
@@ -25,12 +46,22 @@ class TranspositionEntry:
         creation_depth: The search depth at which this entry was created.
             Higher depth = closer to terminal = more valuable for eviction.
         visit_count: How many times we've seen this state (mutated on lookup).
+        remaining_depth: Actions of depth budget left when the state was
+            searched (None = its whole subtree was searched, no depth cut).
     """
     state_hash: Union[int, str]
     best_terminal_hash: Union[int, str]
     best_terminal_value: float
     creation_depth: int
     visit_count: int
+    remaining_depth: Optional[int] = None
+
+    def covers(self, remaining_depth: Optional[int]) -> bool:
+        """Whether a search with remaining_depth left (None = unlimited)
+        would find nothing new here."""
+        if self.remaining_depth is None:
+            return True
+        return remaining_depth is not None and self.remaining_depth >= remaining_depth
 
 
 class TranspositionTable:
@@ -46,11 +77,13 @@ class TranspositionTable:
     Attributes:
         table: Dictionary mapping state hashes to TranspositionEntry
         max_size: Maximum number of entries before eviction
+        eviction_policy: Replacement policy (one of EVICTION_POLICIES)
         hits: Number of successful lookups
         misses: Number of failed lookups
     """
 
-    def __init__(self, max_size: int = 1_000_000, track_history: bool = False):
+    def __init__(self, max_size: int = 1_000_000, track_history: bool = False,
+                 eviction_policy: str = DEFAULT_EVICTION_POLICY):
         """
         Initialize the transposition table.
 
@@ -58,9 +91,14 @@ class TranspositionTable:
             max_size: Maximum entries before eviction triggers.
                      Default 1M entries ≈ 100-200MB depending on entry size.
             track_history: If True, record size snapshots over time for analysis.
+            eviction_policy: Replacement policy, see EVICTION_POLICIES.
         """
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction_policy {eviction_policy!r}, "
+                             f"expected one of {EVICTION_POLICIES}")
         self.table: Dict[Union[int, str], TranspositionEntry] = {}
         self.max_size = max_size
+        self.eviction_policy = eviction_policy
         self.hits = 0
         self.misses = 0
         self.evictions = 0
@@ -68,6 +106,12 @@ class TranspositionTable:
         self.stores = 0
         self.overwrites = 0
 
+        # Eviction pause times (seconds)
+        self.eviction_pause_total = 0.0
+        self.eviction_pause_max = 0.0
+
+        self._reset_policy_state()
+
         # Size history tracking
         self.track_history = track_history
         self.size_history: List[Tuple[float, int]] = []  # (timestamp, size)
@@ -103,17 +147,136 @@ class TranspositionTable:
             entry: TranspositionEntry to store.
         """
         self.stores += 1
-        if state_hash in self.table:
+        previous = self.table.get(state_hash)
+        if previous is not None:
             self.overwrites += 1
-        if len(self.table) >= self.max_size:
-            self._evict()
-        self.table[state_hash] = entry
+            self.table[state_hash] = entry
+            if (self.eviction_policy == "depth_bucketed"
+                    and previous.creation_depth != entry.creation_depth):
+                del self._buckets[previous.creation_depth][state_hash]
+                self._add_to_bucket(state_hash, entry.creation_depth)
+        else:
+            if self.eviction_policy == "two_tier":
+                self._place_two_tier(state_hash, entry)
+            elif len(self.table) >= self.max_size:
+                self._evict()
+            self.table[state_hash] = entry
+            self._admit(state_hash, entry)
 
         # Record size history periodically
         if self.track_history and self.stores % self._snapshot_interval == 0:
             self._record_snapshot()
 
+    # =========================================================================
+    # REPLACEMENT POLICIES
+    # =========================================================================
+
+    def _reset_policy_state(self):
+        """Create empty bookkeeping for the replacement policy."""
+        # depth_bucketed: creation_depth -> keys in insertion order
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_depth = 0                     # No non-empty bucket is shallower
+        # two_tier: [2b] depth-preferred, [2b + 1] always-replace
+        self._tier_buckets = max(1, self.max_size // 2)
+        self._tiers: List[Optional[Union[int, str]]] = (
+            [None] * (2 * self._tier_buckets) if self.eviction_policy == "two_tier" else []
+        )
+        # clock: ring of keys with visit_count when the hand last passed
+        self._ring: List[Union[int, str]] = []
+        self._ring_visits: List[int] = []
+        self._hand = 0
+        self._free_slot: Optional[int] = None  # Ring slot freed by the last eviction
+
+    def _admit(self, state_hash: Union[int, str], entry: TranspositionEntry):
+        """Register a newly inserted key with the replacement policy."""
+        if self.eviction_policy == "depth_bucketed":
+            self._add_to_bucket(state_hash, entry.creation_depth)
+        elif self.eviction_policy == "clock":
+            if self._free_slot is None:
+                self._ring.append(state_hash)
+                self._ring_visits.append(entry.visit_count)
+            else:
+                self._ring[self._free_slot] = state_hash
+                self._ring_visits[self._free_slot] = entry.visit_count
+                self._free_slot = None
+
+    def _add_to_bucket(self, state_hash: Union[int, str], depth: int):
+        bucket = self._buckets.get(depth)
+        if bucket is None:
+            bucket = self._buckets[depth] = OrderedDict()
+        bucket[state_hash] = None
+        if depth < self._min_depth:
+            self._min_depth = depth
+
     def _evict(self):
+        """Make room for one more entry, recording the pause."""
+        if not self.table:
+            return
+
+        start = time.perf_counter()
+        self.evictions += 1
+        if self.eviction_policy == "depth_bucketed":
+            self._evict_shallowest()
+        elif self.eviction_policy == "clock":
+            self._evict_clock()
+        else:
+            self._evict_sorted()
+        self._record_pause(time.perf_counter() - start)
+
+    def _record_pause(self, seconds: float):
+        self.eviction_pause_total += seconds
+        if seconds > self.eviction_pause_max:
+            self.eviction_pause_max = seconds
+
+    def _evict_shallowest(self):
+        """Drop the oldest entry of the shallowest non-empty depth bucket."""
+        depth = self._min_depth
+        while not self._buckets.get(depth):
+            depth += 1
+        self._min_depth = depth
+        state_hash, _ = self._buckets[depth].popitem(last=False)
+        del self.table[state_hash]
+        self.evicted_entries += 1
+
+    def _evict_clock(self):
+        """Advance the clock hand to the first entry not looked up since its last pass."""
+        ring, ring_visits, table = self._ring, self._ring_visits, self.table
+        hand = self._hand
+        while True:
+            visits = table[ring[hand]].visit_count
+            if visits <= ring_visits[hand]:
+                break
+            ring_visits[hand] = visits      # Second chance
+            hand = (hand + 1) % len(ring)
+
+        del table[ring[hand]]
+        self._free_slot = hand
+        self._hand = (hand + 1) % len(ring)
+        self.evicted_entries += 1
+
+    def _place_two_tier(self, state_hash: Union[int, str], entry: TranspositionEntry):
+        """Assign a new key to its bucket, evicting a colliding entry if needed."""
+        slot = 2 * (hash(state_hash) % self._tier_buckets)
+        preferred = self._tiers[slot]
+        if preferred is None:
+            self._tiers[slot] = state_hash
+        elif entry.creation_depth >= self.table[preferred].creation_depth:
+            self._replace_tier(slot + 1, preferred)   # Demote to always-replace
+            self._tiers[slot] = state_hash
+        else:
+            self._replace_tier(slot + 1, state_hash)
+
+    def _replace_tier(self, slot: int, state_hash: Union[int, str]):
+        victim = self._tiers[slot]
+        self._tiers[slot] = state_hash
+        if victim is not None:
+            start = time.perf_counter()
+            del self.table[victim]
+            self.evictions += 1
+            self.evicted_entries += 1
+            self._record_pause(time.perf_counter() - start)
+
+    def _evict_sorted(self):
         """
         Remove least valuable entries when full.
 
@@ -124,11 +287,6 @@ class TranspositionTable:
 
         Removes bottom 10% by (creation_depth, visit_count).
         """
-        if not self.table:
-            return
-
-        self.evictions += 1
-
         # Sort by (creation_depth, visit_count) ascending
         # Remove shallow/low-visit entries first
         sorted_entries = sorted(
@@ -208,6 +366,9 @@ class TranspositionTable:
         print(f"  Overwrites:          {stats['overwrites']:>12,}")
         print(f"  Eviction rounds:     {stats['evictions']:>12,}")
         print(f"  Entries evicted:     {stats['evicted_entries']:>12,}")
+        print(f"  Eviction policy:     {stats['eviction_policy']:>12}")
+        print(f"  Max eviction pause:  {stats['eviction_pause_max_ms']:>10.3f}ms")
+        print(f"  Total pause:         {stats['eviction_pause_total_ms']:>10.3f}ms")
 
         # Depth analysis
         print(f"\n{'DEPTH ANALYSIS':^60}")
@@ -242,6 +403,10 @@ class TranspositionTable:
 
         print(f"\n{'=' * 60}\n")
 
+    def items(self):
+        """Iterate (state_hash, TranspositionEntry) pairs."""
+        return self.table.items()
+
     def clear(self):
         """Clear all entries and reset statistics."""
         self.table.clear()
@@ -251,6 +416,9 @@ class TranspositionTable:
         self.evicted_entries = 0
         self.stores = 0
         self.overwrites = 0
+        self.eviction_pause_total = 0.0
+        self.eviction_pause_max = 0.0
+        self._reset_policy_state()
         self.size_history.clear()
         self._start_time = time.time()
         self._last_snapshot_size = 0
@@ -261,7 +429,8 @@ class TranspositionTable:
 
         Returns:
             Dictionary with size, hits, misses, hit_rate, depth distribution,
-            stores, overwrites, evictions, and evicted_entries.
+            stores, overwrites, evictions, evicted_entries, the eviction
+            policy and its pause times (total, max and per-eviction average).
         """
         total = self.hits + self.misses
 
@@ -286,6 +455,12 @@ class TranspositionTable:
             "overwrites": self.overwrites,
             "evictions": self.evictions,
             "evicted_entries": self.evicted_entries,
+            "eviction_policy": self.eviction_policy,
+            "eviction_pause_total_ms": self.eviction_pause_total * 1000,
+            "eviction_pause_max_ms": self.eviction_pause_max * 1000,
+            "eviction_pause_avg_ms": (
+                self.eviction_pause_total * 1000 / self.evictions if self.evictions else 0.0
+            ),
             "depth_distribution": depth_counts,
             "avg_depth": (
                 sum(d * c for d, c in depth_counts.items()) / len(self.table)
@@ -5,12 +5,17 @@ This module contains fundamental dataclasses used across multiple submodules
 to avoid circular import issues.
 
 Types:
+    CardText: Text naming cards by passcode, rendered on first use
     Action: A single action in a combo sequence
+    ActionHistory: Immutable action path sharing its prefix with siblings
     TerminalState: A terminal state reached by PASS
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
+from typing import (
+    Callable, FrozenSet, Iterable, Iterator, List, Dict, Any, Optional, Sequence, Union,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from ygo_combo.engine.board_types import BoardState
@@ -19,6 +24,58 @@ if TYPE_CHECKING:
 HashValue = Union[str, int]
 
 
+class CardText:
+    """Text naming cards by passcode, rendered on first use.
+
+    Handlers create an Action for every branch, but card names are only
+    shown to humans. Passing CardText as an Action's description or
+    card_name defers the name lookups and formatting until the field is
+    read (logging, export, reports).
+
+    Example:
+        CardText("Special Summon {}", (code,), get_card_name)
+    """
+
+    __slots__ = ("template", "codes", "resolve")
+
+    def __init__(self, template: str, codes: Sequence[int], resolve: Callable[[int], str]):
+        """
+        Args:
+            template: str.format template with one {} per code.
+            codes: Card passcodes whose names fill the placeholders.
+            resolve: Passcode -> name lookup (e.g. get_card_name).
+        """
+        self.template = template
+        self.codes = tuple(codes)
+        self.resolve = resolve
+
+    def render(self) -> str:
+        """Look up the names and format the text."""
+        return self.template.format(*(self.resolve(code) for code in self.codes))
+
+    def __repr__(self) -> str:
+        return f"CardText({self.template!r}, {self.codes!r})"
+
+
+def card_text_property(attr: str, doc: str) -> property:
+    """Property storing str or CardText in attr, rendered once on first read.
+
+    Install it on a dataclass after the decorator has run, so the generated
+    methods and asdict() read through it.
+    """
+
+    def getter(self):
+        value = self.__dict__[attr]
+        if isinstance(value, CardText):
+            value = self.__dict__[attr] = value.render()
+        return value
+
+    def setter(self, value):
+        self.__dict__[attr] = value
+
+    return property(getter, setter, doc=doc)
+
+
 @dataclass
 class Action:
     """A single action in a combo sequence.
@@ -32,6 +89,9 @@ class Action:
         card_code: Passcode of the card involved (if applicable)
         card_name: Name of the card involved (if applicable)
         context_hash: For SELECT_CARD: hash of the prompt context
+
+    description and card_name also accept a CardText, which is rendered
+    the first time the attribute is read.
     """
     action_type: str
     message_type: int
@@ -49,6 +109,143 @@ class Action:
         return d
 
 
+# Installed after @dataclass (fields() and defaults are unaffected)
+Action.description = card_text_property("_description", "Human-readable description")
+Action.card_name = card_text_property("_card_name", "Name of the card involved")
+
+
+class ActionHistory:
+    """Immutable action path stored as a parent-pointer chain.
+
+    The search extends the current path once per branch. Copying a list
+    for every child costs O(depth) per node and every terminal kept its
+    own copy; here a child is one node pointing at its parent, so siblings
+    and the terminals below them share the common prefix.
+
+    Metadata the handlers need about the whole path is derived
+    incrementally when a node is created instead of rescanning:
+        failed_sum_codes   Card codes of SELECT_CARD actions that were
+                           immediately followed by SELECT_SUM_CANCEL
+        last_select_card   Most recent SELECT_CARD action with a card_code
+
+    Supports len(), iteration (root first), reversed(), indexing and
+    comparison with lists. Convert with to_list() when exporting.
+
+    Example:
+        history = ActionHistory.EMPTY.push(activate).push(select)
+        history[-1] is select      # O(1)
+    """
+
+    __slots__ = ("parent", "action", "depth", "failed_sum_codes", "last_select_card")
+
+    EMPTY: "ActionHistory"
+
+    def __init__(self, parent: Optional["ActionHistory"] = None, action: Optional[Action] = None):
+        """
+        Args:
+            parent: History this one extends (None for the empty history).
+            action: Last action of this history (None for the empty history).
+        """
+        self.parent = parent
+        self.action = action
+        if parent is None:
+            self.depth = 0
+            self.failed_sum_codes: FrozenSet[int] = frozenset()
+            self.last_select_card: Optional[Action] = None
+            return
+
+        self.depth = parent.depth + 1
+        self.failed_sum_codes = parent.failed_sum_codes
+        self.last_select_card = parent.last_select_card
+        if action.action_type == "SELECT_CARD" and action.card_code is not None:
+            self.last_select_card = action
+        elif action.action_type == "SELECT_SUM_CANCEL":
+            previous = parent.action
+            if (previous is not None and previous.action_type == "SELECT_CARD"
+                    and previous.card_code is not None):
+                self.failed_sum_codes = parent.failed_sum_codes | {previous.card_code}
+
+    def push(self, action: Action) -> "ActionHistory":
+        """This history followed by action (self is unchanged)."""
+        return ActionHistory(self, action)
+
+    @classmethod
+    def from_actions(cls, actions: Iterable[Action]) -> "ActionHistory":
+        """History holding actions in order."""
+        history = cls.EMPTY
+        for action in actions:
+            history = ActionHistory(history, action)
+        return history
+
+    @classmethod
+    def of(cls, actions: Union["ActionHistory", Iterable[Action]]) -> "ActionHistory":
+        """actions as an ActionHistory (returned as-is if it already is one)."""
+        if isinstance(actions, ActionHistory):
+            return actions
+        return cls.from_actions(actions)
+
+    def to_list(self) -> List[Action]:
+        """The actions as a new list, root first."""
+        actions = [None] * self.depth
+        node = self
+        for i in range(self.depth - 1, -1, -1):
+            actions[i] = node.action
+            node = node.parent
+        return actions
+
+    def copy(self) -> "ActionHistory":
+        """Histories are immutable, so a copy is the history itself."""
+        return self
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __bool__(self) -> bool:
+        return self.depth > 0
+
+    def __iter__(self) -> Iterator[Action]:
+        return iter(self.to_list())
+
+    def __reversed__(self) -> Iterator[Action]:
+        node = self
+        while node.parent is not None:
+            yield node.action
+            node = node.parent
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self.depth
+        if not 0 <= index < self.depth:
+            raise IndexError("ActionHistory index out of range")
+        node = self
+        for _ in range(self.depth - 1 - index):
+            node = node.parent
+        return node.action
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ActionHistory):
+            if self is other:
+                return True
+            return self.depth == other.depth and self.to_list() == other.to_list()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Pickled flat: no recursion on deep chains
+        return ActionHistory.from_actions, (self.to_list(),)
+
+    def __repr__(self) -> str:
+        return f"ActionHistory(depth={self.depth})"
+
+
+ActionHistory.EMPTY = ActionHistory()
+
+
 @dataclass
 class TerminalState:
     """A terminal state reached by PASS.
@@ -57,7 +254,8 @@ class TerminalState:
     (PASS action, no legal actions, or max depth reached).
 
     Attributes:
-        action_sequence: List of actions that led to this state
+        action_sequence: List of actions that led to this state (kept as
+            an ActionHistory, see history; each read returns a new list)
         board_state: Validated BoardState at termination (prevents hallucination errors)
         depth: Number of actions taken to reach this state
         state_hash: Hash of the intermediate game state
@@ -87,5 +285,27 @@ class TerminalState:
             "board_hash": self.board_hash,
         }
 
+    @property
+    def history(self) -> ActionHistory:
+        """The action path as stored (shared with other terminals)."""
+        return self.__dict__["_action_sequence"]
+
+
+def _get_action_sequence(self) -> List[Action]:
+    return self.__dict__["_action_sequence"].to_list()
+
+
+def _set_action_sequence(self, actions) -> None:
+    self.__dict__["_action_sequence"] = ActionHistory.of(actions)
+
+
+# Stored as an ActionHistory; reads return a new list
+TerminalState.action_sequence = property(
+    _get_action_sequence, _set_action_sequence,
+    doc="List of actions that led to this state",
+)
+
 
-__all__ = ['Action', 'TerminalState', 'HashValue']
+__all__ = [
+    'CardText', 'card_text_property', 'Action', 'ActionHistory', 'TerminalState', 'HashValue',
+]
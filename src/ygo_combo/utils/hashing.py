@@ -31,10 +31,12 @@ References:
     - Chess Programming Wiki: https://www.chessprogramming.org/Zobrist_Hashing
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, FrozenSet, List
+from typing import Dict, Tuple, Optional, FrozenSet, Iterable, List
 from enum import IntEnum
-import random
+import hashlib
+import sys
 
 # =============================================================================
 # CONSTANTS
@@ -84,6 +86,32 @@ POSITIONS = [
 ]
 
 
+# Dense card key tables: one row per card, indexed by
+# (location, zone_index, position, owner). CardStates outside these bounds
+# (combined location bits, deep zone indices) use a digest-derived key.
+KEY_LOCATIONS = LOCATIONS + [LOCATION_OVERLAY]
+KEY_SLOTS = 64         # zone_index 0..63 (covers GY/banished for a 60-card deck)
+KEY_OWNERS = 2
+
+_LOCATION_INDEX = {location: i for i, location in enumerate(KEY_LOCATIONS)}
+_POSITION_INDEX = {position: i for i, position in enumerate(POSITIONS)}
+_ROW_KEYS = len(KEY_LOCATIONS) * KEY_SLOTS * len(POSITIONS) * KEY_OWNERS
+
+
+def _key_offset(location: int, zone_index: int, position: int, owner: int) -> Optional[int]:
+    """Index of a card state within its card's key row, or None if out of table."""
+    loc = _LOCATION_INDEX.get(location)
+    pos = _POSITION_INDEX.get(position)
+    if loc is None or pos is None or not 0 <= zone_index < KEY_SLOTS or not 0 <= owner < KEY_OWNERS:
+        return None
+    return ((loc * KEY_SLOTS + zone_index) * len(POSITIONS) + pos) * KEY_OWNERS + owner
+
+
+# Layout of hash_board(); bump when the mapping from a BoardSignature to
+# its hash changes so persisted hashes are invalidated.
+BOARD_HASH_LAYOUT = 2
+
+
 # =============================================================================
 # STATE CHANGE REPRESENTATION
 # =============================================================================
@@ -181,6 +209,16 @@ class StateChange:
         return cls(removed=(old_state,), added=())
 
 
+def board_card_state(card_id: int, location: int) -> CardState:
+    """CardState a card in a BoardSignature zone is hashed as.
+
+    Zone-agnostic like BoardSignature: slot 0, owner 0, monsters face-up
+    attack, everything else position 0.
+    """
+    position = POS_FACEUP_ATTACK if location == LOCATION_MZONE else 0
+    return CardState(card_id, location, 0, position, 0)
+
+
 # =============================================================================
 # ZOBRIST HASHER
 # =============================================================================
@@ -189,35 +227,51 @@ class ZobristHasher:
     """
     Zobrist hash generator for YuGiOh game states.
     
-    Generates deterministic random 64-bit keys for each possible state component,
-    then combines them via XOR to produce a hash. The XOR property enables O(1)
-    incremental updates when state changes.
+    Every key is derived from a stable digest of (seed, component), so the
+    same seed gives the same keys in every process and run regardless of
+    PYTHONHASHSEED; hashes can be shared between workers and persisted.
+    Combining keys via XOR produces a hash, and the XOR property enables
+    O(1) incremental updates when state changes.
+    
+    Card keys live in dense per-card rows (array('Q') of SHAKE-128 output)
+    indexed by location x zone_index x position x owner; cards get a
+    deck-local index the first time they are seen (or via register_cards),
+    so a lookup is two indexings. Action and resource keys are 64-bit
+    BLAKE2b digests of the spec string, memoized.
     
     Thread Safety:
-        The hasher is thread-safe after initialization. All random keys are
-        generated during __init__ and stored in read-only dicts.
+        Lookups are safe from any thread. Rows and memoized keys are built
+        lazily, but a key's value depends only on the seed and component,
+        so a racing build stores the same value.
     
     Attributes:
-        seed: Random seed for reproducible key generation
-        card_keys: Dict mapping (card_id, location, zone, position, owner) -> key
-        resource_keys: Dict mapping resource name -> key
-        action_keys: Dict mapping action spec string -> key
+        seed: Seed mixed into every key digest
+        card_index: Dict mapping card passcode -> deck-local row index
     """
 
     def __init__(self, seed: int = 42):
         """
-        Initialize the Zobrist hasher with deterministic random keys.
+        Initialize the Zobrist hasher.
         
         Args:
-            seed: Random seed for reproducible key generation. Using the same
-                  seed guarantees the same keys, enabling consistent hashing
-                  across sessions.
+            seed: Seed for key derivation. Using the same seed guarantees the
+                  same keys, enabling consistent hashing across sessions
+                  and processes.
         """
         self.seed = seed
-        self._rng = random.Random(seed)
+        self._seed_prefix = f"zobrist\0{seed}\0".encode()
+        
+        # Deck-local card rows; card_index[code] is the row of that card
+        self.card_index: Dict[int, int] = {}
+        self._card_rows: List[array] = []
+        # Board-zone key of each location (see board_card_state)
+        self._board_offsets = {
+            location: _key_offset(location, 0, POS_FACEUP_ATTACK if location == LOCATION_MZONE else 0, 0)
+            for location in KEY_LOCATIONS
+        }
         
-        # Lazily populated key dictionaries
-        self._card_keys: Dict[CardState, int] = {}
+        # Memoized digest keys
+        self._card_keys: Dict[CardState, int] = {}   # CardStates outside the tables
         self._resource_keys: Dict[str, int] = {}
         self._action_keys: Dict[str, int] = {}
         
@@ -237,43 +291,69 @@ class ZobristHasher:
         for turn in range(100):
             resources.append(f"turn_{turn}")
         
-        # Add OPT tracking keys (card_id:effect_idx)
-        # These are generated lazily, but we seed the structure
-        
         for resource in resources:
-            self._resource_keys[resource] = self._rng.getrandbits(64)
+            self._get_resource_key(resource)
+
+    def _digest_key(self, domain: str, component: str) -> int:
+        """64-bit key for one component, stable across processes."""
+        digest = hashlib.blake2b(self._seed_prefix + f"{domain}\0{component}".encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "little")
+
+    # =========================================================================
+    # CARD KEY TABLES
+    # =========================================================================
+
+    def register_cards(self, card_ids: Iterable[int]):
+        """Build key rows for a deck up front (e.g. main + extra deck)."""
+        for card_id in card_ids:
+            self._card_row(card_id)
+
+    def _card_row(self, card_id: int) -> array:
+        index = self.card_index.get(card_id)
+        if index is not None:
+            return self._card_rows[index]
+        data = hashlib.shake_128(self._seed_prefix + f"card\0{card_id}".encode()).digest(_ROW_KEYS * 8)
+        row = array("Q", data)
+        if sys.byteorder != "little":
+            row.byteswap()
+        self.card_index[card_id] = len(self._card_rows)
+        self._card_rows.append(row)
+        return row
 
     def _get_card_key(self, state: CardState) -> int:
         """
-        Get or generate the Zobrist key for a card state.
+        Get the Zobrist key for a card state.
         
-        Keys are generated lazily and cached. This handles the large space
-        of possible (card_id, location, zone, position, owner) tuples without
-        pre-generating millions of keys.
+        In-table states index the card's row; anything else falls back to a
+        memoized digest of the full state.
         """
-        if state not in self._card_keys:
-            # Use a deterministic sub-seed based on the state
-            # This ensures the same state always gets the same key
-            sub_seed = hash(state) ^ self.seed
-            sub_rng = random.Random(sub_seed)
-            self._card_keys[state] = sub_rng.getrandbits(64)
-        return self._card_keys[state]
+        offset = _key_offset(state.location, state.zone_index, state.position, state.owner)
+        if offset is not None:
+            return self._card_row(state.card_id)[offset]
+        key = self._card_keys.get(state)
+        if key is None:
+            key = self._card_keys[state] = self._digest_key(
+                "state", f"{state.card_id}:{state.location}:{state.zone_index}:"
+                         f"{state.position}:{state.owner}")
+        return key
+
+    def board_card_key(self, card_id: int, location: int) -> int:
+        """Key of board_card_state(card_id, location) without building it."""
+        return self._card_row(card_id)[self._board_offsets[location]]
 
     def _get_resource_key(self, resource: str) -> int:
-        """Get or generate the Zobrist key for a resource flag."""
-        if resource not in self._resource_keys:
-            sub_seed = hash(resource) ^ self.seed
-            sub_rng = random.Random(sub_seed)
-            self._resource_keys[resource] = sub_rng.getrandbits(64)
-        return self._resource_keys[resource]
+        """Get the Zobrist key for a resource flag."""
+        key = self._resource_keys.get(resource)
+        if key is None:
+            key = self._resource_keys[resource] = self._digest_key("resource", resource)
+        return key
 
     def _get_action_key(self, action_spec: str) -> int:
-        """Get or generate the Zobrist key for a legal action."""
-        if action_spec not in self._action_keys:
-            sub_seed = hash(action_spec) ^ self.seed
-            sub_rng = random.Random(sub_seed)
-            self._action_keys[action_spec] = sub_rng.getrandbits(64)
-        return self._action_keys[action_spec]
+        """Get the Zobrist key for a legal action."""
+        key = self._action_keys.get(action_spec)
+        if key is None:
+            key = self._action_keys[action_spec] = self._digest_key("action", action_spec)
+        return key
 
     # =========================================================================
     # FULL HASH COMPUTATION
@@ -283,6 +363,10 @@ class ZobristHasher:
         """
         Compute full Zobrist hash for a BoardSignature.
         
+        Zones are sets, so each card hashes as board_card_state(code,
+        location) regardless of slot or order. Adding or removing one card
+        is a single board_card_key XOR (see engine/board_tracker.py).
+        
         Args:
             board_signature: A BoardSignature instance from state_representation.py
             
@@ -291,67 +375,31 @@ class ZobristHasher:
         """
         h = 0
         
-        # Hash monsters on field
-        for i, card_id in enumerate(sorted(board_signature.monsters)):
-            state = CardState(
-                card_id=card_id,
-                location=LOCATION_MZONE,
-                zone_index=i,  # Simplified: use sorted index
-                position=POS_FACEUP_ATTACK,  # Default assumption
-                owner=0
-            )
-            h ^= self._get_card_key(state)
-        
-        # Hash spells/traps on field
-        for i, card_id in enumerate(sorted(board_signature.spells)):
-            state = CardState(
-                card_id=card_id,
-                location=LOCATION_SZONE,
-                zone_index=i,
-                position=0,
-                owner=0
-            )
-            h ^= self._get_card_key(state)
-        
-        # Hash graveyard
-        for i, card_id in enumerate(sorted(board_signature.graveyard)):
-            state = CardState(
-                card_id=card_id,
-                location=LOCATION_GRAVE,
-                zone_index=i,
-                position=0,
-                owner=0
-            )
-            h ^= self._get_card_key(state)
-        
-        # Hash hand
-        for i, card_id in enumerate(sorted(board_signature.hand)):
-            state = CardState(
-                card_id=card_id,
-                location=LOCATION_HAND,
-                zone_index=i,
-                position=0,
-                owner=0
-            )
-            h ^= self._get_card_key(state)
-        
-        # Hash banished
-        for i, card_id in enumerate(sorted(board_signature.banished)):
-            state = CardState(
-                card_id=card_id,
-                location=LOCATION_REMOVED,
-                zone_index=i,
-                position=0,
-                owner=0
-            )
-            h ^= self._get_card_key(state)
-        
-        # Hash equip relationships
-        for equipped, target in sorted(board_signature.equips):
-            # Create a unique key for the equip relationship
-            equip_key = f"equip:{equipped}:{target}"
-            h ^= self._get_action_key(equip_key)
-        
+        for location, zone in (
+            (LOCATION_MZONE, board_signature.monsters),
+            (LOCATION_SZONE, board_signature.spells),
+            (LOCATION_GRAVE, board_signature.graveyard),
+            (LOCATION_HAND, board_signature.hand),
+            (LOCATION_REMOVED, board_signature.banished),
+        ):
+            offset = self._board_offsets[location]
+            for card_id in zone:
+                h ^= self._card_row(card_id)[offset]
+        
+        return h ^ self.hash_equips(board_signature.equips)
+
+    def hash_equips(self, equips) -> int:
+        """XOR of the keys of (equipped_passcode, target_passcode) pairs."""
+        h = 0
+        for equipped, target in equips:
+            h ^= self._get_action_key(f"equip:{equipped}:{target}")
+        return h
+
+    def hash_actions(self, action_specs) -> int:
+        """XOR of the keys of a set of legal action spec strings."""
+        h = 0
+        for action_spec in action_specs:
+            h ^= self._get_action_key(action_spec)
         return h
 
     def hash_intermediate_state(self, intermediate_state) -> int:
@@ -366,14 +414,9 @@ class ZobristHasher:
         Returns:
             64-bit Zobrist hash as integer
         """
-        # Start with board hash
-        h = self.hash_board(intermediate_state.board)
-        
-        # XOR in all legal actions (captures OPT state)
-        for action_spec in sorted(intermediate_state.legal_actions):
-            h ^= self._get_action_key(action_spec)
-        
-        return h
+        # Board hash XOR all legal actions (captures OPT state)
+        return (self.hash_board(intermediate_state.board)
+                ^ self.hash_actions(intermediate_state.legal_actions))
 
     def hash_with_resources(
         self,
@@ -488,7 +531,8 @@ class ZobristHasher:
     def stats(self) -> dict:
         """Return statistics about key generation."""
         return {
-            "card_keys_generated": len(self._card_keys),
+            "card_rows": len(self._card_rows),
+            "card_keys_generated": len(self._card_rows) * _ROW_KEYS + len(self._card_keys),
             "resource_keys_generated": len(self._resource_keys),
             "action_keys_generated": len(self._action_keys),
             "seed": self.seed,
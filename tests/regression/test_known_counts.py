@@ -316,6 +316,46 @@ class TestDeterminism:
         print(f"\n  {len(state_hashes)} terminals, {len(unique_hashes)} unique state hashes")
 
 
+class TestReplayModes:
+    """Prefix replay must reproduce path replay exactly on known hands."""
+
+    @pytest.mark.parametrize("hand_name", ["engraver_solo", "crystal_bond_solo", "brick_hand"])
+    def test_prefix_matches_path_replay(self, engine_setup, hand_name):
+        from src.ygo_combo.combo_enumeration import EnumerationEngine
+        import src.ygo_combo.combo_enumeration as combo_enumeration
+
+        combo_enumeration.MAX_PATHS = MAX_PATHS
+        combo_enumeration.MAX_DEPTH = MAX_DEPTH
+
+        hand = KNOWN_HANDS[hand_name]["hand"]
+        results = {}
+        for mode in ("path", "prefix"):
+            engine = EnumerationEngine(
+                engine_setup["lib"],
+                engine_setup["main_deck"],
+                engine_setup["extra_deck"],
+                verbose=False,
+                replay_mode=mode,
+            )
+            terminals = engine.enumerate_from_hand(hand)
+            results[mode] = (
+                [(tuple(a.description for a in t.action_sequence), t.termination_reason, t.board_hash)
+                 for t in terminals],
+                engine.paths_explored,
+                engine.replay_stats(),
+            )
+
+        path_terms, path_paths, path_stats = results["path"]
+        prefix_terms, prefix_paths, prefix_stats = results["prefix"]
+
+        print(f"\n  {hand_name}: path {path_stats['replayed_actions_per_node']:.2f} "
+              f"vs prefix {prefix_stats['replayed_actions_per_node']:.2f} replayed actions/node")
+
+        assert prefix_terms == path_terms
+        assert prefix_paths == path_paths
+        assert prefix_stats["actions_replayed"] <= path_stats["actions_replayed"]
+
+
 # =============================================================================
 # BASELINE CAPTURE HELPER
 # =============================================================================
@@ -0,0 +1,221 @@
+"""
+Deterministic stand-in for ygopro-core used by enumeration unit tests.
+
+The real engine (libygo + Lua scripts) is not available in unit test runs,
+so these helpers model a tiny duel that speaks the same protocol the
+EnumerationEngine relies on:
+
+    OCG_StartDuel / OCG_DuelProcess / OCG_DuelSetResponse / OCG_DestroyDuel
+
+Game rules (player 0 only):
+    - MSG_IDLE offers ACTIVATE for every unused hand card in HAND_CARDS,
+      SPSUMMON of SUMMON_CARD until it has been summoned, and PASS.
+    - Special summoning prompts MSG_SELECT_POSITION (a forced, single-child
+      node in the search tree).
+    - PASS ends the duel.
+    - The board is the set of activated/summoned codes (plus the unused
+      starting hand), so different orderings reach the same board
+      (exercises transposition pruning).
+    - Every activation/summon is reported with a decoded MSG_MOVE ahead of
+      the next prompt (drives the incremental BoardTracker).
+
+Use patched_engine() to route DuelFactory/capture_board_state (and the
+targeted capture_board_signature / query_signature_zones) to the fake.
+"""
+
+import struct
+from contextlib import contextmanager
+from typing import List, Optional
+from unittest.mock import patch
+
+from src.ygo_combo import combo_enumeration
+from src.ygo_combo.combo_enumeration import EnumerationEngine
+from src.ygo_combo.engine.bindings import (
+    MSG_IDLE, MSG_MOVE, MSG_SELECT_POSITION, LOCATION_EXTRA, LOCATION_HAND, LOCATION_MZONE,
+)
+from src.ygo_combo.engine.board_types import BoardState
+from src.ygo_combo.engine.evaluator import compile_evaluation_config
+from src.ygo_combo.engine.state import BoardSignature
+
+
+HAND_CARDS = (101, 102, 103)
+SUMMON_CARD = 201
+
+IDLE_SPSUMMON = 1
+IDLE_ACTIVATE = 5
+IDLE_TO_END = 7
+
+
+class FakeDuel:
+    """Mutable duel state for the fake engine."""
+
+    def __init__(self, starting_hand=None):
+        self.starting_hand = starting_hand
+        self.started = False
+        self.ended = False
+        self.used: List[int] = []       # Codes activated/summoned, in order
+        self.pending = None             # (msg_type, msg_data) awaiting a response
+        self.outbox = []                # Messages produced by the last process call
+        self.events = []                # Board messages emitted with the next prompt
+        self.responses: List[bytes] = []
+
+    def board_codes(self):
+        return sorted(set(self.used))
+
+    def hand_codes(self):
+        return [c for c in (self.starting_hand or []) if c not in self.used]
+
+    def play(self, code: int, source):
+        """Move code from source (con, loc, seq) to the next monster zone."""
+        self.used.append(code)
+        self.events.append((MSG_MOVE, {
+            "code": code, "from": source, "to": (0, LOCATION_MZONE, len(self.used) - 1),
+        }))
+
+
+class FakeLib:
+    """Minimal OCG_* surface used by EnumerationEngine."""
+
+    def __init__(self):
+        self.duels_created = 0
+        self.duels_destroyed = 0
+        self.process_calls = 0
+        self.responses_set = 0
+        self.signatures_captured = 0    # Targeted IDLE captures
+        self.zone_queries = 0           # Incremental seeds / cross-checks
+
+    def new_duel(self, starting_hand=None) -> FakeDuel:
+        self.duels_created += 1
+        return FakeDuel(starting_hand)
+
+    def OCG_StartDuel(self, duel):
+        duel.started = True
+
+    def OCG_DestroyDuel(self, duel):
+        self.duels_destroyed += 1
+
+    def OCG_DuelProcess(self, duel):
+        self.process_calls += 1
+        if duel.ended:
+            duel.outbox = []
+            return 0
+        if duel.pending is None:
+            duel.pending = self._next_prompt(duel)
+        duel.outbox = duel.events + [duel.pending]
+        duel.events = []
+        return 1
+
+    def OCG_DuelSetResponse(self, duel, response, length):
+        self.responses_set += 1
+        data = bytes(response[:length])
+        duel.responses.append(data)
+        msg_type, msg_data = duel.pending
+        duel.pending = None
+        if msg_type != MSG_IDLE:
+            return
+        value = struct.unpack("<I", data[:4])[0]
+        kind, index = value & 0xFFFF, value >> 16
+        if kind == IDLE_TO_END:
+            duel.ended = True
+        elif kind == IDLE_ACTIVATE:
+            code = msg_data["activatable"][index]["code"]
+            duel.play(code, (0, LOCATION_HAND, duel.hand_codes().index(code)))
+        elif kind == IDLE_SPSUMMON:
+            duel.play(msg_data["spsummon"][index]["code"], (0, LOCATION_EXTRA, 0))
+            duel.pending = (MSG_SELECT_POSITION, {"code": SUMMON_CARD})
+
+    @staticmethod
+    def _next_prompt(duel):
+        unused = [c for c in HAND_CARDS if c not in duel.used]
+        idle_data = {
+            "activatable": [{"code": c, "loc": 2, "desc": 0} for c in unused],
+            "spsummon": [] if SUMMON_CARD in duel.used else [{"code": SUMMON_CARD}],
+            "summonable": [],
+            "to_ep": True,
+        }
+        return (MSG_IDLE, idle_data)
+
+
+def fake_board_state(duel: FakeDuel) -> BoardState:
+    """Board for a fake duel: every used code is a monster on field."""
+    empty = {"hand": [], "monsters": [], "spells": [], "graveyard": [], "banished": [], "extra": []}
+    hand = duel.hand_codes()
+    player0 = dict(
+        empty,
+        hand=[{"code": c, "name": f"Card_{c}"} for c in hand],
+        monsters=[{"code": c, "name": f"Card_{c}"} for c in duel.board_codes()],
+    )
+    return BoardState.from_dict({"player0": player0, "player1": dict(empty)})
+
+
+class FakeMessagesMixin:
+    """Read messages straight from FakeDuel instead of the CFFI buffer."""
+
+    def _get_messages(self, duel):
+        messages, duel.outbox = duel.outbox, []
+        return messages
+
+
+class FakeEnumerationEngine(FakeMessagesMixin, EnumerationEngine):
+    """EnumerationEngine driven by the fake engine."""
+
+
+@contextmanager
+def patched_engine(lib: Optional[FakeLib] = None):
+    """Route duel creation and board capture to the fake engine."""
+    lib = lib or FakeLib()
+
+    class FakeDuelFactory:
+        def __init__(self, _lib, main_deck, extra_deck, starting_hand=None):
+            self.starting_hand = list(starting_hand) if starting_hand is not None else None
+
+        def new_duel(self):
+            return lib.new_duel(self.starting_hand)
+
+    def fake_capture(_lib, duel):
+        return fake_board_state(duel)
+
+    def fake_signature(_lib, duel):
+        lib.signatures_captured += 1
+        return BoardSignature.from_board_state(fake_board_state(duel))
+
+    def fake_zones(_lib, duel):
+        lib.zone_queries += 1
+        return {LOCATION_HAND: duel.hand_codes(), LOCATION_MZONE: list(duel.used)}, []
+
+    with patch.object(combo_enumeration, "DuelFactory", FakeDuelFactory), \
+            patch.object(combo_enumeration, "capture_board_state", fake_capture), \
+            patch("src.ygo_combo.enumeration.handlers.capture_board_state", fake_capture), \
+            patch("src.ygo_combo.enumeration.handlers.capture_board_signature", fake_signature), \
+            patch("src.ygo_combo.enumeration.handlers.query_signature_zones", fake_zones):
+        yield lib
+
+
+def run_fake_enumeration(replay_mode: str = "prefix", engine_cls=FakeEnumerationEngine, **engine_kwargs):
+    """Enumerate the fake game and return (engine, lib, terminals)."""
+    with patched_engine() as lib:
+        engine = engine_cls(lib, [], [], replay_mode=replay_mode, **engine_kwargs)
+        terminals = engine.enumerate_from_hand(list(HAND_CARDS))
+    return engine, lib, terminals
+
+
+def boss_evaluator():
+    """Evaluator for heuristic search on the fake game.
+
+    SUMMON_CARD is the only boss and every other monster costs 5 points, so
+    the S-tier board is the boss alone (the last root branch DFS tries).
+    """
+    return compile_evaluation_config(config={
+        "score_weights": {"boss_monster": 55, "monster_on_field": -5},
+        "tier_thresholds": {"S": 50, "A": 40},
+        "boss_monsters": [SUMMON_CARD],
+    }, library={})
+
+
+def terminal_key(terminal):
+    """Comparable identity for a terminal: action path, reason, board hash."""
+    return (
+        tuple(a.description for a in terminal.action_sequence),
+        terminal.termination_reason,
+        terminal.board_hash,
+    )
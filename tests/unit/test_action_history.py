@@ -0,0 +1,152 @@
+"""
+Unit tests for ActionHistory.
+
+A history must behave like the list it replaces (length, order, indexing,
+equality, export), share prefixes between siblings and terminals, and
+derive the same SELECT_SUM metadata the handlers used to rescan for.
+"""
+
+import pickle
+
+import pytest
+
+from src.ygo_combo.types import Action, ActionHistory, TerminalState
+from fake_engine import run_fake_enumeration
+
+
+def make_action(action_type="ACTIVATE", card_code=None, description=None):
+    return Action(
+        action_type=action_type,
+        message_type=0,
+        response_value=0,
+        response_bytes=b"",
+        description=description or action_type,
+        card_code=card_code,
+    )
+
+
+def rescan_failed_codes(actions):
+    """The scan _handle_select_card used to run on every prompt."""
+    failed = set()
+    for action, next_action in zip(actions, actions[1:]):
+        if (action.action_type == "SELECT_CARD"
+                and next_action.action_type == "SELECT_SUM_CANCEL"
+                and action.card_code is not None):
+            failed.add(action.card_code)
+    return failed
+
+
+class TestActionHistory:
+    """List behaviour of the parent-pointer chain."""
+
+    def test_empty(self):
+        history = ActionHistory.EMPTY
+        assert len(history) == 0
+        assert not history
+        assert history.to_list() == []
+        assert ActionHistory.of([]) == []
+
+    def test_push_leaves_parent_unchanged(self):
+        a, b = make_action(description="a"), make_action(description="b")
+        parent = ActionHistory.EMPTY.push(a)
+        child = parent.push(b)
+
+        assert parent.to_list() == [a]
+        assert child.to_list() == [a, b]
+        assert child.parent is parent
+
+    def test_sequence_access(self):
+        actions = [make_action(description=str(i)) for i in range(5)]
+        history = ActionHistory.from_actions(actions)
+
+        assert len(history) == 5
+        assert list(history) == actions
+        assert list(reversed(history)) == actions[::-1]
+        assert history[0] is actions[0]
+        assert history[-1] is actions[-1]
+        assert history[1:3] == actions[1:3]
+        with pytest.raises(IndexError):
+            history[5]
+
+    def test_equality(self):
+        actions = [make_action(), make_action("SUMMON")]
+        history = ActionHistory.from_actions(actions)
+
+        assert history == actions
+        assert history == ActionHistory.from_actions(actions)
+        assert history != actions[:1]
+        assert history.copy() is history
+        assert ActionHistory.of(history) is history
+
+    def test_pickles_flat(self):
+        actions = [make_action(description=str(i)) for i in range(2000)]
+        restored = pickle.loads(pickle.dumps(ActionHistory.from_actions(actions)))
+
+        assert isinstance(restored, ActionHistory)
+        assert [a.description for a in restored] == [a.description for a in actions]
+
+
+class TestDerivedMetadata:
+    """failed_sum_codes and last_select_card match a full rescan."""
+
+    PATH = [
+        make_action("SELECT_CARD", card_code=1),
+        make_action("SELECT_SUM_CANCEL"),
+        make_action("SELECT_CARD", card_code=2),
+        make_action("SELECT_SUM"),
+        make_action("SELECT_CARD", card_code=3),
+        make_action("SELECT_SUM_CANCEL"),
+        make_action("SELECT_SUM_CANCEL"),
+        make_action("SELECT_CARD"),
+    ]
+
+    def test_every_prefix_matches_rescan(self):
+        for n in range(len(self.PATH) + 1):
+            prefix = self.PATH[:n]
+            history = ActionHistory.from_actions(prefix)
+
+            assert history.failed_sum_codes == rescan_failed_codes(prefix)
+            expected_last = next((a for a in reversed(prefix)
+                                  if a.action_type == "SELECT_CARD" and a.card_code is not None), None)
+            assert history.last_select_card is expected_last
+
+    def test_siblings_do_not_leak(self):
+        base = ActionHistory.EMPTY.push(make_action("SELECT_CARD", card_code=7))
+        cancelled = base.push(make_action("SELECT_SUM_CANCEL"))
+        summed = base.push(make_action("SELECT_SUM"))
+
+        assert cancelled.failed_sum_codes == {7}
+        assert summed.failed_sum_codes == frozenset()
+
+
+class TestTerminalState:
+    """Terminals keep the shared chain and export lists."""
+
+    def test_list_in_list_out(self):
+        actions = [make_action(), make_action("PASS")]
+        terminal = TerminalState(actions, {}, 2, "h", "PASS")
+
+        assert isinstance(terminal.history, ActionHistory)
+        assert isinstance(terminal.action_sequence, list)
+        assert terminal.action_sequence == actions
+        assert terminal.to_dict()["action_sequence"] == [a.to_dict() for a in actions]
+
+    def test_pickle_round_trip(self):
+        terminal = TerminalState([make_action()], {}, 1, "h", "PASS")
+        assert pickle.loads(pickle.dumps(terminal)) == terminal
+
+    def test_engine_terminals_share_prefixes(self):
+        _, _, terminals = run_fake_enumeration("prefix")
+        assert len(terminals) > 1
+
+        # Every node of every terminal path, by identity
+        node_ids = set()
+        node_count = 0
+        for terminal in terminals:
+            node = terminal.history
+            assert len(node) == terminal.depth
+            while node.parent is not None:
+                node_ids.add(id(node))
+                node_count += 1
+                node = node.parent
+        assert len(node_ids) < node_count
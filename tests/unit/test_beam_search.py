@@ -0,0 +1,139 @@
+"""
+Unit tests for beam_search.py and search/scorers.py.
+
+A beam wide enough to hold every node must find the same boards as DFS;
+narrower beams spend fewer paths, and the quality curve records what each
+level bought.
+"""
+
+import pytest
+
+from src.ygo_combo.beam_search import BeamSearchEngine, parse_beam_width
+from src.ygo_combo.cards.roles import CardClassification, CardRole, CardRoleClassifier
+from src.ygo_combo.engine.state import BoardSignature
+from src.ygo_combo.search.iddfs import TargetTierReached
+from src.ygo_combo.search.scorers import (
+    BoardQualityScorer, LearnedScorer, RoleProgressScorer, make_scorer,
+)
+from fake_engine import (
+    FakeMessagesMixin, HAND_CARDS, SUMMON_CARD, boss_evaluator, run_fake_enumeration,
+)
+
+
+class FakeBeamEngine(FakeMessagesMixin, BeamSearchEngine):
+    """BeamSearchEngine driven by the fake engine."""
+
+
+def run_beam(**kwargs):
+    kwargs.setdefault("evaluator", boss_evaluator())
+    return run_fake_enumeration(engine_cls=FakeBeamEngine, **kwargs)
+
+
+def signature(monsters=(), graveyard=(), banished=()):
+    return BoardSignature(
+        monsters=frozenset(monsters), spells=frozenset(), graveyard=frozenset(graveyard),
+        hand=frozenset(), banished=frozenset(banished), extra_deck=frozenset(),
+        equips=frozenset(),
+    )
+
+
+# =============================================================================
+# BEAM SEARCH
+# =============================================================================
+
+def test_wide_beam_finds_same_boards_as_dfs():
+    _, _, dfs_terms = run_fake_enumeration()
+    engine, _, terms = run_beam(beam_width=100)
+
+    assert {t.board_hash for t in terms} == {t.board_hash for t in dfs_terms}
+    assert engine.beam_cut == 0
+    assert engine.stopped_reason == "beam_exhausted"
+
+
+def test_narrow_beam_spends_fewer_paths():
+    wide, _, _ = run_beam(beam_width=100)
+    greedy, _, _ = run_beam(beam_width=1)
+
+    assert greedy.paths_explored < wide.paths_explored
+    assert greedy.beam_cut > 0
+    # The greedy line takes the boss first and still reaches S tier
+    assert greedy.best_tier == "S"
+
+
+def test_curve_tracks_paths_and_quality_per_level():
+    engine, _, _ = run_beam(beam_width=2)
+    curve = engine.curve
+
+    assert [p["level"] for p in curve] == list(range(1, len(curve) + 1))
+    assert len(curve) == engine.levels_searched
+    for earlier, later in zip(curve, curve[1:]):
+        assert later["paths"] >= earlier["paths"]
+        assert later["best_score"] >= earlier["best_score"]
+    assert curve[-1]["paths"] == engine.paths_explored
+
+
+def test_beam_depth_limits_levels():
+    engine, _, _ = run_beam(beam_width=100, beam_depth=1)
+    assert engine.levels_searched == 1
+    assert engine.stopped_reason == "beam_depth"
+
+
+def test_stopping_condition_ends_search():
+    engine, _, _ = run_beam(beam_width=100, stopping_conditions=[TargetTierReached("S")])
+    assert engine.stopped_reason == "target_tier_reached (S)"
+    assert engine.paths_explored < run_beam(beam_width=100)[0].paths_explored
+
+
+def test_width_schedule():
+    engine, _, _ = run_beam(beam_width=[3, 1])
+    assert [engine.width_at(level) for level in range(4)] == [3, 1, 1, 1]
+    assert engine.curve[0]["expanded"] == 1   # The root
+    assert engine.curve[1]["expanded"] <= 1
+
+
+def test_parse_and_validate_width():
+    assert parse_beam_width("32, 16,8") == [32, 16, 8]
+    with pytest.raises(ValueError):
+        parse_beam_width("0")
+    with pytest.raises(ValueError):
+        BeamSearchEngine(None, [], [], beam_width=[])
+
+
+# =============================================================================
+# SCORERS
+# =============================================================================
+
+def test_role_scorer_beam():
+    classifier = CardRoleClassifier()
+    classifier.add_classification(CardClassification(SUMMON_CARD, CardRole.PAYOFF))
+    engine, _, terms = run_beam(beam_width=1, scorer=RoleProgressScorer(classifier))
+    # Greedy on roles takes the payoff summon first
+    assert [a.card_code for a in terms[1].action_sequence][:1] == [SUMMON_CARD]
+
+
+def test_role_progress_weights():
+    classifier = CardRoleClassifier()
+    for code, role in ((1, CardRole.PAYOFF), (2, CardRole.EXTENDER), (3, CardRole.STARTER)):
+        classifier.add_classification(CardClassification(code, role))
+    scorer = RoleProgressScorer(classifier)
+
+    assert scorer(signature(monsters=[1, 2, 99])) == 40
+    assert scorer(signature(graveyard=[3], banished=[2, 1])) == 10
+
+
+def test_learned_scorer_uses_encoded_board():
+    seen = []
+
+    def model(features):
+        seen.append(features)
+        return 7
+
+    assert LearnedScorer(model)(signature(monsters=[SUMMON_CARD], graveyard=list(HAND_CARDS))) == 7.0
+    assert set(seen[0]) == {"card_features", "global_features"}
+
+
+def test_make_scorer():
+    assert isinstance(make_scorer("board"), BoardQualityScorer)
+    assert isinstance(make_scorer("roles"), RoleProgressScorer)
+    with pytest.raises(ValueError):
+        make_scorer("learned")
@@ -0,0 +1,102 @@
+"""
+Unit tests for best_first.py.
+
+Best-first must reach the same boards as DFS when it runs to completion,
+and reach a high-scoring board in fewer paths when a StoppingCondition
+ends it early.
+"""
+
+import pytest
+
+from src.ygo_combo.best_first import BestFirstEngine
+from src.ygo_combo.search.iddfs import PathBudgetExhausted, TargetTierReached
+from fake_engine import (
+    FakeEnumerationEngine, FakeMessagesMixin, SUMMON_CARD, boss_evaluator, run_fake_enumeration,
+    terminal_key,
+)
+
+
+class FakeBestFirstEngine(FakeMessagesMixin, BestFirstEngine):
+    """BestFirstEngine driven by the fake engine."""
+
+
+class RecordingDFSEngine(FakeEnumerationEngine):
+    """DFS that notes how many paths it took to record an S-tier board."""
+
+    paths_to_target = None
+
+    def _record_terminal(self, action_history, reason, duel=None):
+        recorded = len(self.terminals)
+        super()._record_terminal(action_history, reason, duel=duel)
+        for terminal in self.terminals[recorded:]:
+            if (self.paths_to_target is None and terminal.board_state
+                    and boss_evaluator().evaluate_board(terminal.board_state)["tier"] == "S"):
+                self.paths_to_target = self.paths_explored
+
+
+def run_best_first(**kwargs):
+    kwargs.setdefault("evaluator", boss_evaluator())
+    return run_fake_enumeration(engine_cls=FakeBestFirstEngine, **kwargs)
+
+
+# =============================================================================
+# COMPLETE SEARCH
+# =============================================================================
+
+@pytest.mark.parametrize("dedupe_intermediate", [True, False])
+def test_exhaustive_run_finds_same_boards_as_dfs(dedupe_intermediate):
+    # Without board dedupe either, so both keep every path to each board
+    dedupe_boards = dedupe_intermediate
+    _, _, dfs_terms = run_fake_enumeration(dedupe_intermediate=dedupe_intermediate,
+                                           dedupe_boards=dedupe_boards)
+    engine, _, terms = run_best_first(dedupe_intermediate=dedupe_intermediate,
+                                      dedupe_boards=dedupe_boards)
+
+    assert {t.board_hash for t in terms} == {t.board_hash for t in dfs_terms}
+    assert engine.stopped_reason == "open_list_exhausted"
+    if not dedupe_intermediate:
+        # No pruning: every path is found, in a different order
+        assert sorted(map(terminal_key, terms)) == sorted(map(terminal_key, dfs_terms))
+
+
+def test_transposition_table_prunes_reordered_lines():
+    engine, _, _ = run_best_first()
+    assert engine.intermediate_states_pruned > 0
+    # Every IDLE node is expanded at most once
+    assert engine.nodes_expanded == len(engine.transposition_table)
+
+
+def test_expands_best_board_first():
+    engine, _, terms = run_best_first()
+    # Root PASS first, then the boss board (expanded right after the root)
+    assert [len(t.action_sequence) for t in terms[:2]] == [1, 3]
+    assert [c.code for c in terms[1].board_state.player0.monsters] == [SUMMON_CARD]
+
+
+# =============================================================================
+# STOPPING CONDITIONS
+# =============================================================================
+
+def test_target_tier_reached_in_fewer_paths_than_dfs():
+    dfs, _, _ = run_fake_enumeration(engine_cls=RecordingDFSEngine)
+    engine, _, terms = run_best_first(stopping_conditions=[TargetTierReached("S")])
+
+    assert engine.stopped_reason == "target_tier_reached (S)"
+    assert engine.best_tier == "S" and engine.terminals_with_boss > 0
+    assert engine.paths_explored < dfs.paths_to_target
+    assert engine.replay_stats()["open_nodes"] > 0
+
+
+def test_path_budget():
+    engine, _, _ = run_best_first(stopping_conditions=[PathBudgetExhausted(3)])
+    assert engine.stopped_reason == "path_budget_exhausted (3)"
+    assert engine.nodes_expanded < run_best_first()[0].nodes_expanded
+
+
+def test_search_state_keys_match_iddfs():
+    engine, _, terms = run_best_first()
+    state = engine.search_state()
+    assert set(state) == {"depth", "best_score", "best_tier", "total_terminals",
+                          "terminals_with_boss", "total_paths"}
+    assert state["total_terminals"] == len(terms)
+    assert state["best_score"] == 50 and state["best_tier"] == "S"
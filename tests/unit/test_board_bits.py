@@ -0,0 +1,149 @@
+"""
+Unit tests for engine/board_bits.py.
+
+BoardBits must agree with BoardSignature on everything built from it:
+round trips, Zobrist hashes, board evaluation and terminal dedupe.
+"""
+
+import pytest
+
+from src.ygo_combo.engine.board_bits import (
+    BoardBits, CardIndex, dedupe_terminals, get_card_index, iter_bits,
+)
+from src.ygo_combo.engine.evaluator import evaluate_board_bits
+from src.ygo_combo.engine.board_types import BoardState
+from src.ygo_combo.engine.state import BoardSignature, _load_evaluation_config
+from src.ygo_combo.types import TerminalState
+
+
+CAESAR, ABAQU, REQUIEM, ENGRAVER, TOKEN = 79559912, 4731783, 2463794, 60764609, 35552986
+
+
+def signature(monsters=(), spells=(), graveyard=(), hand=(), banished=(), equips=()):
+    return BoardSignature(
+        monsters=frozenset(monsters), spells=frozenset(spells),
+        graveyard=frozenset(graveyard), hand=frozenset(hand),
+        banished=frozenset(banished), extra_deck=frozenset(),
+        equips=frozenset(equips),
+    )
+
+
+def board_dict(monsters=(), graveyard=(), hand=()):
+    def cards(codes):
+        return [{"code": code, "name": f"Card_{code}"} for code in codes]
+    empty = {zone: [] for zone in ("monsters", "spells", "graveyard", "hand", "banished", "extra")}
+    return {"player0": {**empty, "monsters": cards(monsters), "graveyard": cards(graveyard),
+                        "hand": cards(hand)},
+            "player1": empty}
+
+
+SIGNATURES = [
+    signature(),
+    signature(monsters=[CAESAR, ABAQU], graveyard=[ENGRAVER, REQUIEM]),
+    signature(monsters=[TOKEN], spells=[REQUIEM], hand=[1, 2, 3], banished=[ENGRAVER],
+              equips=[(REQUIEM, TOKEN)]),
+]
+
+
+# =============================================================================
+# CARD INDEX
+# =============================================================================
+
+def test_index_orders_library_codes_by_passcode():
+    index = CardIndex([30, 10, 20, 10])
+    assert index.codes == [10, 20, 30]
+    assert index.mask([30, 10]) == 0b101
+
+
+def test_unknown_codes_get_next_bit():
+    index = CardIndex([10])
+    assert index.mask([99]) == 0b10
+    assert index.bit(99) == 1
+    assert index.decode(0b11) == [10, 99]
+
+
+def test_iter_bits():
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits((1 << 70) | 0b1010)) == [1, 3, 70]
+
+
+def test_default_index_is_locked_library():
+    index = get_card_index()
+    assert index.codes[:len(CardIndex.from_library())] == CardIndex.from_library().codes
+
+
+# =============================================================================
+# SIGNATURE EQUIVALENCE
+# =============================================================================
+
+@pytest.mark.parametrize("sig", SIGNATURES)
+def test_round_trip(sig):
+    assert BoardBits.from_signature(sig).to_signature() == sig
+
+
+@pytest.mark.parametrize("sig", SIGNATURES)
+def test_zobrist_hash_matches_signature(sig):
+    assert BoardBits.from_signature(sig).zobrist_hash() == sig.zobrist_hash()
+
+
+def test_equality_follows_signature():
+    a = BoardBits.from_signature(signature(monsters=[CAESAR, ABAQU], hand=[1]))
+    b = BoardBits.from_signature(signature(monsters=[ABAQU, CAESAR], hand=[1]))
+    c = BoardBits.from_signature(signature(monsters=[CAESAR], graveyard=[ABAQU], hand=[1]))
+    assert a == b and hash(a) == hash(b)
+    assert a != c
+    assert a.monster_count() == 2 and a.total_cards_on_field() == 2
+
+
+def test_board_state_matches_dict_path():
+    board = board_dict(monsters=[CAESAR, TOKEN], graveyard=[ENGRAVER], hand=[1, 1])
+    assert (BoardBits.from_board_state(BoardState.from_dict(board))
+            == BoardBits.from_board_state(board)
+            == BoardBits.from_signature(BoardSignature.from_board_state(board)))
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+def set_based_score(sig):
+    """The set-intersection scoring evaluate_board_quality used to do."""
+    config = _load_evaluation_config()
+    w = config["score_weights"]
+    return (w["boss_monster"] * len(sig.monsters & set(config["boss_monsters"]))
+            + w["interaction_piece"] * len(sig.monsters & set(config["interaction_pieces"]))
+            + w["equipped_link"] * len(sig.equips)
+            + w["monster_on_field"] * len(sig.monsters)
+            + w["fiendsmith_in_gy"] * len(sig.graveyard & set(config["fiendsmith_gy_targets"])))
+
+
+@pytest.mark.parametrize("sig", SIGNATURES)
+def test_popcount_scoring_matches_sets(sig):
+    result = evaluate_board_bits(BoardBits.from_signature(sig))
+    assert result["score"] == set_based_score(sig)
+    assert result["monsters_on_field"] == len(sig.monsters)
+
+
+def test_caesar_board_tiers():
+    result = evaluate_board_bits(BoardBits.from_signature(SIGNATURES[1]))
+    assert result["has_boss"] and result["has_interaction"]
+    assert result["tier"] == "S"
+    assert result["details"] == [
+        "Boss monsters: 2", "Interaction pieces: 2", "Fiendsmith pieces in GY: 2",
+    ]
+
+
+# =============================================================================
+# BULK DEDUPE
+# =============================================================================
+
+def terminal(board_state):
+    return TerminalState([], board_state, 0, "h", "PASS")
+
+
+def test_dedupe_keeps_first_per_board():
+    a1 = terminal(board_dict(monsters=[CAESAR], hand=[1]))
+    a2 = terminal(BoardState.from_dict(board_dict(monsters=[CAESAR], hand=[1])))
+    b = terminal(board_dict(monsters=[ABAQU]))
+    empty = terminal({})
+    assert dedupe_terminals([a1, b, a2, empty, empty]) == [a1, b, empty, empty]
@@ -0,0 +1,181 @@
+"""
+Unit tests for targeted board capture (engine/board_capture.py).
+
+A fake OCG_DuelQueryLocation serves hand-built query responses, so the
+targeted signature capture can be checked against the full BoardState
+capture without the engine.
+"""
+
+import struct
+from dataclasses import replace
+
+from src.ygo_combo.engine.bindings import (
+    ffi,
+    LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE,
+    LOCATION_REMOVED, LOCATION_EXTRA,
+    QUERY_CODE, QUERY_POSITION, QUERY_EQUIP_CARD, QUERY_ATTACK, QUERY_END,
+)
+from src.ygo_combo.engine.board_capture import (
+    SIGNATURE_ZONES,
+    capture_board_signature,
+    capture_board_state,
+    parse_query_response,
+    query_signature_zones,
+    scan_query_codes,
+)
+from src.ygo_combo.engine.board_tracker import BoardTracker
+from src.ygo_combo.engine.state import BoardSignature
+from src.ygo_combo.combo_enumeration import IDLE_CAPTURE_MODES, EnumerationEngine
+from fake_engine import run_fake_enumeration, terminal_key
+
+
+# =============================================================================
+# QUERY RESPONSE BUILDERS
+# =============================================================================
+
+def block(flag: int, value: bytes = b"") -> bytes:
+    return struct.pack("<HI", 4 + len(value), flag) + value
+
+
+def card(code: int, flags: int, equip_target=None) -> bytes:
+    """One occupied slot with the requested query fields."""
+    data = b""
+    if flags & QUERY_CODE:
+        data += block(QUERY_CODE, struct.pack("<I", code))
+    if flags & QUERY_POSITION:
+        data += block(QUERY_POSITION, struct.pack("<I", 1))
+    if flags & QUERY_EQUIP_CARD:
+        con, loc, seq = equip_target or (0, 0, 0)
+        data += block(QUERY_EQUIP_CARD, struct.pack("<BBII", con, loc, seq, 0))
+    if flags & QUERY_ATTACK:
+        data += block(QUERY_ATTACK, struct.pack("<i", 1500))
+    return data + block(QUERY_END)
+
+
+EMPTY = struct.pack("<H", 0)
+
+
+def response(slots) -> bytes:
+    body = b"".join(slots)
+    return struct.pack("<I", len(body)) + body
+
+
+# Player 0 zones: location -> [(code, equip_target) or None per slot]
+BOARD = {
+    LOCATION_HAND: [(1001, None), (1002, None)],
+    LOCATION_MZONE: [None, (2001, None), None, None, None, (2002, None)],
+    LOCATION_SZONE: [(3001, (0, LOCATION_MZONE, 5)), None, (3002, None)],
+    LOCATION_GRAVE: [(4001, None)],
+    LOCATION_REMOVED: [],
+    LOCATION_EXTRA: [(5001, None), (5002, None)],
+}
+
+
+class QueryLib:
+    """OCG_DuelQueryLocation over BOARD (player 1 is empty)."""
+
+    def __init__(self):
+        self.queries = []
+        self._keep = []
+
+    def OCG_DuelQueryLocation(self, duel, length, query_info):
+        self.queries.append((query_info.con, query_info.loc, query_info.flags))
+        slots = BOARD.get(query_info.loc, []) if query_info.con == 0 else []
+        data = response([
+            EMPTY if slot is None else card(slot[0], query_info.flags, slot[1])
+            for slot in slots
+        ])
+        buf = ffi.new("uint8_t[]", data)
+        self._keep.append(buf)
+        length[0] = len(data)
+        return buf
+
+
+# =============================================================================
+# scan_query_codes
+# =============================================================================
+
+def test_scan_matches_parse_query_response():
+    flags = QUERY_CODE | QUERY_POSITION | QUERY_ATTACK
+    data = response([card(11, flags), EMPTY, card(12, flags)])
+    codes, equips = scan_query_codes(data)
+    parsed = parse_query_response(data)
+    assert codes == [c["code"] if c else 0 for c in parsed] == [11, 0, 12]
+    assert equips == []
+
+
+def test_scan_reads_equip_targets():
+    flags = QUERY_CODE | QUERY_EQUIP_CARD
+    data = response([
+        card(21, flags, (0, LOCATION_MZONE, 2)),
+        card(22, flags),
+    ])
+    codes, equips = scan_query_codes(data)
+    assert codes == [21, 22]
+    assert equips == [(0, 0, LOCATION_MZONE, 2)]
+
+
+def test_scan_stops_on_truncated_block():
+    data = response([card(31, QUERY_CODE)])
+    assert scan_query_codes(data[:-3]) == ([31], [])
+    assert scan_query_codes(b"") == ([], [])
+
+
+# =============================================================================
+# capture_board_signature
+# =============================================================================
+
+def test_targeted_capture_queries_only_signature_zones():
+    lib = QueryLib()
+    capture_board_signature(lib, None)
+    assert [(con, loc) for con, loc, _ in lib.queries] == [(0, loc) for _, loc in SIGNATURE_ZONES]
+    assert all(flags == QUERY_CODE | QUERY_EQUIP_CARD for _, _, flags in lib.queries)
+
+
+def test_targeted_capture_matches_full_capture_hash():
+    lib = QueryLib()
+    targeted = capture_board_signature(lib, None)
+    full = BoardSignature.from_board_state(capture_board_state(lib, None))
+
+    assert targeted.monsters == full.monsters == {2001, 2002}
+    assert targeted.spells == full.spells
+    assert targeted.hand == full.hand
+    assert targeted.graveyard == full.graveyard
+    assert targeted.banished == full.banished
+    # Extra deck is not hashed, so it is not queried
+    assert targeted.extra_deck == frozenset()
+    assert full.extra_deck == {5001, 5002}
+    # Equip targets resolve to the monster in the target sequence
+    assert targeted.equips == {(3001, 2002)}
+    assert targeted.hash() == replace(full, equips=targeted.equips).hash()
+
+
+# =============================================================================
+# ENGINE INTEGRATION
+# =============================================================================
+
+def test_idle_capture_modes_find_same_terminals():
+    targeted, targeted_lib, targeted_terms = run_fake_enumeration(idle_capture="targeted")
+    full, full_lib, full_terms = run_fake_enumeration(idle_capture="full")
+
+    assert sorted(map(terminal_key, targeted_terms)) == sorted(map(terminal_key, full_terms))
+    assert targeted.intermediate_states_pruned == full.intermediate_states_pruned > 0
+    assert targeted_lib.signatures_captured > 0
+    assert full_lib.signatures_captured == 0
+
+
+def test_idle_capture_modes_hash_equipped_board_alike():
+    lib = QueryLib()
+    hashes = {}
+    for mode in IDLE_CAPTURE_MODES:
+        engine = EnumerationEngine(lib, [], [], idle_capture=mode)
+        if mode == "incremental":
+            tracker = BoardTracker()
+            tracker.reset(*query_signature_zones(lib, None))
+            hashes[mode] = tracker.hash()
+        else:
+            signature = engine._capture_signature(lib, None)
+            assert signature.equips == {(3001, 2002)}, mode
+            hashes[mode] = signature.zobrist_hash()
+
+    assert len(set(hashes.values())) == 1, hashes
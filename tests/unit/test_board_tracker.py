@@ -0,0 +1,183 @@
+"""
+Unit tests for engine/board_tracker.py and incremental IDLE hashing.
+
+The tracker is checked against signature_from_zones for hand-built zone
+layouts, the board message decoders against packed message bodies, and
+the "incremental" idle_capture mode against "targeted" on the fake engine.
+"""
+
+import struct
+from unittest.mock import patch
+
+from src.ygo_combo.engine.bindings import (
+    LOCATION_DECK, LOCATION_EXTRA, LOCATION_GRAVE, LOCATION_HAND, LOCATION_MZONE,
+    LOCATION_OVERLAY, LOCATION_REMOVED, LOCATION_SZONE,
+    MSG_DRAW, MSG_EQUIP, MSG_MOVE, MSG_UNEQUIP,
+)
+from src.ygo_combo.engine.board_capture import signature_from_zones
+from src.ygo_combo.engine.board_tracker import BoardTracker
+from src.ygo_combo.enumeration.decoder import (
+    DECODERS, TRACKING_DECODERS, decode_messages,
+)
+from src.ygo_combo.utils.hashing import zobrist_hash
+from fake_engine import run_fake_enumeration, terminal_key
+
+
+def move(code, src, dst):
+    return (MSG_MOVE, {"code": code, "from": src, "to": dst})
+
+
+def seeded(zones, equipped=()):
+    tracker = BoardTracker()
+    tracker.reset(zones, list(equipped))
+    return tracker
+
+
+def assert_matches(tracker, zones, equipped=()):
+    expected = signature_from_zones(zones, list(equipped))
+    assert tracker.signature() == expected
+    assert tracker.hash() == zobrist_hash(expected)
+
+
+# =============================================================================
+# TRACKER
+# =============================================================================
+
+def test_reset_matches_captured_signature():
+    zones = {
+        LOCATION_HAND: [11, 12, 12],
+        LOCATION_MZONE: [0, 21, 0, 0, 0, 22],
+        LOCATION_SZONE: [31, 0, 0],
+        LOCATION_GRAVE: [41],
+        LOCATION_REMOVED: [],
+    }
+    equipped = [(0, 0, LOCATION_MZONE, 5)]
+    tracker = seeded(zones, equipped)
+    assert tracker.seeded
+    assert_matches(tracker, zones, equipped)
+
+
+def test_moves_update_hash_like_a_recapture():
+    tracker = seeded({LOCATION_HAND: [11, 12], LOCATION_MZONE: [], LOCATION_GRAVE: []})
+    tracker.apply([
+        move(11, (0, LOCATION_HAND, 0), (0, LOCATION_MZONE, 2)),
+        move(12, (0, LOCATION_HAND, 0), (0, LOCATION_GRAVE, 0)),
+        move(51, (0, LOCATION_DECK, 0), (0, LOCATION_HAND, 0)),
+        move(61, (0, LOCATION_EXTRA, 0), (0, LOCATION_MZONE, 5)),
+    ])
+    assert_matches(tracker, {
+        LOCATION_HAND: [51],
+        LOCATION_MZONE: [0, 0, 11, 0, 0, 61],
+        LOCATION_GRAVE: [12],
+    })
+
+
+def test_duplicate_codes_leave_zone_only_when_last_copy_moves():
+    tracker = seeded({LOCATION_HAND: [11, 11]})
+    before = tracker.hash()
+    tracker.apply([move(11, (0, LOCATION_HAND, 1), (0, LOCATION_GRAVE, 0))])
+    assert 11 in tracker.signature().hand
+    tracker.apply([move(11, (0, LOCATION_HAND, 0), (0, LOCATION_GRAVE, 1))])
+    assert_matches(tracker, {LOCATION_GRAVE: [11, 11]})
+    # Moving both back restores the original hash (XOR is self-inverse)
+    tracker.apply([
+        move(11, (0, LOCATION_GRAVE, 0), (0, LOCATION_HAND, 0)),
+        move(11, (0, LOCATION_GRAVE, 0), (0, LOCATION_HAND, 1)),
+    ])
+    assert tracker.hash() == before
+
+
+def test_ignores_opponent_deck_extra_and_overlay():
+    zones = {LOCATION_MZONE: [21]}
+    tracker = seeded(zones)
+    tracker.apply([
+        move(71, (1, LOCATION_HAND, 0), (1, LOCATION_MZONE, 0)),
+        move(72, (0, LOCATION_DECK, 0), (0, LOCATION_EXTRA, 0)),
+        move(73, (0, LOCATION_GRAVE, 0), (0, LOCATION_OVERLAY | LOCATION_MZONE, 0)),
+    ])
+    assert_matches(tracker, zones)
+
+
+def test_draw_adds_to_hand():
+    tracker = seeded({})
+    tracker.apply([(MSG_DRAW, {"player": 0, "codes": [11, 12]}),
+                   (MSG_DRAW, {"player": 1, "codes": [99]})])
+    assert_matches(tracker, {LOCATION_HAND: [11, 12]})
+
+
+def test_equip_follows_cards():
+    tracker = seeded({LOCATION_MZONE: [21, 22], LOCATION_SZONE: [31]})
+    tracker.apply([(MSG_EQUIP, {"card": (0, LOCATION_SZONE, 0), "target": (0, LOCATION_MZONE, 1)})])
+    assert tracker.signature().equips == {(31, 22)}
+    assert tracker.hash() == zobrist_hash(tracker.signature())
+
+    # Target leaves: the equip pair goes with it
+    tracker.apply([move(22, (0, LOCATION_MZONE, 1), (0, LOCATION_GRAVE, 0))])
+    assert tracker.signature().equips == frozenset()
+
+    tracker.apply([(MSG_EQUIP, {"card": (0, LOCATION_SZONE, 0), "target": (0, LOCATION_MZONE, 0)})])
+    assert tracker.signature().equips == {(31, 21)}
+    tracker.apply([(MSG_UNEQUIP, {"card": (0, LOCATION_SZONE, 0)})])
+    assert_matches(tracker, {LOCATION_MZONE: [21], LOCATION_SZONE: [31], LOCATION_GRAVE: [22]})
+
+
+# =============================================================================
+# DECODERS
+# =============================================================================
+
+def frame(msg_type, body):
+    return struct.pack("<IB", len(body) + 1, msg_type) + body
+
+
+def loc_info(con, loc, seq, pos=0):
+    return struct.pack("<BBII", con, loc, seq, pos)
+
+
+def test_board_messages_decoded_only_with_tracking_decoders():
+    batch = (
+        frame(MSG_MOVE, struct.pack("<I", 11) + loc_info(0, LOCATION_HAND, 1)
+              + loc_info(0, LOCATION_MZONE, 2, 1) + struct.pack("<I", 0))
+        + frame(MSG_DRAW, struct.pack("<BI", 0, 2) + struct.pack("<IIII", 12, 0, 13, 0))
+        + frame(MSG_EQUIP, loc_info(0, LOCATION_SZONE, 0) + loc_info(0, LOCATION_MZONE, 2))
+        + frame(MSG_UNEQUIP, loc_info(0, LOCATION_SZONE, 0))
+    )
+    assert [d for _, d in decode_messages(batch)] == [None] * 4
+    assert [d for _, d in decode_messages(batch, decoders=DECODERS)] == [None] * 4
+    assert decode_messages(batch, decoders=TRACKING_DECODERS) == [
+        (MSG_MOVE, {"code": 11, "from": (0, LOCATION_HAND, 1), "to": (0, LOCATION_MZONE, 2)}),
+        (MSG_DRAW, {"player": 0, "codes": [12, 13]}),
+        (MSG_EQUIP, {"card": (0, LOCATION_SZONE, 0), "target": (0, LOCATION_MZONE, 2)}),
+        (MSG_UNEQUIP, {"card": (0, LOCATION_SZONE, 0)}),
+    ]
+
+
+# =============================================================================
+# ENGINE INTEGRATION
+# =============================================================================
+
+def test_incremental_matches_targeted():
+    _, _, targeted_terms = run_fake_enumeration(idle_capture="targeted")
+    engine, lib, terms = run_fake_enumeration(idle_capture="incremental", verify_interval=1)
+
+    assert sorted(map(terminal_key, terms)) == sorted(map(terminal_key, targeted_terms))
+    assert engine.incremental_checks > 0
+    assert engine.incremental_mismatches == 0
+    assert lib.signatures_captured == 0
+
+
+def test_incremental_queries_zones_only_to_seed():
+    engine, lib, _ = run_fake_enumeration(idle_capture="incremental", verify_interval=0)
+    assert engine.incremental_checks == 0
+    # One seed per duel, not one query per IDLE node
+    assert 0 < lib.zone_queries <= engine.duels_created
+    assert engine.replay_stats()["incremental_mismatches"] == 0
+
+
+def test_cross_check_detects_and_resyncs_desync():
+    _, _, targeted_terms = run_fake_enumeration(idle_capture="targeted")
+    with patch.object(BoardTracker, "apply", lambda self, messages: None):
+        engine, _, terms = run_fake_enumeration(idle_capture="incremental", verify_interval=1)
+
+    assert engine.incremental_mismatches > 0
+    # Every IDLE re-synced before hashing, so the search is unaffected
+    assert sorted(map(terminal_key, terms)) == sorted(map(terminal_key, targeted_terms))
@@ -0,0 +1,127 @@
+"""
+Unit tests for the in-memory card data cache behind py_card_reader.
+
+The preloaded OCG_CardData must match what the SQL path produces field
+for field, and cards outside the cache must still be served from SQLite.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.ygo_combo.engine import interface
+from src.ygo_combo.engine.bindings import TYPE_LINK, ffi
+
+MONSTER = (1001, 0, 0x00A3_0042, 0x21, 2500, 2000, 0x0404_0007, 0x8, 0x20)
+LINK = (1002, 0, 0x42, 0x21 | TYPE_LINK, 2000, 0x0A5, 2, 0x2, 0x10)
+ALIAS = (1003, 1001, 0, 0x21, None, None, None, None, None)
+
+FIELDS = ("code", "alias", "type", "level", "attribute", "race",
+          "attack", "defense", "lscale", "rscale", "link_marker")
+
+
+@pytest.fixture
+def cdb(tmp_path):
+    path = tmp_path / "cards.cdb"
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE datas (id INTEGER PRIMARY KEY, ot, alias, setcode, type, "
+               "atk, def, level, race, attribute, category)")
+    db.execute("CREATE TABLE texts (id INTEGER PRIMARY KEY, name)")
+    for id_, alias, setcode, type_, atk, def_, level, race, attribute in (MONSTER, LINK, ALIAS):
+        db.execute("INSERT INTO datas VALUES (?, 3, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                   (id_, alias, setcode, type_, atk, def_, level, race, attribute))
+        db.execute("INSERT INTO texts VALUES (?, ?)", (id_, f"Card {id_}"))
+    db.commit()
+    db.close()
+    yield path
+    interface.close_card_database()
+
+
+def read_card(code):
+    data = ffi.new("OCG_CardData*")
+    interface.py_card_reader(ffi.NULL, code, data)
+    fields = {name: getattr(data, name) for name in FIELDS}
+    setcodes = []
+    if data.setcodes != ffi.NULL:
+        while data.setcodes[len(setcodes)]:
+            setcodes.append(data.setcodes[len(setcodes)])
+    fields["setcodes"] = setcodes
+    return fields
+
+
+class TestCardDataCache:
+    """Preloading and serving card data."""
+
+    def test_preload_whole_database(self, cdb):
+        assert interface.init_card_database(cdb)
+        assert interface.card_data_cache_size() == 3
+
+    def test_preload_deck_only(self, cdb):
+        assert interface.init_card_database(cdb, preload=False)
+        assert interface.card_data_cache_size() == 0
+
+        assert interface.preload_card_data([1001, 1002, 1001, 9999]) == 2
+        assert interface.preload_card_data([1001]) == 2
+
+    @pytest.mark.parametrize("code", [1001, 1002, 1003])
+    def test_cached_matches_sql(self, cdb, code):
+        interface.init_card_database(cdb, preload=False)
+        from_sql = read_card(code)
+
+        interface.preload_card_data()
+        assert interface.card_data_cache_size() == 3
+        assert read_card(code) == from_sql
+
+    def test_fields(self, cdb):
+        interface.init_card_database(cdb)
+
+        monster = read_card(1001)
+        assert monster["level"] == 7
+        assert (monster["lscale"], monster["rscale"]) == (4, 4)
+        assert monster["setcodes"] == [0x42, 0xA3]
+
+        link = read_card(1002)
+        assert (link["link_marker"], link["defense"]) == (0x0A5, 0)
+
+        alias = read_card(1003)
+        assert alias["alias"] == 1001
+        assert (alias["attack"], alias["level"], alias["setcodes"]) == (0, 0, [])
+
+    def test_unknown_card_gets_defaults(self, cdb):
+        interface.init_card_database(cdb)
+        card = read_card(4242)
+        assert card["code"] == 4242
+        assert all(card[name] == 0 for name in FIELDS if name != "code")
+        assert card["setcodes"] == []
+
+    def test_names_preloaded(self, cdb, monkeypatch):
+        interface.init_card_database(cdb)
+        monkeypatch.setattr(interface, "_card_db", None)    # No SQL from here on
+
+        assert interface.get_card_name(1002) == "Card 1002"
+        assert interface.get_card_name(4242) == "Card#4242"
+
+    def test_names_memoized(self, cdb):
+        interface.init_card_database(cdb, preload=False)
+        assert interface.get_card_name(1001) == "Card 1001"
+        assert interface.get_card_name(4242) == "Card#4242"
+        assert interface._card_names == {1001: "Card 1001", 4242: "Card#4242"}
+
+        interface.preload_card_data([1003])
+        assert interface._card_names[1003] == "Card 1003"
+
+    def test_card_data_accessor(self, cdb):
+        interface.init_card_database(cdb)
+        assert interface.get_card_data(1001).attack == 2500
+        assert interface.get_card_data(4242) is None
+
+    def test_close_and_clear_drop_cache(self, cdb):
+        interface.init_card_database(cdb)
+        interface.clear_setcode_cache()
+        assert interface.card_data_cache_size() == 0
+
+        interface.preload_card_data()
+        interface.close_card_database()
+        assert interface.card_data_cache_size() == 0
+        assert interface.get_card_name(1001) == "Card#1001"
+        assert read_card(1001)["type"] == 0    # No database: defaults only
@@ -435,6 +435,8 @@ class TestCheckpointManager:
         class MockEngine:
             paths_explored = 500
             max_depth_seen = 15
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 10
             intermediate_states_pruned = 5
             main_deck = [1, 2, 3]
@@ -470,6 +472,8 @@ class TestCheckpointManager:
         class MockEngine:
             paths_explored = 0
             max_depth_seen = 0
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 0
             intermediate_states_pruned = 0
             main_deck = [1]
@@ -510,6 +514,8 @@ class TestCheckpointManager:
         class MockEngine:
             paths_explored = 100
             max_depth_seen = 5
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 0
             intermediate_states_pruned = 0
             main_deck = [1]
@@ -548,6 +554,8 @@ class TestCheckpointManager:
         class MockEngine:
             paths_explored = 777
             max_depth_seen = 12
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 5
             intermediate_states_pruned = 3
             main_deck = [1, 2, 3]
@@ -598,6 +606,8 @@ class TestCreateCheckpointFromEngine:
         class MockEngine:
             paths_explored = 1234
             max_depth_seen = 20
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 100
             intermediate_states_pruned = 50
             main_deck = [1, 2, 3, 4, 5]
@@ -640,6 +650,8 @@ class TestRestoreEngineFromCheckpoint:
         class MockEngine:
             paths_explored = 0
             max_depth_seen = 0
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 0
             intermediate_states_pruned = 0
             main_deck = [1, 2, 3]
@@ -699,6 +711,8 @@ class TestRestoreEngineFromCheckpoint:
         class MockEngine:
             paths_explored = 0
             max_depth_seen = 0
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 0
             intermediate_states_pruned = 0
             main_deck = [1, 2]
@@ -790,6 +804,8 @@ class TestRestoreEngineFromCheckpoint:
         class MockEngine:
             paths_explored = 789
             max_depth_seen = 18
+            max_depth = 25
+            max_paths = 100000
             duplicate_boards_skipped = 30
             intermediate_states_pruned = 15
             main_deck = [60764609, 81275020]
@@ -0,0 +1,264 @@
+"""
+Unit tests for the compact array-backed transposition table.
+
+CompactTranspositionTable must be a drop-in replacement for
+TranspositionTable: same lookup/store/stats behaviour and, under the "sorted" policy, the
+same eviction order, in a fixed ~24 bytes per entry.
+"""
+
+import random
+
+import pytest
+
+from src.ygo_combo.search.compact_transposition import (
+    COMPACT_EVICTION_POLICIES,
+    MAX_LOAD,
+    CompactTranspositionTable,
+)
+from src.ygo_combo.search.transposition import TranspositionEntry, TranspositionTable
+from fake_engine import run_fake_enumeration, terminal_key
+
+
+def _entry(state_hash, depth=1, visits=1, value=0.0):
+    return TranspositionEntry(
+        state_hash=state_hash,
+        best_terminal_hash="",
+        best_terminal_value=value,
+        creation_depth=depth,
+        visit_count=visits,
+    )
+
+
+class TestCompactTranspositionTable:
+    """Behaviour shared with TranspositionTable."""
+
+    def test_store_and_lookup(self):
+        tt = CompactTranspositionTable(max_size=100)
+        tt.store(0x123456789ABCDEF0, _entry(0x123456789ABCDEF0, depth=5, value=85.0))
+
+        result = tt.lookup(0x123456789ABCDEF0)
+
+        assert result is not None
+        assert result.best_terminal_value == 85.0
+        assert result.creation_depth == 5
+        assert result.visit_count == 2  # Incremented on lookup
+        assert tt.lookup(0xDEADBEEF) is None
+        assert tt.stats()["hits"] == 1
+        assert tt.stats()["misses"] == 1
+
+    def test_zero_and_string_keys(self):
+        tt = CompactTranspositionTable(max_size=10)
+        tt.store(0, _entry(0, depth=0))
+        tt.store("abc123def456", _entry("abc123def456", depth=3))
+
+        assert 0 in tt
+        assert "abc123def456" in tt
+        assert "abc123def457" not in tt
+        assert tt.lookup("abc123def456").creation_depth == 3
+
+    def test_overwrite_keeps_size(self):
+        tt = CompactTranspositionTable(max_size=10)
+        tt.store(7, _entry(7, depth=1))
+        tt.store(7, _entry(7, depth=4))
+
+        assert len(tt) == 1
+        assert tt.overwrites == 1
+        assert tt.stats()["depth_distribution"] == {4: 1}
+
+    def test_clamps_depth_and_visits(self):
+        tt = CompactTranspositionTable(max_size=10)
+        tt.store(1, _entry(1, depth=1000, visits=100_000))
+
+        entry = tt.lookup(1)
+
+        assert entry.creation_depth == 254
+        assert entry.visit_count == 0xFFFF
+
+    def test_remaining_depth_survives_rehash(self):
+        tt = CompactTranspositionTable(max_size=10, eviction_policy="sorted")
+        tt.store(1, TranspositionEntry(1, "", -5.0, 5, 1, remaining_depth=3))
+        tt.store(2, TranspositionEntry(2, "", 0.0, 5, 1, remaining_depth=0))
+        tt.store(3, _entry(3, depth=5))                    # Subtree complete
+        tt.store(4, TranspositionEntry(4, "", 0.0, 5, 1, remaining_depth=1000))
+        for i in range(10, 16):
+            tt.store(i, _entry(i, depth=i - 10))
+        tt.store(100, _entry(100, depth=5))                # Evicts and rehashes
+
+        assert tt.evictions == 1 and 10 not in tt
+
+        entries = dict(tt.items())
+        assert [entries[k].remaining_depth for k in (1, 2, 3, 4)] == [3, 0, None, 254]
+        assert entries[1].best_terminal_value == -5.0
+        # A clamped budget under-reports, so it can only cause a re-search
+        assert not entries[4].covers(300) and entries[3].covers(None)
+
+    def test_depth_preferred_eviction(self):
+        tt = CompactTranspositionTable(max_size=10, eviction_policy="sorted")
+        for i in range(10):
+            tt.store(i, _entry(i, depth=i))
+
+        tt.store(100, _entry(100, depth=10))
+
+        assert len(tt) == 10
+        assert tt.evictions == 1
+        assert 0 not in tt      # Depth 0 evicted
+        assert 9 in tt
+        assert 100 in tt
+
+    def test_eviction_breaks_ties_by_visits(self):
+        tt = CompactTranspositionTable(max_size=10, eviction_policy="sorted")
+        for i in range(10):
+            tt.store(i, _entry(i, depth=3))
+        for _ in range(3):
+            for i in range(1, 10):
+                tt.lookup(i)
+
+        tt.store(100, _entry(100, depth=3))
+
+        assert 0 not in tt      # Same depth, fewest visits
+        assert all(i in tt for i in range(1, 10))
+
+    def test_matches_dict_table(self):
+        rng = random.Random(7)
+        compact = CompactTranspositionTable(max_size=2000)
+        reference = TranspositionTable(max_size=2000)
+        keys = [rng.getrandbits(64) for _ in range(2000)]
+
+        for n, key in enumerate(keys):
+            compact.store(key, _entry(key, depth=n % 20))
+            reference.store(key, _entry(key, depth=n % 20))
+            probe = keys[rng.randrange(n + 1)] if n % 2 else rng.getrandbits(64)
+            assert (compact.lookup(probe) is None) == (reference.lookup(probe) is None)
+
+        assert set(k for k, _ in compact.items()) == set(reference.table)
+        ours, theirs = compact.stats(), reference.stats()
+        for name in ("size", "hits", "misses", "stores", "depth_distribution",
+                     "avg_depth", "max_visits", "avg_visits"):
+            assert ours[name] == theirs[name], name
+
+    def test_eviction_counts_match_dict_table(self):
+        # Ties within a depth are broken differently (slot vs insertion
+        # order), so compare what was evicted per depth rather than keys
+        rng = random.Random(11)
+        compact = CompactTranspositionTable(max_size=500, eviction_policy="sorted")
+        reference = TranspositionTable(max_size=500, eviction_policy="sorted")
+
+        for n in range(3000):
+            key = rng.getrandbits(64)
+            compact.store(key, _entry(key, depth=n % 20))
+            reference.store(key, _entry(key, depth=n % 20))
+
+        ours, theirs = compact.stats(), reference.stats()
+        for name in ("size", "evictions", "evicted_entries", "depth_distribution"):
+            assert ours[name] == theirs[name], name
+
+    def test_window_eviction_drops_shallowest_nearby(self):
+        tt = CompactTranspositionTable(max_size=10)
+        for i in range(10):
+            tt.store(i, _entry(i, depth={3: 1, 9: 0}.get(i, 5)))
+
+        tt.store(tt.capacity, _entry(tt.capacity, depth=5))    # Home slot 0
+
+        assert len(tt) == 10
+        assert tt.evictions == 1 and tt.evicted_entries == 1
+        assert 3 not in tt      # Shallowest in slots 0-7
+        assert 9 in tt          # Shallower, but outside the window
+        assert tt.capacity in tt
+
+    def test_window_eviction_keeps_keys_reachable(self):
+        rng = random.Random(5)
+        tt = CompactTranspositionTable(max_size=200)
+        stored = {}
+        for n in range(5000):
+            # Small key range: long clusters, wrap-around and overwrites
+            key = rng.randrange(4 * tt.capacity)
+            tt.store(key, _entry(key, depth=n % 7, value=float(n)))
+            stored[key] = float(n)
+
+        kept = dict(tt.items())
+        assert len(tt) == len(kept) == 200
+        assert tt.stats()["depth_distribution"] == {
+            d: sum(1 for e in kept.values() if e.creation_depth == d)
+            for d in {e.creation_depth for e in kept.values()}
+        }
+        for key, entry in kept.items():
+            assert key in tt
+            assert tt.lookup(key).best_terminal_value == stored[key]
+
+    @pytest.mark.parametrize("policy", COMPACT_EVICTION_POLICIES)
+    def test_pause_stats(self, policy):
+        tt = CompactTranspositionTable(max_size=10, eviction_policy=policy)
+        for i in range(50):
+            tt.store(i, _entry(i))
+
+        stats = tt.stats()
+
+        assert stats["eviction_policy"] == policy
+        assert stats["evictions"] > 0
+        assert stats["eviction_pause_total_ms"] > 0
+        assert 0 < stats["eviction_pause_max_ms"] <= stats["eviction_pause_total_ms"]
+        assert stats["eviction_pause_avg_ms"] == pytest.approx(
+            stats["eviction_pause_total_ms"] / stats["evictions"])
+
+        tt.clear()
+        assert tt.stats()["eviction_pause_total_ms"] == tt.stats()["eviction_pause_max_ms"] == 0
+
+    def test_rejects_unsupported_policy(self):
+        with pytest.raises(ValueError, match="eviction_policy"):
+            CompactTranspositionTable(max_size=10, eviction_policy="clock")
+
+    def test_memory_is_fixed(self):
+        tt = CompactTranspositionTable(max_size=1000)
+
+        assert tt.capacity >= 1000 / MAX_LOAD
+        assert tt.nbytes <= 24 * 1000 + 15
+        for i in range(5000):
+            tt.store(i, _entry(i))
+        assert tt.nbytes <= 24 * 1000 + 15
+
+    def test_clear(self):
+        tt = CompactTranspositionTable(max_size=10)
+        tt.store(1, _entry(1))
+        tt.lookup(1)
+
+        tt.clear()
+
+        assert len(tt) == 0
+        assert 1 not in tt
+        assert tt.stats()["hits"] == 0
+
+    def test_rejects_empty_table(self):
+        with pytest.raises(ValueError, match="max_size"):
+            CompactTranspositionTable(max_size=0)
+
+
+class TestEngineBackend:
+    """EnumerationEngine(transposition_backend="compact")."""
+
+    def test_same_terminals_as_dict_backend(self):
+        dict_engine, _, dict_terms = run_fake_enumeration("prefix")
+        compact_engine, _, compact_terms = run_fake_enumeration(
+            "prefix", transposition_backend="compact")
+
+        assert isinstance(compact_engine.transposition_table, CompactTranspositionTable)
+        assert [terminal_key(t) for t in compact_terms] == [terminal_key(t) for t in dict_terms]
+        assert compact_engine.intermediate_states_pruned == dict_engine.intermediate_states_pruned
+        assert compact_engine.intermediate_states_pruned > 0
+
+    def test_passes_eviction_policy(self):
+        engine, _, _ = run_fake_enumeration(
+            "prefix", transposition_backend="compact", eviction_policy="sorted")
+
+        assert engine.transposition_table.eviction_policy == "sorted"
+
+    def test_unsupported_policy_rejected(self):
+        from src.ygo_combo.combo_enumeration import EnumerationEngine
+
+        with pytest.raises(ValueError, match="compact"):
+            EnumerationEngine(None, [], [], transposition_backend="compact", eviction_policy="two_tier")
+
+    def test_unknown_backend_rejected(self):
+        from src.ygo_combo.combo_enumeration import EnumerationEngine
+
+        with pytest.raises(ValueError, match="transposition_backend"):
+            EnumerationEngine(None, [], [], transposition_backend="numpy")
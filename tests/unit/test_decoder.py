@@ -0,0 +1,200 @@
+"""
+Unit tests for enumeration/decoder.py.
+
+Every decision message is built as raw bytes, decoded both by the
+table-driven decoder and by the matching parse_* function, and the two
+dicts are compared. Batch tests cover message splitting, skipping of
+informational messages and the SELECT_SUM debug flag.
+"""
+
+import struct
+
+import pytest
+
+from src.ygo_combo.engine.bindings import (
+    MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_CHAIN, MSG_SELECT_EFFECTYN,
+    MSG_SELECT_OPTION, MSG_SELECT_PLACE, MSG_SELECT_POSITION, MSG_SELECT_SUM,
+    MSG_SELECT_TRIBUTE, MSG_SELECT_UNSELECT_CARD, MSG_HINT, MSG_MOVE,
+)
+from src.ygo_combo.enumeration.decoder import (
+    DECODERS,
+    decode_messages,
+    decode_idle,
+    decode_select_card,
+    decode_select_chain,
+    decode_select_option,
+    decode_select_place,
+    decode_select_sum,
+    decode_select_tribute,
+    decode_select_unselect_card,
+)
+from src.ygo_combo.enumeration.parsers import (
+    parse_idle,
+    parse_select_card,
+    parse_select_chain,
+    parse_select_option,
+    parse_select_place,
+    parse_select_sum,
+    parse_select_tribute,
+    parse_select_unselect_card,
+)
+
+
+# =============================================================================
+# MESSAGE BUILDERS
+# =============================================================================
+
+def frame(msg_type: int, body: bytes) -> bytes:
+    """Length-prefixed message as OCG_DuelGetMessage returns it."""
+    return struct.pack("<IB", len(body) + 1, msg_type) + body
+
+
+def idle_body() -> bytes:
+    body = struct.pack("<B", 0)
+    body += struct.pack("<I", 1) + struct.pack("<IBBI", 1001, 0, 2, 0)        # summonable
+    body += struct.pack("<I", 2) + struct.pack("<IBBI", 1002, 0, 2, 1) \
+        + struct.pack("<IBBI", 1003, 0, 64, 0)                                 # spsummon
+    body += struct.pack("<I", 1) + struct.pack("<IBBB", 1004, 0, 4, 2)         # repos
+    body += struct.pack("<I", 0)                                               # mset
+    body += struct.pack("<I", 1) + struct.pack("<IBBI", 1005, 0, 2, 3)         # sset
+    body += struct.pack("<I", 2) + struct.pack("<IBBIQB", 1006, 0, 2, 4, 1006 << 20, 0) \
+        + struct.pack("<IBBIQB", 1007, 0, 16, 0, (1007 << 20) | 1, 1)          # activatable
+    body += struct.pack("<BBB", 1, 1, 0)
+    return body
+
+
+def select_card_body() -> bytes:
+    body = struct.pack("<BBIII", 0, 1, 1, 2, 3)
+    for i in range(3):
+        body += struct.pack("<IBBII", 2000 + i, 0, 1, i, 0x5)
+    return body
+
+
+def select_chain_body() -> bytes:
+    return struct.pack("<BBBB", 0, 2, 0, 1) + b"\x00" * 12
+
+
+def select_place_body() -> bytes:
+    return struct.pack("<BBI", 0, 1, 0xFFFFE0E0)
+
+
+def select_unselect_body() -> bytes:
+    body = struct.pack("<BBBIII", 0, 1, 0, 1, 2, 2)
+    body += struct.pack("<IBBII", 3000, 0, 4, 0, 1) + struct.pack("<IBBII", 3001, 0, 4, 1, 1)
+    body += struct.pack("<I", 1) + struct.pack("<IBBII", 3002, 0, 4, 2, 1)
+    return body
+
+
+def select_option_body() -> bytes:
+    return struct.pack("<BB", 0, 2) + struct.pack("<QQ", 4000 << 20, (4000 << 20) | 1)
+
+
+def select_tribute_body() -> bytes:
+    body = struct.pack("<BBBBB", 0, 0, 1, 2, 2)
+    body += struct.pack("<IBBBI", 5000, 0, 4, 0, 1) + struct.pack("<IBBBI", 5001, 0, 4, 1, 2)
+    return body
+
+
+def select_sum_body() -> bytes:
+    body = struct.pack("<BBIBBB", 0, 0, 6, 2, 2, 1)
+    body += struct.pack("<IBBBI", 6000, 0, 4, 0, 4)
+    body += struct.pack("<B", 2)
+    body += struct.pack("<IBBBI", 6001, 0, 4, 1, 2)
+    body += struct.pack("<IBBBI", 6002, 0, 4, 2, (3 << 16) | 2)
+    return body
+
+
+# =============================================================================
+# PER-MESSAGE EQUIVALENCE
+# =============================================================================
+
+@pytest.mark.parametrize("decoder,parser,body", [
+    (decode_idle, parse_idle, idle_body()),
+    (decode_select_card, parse_select_card, select_card_body()),
+    (decode_select_chain, parse_select_chain, select_chain_body()),
+    (decode_select_place, parse_select_place, select_place_body()),
+    (decode_select_unselect_card, parse_select_unselect_card, select_unselect_body()),
+    (decode_select_option, parse_select_option, select_option_body()),
+    (decode_select_tribute, parse_select_tribute, select_tribute_body()),
+    (decode_select_sum, parse_select_sum, select_sum_body()),
+])
+def test_decoder_matches_parser(decoder, parser, body):
+    assert decoder(memoryview(body)) == parser(body)
+
+
+def test_select_sum_levels():
+    data = decode_select_sum(memoryview(select_sum_body()))
+    assert data["must_select"][0]["level"] == 4
+    assert [c["level"] for c in data["can_select"]] == [2, 2]
+    assert data["can_select"][1]["level2"] == 3
+    assert "_raw_hex" not in data
+
+
+def test_select_sum_truncated_reports_error():
+    data = decode_select_sum(memoryview(b"\x00\x00\x06"))
+    assert data["can_select"] == []
+    assert "_parse_error" in data
+
+
+def test_parse_select_sum_debug_flag():
+    body = select_sum_body()
+    assert "_raw_hex" not in parse_select_sum(body)
+    assert parse_select_sum(body, debug=True)["_raw_hex"] == body.hex()
+
+
+# =============================================================================
+# BATCH DECODING
+# =============================================================================
+
+def test_batch_splits_and_skips_informational():
+    batch = (
+        frame(MSG_HINT, b"\x01\x00" + b"\x00" * 8)
+        + frame(MSG_MOVE, b"\xAA" * 28)
+        + frame(MSG_SELECT_POSITION, b"\x00" * 6)
+        + frame(MSG_IDLE, idle_body())
+    )
+    messages = decode_messages(batch)
+    assert [t for t, _ in messages] == [MSG_HINT, MSG_MOVE, MSG_SELECT_POSITION, MSG_IDLE]
+    assert [d for _, d in messages[:3]] == [None, None, None]
+    assert messages[3][1] == parse_idle(idle_body())
+
+
+def test_batch_accepts_bytearray_and_stops_at_zero_length():
+    batch = bytearray(frame(MSG_SELECT_PLACE, select_place_body()) + b"\x00" * 8)
+    messages = decode_messages(batch)
+    assert messages == [(MSG_SELECT_PLACE, parse_select_place(select_place_body()))]
+
+
+def test_batch_ignores_trailing_partial_header():
+    batch = frame(MSG_SELECT_CHAIN, select_chain_body()) + b"\x05\x00"
+    assert [t for t, _ in decode_messages(batch)] == [MSG_SELECT_CHAIN]
+
+
+def test_empty_batch():
+    assert decode_messages(b"") == []
+
+
+def test_legacy_12_keeps_raw_body():
+    body = b"\x00\x01\x02\x03"
+    [(msg_type, data)] = decode_messages(frame(MSG_SELECT_EFFECTYN, body))
+    assert msg_type == MSG_SELECT_EFFECTYN
+    assert data == {"raw": body}
+    assert isinstance(data["raw"], bytes)
+
+
+def test_select_sum_debug_payload_only_when_enabled():
+    body = select_sum_body()
+    batch = frame(MSG_SELECT_SUM, body)
+    [(_, plain)] = decode_messages(batch)
+    [(_, debug)] = decode_messages(batch, debug=True)
+    assert "_raw_hex" not in plain
+    assert debug["_raw_hex"] == body.hex()
+    assert debug["_raw_len"] == len(body)
+
+
+def test_decoders_cover_decision_messages():
+    assert set(DECODERS) == {
+        MSG_IDLE, MSG_SELECT_CARD, MSG_SELECT_CHAIN, MSG_SELECT_PLACE,
+        MSG_SELECT_UNSELECT_CARD, MSG_SELECT_OPTION, MSG_SELECT_SUM,
+        MSG_SELECT_TRIBUTE, MSG_SELECT_EFFECTYN,
+    }
@@ -0,0 +1,106 @@
+"""
+Unit tests for per-engine depth limits and depth-aware transposition hits.
+
+A deeper enumerate_with_depth_limit call on the same engine must find the
+same boards as a fresh search at that depth: states cut off by the old
+limit are expanded again, states whose subtree was complete are pruned.
+"""
+
+import pytest
+
+from src.ygo_combo import combo_enumeration
+from src.ygo_combo.search.iddfs import IterativeDeepeningSearch, SearchConfig
+from src.ygo_combo.search.transposition import TranspositionEntry
+from fake_engine import (
+    FakeEnumerationEngine, HAND_CARDS, patched_engine, run_fake_enumeration,
+)
+
+
+def pass_boards(terminals):
+    return {t.board_hash for t in terminals if t.termination_reason == "PASS"}
+
+
+def test_covers():
+    complete = TranspositionEntry(1, "", 0.0, 3, 1)
+    cut = TranspositionEntry(1, "", 0.0, 3, 1, remaining_depth=4)
+
+    assert complete.covers(100) and complete.covers(None)
+    assert cut.covers(4) and cut.covers(2)
+    assert not cut.covers(5) and not cut.covers(None)
+
+
+def test_engine_limits_replace_globals():
+    shallow, _, terms = run_fake_enumeration(max_depth=2, max_paths=3)
+
+    assert shallow.max_depth == 2 and shallow.max_paths == 3
+    assert combo_enumeration.MAX_DEPTH == 50 and combo_enumeration.MAX_PATHS == 100000
+    assert shallow.paths_explored == 3
+    assert all(t.depth <= 2 for t in terms)
+    # Another engine keeps the module defaults
+    assert run_fake_enumeration()[0].max_depth_seen > 2
+
+
+@pytest.mark.parametrize("backend", ["dict", "compact"])
+def test_deeper_iteration_matches_fresh_search(backend):
+    full, _, full_terms = run_fake_enumeration()
+    found = set()
+    with patched_engine() as lib:
+        engine = FakeEnumerationEngine(lib, [], [], transposition_backend=backend)
+        for depth in range(1, full.max_depth_seen + 3):
+            terms = engine.enumerate_with_depth_limit(depth, list(HAND_CARDS))
+            found |= pass_boards(terms)
+            fresh, _, fresh_terms = run_fake_enumeration(max_depth=depth)
+
+            assert engine.max_depth == combo_enumeration.MAX_DEPTH   # Restored
+            assert pass_boards(fresh_terms) <= found
+            assert engine.paths_explored <= fresh.paths_explored
+            if 1 < depth <= full.max_depth_seen:
+                # The previous limit cut states off; they are searched again
+                assert engine.states_reexpanded > 0
+
+        # The whole tree fit under the previous limit: the root is pruned
+        assert engine.paths_explored == 1 and engine.intermediate_states_pruned == 1
+    assert found == pass_boards(full_terms)
+
+
+def test_entries_record_budget_and_best_value():
+    with patched_engine() as lib:
+        engine = FakeEnumerationEngine(lib, [], [])
+        engine.enumerate_with_depth_limit(2, list(HAND_CARDS))
+        cut = dict(engine.transposition_table.items())
+
+        engine.enumerate_with_depth_limit(10)
+        complete = dict(engine.transposition_table.items())
+
+    assert all(e.remaining_depth == 2 - e.creation_depth for e in cut.values())
+    assert all(e.remaining_depth is None for e in complete.values())
+    root = min(complete.values(), key=lambda e: e.creation_depth)
+    assert root.best_terminal_value == max(e.best_terminal_value for e in complete.values())
+
+
+def test_new_hand_starts_new_table():
+    with patched_engine() as lib:
+        engine = FakeEnumerationEngine(lib, [], [])
+        engine.enumerate_with_depth_limit(10, list(HAND_CARDS))
+        engine.enumerate_with_depth_limit(10, list(reversed(HAND_CARDS)))
+
+        assert engine.intermediate_states_pruned < engine.paths_explored
+        with pytest.raises(ValueError, match="starting hand"):
+            FakeEnumerationEngine(lib, [], []).enumerate_with_depth_limit(3)
+
+
+def test_iterative_deepening_reuses_table():
+    full, _, full_terms = run_fake_enumeration()
+    with patched_engine() as lib:
+        search = IterativeDeepeningSearch(
+            lambda: FakeEnumerationEngine(lib, [], []),
+            SearchConfig(max_depth=full.max_depth_seen + 2, verbose=False,
+                         starting_hand=list(HAND_CARDS)),
+        )
+        result = search.run()
+
+    assert pass_boards(full_terms) <= search.all_terminal_hashes
+    assert sum(r.states_reexpanded for r in result.depth_results) > 0
+    last = result.depth_results[-1]
+    assert last.paths_explored == 1 and last.states_pruned == 1
+    assert all(r.paths_explored > 0 for r in result.depth_results)
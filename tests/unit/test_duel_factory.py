@@ -0,0 +1,124 @@
+"""
+Unit tests for DuelFactory.
+
+A factory must place exactly the cards create_duel() always placed, and
+reusing its prebuilt structs must give every duel the same start.
+"""
+
+import pytest
+
+from src.ygo_combo.engine.bindings import (
+    LOCATION_DECK, LOCATION_EXTRA, LOCATION_HAND, ffi,
+)
+from src.ygo_combo.engine.duel_factory import (
+    DUEL_FLAGS, DUEL_SEED, ENGRAVER, HOLACTIE,
+    DuelFactory, card_placements, create_duel,
+)
+from src.ygo_combo.engine.script_store import DirectoryScriptStore, set_script_store
+from fake_engine import HAND_CARDS, run_fake_enumeration
+
+MAIN = [1001, 1002, 1003]
+EXTRA = [2001, 2002]
+
+
+class RecordingLib:
+    """Records duel creation and card placement."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.options = []
+        self.cards = []
+
+    def OCG_CreateDuel(self, duel_ptr, options):
+        if self.fail:
+            return 2
+        self.options.append((list(options.seed), options.flags,
+                             options.team1.startingDrawCount, options.team2.startingDrawCount))
+        duel_ptr[0] = ffi.cast("void*", len(self.options))
+        return 0
+
+    def OCG_DuelNewCard(self, duel, info):
+        self.cards.append((int(ffi.cast("uintptr_t", duel)), info.team, info.duelist, info.code,
+                           info.con, info.loc, info.seq, info.pos))
+
+    def OCG_LoadScript(self, duel, data, size, name):
+        return 1
+
+
+@pytest.fixture(autouse=True)
+def no_scripts(tmp_path):
+    set_script_store(DirectoryScriptStore(tmp_path))
+    yield
+    set_script_store(None)
+
+
+def _cards_of(lib, duel_id):
+    return [card[1:] for card in lib.cards if card[0] == duel_id]
+
+
+class TestCardPlacements:
+    """Same layout create_duel() always used."""
+
+    def test_layout(self):
+        placements = card_placements(MAIN, EXTRA, [101, 102])
+        assert len(placements) == 5 + 40 + len(EXTRA) + 40
+
+        hand = [p for p in placements if p[4] == LOCATION_HAND]
+        assert [p[2] for p in hand] == [101, 102, HOLACTIE, HOLACTIE, HOLACTIE]
+
+        deck = [p for p in placements if p[4] == LOCATION_DECK and p[0] == 0]
+        assert [p[2] for p in deck] == MAIN + [HOLACTIE] * 37
+        assert [p[5] for p in deck] == list(range(40))
+
+        extra = [p for p in placements if p[4] == LOCATION_EXTRA]
+        assert [(p[2], p[5]) for p in extra] == [(2001, 0), (2002, 1)]
+
+        opponent = [p for p in placements if p[0] == 1]
+        assert len(opponent) == 40
+        assert all(p[2] == HOLACTIE and p[3] == 1 for p in opponent)
+
+    def test_default_and_oversized_hand(self):
+        default = card_placements([], [])[:5]
+        assert [p[2] for p in default] == [ENGRAVER] + [HOLACTIE] * 4
+
+        oversized = card_placements([], [], list(range(1, 8)))
+        assert [p[2] for p in oversized[:5]] == [1, 2, 3, 4, 5]
+
+
+class TestDuelFactory:
+    """Prebuilt structs are reused across duels."""
+
+    def test_duels_identical(self):
+        lib = RecordingLib()
+        factory = DuelFactory(lib, MAIN, EXTRA, starting_hand=[101])
+
+        first = factory.new_duel()
+        second = factory.new_duel()
+
+        assert first != second
+        assert factory.duels_created == 2
+        assert _cards_of(lib, 1) == _cards_of(lib, 2) == [tuple(p) for p in factory.placements]
+        assert lib.options[0] == lib.options[1] == (list(DUEL_SEED), DUEL_FLAGS, 0, 5)
+
+    def test_matches_create_duel(self):
+        lib = RecordingLib()
+        create_duel(lib, MAIN, EXTRA, starting_hand=[101])
+        DuelFactory(lib, MAIN, EXTRA, starting_hand=[101]).new_duel()
+
+        assert _cards_of(lib, 1) == _cards_of(lib, 2)
+
+    def test_creation_failure(self):
+        factory = DuelFactory(RecordingLib(fail=True), MAIN, EXTRA)
+        with pytest.raises(RuntimeError, match="Failed to create duel"):
+            factory.new_duel()
+        assert factory.duels_created == 0
+
+
+class TestEngineFactory:
+    """EnumerationEngine keeps one factory per starting hand."""
+
+    def test_factory_follows_hand(self):
+        engine, lib, _ = run_fake_enumeration("path")
+
+        assert engine._duel_factory.starting_hand == list(HAND_CARDS)
+        assert engine.duels_created == lib.duels_created
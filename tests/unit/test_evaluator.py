@@ -0,0 +1,182 @@
+"""
+Unit tests for engine/evaluator.py.
+
+The compiled evaluator is checked against the set- and name-based
+scoring it replaced, and its board-hash LRU cache against uncached
+evaluation.
+"""
+
+import random
+
+import pytest
+
+from src.ygo_combo.engine.board_bits import BoardBits
+from src.ygo_combo.engine.board_types import BoardState
+from src.ygo_combo.engine.evaluator import BoardEvaluator, compile_evaluation_config, get_evaluator
+from src.ygo_combo.engine.state import (
+    BoardSignature, _load_evaluation_config, evaluate_board_quality, evaluate_endboard,
+)
+
+
+CAESAR, ABAQU, DESIRAE, SEQUENCE, REQUIEM, ENGRAVER = (
+    79559912, 4731783, 82135803, 49867899, 2463794, 60764609)
+NAMES = {
+    CAESAR: "D/D/D Wave High King Caesar", ABAQU: "A Bao A Qu, the Lightless Shadow",
+    DESIRAE: "Fiendsmith's Desirae", SEQUENCE: "Fiendsmith's Sequence",
+    REQUIEM: "Fiendsmith's Requiem", ENGRAVER: "Fiendsmith Engraver",
+    35552986: "Fiendsmith Token", 40000: "Holactie the Creator of Light", 1: "Filler",
+}
+POOL = list(NAMES)
+
+
+def random_signature(rng):
+    def zone(k):
+        return frozenset(rng.sample(POOL, rng.randrange(k)))
+    monsters = zone(5)
+    return BoardSignature(
+        monsters=monsters, spells=zone(2), graveyard=zone(5), hand=zone(3),
+        banished=frozenset(), extra_deck=frozenset(),
+        equips=frozenset((REQUIEM, m) for m in list(monsters)[:rng.randrange(2)]),
+    )
+
+
+def set_based(sig):
+    """evaluate_board_quality before compilation."""
+    config = _load_evaluation_config()
+    w = config["score_weights"]
+    bosses = sig.monsters & set(config["boss_monsters"])
+    interaction = sig.monsters & set(config["interaction_pieces"])
+    gy = [c for c in sig.graveyard if c in set(config["fiendsmith_gy_targets"])]
+    score = (w["boss_monster"] * len(bosses) + w["interaction_piece"] * len(interaction)
+             + w["equipped_link"] * len(sig.equips) + w["monster_on_field"] * len(sig.monsters)
+             + w["fiendsmith_in_gy"] * len(gy))
+    return score, bool(bosses), bool(interaction)
+
+
+def name_based_endboard(board_state):
+    """evaluate_endboard before it scored by passcode."""
+    if isinstance(board_state, BoardState):
+        board_state = board_state.to_dict()
+    p0 = board_state.get("player0", {})
+    score = 0
+    for card in p0.get("monsters", []):
+        name = card.get("name", "")
+        if name == "D/D/D Wave High King Caesar":
+            score += 100
+        elif "Desirae" in name:
+            score += 100 if card.get("atk", 0) > 2500 else 40
+        elif "Sequence" in name:
+            score += 50
+        elif "Fiendsmith" in name:
+            score += 30
+        else:
+            score += 10
+    score += 10 * sum("Fiendsmith" in c.get("name", "") for c in p0.get("graveyard", []))
+    score += 5 * sum("Holactie" not in c.get("name", "") for c in p0.get("hand", []))
+    return score
+
+
+def board_state(sig, atk):
+    def cards(codes):
+        return [{"code": c, "name": NAMES[c], "atk": atk, "def": 0} for c in sorted(codes)]
+    empty = {zone: [] for zone in ("monsters", "spells", "graveyard", "hand", "banished", "extra")}
+    return {"player0": {**empty, "monsters": cards(sig.monsters), "graveyard": cards(sig.graveyard),
+                        "hand": cards(sig.hand)},
+            "player1": empty}
+
+
+def field_only(sig, monsters=None):
+    """sig without spells, banished and equips (what board_state() keeps)."""
+    return BoardSignature(
+        monsters=frozenset(sig.monsters if monsters is None else monsters),
+        spells=frozenset(), graveyard=sig.graveyard, hand=sig.hand,
+        banished=frozenset(), extra_deck=frozenset(), equips=frozenset(),
+    )
+
+
+BOARDS = [random_signature(random.Random(seed)) for seed in range(40)]
+
+
+# =============================================================================
+# COMPILED SCORING
+# =============================================================================
+
+@pytest.mark.parametrize("sig", BOARDS)
+def test_compiled_matches_set_based(sig):
+    evaluator = get_evaluator()
+    result = evaluator.evaluate(sig)
+    assert (result["score"], result["has_boss"], result["has_interaction"]) == set_based(sig)
+    assert result == evaluator.evaluate_bits(BoardBits.from_signature(sig))
+    assert result == evaluate_board_quality(sig)
+
+
+def test_thresholds_and_weights_come_from_config():
+    config = {"score_weights": {"monster_on_field": 7, "boss_monster": 0},
+              "tier_thresholds": {"S": 14, "A": 7}, "boss_monsters": [CAESAR]}
+    evaluator = compile_evaluation_config(config=config, library={})
+    result = evaluator.evaluate(field_only(BOARDS[0], monsters={CAESAR, 1}))
+    assert result["score"] == 14 and result["tier"] == "S"
+    assert result["details"] == ["Boss monsters: 1"]
+
+
+@pytest.mark.parametrize("atk", [2000, 3000])
+@pytest.mark.parametrize("sig", BOARDS[:20])
+def test_endboard_matches_name_based(sig, atk):
+    board = board_state(sig, atk)
+    assert evaluate_endboard(board) == name_based_endboard(board)
+    assert evaluate_endboard(BoardState.from_dict(board)) == name_based_endboard(board)
+
+
+def test_endboard_reads_names_once_per_code():
+    evaluator = BoardEvaluator({}, names={})
+    reads = []
+
+    class Card(dict):
+        def get(self, key, default=None):
+            if key == "name":
+                reads.append(self["code"])
+            return super().get(key, default)
+
+    board = {"player0": {"monsters": [Card(code=CAESAR, name=NAMES[CAESAR], atk=3000)],
+                         "hand": [Card(code=1, name="Filler"), Card(code=1, name="Filler")]}}
+    assert evaluator.score_endboard(board) == 110
+    assert evaluator.score_endboard(board) == 110
+    assert sorted(reads) == [1, CAESAR]
+
+
+# =============================================================================
+# BOARD HASH CACHE
+# =============================================================================
+
+def test_cache_hits_skip_evaluation():
+    evaluator = BoardEvaluator(_load_evaluation_config(), cache_size=2)
+    sig = BOARDS[1]
+    first = evaluator.evaluate_board(sig, sig.zobrist_hash())
+    # A hit never looks at the board
+    assert evaluator.evaluate_board(None, sig.zobrist_hash()) == first
+    assert evaluator.cache_info() == {"hits": 1, "misses": 1, "size": 1, "capacity": 2}
+
+
+def test_cache_returns_copies():
+    evaluator = BoardEvaluator(_load_evaluation_config())
+    first = evaluator.evaluate_board(BOARDS[2], 7)
+    first["details"].append("mutated")
+    first["score"] = -1
+    assert evaluator.evaluate_board(BOARDS[2], 7) == evaluator.evaluate(BOARDS[2])
+
+
+def test_cache_evicts_least_recently_used():
+    evaluator = BoardEvaluator(_load_evaluation_config(), cache_size=2)
+    for key in (1, 2, 1, 3):
+        evaluator.evaluate_board(BOARDS[key], key)
+    assert list(evaluator._cache) == [1, 3]
+
+
+def test_board_forms_and_no_hash():
+    evaluator = BoardEvaluator(_load_evaluation_config())
+    sig = BOARDS[3]
+    state = BoardState.from_dict(board_state(sig, 0))
+    # BoardState carries no spells here and no equip targets
+    assert evaluator.evaluate_board(state) == evaluator.evaluate(field_only(sig))
+    assert evaluator.evaluate_board(BoardBits.from_signature(sig)) == evaluator.evaluate(sig)
+    assert evaluator.cache_info()["size"] == 0
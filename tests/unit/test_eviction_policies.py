@@ -0,0 +1,236 @@
+"""
+Unit tests for TranspositionTable replacement policies.
+
+Every policy must keep the table within max_size, prefer the entries the
+search values (deep or recently used ones), and report its pause times.
+"""
+
+import os
+import random
+
+import pytest
+
+from src.ygo_combo.search.transposition import (
+    EVICTION_POLICIES,
+    TranspositionEntry,
+    TranspositionTable,
+)
+from src.ygo_combo.fork_enumeration import ForkEnumerationEngine
+from src.ygo_combo.search.compact_transposition import COMPACT_EVICTION_POLICIES
+from fake_engine import FakeMessagesMixin, run_fake_enumeration
+
+
+class FakeForkEngine(FakeMessagesMixin, ForkEnumerationEngine):
+    """ForkEnumerationEngine driven by the fake engine."""
+
+
+def _entry(state_hash, depth=1, visits=1):
+    return TranspositionEntry(state_hash, "", 0.0, depth, visits)
+
+
+def _fill(tt, keys, depth=1):
+    for key in keys:
+        tt.store(key, _entry(key, depth))
+
+
+class TestAllPolicies:
+    """Properties every policy shares."""
+
+    @pytest.mark.parametrize("policy", EVICTION_POLICIES)
+    def test_bounded_size(self, policy):
+        rng = random.Random(3)
+        tt = TranspositionTable(max_size=100, eviction_policy=policy)
+        for n in range(2000):
+            key = rng.getrandbits(64)
+            tt.store(key, _entry(key, depth=n % 15))
+            if n % 3 == 0:
+                tt.lookup(key)
+
+        assert len(tt) <= 100
+        assert tt.evicted_entries == tt.stores - tt.overwrites - len(tt)
+
+    @pytest.mark.parametrize("policy", EVICTION_POLICIES)
+    def test_pause_stats(self, policy):
+        tt = TranspositionTable(max_size=10, eviction_policy=policy)
+        _fill(tt, range(50))
+
+        stats = tt.stats()
+
+        assert stats["eviction_policy"] == policy
+        assert stats["evictions"] > 0
+        assert stats["eviction_pause_total_ms"] > 0
+        assert 0 < stats["eviction_pause_max_ms"] <= stats["eviction_pause_total_ms"]
+        assert stats["eviction_pause_avg_ms"] == pytest.approx(
+            stats["eviction_pause_total_ms"] / stats["evictions"])
+
+    @pytest.mark.parametrize("policy", EVICTION_POLICIES)
+    def test_clear_resets_policy_state(self, policy):
+        tt = TranspositionTable(max_size=10, eviction_policy=policy)
+        _fill(tt, range(30))
+
+        tt.clear()
+        _fill(tt, range(100, 130))
+
+        assert len(tt) <= 10
+        assert all(key >= 100 for key in tt.table)
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError, match="eviction_policy"):
+            TranspositionTable(eviction_policy="lru")
+
+
+class TestDepthBucketed:
+    """Shallowest depth first, oldest first within a depth."""
+
+    def test_evicts_shallowest_oldest(self):
+        tt = TranspositionTable(max_size=4, eviction_policy="depth_bucketed")
+        tt.store("a", _entry("a", depth=3))
+        tt.store("b", _entry("b", depth=1))
+        tt.store("c", _entry("c", depth=1))
+        tt.store("d", _entry("d", depth=5))
+
+        tt.store("e", _entry("e", depth=4))
+        assert "b" not in tt
+        tt.store("f", _entry("f", depth=4))
+        assert "c" not in tt
+        tt.store("g", _entry("g", depth=4))
+        assert "a" not in tt
+        assert set(tt.table) == {"d", "e", "f", "g"}
+
+    def test_overwrite_moves_bucket(self):
+        tt = TranspositionTable(max_size=2, eviction_policy="depth_bucketed")
+        tt.store("a", _entry("a", depth=1))
+        tt.store("b", _entry("b", depth=2))
+        tt.store("a", _entry("a", depth=9))   # Now the deepest
+
+        tt.store("c", _entry("c", depth=5))
+
+        assert "b" not in tt
+        assert "a" in tt
+
+    def test_one_entry_per_eviction(self):
+        tt = TranspositionTable(max_size=1000, eviction_policy="depth_bucketed")
+        _fill(tt, range(1000))
+
+        tt.store(-1, _entry(-1))
+
+        assert tt.evicted_entries == 1
+        assert len(tt) == 1000
+
+
+class TestTwoTier:
+    """Depth-preferred + always-replace buckets."""
+
+    def test_deeper_entry_demotes_preferred(self):
+        tt = TranspositionTable(max_size=2, eviction_policy="two_tier")  # One bucket
+        tt.store(1, _entry(1, depth=5))
+        tt.store(2, _entry(2, depth=2))     # Shallower: always-replace slot
+        assert set(tt.table) == {1, 2}
+
+        tt.store(3, _entry(3, depth=1))     # Replaces the always-replace slot
+        assert set(tt.table) == {1, 3}
+
+        tt.store(4, _entry(4, depth=7))     # Deeper: takes preferred, demotes 1
+        assert set(tt.table) == {4, 1}
+        assert tt.evicted_entries == 2
+
+    def test_deep_entries_survive_shallow_flood(self):
+        tt = TranspositionTable(max_size=64, eviction_policy="two_tier")
+        deep = list(range(1000, 1032))
+        _fill(tt, deep, depth=20)
+        _fill(tt, range(2000, 7000), depth=1)
+
+        survivors = sum(1 for key in deep if key in tt)
+        assert survivors == len({key % 32 for key in deep})
+
+
+class TestClock:
+    """Entries looked up since the last sweep get a second chance."""
+
+    def test_referenced_entries_survive(self):
+        tt = TranspositionTable(max_size=4, eviction_policy="clock")
+        _fill(tt, ["a", "b", "c", "d"])
+        tt.lookup("a")
+        tt.lookup("c")
+
+        tt.store("e", _entry("e"))
+        tt.store("f", _entry("f"))
+
+        assert set(tt.table) == {"a", "c", "e", "f"}
+
+    def test_second_chance_is_spent(self):
+        tt = TranspositionTable(max_size=2, eviction_policy="clock")
+        _fill(tt, ["a", "b"])
+        tt.lookup("a")
+
+        tt.store("c", _entry("c"))      # Skips a, evicts b
+        tt.store("d", _entry("d"))      # a's chance was used: evicted now
+
+        assert set(tt.table) == {"c", "d"}
+
+
+class TestSorted:
+    """Original sort-and-drop-10% policy."""
+
+    def test_drops_bottom_tenth(self):
+        tt = TranspositionTable(max_size=20, eviction_policy="sorted")
+        for i in range(20):
+            tt.store(i, _entry(i, depth=i))
+
+        tt.store(100, _entry(100, depth=0))
+
+        assert tt.evictions == 1
+        assert tt.evicted_entries == 2
+        assert 0 not in tt and 1 not in tt
+        assert len(tt) == 19
+
+
+class TestEngineIntegration:
+    """EnumerationEngine(eviction_policy=...)."""
+
+    @pytest.mark.parametrize("policy", EVICTION_POLICIES)
+    def test_engine_uses_policy(self, policy):
+        engine, _, terminals = run_fake_enumeration("prefix", eviction_policy=policy)
+
+        assert terminals
+        assert engine.transposition_table.eviction_policy == policy
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() not available")
+    @pytest.mark.parametrize("backend,policy", [
+        *(("dict", policy) for policy in EVICTION_POLICIES),
+        *(("compact", policy) for policy in COMPACT_EVICTION_POLICIES),
+    ])
+    def test_fork_engine_uses_policy(self, backend, policy):
+        engine, _, terminals = run_fake_enumeration(
+            engine_cls=FakeForkEngine, transposition_backend=backend, eviction_policy=policy)
+
+        assert terminals
+        assert engine.transposition_table.eviction_policy == policy
+        assert engine.transposition_table.stats()["eviction_policy"] == policy
+
+    def test_checkpoint_restore_tracks_entries(self):
+        from src.ygo_combo.checkpoint import (
+            Checkpoint, TranspositionTableState, restore_engine_from_checkpoint,
+        )
+
+        class MockEngine:
+            main_deck, extra_deck = [], []
+            transposition_table = None
+
+        cp = Checkpoint()
+        cp.transposition_table = TranspositionTableState(
+            max_size=3, hits=7, misses=2, stores=3, overwrites=0, evictions=0, evicted_entries=0,
+            entries={
+                str(k): {"state_hash": str(k), "best_terminal_hash": "", "best_terminal_value": 0.0,
+                         "creation_depth": k, "visit_count": 1}
+                for k in (1, 2, 3)
+            },
+        )
+        engine = MockEngine()
+        restore_engine_from_checkpoint(engine, cp)
+        tt = engine.transposition_table
+
+        assert tt.stats()["hits"] == 7 and tt.stores == 3
+        tt.store(4, _entry(4, depth=9))
+        assert len(tt) == 3
+        assert 1 not in tt
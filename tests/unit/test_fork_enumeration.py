@@ -0,0 +1,80 @@
+"""
+Unit tests for fork_enumeration.py.
+
+Forked children explore subtrees on copy-on-write snapshots of the fake
+duel; the parent must end up with the same unique boards as the replay
+backend.
+"""
+
+import os
+
+import pytest
+
+from src.ygo_combo.fork_enumeration import ForkEnumerationEngine
+from fake_engine import FakeMessagesMixin, run_fake_enumeration
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() not available")
+
+# More slots than the fake tree has branch points: every alternative forks
+ALL_FORK = 64
+
+
+class FakeForkEngine(FakeMessagesMixin, ForkEnumerationEngine):
+    """ForkEnumerationEngine driven by the fake engine."""
+
+
+def unique_boards(terminals):
+    return {t.board_hash for t in terminals}
+
+
+class TestForkEnumeration:
+    """Fork backend produces the same boards as replay."""
+
+    @pytest.mark.parametrize("max_forks", [1, 4])
+    def test_same_unique_boards_as_replay(self, max_forks):
+        _, _, replay_terms = run_fake_enumeration("prefix")
+        engine, _, fork_terms = run_fake_enumeration(engine_cls=FakeForkEngine, max_forks=max_forks)
+
+        assert unique_boards(fork_terms) == unique_boards(replay_terms)
+        assert len(fork_terms) == len(replay_terms)
+        assert engine.forks_created > 0
+
+    def test_without_intermediate_dedupe_matches_paths(self):
+        replay_engine, _, replay_terms = run_fake_enumeration("prefix", dedupe_intermediate=False)
+        engine, _, fork_terms = run_fake_enumeration(
+            engine_cls=FakeForkEngine, max_forks=2, dedupe_intermediate=False)
+
+        # No pruning: both backends walk the full tree
+        assert engine.paths_explored == replay_engine.paths_explored
+        assert sorted(len(t.action_sequence) for t in fork_terms) == \
+            sorted(len(t.action_sequence) for t in replay_terms)
+
+    def test_forked_subtrees_do_not_replay(self):
+        engine, _, _ = run_fake_enumeration(engine_cls=FakeForkEngine, max_forks=ALL_FORK,
+                                            dedupe_intermediate=False, dedupe_boards=False)
+        replay_engine, _, _ = run_fake_enumeration("prefix", dedupe_intermediate=False,
+                                                   dedupe_boards=False)
+
+        assert engine.actions_replayed == 0
+        assert replay_engine.actions_replayed > 0
+
+    def test_max_fork_depth_limits_forking(self):
+        shallow, _, shallow_terms = run_fake_enumeration(
+            engine_cls=FakeForkEngine, max_forks=ALL_FORK, max_fork_depth=0)
+        deep, _, _ = run_fake_enumeration(engine_cls=FakeForkEngine, max_forks=ALL_FORK)
+
+        # Root IDLE has 4 non-PASS alternatives
+        assert shallow.forks_created == 4
+        assert deep.forks_created > shallow.forks_created
+        assert shallow.replay_stats()["forks_created"] == 4
+        assert len(shallow_terms) > 0
+
+    def test_no_free_slot_explores_in_process(self):
+        _, _, replay_terms = run_fake_enumeration("prefix")
+        unbounded, _, _ = run_fake_enumeration(engine_cls=FakeForkEngine, max_forks=ALL_FORK)
+        bounded, _, terms = run_fake_enumeration(engine_cls=FakeForkEngine, max_forks=1)
+
+        # Slot-less alternatives are replayed here rather than forked
+        assert 0 < bounded.forks_created < unbounded.forks_created
+        assert bounded.actions_replayed > 0
+        assert unique_boards(terms) == unique_boards(replay_terms)
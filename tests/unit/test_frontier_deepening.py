@@ -0,0 +1,117 @@
+"""
+Unit tests for EnumerationEngine.deepen and FrontierDeepeningSearch.
+
+Continuing from the previous depth's frontier must find the same boards
+as iterative deepening from the root while exploring fewer paths; a
+frontier over max_frontier must be dropped and the depth re-searched.
+"""
+
+import os
+
+import pytest
+
+from src.ygo_combo.fork_enumeration import ForkEnumerationEngine
+from src.ygo_combo.search.iddfs import (
+    FrontierDeepeningSearch, IterativeDeepeningSearch, SearchConfig,
+)
+from fake_engine import (
+    FakeEnumerationEngine, FakeMessagesMixin, HAND_CARDS, patched_engine, run_fake_enumeration,
+)
+
+
+class FakeForkEngine(FakeMessagesMixin, ForkEnumerationEngine):
+    """ForkEnumerationEngine driven by the fake engine."""
+
+
+def pass_boards(terminals):
+    return {t.board_hash for t in terminals if t.termination_reason == "PASS"}
+
+
+def run_search(search_cls, engine_cls=FakeEnumerationEngine, **config):
+    full, _, full_terms = run_fake_enumeration()
+    with patched_engine() as lib:
+        search = search_cls(
+            lambda: engine_cls(lib, [], []),
+            SearchConfig(max_depth=full.max_depth_seen + 2, verbose=False,
+                         starting_hand=list(HAND_CARDS), **config),
+        )
+        result = search.run()
+    return search, result, pass_boards(full_terms)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+def test_deepen_from_frontier_matches_research():
+    with patched_engine() as lib:
+        resumed = FakeEnumerationEngine(lib, [], [])
+        research = FakeEnumerationEngine(lib, [], [])
+        resumed.deepen(2, starting_hand=list(HAND_CARDS))
+        research.deepen(2, starting_hand=list(HAND_CARDS))
+        frontier = resumed.cutoffs
+
+        below = pass_boards(resumed.deepen(3, frontier))
+        again = pass_boards(research.deepen(3, previous_depth=2))
+
+        assert frontier and all(len(node) == 2 for node in frontier)
+        assert below and below <= again
+        assert resumed.paths_explored < research.paths_explored
+        assert all(len(node) == 3 for node in resumed.cutoffs)
+        assert len(resumed.cutoffs) == len(research.cutoffs)
+        assert resumed.research_seconds >= 0 and resumed.expansion_seconds > 0
+
+
+def test_deepen_drops_frontier_over_cap():
+    with patched_engine() as lib:
+        uncapped = FakeEnumerationEngine(lib, [], [])
+        uncapped.deepen(2, starting_hand=list(HAND_CARDS))
+        capped = FakeEnumerationEngine(lib, [], [])
+        capped.deepen(2, starting_hand=list(HAND_CARDS), max_frontier=len(uncapped.cutoffs) - 1)
+
+        assert len(uncapped.cutoffs) > 1 and capped.cutoffs is None
+
+
+def test_deepen_rejects_bad_previous_depth():
+    with patched_engine() as lib:
+        engine = FakeEnumerationEngine(lib, [], [])
+        with pytest.raises(ValueError, match="previous_depth"):
+            engine.deepen(3, starting_hand=list(HAND_CARDS), previous_depth=3)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() not available")
+def test_fork_engine_deepens_in_process():
+    with patched_engine() as lib:
+        engine = FakeForkEngine(lib, [], [])
+        engine.deepen(3, starting_hand=list(HAND_CARDS))
+        assert engine.forks_created == 0 and engine.cutoffs
+
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+def test_frontier_search_finds_same_boards_in_fewer_paths():
+    iddfs, iddfs_result, full_boards = run_search(IterativeDeepeningSearch)
+    search, result, _ = run_search(FrontierDeepeningSearch)
+
+    assert full_boards <= search.all_terminal_hashes
+    assert search.all_terminal_hashes == iddfs.all_terminal_hashes
+    assert result.total_paths < iddfs_result.total_paths
+    first, *rest = result.depth_results
+    assert not first.resumed and all(r.resumed for r in rest)
+    assert all(r.research_seconds >= 0 and r.expansion_seconds >= 0 for r in result.depth_results)
+    # The whole tree fit: nothing left below the last depth
+    assert result.depth_results[-1].frontier_size == 0
+
+
+def test_frontier_over_cap_falls_back_to_research():
+    iddfs, _, full_boards = run_search(IterativeDeepeningSearch)
+    search, result, _ = run_search(FrontierDeepeningSearch, max_frontier=3)
+
+    assert full_boards <= search.all_terminal_hashes
+    assert search.all_terminal_hashes == iddfs.all_terminal_hashes
+    dropped = [r for r in result.depth_results if r.frontier_size is None]
+    assert dropped
+    for previous, current in zip(result.depth_results, result.depth_results[1:]):
+        assert current.resumed == (previous.frontier_size is not None)
@@ -0,0 +1,157 @@
+"""
+Unit tests for splitting one hand's search tree into prefix work units.
+
+expand_frontier() explores the tree down to a cut depth and returns the
+action histories found there; enumerating every prefix separately and
+adding the terminals above the cut must cover exactly the tree that a
+single sequential enumeration explores.
+"""
+
+from unittest.mock import patch
+
+import itertools
+
+import pytest
+
+from src.ygo_combo import combo_enumeration
+from fake_engine import HAND_CARDS, FakeEnumerationEngine, patched_engine, run_fake_enumeration
+
+
+def _split_enumeration(depth, **engine_kwargs):
+    """Expand to depth, enumerate every prefix, return (expander, units, lib)."""
+    with patched_engine() as lib:
+        expander = FakeEnumerationEngine(lib, [], [], **engine_kwargs)
+        frontier = [list(p) for p in expander.expand_frontier(list(HAND_CARDS), depth)]
+
+        units = []
+        for prefix in frontier:
+            engine = FakeEnumerationEngine(lib, [], [], **engine_kwargs)
+            engine.enumerate_from_hand(list(HAND_CARDS), prefix=prefix)
+            units.append(engine)
+    return expander, units, lib
+
+
+class TestExpandFrontier:
+    """EnumerationEngine.expand_frontier / enumerate_from_hand(prefix=...)."""
+
+    @pytest.mark.parametrize("depth", [1, 2, 3])
+    def test_prefixes_cut_at_depth(self, depth):
+        expander, units, lib = _split_enumeration(depth, dedupe_intermediate=False)
+
+        assert expander.frontier
+        assert all(len(prefix) == depth for prefix in expander.frontier)
+        # PASS terminals of nodes above the cut (the PASS action adds one)
+        assert all(t.depth <= depth for t in expander.terminals)
+        assert lib.duels_destroyed == lib.duels_created
+
+    @pytest.mark.parametrize("depth", [1, 2, 4])
+    def test_units_cover_whole_tree(self, depth):
+        sequential, _, terminals = run_fake_enumeration(dedupe_intermediate=False)
+        expander, units, _ = _split_enumeration(depth, dedupe_intermediate=False)
+
+        split_boards = {t.board_hash for t in expander.terminals}
+        for unit in units:
+            split_boards.update(t.board_hash for t in unit.terminals)
+
+        assert split_boards == {t.board_hash for t in terminals}
+        assert expander.paths_explored + sum(u.paths_explored for u in units) == sequential.paths_explored
+
+    def test_transposition_pruning_above_cut(self):
+        expander, units, _ = _split_enumeration(3)
+        _, _, terminals = run_fake_enumeration()
+
+        split_boards = {t.board_hash for t in expander.terminals}
+        for unit in units:
+            split_boards.update(t.board_hash for t in unit.terminals)
+
+        assert expander.intermediate_states_pruned > 0
+        assert split_boards == {t.board_hash for t in terminals}
+
+    def test_engine_reusable_after_expansion(self):
+        with patched_engine() as lib:
+            engine = FakeEnumerationEngine(lib, [], [])
+            engine.expand_frontier(list(HAND_CARDS), 2)
+            terminals = engine.enumerate_from_hand(list(HAND_CARDS))
+
+        _, _, expected = run_fake_enumeration()
+        assert [t.board_hash for t in terminals] == [t.board_hash for t in expected]
+        assert engine.frontier == []
+
+    def test_depth_must_be_positive(self):
+        engine = FakeEnumerationEngine(None, [], [])
+        with pytest.raises(ValueError, match="depth"):
+            engine.expand_frontier(list(HAND_CARDS), 0)
+
+
+class TestTimeBudgetDonation:
+    """Stragglers donate their unexplored subtrees once the budget is spent."""
+
+    def _drain(self, budget, **engine_kwargs):
+        """Enumerate with a budget, re-queueing donated prefixes until done."""
+        clock = itertools.count()  # Every deadline check advances one "second"
+        engines = []
+        todo = [None]
+        with patched_engine() as lib, \
+                patch.object(combo_enumeration.time, "monotonic", lambda: float(next(clock))):
+            while todo:
+                prefix = todo.pop()
+                engine = FakeEnumerationEngine(lib, [], [], **engine_kwargs)
+                engine.enumerate_from_hand(list(HAND_CARDS), prefix=prefix, time_budget=budget)
+                todo.extend(engine.frontier)
+                engines.append(engine)
+        return engines, lib
+
+    def test_donated_units_cover_whole_tree(self):
+        sequential, _, terminals = run_fake_enumeration(dedupe_intermediate=False)
+        engines, lib = self._drain(3, dedupe_intermediate=False)
+
+        assert len(engines) > 2
+        assert engines[0].frontier
+        boards = {t.board_hash for e in engines for t in e.terminals}
+        assert boards == {t.board_hash for t in terminals}
+        assert sum(e.paths_explored for e in engines) == sequential.paths_explored
+        assert lib.duels_destroyed == lib.duels_created
+
+    def test_root_prefix_always_explored(self):
+        engines, _ = self._drain(0.5)
+
+        for engine in engines:
+            assert engine.paths_explored >= 1
+            assert all(len(p) > len(engine._root_prefix) for p in engine.frontier)
+
+    def test_no_budget_no_donation(self):
+        engine, _, _ = run_fake_enumeration()
+        assert engine.frontier == []
+
+
+class TestWorkerEntryPoint:
+    """Module-level combo_enumeration.expand_frontier."""
+
+    def _expand(self, **kwargs):
+        with patched_engine() as lib:
+            fake = FakeEnumerationEngine(lib, [], [])
+            with patch.object(combo_enumeration, "_create_worker_engine", return_value=fake):
+                return combo_enumeration.expand_frontier(HAND_CARDS, **kwargs)
+
+    def test_adaptive_depth_reaches_target(self):
+        shallow = self._expand(min_units=1)
+        deeper = self._expand(min_units=10)
+
+        assert shallow["split_depth"] == 1
+        assert deeper["split_depth"] > 1
+        assert len(deeper["frontier"]) >= 10
+        assert all(len(p) == deeper["split_depth"] for p in deeper["frontier"])
+
+    def test_fixed_depth(self):
+        result = self._expand(split_depth=3, min_units=1000)
+
+        assert result["split_depth"] == 3
+        assert "terminal_hashes" in result
+        assert "intermediate_states_pruned" in result
+
+    def test_expansion_failure_falls_back_to_whole_tree(self):
+        with patch.object(combo_enumeration, "_create_worker_engine", side_effect=RuntimeError("no engine")):
+            result = combo_enumeration.expand_frontier(HAND_CARDS, min_units=4)
+
+        assert result["frontier"] == [[]]
+        assert result["terminal_hashes"] == []
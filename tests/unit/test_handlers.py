@@ -11,6 +11,8 @@ from typing import List, Dict, Any, Optional
 from unittest.mock import patch
 
 from src.ygo_combo.enumeration.handlers import MessageHandlerMixin
+from src.ygo_combo.search.shared_transposition import SharedTranspositionTable
+from src.ygo_combo.search.transposition import TranspositionEntry
 from src.ygo_combo.types import Action
 
 
@@ -26,8 +28,15 @@ class HandlerHarness(MessageHandlerMixin):
     Expected Attributes (from handlers.py docstring):
         - lib: The CFFI library handle
         - dedupe_intermediate: bool - Whether to dedupe intermediate states
+        - idle_capture: str - Board capture for the intermediate-state hash
         - transposition_table: TranspositionTable instance
         - intermediate_states_pruned: int - Counter for pruned states
+        - shared_table: SharedTranspositionTable or None - Cross-worker table
+        - shared_states_pruned: int - Counter for states pruned by shared_table
+        - states_reexpanded: int - Counter for hits searched again with more depth
+        - max_depth: int - Depth limit of the search
+        - _subtrees: list - [best value, cut, best terminal] frame per IDLE
+          state being searched
         - verbose: bool - Enable verbose logging
         - prioritize_cards: set - Card codes to prioritize
         - prioritize_order: list - Order of prioritized cards
@@ -37,6 +46,8 @@ class HandlerHarness(MessageHandlerMixin):
         - log(msg, depth): Log a message at given depth
         - _recurse(action_history): Continue enumeration with action history
         - _record_terminal(action_history, reason): Record a terminal state
+        - _board_value(board_state, board_hash): Score of a terminal board
+        - _use_cached_result / _persist_subtree: Persistent cache only (unused)
         - _compute_select_card_context(select_data): Compute context hash
         - _mark_card_failed_at_context(context_hash, card_code): Mark card failed
     """
@@ -51,8 +62,14 @@ class HandlerHarness(MessageHandlerMixin):
         # Required attributes
         self.lib = None  # Not needed for simple handlers
         self.dedupe_intermediate = dedupe_intermediate
+        self.idle_capture = "targeted"
         self.transposition_table = MockTranspositionTable()
         self.intermediate_states_pruned = 0
+        self.shared_table = None
+        self.shared_states_pruned = 0
+        self.states_reexpanded = 0
+        self.max_depth = 50
+        self._subtrees = []
         self.verbose = verbose
         self.prioritize_cards = prioritize_cards or set()
         self.prioritize_order = prioritize_order or []
@@ -1370,17 +1387,18 @@ class TestHandleIdleActionFormat:
 class TestHandleIdleDeduplication:
     """Tests for _handle_idle transposition table deduplication."""
 
+    @patch('src.ygo_combo.enumeration.handlers.capture_board_signature')
     @patch('src.ygo_combo.enumeration.handlers.IntermediateState')
-    def test_deduplication_enabled_skips_duplicate_state(self, mock_state_class):
+    def test_deduplication_enabled_skips_duplicate_state(self, mock_state_class, mock_capture):
         """Handler should skip processing when state is already in transposition table."""
         harness = HandlerHarness(dedupe_intermediate=True)
 
         # Set up mock to return a state with known hash
         mock_state = MockIntermediateState(hash_value=99999)
-        mock_state_class.from_engine.return_value = mock_state
+        mock_state_class.from_signature.return_value = mock_state
 
-        # Pre-populate transposition table with this hash
-        harness.transposition_table.stored[99999] = "existing_entry"
+        # Pre-populate transposition table with this hash (subtree fully searched)
+        harness.transposition_table.stored[99999] = TranspositionEntry(99999, "", 0.0, 0, 1)
 
         idle_data = {
             "activatable": [{"code": 111, "loc": 2, "desc": 0}],
@@ -1395,8 +1413,9 @@ class TestHandleIdleDeduplication:
         assert len(harness.recorded_recurses) == 0
         assert harness.intermediate_states_pruned == 1
 
+    @patch('src.ygo_combo.enumeration.handlers.capture_board_signature')
     @patch('src.ygo_combo.enumeration.handlers.IntermediateState')
-    def test_deduplication_disabled_no_pruning(self, mock_state_class):
+    def test_deduplication_disabled_no_pruning(self, mock_state_class, mock_capture):
         """Handler should not prune when dedupe_intermediate is False."""
         harness = HandlerHarness(dedupe_intermediate=False)
 
@@ -1409,17 +1428,19 @@ class TestHandleIdleDeduplication:
 
         harness._handle_idle(None, [], idle_data)
 
-        # Should process - IntermediateState.from_engine never called
-        mock_state_class.from_engine.assert_not_called()
+        # Should process - no capture, no IntermediateState
+        mock_capture.assert_not_called()
+        mock_state_class.from_signature.assert_not_called()
         assert len(harness.recorded_recurses) == 1
 
+    @patch('src.ygo_combo.enumeration.handlers.capture_board_signature')
     @patch('src.ygo_combo.enumeration.handlers.IntermediateState')
-    def test_stores_state_in_transposition_table(self, mock_state_class):
+    def test_stores_state_in_transposition_table(self, mock_state_class, mock_capture):
         """Handler should store new states in transposition table."""
         harness = HandlerHarness(dedupe_intermediate=True)
 
         mock_state = MockIntermediateState(hash_value=77777)
-        mock_state_class.from_engine.return_value = mock_state
+        mock_state_class.from_signature.return_value = mock_state
 
         idle_data = {
             "activatable": [{"code": 111, "loc": 2, "desc": 0}],
@@ -1435,6 +1456,67 @@ class TestHandleIdleDeduplication:
         # Branch should be created
         assert len(harness.recorded_recurses) == 1
 
+    @patch('src.ygo_combo.enumeration.handlers.capture_board_signature')
+    @patch('src.ygo_combo.enumeration.handlers.IntermediateState')
+    def test_reexpands_state_searched_with_less_depth(self, mock_state_class, mock_capture):
+        """A hit cut off with fewer actions left than now is searched again."""
+        harness = HandlerHarness(dedupe_intermediate=True)
+        mock_state_class.from_signature.return_value = MockIntermediateState(hash_value=55555)
+        harness.transposition_table.stored[55555] = TranspositionEntry(
+            55555, "", 0.0, 48, 1, remaining_depth=2)
+        idle_data = {
+            "activatable": [{"code": 111, "loc": 2, "desc": 0}],
+            "spsummon": [],
+            "summonable": [],
+            "to_ep": False,
+        }
+
+        harness._handle_idle(None, [], idle_data)
+
+        assert len(harness.recorded_recurses) == 1
+        assert harness.states_reexpanded == 1 and harness.intermediate_states_pruned == 0
+        # Nothing below hit a limit: the entry now covers any depth
+        assert harness.transposition_table.stored[55555].remaining_depth is None
+
+        # The same hit one action from the limit is covered and pruned
+        harness.transposition_table.stored[55555] = TranspositionEntry(
+            55555, "", 0.0, 48, 1, remaining_depth=2)
+        harness._handle_idle(None, [None] * 49, idle_data)
+        assert harness.intermediate_states_pruned == 1
+
+    @patch('src.ygo_combo.enumeration.handlers.capture_board_signature')
+    @patch('src.ygo_combo.enumeration.handlers.IntermediateState')
+    def test_shared_hits_follow_remaining_depth(self, mock_state_class, mock_capture):
+        """Cross-worker hits only prune when recorded with at least as much depth left."""
+        mock_state_class.from_signature.return_value = MockIntermediateState(hash_value=44444)
+        idle_data = {
+            "activatable": [{"code": 111, "loc": 2, "desc": 0}],
+            "spsummon": [],
+            "summonable": [],
+            "to_ep": False,
+        }
+        shared = SharedTranspositionTable.create(64)
+        try:
+            shared.probe(44444, 2)        # Explored elsewhere two actions from the limit
+
+            harness = HandlerHarness(dedupe_intermediate=True)
+            harness.shared_table = shared
+            harness._handle_idle(None, [], idle_data)
+            assert len(harness.recorded_recurses) == 1
+            assert harness.shared_states_pruned == 0
+
+            # Now recorded with the root's budget: deeper copies are pruned,
+            # including one the local table only holds with less depth left
+            other = HandlerHarness(dedupe_intermediate=True)
+            other.shared_table = shared
+            other.transposition_table.stored[44444] = TranspositionEntry(
+                44444, "", 0.0, 48, 1, remaining_depth=2)
+            other._handle_idle(None, [None] * 10, idle_data)
+            assert len(other.recorded_recurses) == 0
+            assert other.states_reexpanded == 1 and other.shared_states_pruned == 1
+        finally:
+            shared.unlink()
+
 
 # =============================================================================
 # Tests for _handle_select_unselect_card
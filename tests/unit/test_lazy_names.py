@@ -0,0 +1,154 @@
+"""
+Unit tests for deferred card names.
+
+Handlers and board capture must not look up card names while building
+branches; names are resolved once, when an action or board is rendered.
+"""
+
+import pickle
+from unittest.mock import patch
+
+from src.ygo_combo.engine.board_types import BoardState
+from src.ygo_combo.engine.state import BoardSignature
+from src.ygo_combo.enumeration.handlers import MessageHandlerMixin
+from src.ygo_combo.types import Action, CardText
+from fake_engine import run_fake_enumeration
+
+
+class CountingNames:
+    """get_card_name stand-in that counts lookups."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, code):
+        self.calls.append(code)
+        return f"Card_{code}"
+
+
+class Harness(MessageHandlerMixin):
+    dedupe_intermediate = False
+    shared_table = None
+    verbose = False
+    prioritize_cards = set()
+    prioritize_order = []
+
+    def __init__(self):
+        self.failed_at_context = {}
+        self.branches = []
+
+    def log(self, msg, depth):
+        pass
+
+    def _recurse(self, action_history):
+        self.branches.append(action_history[-1])
+
+    def _record_terminal(self, action_history, reason):
+        pass
+
+    def _compute_select_card_context(self, select_data):
+        return 0
+
+
+def _action(description, card_name=None):
+    return Action("ACTIVATE", 0, 0, b"\0", description, card_code=7, card_name=card_name)
+
+
+class TestCardText:
+    """CardText and the Action fields that accept it."""
+
+    def test_rendered_once_on_read(self):
+        names = CountingNames()
+        action = _action(CardText("Activate {} and {}", (7, 8), names),
+                         CardText("{}", (7,), names))
+        assert names.calls == []
+
+        assert action.description == "Activate Card_7 and Card_8"
+        assert action.description == "Activate Card_7 and Card_8"
+        assert action.card_name == "Card_7"
+        assert names.calls == [7, 8, 7]
+
+    def test_export_and_equality(self):
+        lazy = _action(CardText("Select {}", (7,), CountingNames()), CardText("{}", (7,), CountingNames()))
+        plain = _action("Select Card_7", "Card_7")
+
+        assert lazy == plain
+        assert lazy.to_dict() == plain.to_dict()
+        assert "_description" not in lazy.to_dict()
+
+    def test_plain_strings_and_defaults(self):
+        action = _action("Pass")
+        assert action.card_name is None
+        action.description = "Pass (End Phase)"
+        assert action.description == "Pass (End Phase)"
+
+    def test_pickle_unrendered(self):
+        action = _action(CardText("Select {}", (7,), str))
+        assert pickle.loads(pickle.dumps(action)).description == "Select 7"
+
+    def test_card_info_name(self):
+        names = CountingNames()
+        empty = {"hand": [], "monsters": [], "spells": [], "graveyard": [], "banished": [], "extra": []}
+        board = BoardState.from_dict({
+            "player0": dict(empty, monsters=[{"code": 7, "name": CardText("{}", (7,), names)}]),
+            "player1": empty,
+        })
+
+        assert BoardSignature.from_board_state(board).monsters == frozenset({7})
+        assert names.calls == []
+        assert board.player0.monsters[0].name == "Card_7"
+        assert board.to_dict()["player0"]["monsters"][0]["name"] == "Card_7"
+        assert names.calls == [7]
+
+
+class TestHandlersDeferNames:
+    """Branch creation does no name lookups unless verbose."""
+
+    def test_idle_branches(self):
+        names = CountingNames()
+        harness = Harness()
+        idle_data = {
+            "activatable": [{"code": 1, "loc": 2, "desc": 1}],
+            "spsummon": [{"code": 2}],
+            "summonable": [{"code": 3}],
+            "to_ep": False,
+        }
+        with patch("src.ygo_combo.enumeration.handlers.get_card_name", names):
+            harness._handle_idle(None, [], idle_data)
+            assert names.calls == []
+
+            descriptions = [a.description for a in harness.branches]
+        assert descriptions == ["Activate Card_1 (hand eff1)", "Special Summon Card_2",
+                                "Normal Summon Card_3"]
+        assert [a.card_name for a in harness.branches] == ["Card_1", "Card_2", "Card_3"]
+
+    def test_multi_select_and_sum(self):
+        names = CountingNames()
+        harness = Harness()
+        with patch("src.ygo_combo.enumeration.handlers.get_card_name", names):
+            harness._handle_select_card(None, [], {"cards": [{"code": 1}, {"code": 2}], "min": 2, "max": 2})
+            harness._handle_select_sum(None, [], {
+                "must_select": [], "target_sum": 2, "min": 2, "max": 2, "select_mode": 0,
+                "can_select": [{"code": 4, "value": 1}, {"code": 5, "value": 1}],
+            })
+            assert names.calls == []
+
+            descriptions = [a.description for a in harness.branches]
+        assert "Select Card_1, Card_2" in descriptions
+        assert any(d.startswith("Sum select: Card_4, Card_5") for d in descriptions)
+
+
+class TestEnumerationDefersNames:
+    """A whole search does no name lookups until terminals are exported."""
+
+    def test_lookups_only_on_export(self):
+        names = CountingNames()
+        with patch("src.ygo_combo.enumeration.handlers.get_card_name", names):
+            _, _, terminals = run_fake_enumeration()
+            assert terminals
+            assert names.calls == []
+
+            exported = [t.to_dict() for t in terminals]
+        assert names.calls
+        assert all("Card_" in a["description"]
+                   for t in exported for a in t["action_sequence"] if a["card_code"])
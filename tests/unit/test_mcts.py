@@ -0,0 +1,104 @@
+"""
+Unit tests for mcts.py.
+
+Run to exhaustion, MCTS must find the same boards as DFS with one tree
+node per distinct IDLE state; under a budget it must stop on time and
+report the best board found so far.
+"""
+
+import pytest
+
+from src.ygo_combo.cards.roles import CardClassification, CardRole, CardRoleClassifier
+from src.ygo_combo.mcts import MCTSEngine
+from src.ygo_combo.search.iddfs import TargetTierReached
+from fake_engine import (
+    FakeMessagesMixin, SUMMON_CARD, boss_evaluator, run_fake_enumeration, terminal_key,
+)
+
+
+class FakeMCTSEngine(FakeMessagesMixin, MCTSEngine):
+    """MCTSEngine driven by the fake engine."""
+
+
+def run_mcts(**kwargs):
+    kwargs.setdefault("evaluator", boss_evaluator())
+    kwargs.setdefault("seed", 7)
+    return run_fake_enumeration(engine_cls=FakeMCTSEngine, **kwargs)
+
+
+# =============================================================================
+# TREE SEARCH
+# =============================================================================
+
+@pytest.mark.parametrize("rollout_workers", [1, 2])
+def test_exhausted_tree_finds_same_boards_as_dfs(rollout_workers):
+    dfs, _, dfs_terms = run_fake_enumeration()
+    engine, _, terms = run_mcts(iterations=None, rollout_workers=rollout_workers)
+
+    assert engine.stopped_reason == "tree_exhausted"
+    assert {t.board_hash for t in terms} == {t.board_hash for t in dfs_terms}
+    # Transpositions share a node: one per distinct IDLE state
+    assert len(engine.nodes) == len(dfs.transposition_table)
+    assert engine.best_tier == "S"
+
+
+def test_iteration_budget_gives_anytime_answer():
+    engine, _, terms = run_mcts(iterations=5)
+
+    assert engine.stopped_reason == "iterations"
+    assert engine.iterations_done == 5 and engine.rollouts > 0
+    assert engine.best_terminal in terms
+    scores = [point["best_score"] for point in engine.curve]
+    assert scores == sorted(scores) and scores[-1] == engine.best_score
+
+
+def test_time_budget():
+    engine, _, _ = run_mcts(iterations=None, time_budget=1e-9)
+    assert engine.stopped_reason == "time_budget"
+    assert engine.iterations_done == 0
+
+
+def test_stopping_condition():
+    engine, _, _ = run_mcts(iterations=None, stopping_conditions=[TargetTierReached("S")])
+    assert engine.stopped_reason == "target_tier_reached (S)"
+    assert [c.code for c in engine.best_terminal.board_state.player0.monsters] == [SUMMON_CARD]
+
+
+def test_seeded_runs_are_reproducible():
+    _, _, first = run_mcts(iterations=8)
+    _, _, second = run_mcts(iterations=8)
+    assert list(map(terminal_key, first)) == list(map(terminal_key, second))
+
+
+def test_visits_back_up_to_principal_line():
+    engine, _, _ = run_mcts(iterations=30)
+    root_children = [engine.nodes[h] for h in engine._root.children]
+    assert sum(c.visits for c in root_children) == engine.iterations_done
+    line = engine.principal_line()
+    assert line and all(len(a) < len(b) for a, b in zip(line, line[1:]))
+
+
+# =============================================================================
+# ROLLOUT POLICY
+# =============================================================================
+
+def test_roles_policy_weights_actions_by_card_role():
+    classifier = CardRoleClassifier()
+    classifier.add_classification(CardClassification(SUMMON_CARD, CardRole.PAYOFF))
+    classifier.add_classification(CardClassification(101, CardRole.STARTER))
+    engine = MCTSEngine(None, [], [], rollout_policy="roles", classifier=classifier)
+
+    weight = lambda code: engine._action_weight(type("A", (), {"card_code": code})())  # noqa: E731
+    assert [weight(SUMMON_CARD), weight(101), weight(999), weight(None)] == [8.0, 4.0, 1.0, 1.0]
+
+    run, _, terms = run_mcts(iterations=10, rollout_policy="roles", classifier=classifier)
+    assert run.best_tier == "S" and terms
+
+
+def test_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        MCTSEngine(None, [], [], rollout_policy="greedy")
+    with pytest.raises(ValueError):
+        MCTSEngine(None, [], [], iterations=0)
+    with pytest.raises(ValueError):
+        MCTSEngine(None, [], [], rollout_workers=0)
@@ -5,6 +5,7 @@ import unittest
 import sys
 from pathlib import Path
 from math import comb
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "ygo_combo"))
 
@@ -14,7 +15,40 @@ from search.parallel import (
     ParallelResult,
     generate_all_hands,
     estimate_runtime,
+    merge_hand_results,
+    plan_work_units,
+    WorkUnit,
+    _should_split,
+    _iter_scheduled_results,
 )
+import search.parallel as parallel_module
+
+
+class _InlinePool:
+    """Pool stand-in that runs apply_async calls synchronously."""
+
+    def __init__(self):
+        self.units = []
+
+    def apply_async(self, func, args, callback=None, error_callback=None):
+        self.units.append(args[0])
+        try:
+            value = func(*args)
+        except Exception as e:
+            error_callback(e)
+        else:
+            callback(value)
+
+
+def _part(hand, terminals, paths=1):
+    return ComboResult(
+        hand=hand,
+        terminal_boards=terminals,
+        best_score=0.0,
+        paths_explored=paths,
+        depth_reached=1,
+        duration_ms=1.0,
+    )
 
 
 class TestParallelConfig(unittest.TestCase):
@@ -199,5 +233,188 @@ class TestParallelResult(unittest.TestCase):
         self.assertIsNone(result.best_hand)
 
 
+class TestIntraHandSplit(unittest.TestCase):
+    """Test splitting one hand into prefix work units."""
+
+    def _part(self, terminals, score=0.0, paths=1, depth=1, pruned=0):
+        return ComboResult(
+            hand=(1, 2, 3, 4, 5),
+            terminal_boards=terminals,
+            best_score=score,
+            paths_explored=paths,
+            depth_reached=depth,
+            duration_ms=1.0,
+            duels_created=1,
+            intermediate_states_pruned=pruned,
+        )
+
+    def test_merge_unions_terminals(self):
+        """Merged result holds each terminal hash once, in first-seen order."""
+        parts = [self._part(["a"]), self._part(["b", "a"]), self._part(["c", "b"])]
+        merged = merge_hand_results((1, 2, 3, 4, 5), parts, duration_ms=7.0)
+
+        self.assertEqual(merged.terminal_boards, ["a", "b", "c"])
+        self.assertEqual(merged.duration_ms, 7.0)
+        self.assertEqual(merged.work_units, 2)
+
+    def test_merge_counters(self):
+        """Counters are summed, score and depth take the maximum."""
+        parts = [
+            self._part([], score=10.0, paths=3, depth=2, pruned=1),
+            self._part(["x"], score=40.0, paths=5, depth=9, pruned=4),
+            self._part(["y"], score=20.0, paths=7, depth=6, pruned=0),
+        ]
+        merged = merge_hand_results((1, 2, 3, 4, 5), parts, duration_ms=1.0)
+
+        self.assertEqual(merged.best_score, 40.0)
+        self.assertEqual(merged.paths_explored, 15)
+        self.assertEqual(merged.depth_reached, 9)
+        self.assertEqual(merged.duels_created, 3)
+        self.assertEqual(merged.intermediate_states_pruned, 5)
+
+    def test_auto_split_only_for_few_hands(self):
+        """Automatic splitting kicks in when hands cannot fill the pool."""
+        config = ParallelConfig(deck=list(range(10)), num_workers=8, fixed_hands=[(1, 2, 3, 4, 5)])
+
+        self.assertTrue(_should_split(config, remaining_hands=1))
+        self.assertFalse(_should_split(config, remaining_hands=8))
+
+    def test_split_depth_overrides(self):
+        """split_depth=0 disables splitting, a positive depth forces it."""
+        never = ParallelConfig(deck=list(range(10)), num_workers=8, split_depth=0)
+        always = ParallelConfig(deck=list(range(10)), num_workers=8, split_depth=2)
+        single = ParallelConfig(deck=list(range(10)), num_workers=1)
+
+        self.assertFalse(_should_split(never, remaining_hands=1))
+        self.assertTrue(_should_split(always, remaining_hands=100))
+        self.assertFalse(_should_split(single, remaining_hands=1))
+
+    def test_split_results_merge_units_per_hand(self):
+        """Every frontier prefix becomes one unit and one merged result per hand."""
+        hand = (1, 2, 3, 4, 5)
+        frontier = [["a"], ["b"], ["c"]]
+
+        def fake_expand(h, split_depth, min_units):
+            return _part(h, ["top"], paths=2), frontier
+
+        def fake_run(h, prefix=None, time_budget=None):
+            return _part(h, [prefix[0], "shared"], paths=10), []
+
+        config = ParallelConfig(deck=list(range(10)), num_workers=2, fixed_hands=[hand])
+        units = plan_work_units([hand], config)
+        pool = _InlinePool()
+        with patch.object(parallel_module, "_expand_hand", fake_expand), \
+                patch.object(parallel_module, "_run_enumeration", fake_run):
+            batches = list(_iter_scheduled_results(pool, units, config))
+
+        self.assertEqual(len(batches), 1)
+        merged = batches[0][0]
+        self.assertEqual(merged.hand, hand)
+        self.assertEqual(merged.work_units, 3)
+        self.assertEqual(sorted(merged.terminal_boards), ["a", "b", "c", "shared", "top"])
+        self.assertEqual(merged.paths_explored, 32)
+        # Target of split_units_per_worker (4) units per worker for 2 workers
+        self.assertEqual(pool.units[0].split_units, 8)
+
+
+class TestWorkScheduling(unittest.TestCase):
+    """Test cost-aware work units and completion-order scheduling."""
+
+    HANDS = [(1,), (2,), (3,), (4,), (5,), (6,)]
+
+    def _config(self, **kwargs):
+        kwargs.setdefault("num_workers", 2)
+        kwargs.setdefault("batch_size", 2)
+        kwargs.setdefault("split_depth", 0)
+        return ParallelConfig(deck=list(range(10)), fixed_hands=self.HANDS, **kwargs)
+
+    def test_plan_without_costs_keeps_order(self):
+        """Without a cost model hands are batched in their original order."""
+        units = plan_work_units(self.HANDS, self._config())
+
+        self.assertEqual([u.hands for u in units], [[(1,), (2,)], [(3,), (4,)], [(5,), (6,)]])
+
+    def test_plan_orders_expensive_hands_first(self):
+        """Expensive hands are scheduled first and travel alone."""
+        cost = {(1,): 1.0, (2,): 1.0, (3,): 50.0, (4,): 1.0, (5,): 8.0, (6,): 1.0}
+        units = plan_work_units(self.HANDS, self._config(hand_cost=cost.__getitem__))
+
+        self.assertEqual(units[0].hands, [(3,)])
+        self.assertEqual(units[1].hands[0], (5,))
+        self.assertEqual(sorted(h for u in units for h in u.hands), sorted(self.HANDS))
+        self.assertTrue(all(len(u.hands) <= 2 for u in units))
+        self.assertEqual(units[0].cost, 50.0)
+
+    def test_plan_empty(self):
+        self.assertEqual(plan_work_units([], self._config()), [])
+
+    def _schedule(self, fake_run, config):
+        pool = _InlinePool()
+        with patch.object(parallel_module, "_run_enumeration", fake_run):
+            batches = list(_iter_scheduled_results(pool, plan_work_units(self.HANDS, config), config))
+        return pool, [r for batch in batches for r in batch]
+
+    def test_straggler_donates_subtrees(self):
+        """A hand that runs out of budget is finished by its donated prefixes."""
+        def fake_run(hand, prefix=None, time_budget=None):
+            if hand == (1,) and prefix is None:
+                return _part(hand, ["root"]), [["x"], ["y"]]
+            return _part(hand, [f"{hand[0]}{prefix[0] if prefix else ''}"]), []
+
+        pool, results = self._schedule(fake_run, self._config(max_in_flight=1))
+
+        self.assertEqual(sorted(r.hand for r in results), self.HANDS)
+        straggler = next(r for r in results if r.hand == (1,))
+        self.assertEqual(straggler.terminal_boards, ["root", "1x", "1y"])
+        self.assertEqual(straggler.paths_explored, 3)
+        self.assertEqual(straggler.work_units, 2)
+        # Donated prefixes run before untouched hands
+        self.assertEqual([u.prefix for u in pool.units[:3]], [None, ["x"], ["y"]])
+        self.assertEqual(pool.units[3].hands, [(3,), (4,)])
+
+    def test_completed_hands_yielded_individually(self):
+        """Hands that need no splitting are yielded as soon as their unit is done."""
+        def fake_run(hand, prefix=None, time_budget=None):
+            return _part(hand, [str(hand[0])]), []
+
+        pool, results = self._schedule(fake_run, self._config())
+
+        self.assertEqual([r.hand for r in results], self.HANDS)
+        self.assertTrue(all(r.work_units == 1 for r in results))
+
+    def test_worker_stats_per_unit(self):
+        """Per-worker statistics include shared transposition table counters."""
+        def fake_run(hand, prefix=None, time_budget=None):
+            result = _part(hand, [str(hand[0])], paths=2)
+            result.worker_id = 100 + hand[0] % 2
+            result.shared_table_hits = 1
+            result.shared_table_misses = 3
+            return result, []
+
+        config = self._config()
+        worker_stats = {}
+        with patch.object(parallel_module, "_run_enumeration", fake_run):
+            list(_iter_scheduled_results(_InlinePool(), plan_work_units(self.HANDS, config),
+                                         config, worker_stats))
+
+        self.assertEqual(sorted(worker_stats), [100, 101])
+        self.assertEqual(worker_stats[100]["work_units"], 3)
+        self.assertEqual(worker_stats[100]["paths_explored"], 6)
+        self.assertEqual(worker_stats[101]["shared_table_hits"], 3)
+        self.assertEqual(worker_stats[101]["shared_table_misses"], 9)
+
+    def test_failed_unit_reports_empty_results(self):
+        """A crashed work unit does not stall the run."""
+        def fake_run(hand, prefix=None, time_budget=None):
+            if hand == (3,):
+                raise RuntimeError("worker crashed")
+            return _part(hand, [str(hand[0])]), []
+
+        _, results = self._schedule(fake_run, self._config())
+
+        self.assertEqual(sorted(r.hand for r in results), self.HANDS)
+        self.assertEqual(next(r for r in results if r.hand == (3,)).terminal_boards, [])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,293 @@
+"""
+Unit tests for the persistent on-disk transposition cache.
+
+A cache written by a completed run must come back warm for the next run
+with the same fingerprint, and be discarded automatically when the
+fingerprint changes, the file is damaged, or the run did not finish. A
+warm hit must hand back the best board found below the state.
+"""
+
+import json
+import multiprocessing as mp
+import pickle
+from collections import namedtuple
+
+import pytest
+
+from src.ygo_combo.search import parallel as P
+from src.ygo_combo.search.persistent_transposition import (
+    PersistentTranspositionTable,
+    library_fingerprint,
+)
+from src.ygo_combo.engine.evaluator import get_evaluator
+from fake_engine import HAND_CARDS, FakeEnumerationEngine, patched_engine
+
+FP_A = "a" * 64
+FP_B = "b" * 64
+
+Board = namedtuple("Board", "board_hash board_state")
+
+
+def _lookup_range(path, start, count):
+    """Worker: attach by path, look up a range of keys and record the misses."""
+    table = PersistentTranspositionTable.attach(path)
+    try:
+        values = []
+        for key in range(start, start + count):
+            result = table.lookup(key, 1)
+            if result is None:
+                table.record(key, 1, float(key), Board(key, {"key": key}))
+            values.append(None if result is None else result.value)
+        return values
+    finally:
+        table.close()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache" / "tt.bin"
+
+
+class TestPersistence:
+    """Warm starts and invalidation."""
+
+    def test_warm_start_after_clean_close(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=256)
+        assert table.warm_entries == 0 and table.invalidated is None
+        assert [table.lookup(k, 2) for k in range(10)] == [None] * 10
+        for k in range(10):
+            table.record(k, 2 if k else None, float(k), Board(100 + k, {"k": k}))
+        table.close()
+
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=4096)
+        try:
+            assert table.capacity == 256            # Existing file keeps its size
+            assert table.warm_entries == 10
+            result = table.lookup(3, 2)
+            assert (result.value, result.board_hash, result.board_state) == (3.0, 103, {"k": 3})
+            assert not result.complete and table.lookup(0, 40).complete
+            assert table.result_offset(3) == result.offset
+            assert table.stats()["warm_entries"] == 10
+        finally:
+            table.close()
+
+    def test_budget_covers_like_local_entries(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            table.record(1, 3, 5.0, Board(8, {}))
+            assert table.lookup(1, 3).value == 5.0 and table.lookup(1, 2) is not None
+            assert table.lookup(1, 4) is None
+            # Never downgraded by a smaller budget; raised by a bigger one
+            table.record(1, 1, 0.0)
+            assert table.lookup(1, 3) is not None
+            table.record(1, 6, 7.0, Board(9, {}))
+            assert table.lookup(1, 6).board_hash == 9
+            assert table.probe(1, 6) and not table.probe(1, 7)
+        finally:
+            table.close()
+
+    def test_board_written_once(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            for key in range(5):
+                table.record(key, None, 1.0, Board(42, {"big": "board"}))
+            assert len({table.result_offset(key) for key in range(5)}) == 1
+        finally:
+            table.close()
+        assert len(cache_path.with_name("tt.bin.results").read_bytes().splitlines()) == 1
+
+    def test_fingerprint_change_invalidates(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        table.record(1, 1, 0.0)
+        table.close()
+
+        table = PersistentTranspositionTable.open(cache_path, FP_B, capacity=64)
+        try:
+            assert table.invalidated == "library fingerprint changed"
+            assert 1 not in table
+            assert len(table) == 0
+        finally:
+            table.close()
+
+    def test_unfinished_run_invalidates(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        table.record(1, 1, 0.0)
+        table.close(clean=False)
+
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            assert table.invalidated == "previous run did not finish"
+            assert 1 not in table
+        finally:
+            table.close()
+
+    def test_open_marks_in_use(self, cache_path):
+        PersistentTranspositionTable.open(cache_path, FP_A, capacity=64).close()
+        first = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            # Crash before close(): the next open must not trust the file
+            second = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+            assert second.invalidated == "previous run did not finish"
+            second.close()
+        finally:
+            first.close(clean=False)
+
+    @pytest.mark.parametrize("content", [b"", b"garbage", b"\0" * 4096])
+    def test_damaged_file_recreated(self, cache_path, content):
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(content)
+
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            assert table.invalidated.startswith("unreadable")
+            assert table.lookup(5, 1) is None
+            table.record(5, 1, 0.0)
+            assert 5 in table
+        finally:
+            table.close()
+
+    def test_missing_results_invalidates(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        table.record(1, None, 2.0, Board(3, {}))
+        table.close()
+        cache_path.with_name("tt.bin.results").unlink()
+
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            assert table.invalidated == "results file missing"
+            assert 1 not in table
+        finally:
+            table.close()
+
+    def test_attach_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"x" * 128)
+        with pytest.raises(ValueError, match="not a transposition cache"):
+            PersistentTranspositionTable.attach(path)
+
+    def test_not_picklable(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=64)
+        try:
+            with pytest.raises(TypeError, match="attach"):
+                pickle.dumps(table)
+        finally:
+            table.close()
+
+    def test_workers_share_file(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=1024)
+        try:
+            for key in range(20):
+                table.record(key, 1, float(key), Board(key, {"key": key}))
+            with mp.get_context("fork").Pool(1) as pool:
+                seen = pool.apply(_lookup_range, (str(cache_path), 10, 20))
+            assert seen == [float(key) for key in range(10, 20)] + [None] * 10
+            # Boards the worker appended are readable here
+            assert table.lookup(25, 1).board_state == {"key": 25}
+            assert table.lookup(5, 1).board_state == {"key": 5}
+        finally:
+            table.close()
+
+
+class TestLibraryFingerprint:
+    """Everything a cached state depends on changes the fingerprint."""
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        path = tmp_path / "locked_library.json"
+        path.write_text(json.dumps({"cards": {"101": {"count": 3}}}))
+        scripts = tmp_path / "script"
+        (scripts / "official").mkdir(parents=True)
+        (scripts / "official" / "c101.lua").write_text("-- v1")
+        return path, scripts
+
+    def test_stable(self, library):
+        path, scripts = library
+        assert library_fingerprint(path, scripts) == library_fingerprint(path, scripts)
+        assert len(library_fingerprint(path, scripts)) == 64
+
+    def test_library_change(self, library):
+        path, scripts = library
+        before = library_fingerprint(path, scripts)
+        path.write_text(json.dumps({"cards": {"101": {"count": 2}}}))
+        assert library_fingerprint(path, scripts) != before
+
+    def test_script_change(self, library):
+        path, scripts = library
+        before = library_fingerprint(path, scripts)
+        (scripts / "official" / "c101.lua").write_text("-- v2")
+        assert library_fingerprint(path, scripts) != before
+
+    def test_extra_settings(self, library):
+        path, scripts = library
+        assert (library_fingerprint(path, scripts, extra={"max_depth": 25})
+                != library_fingerprint(path, scripts, extra={"max_depth": 30}))
+
+
+class TestEngineIntegration:
+    """A warm cache prunes states explored by an earlier run and reports their results."""
+
+    def test_second_run_reports_cached_best_board(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=1024)
+        with patched_engine() as lib:
+            first = FakeEnumerationEngine(lib, [], [], shared_table=table)
+            terminals = list(first.enumerate_from_hand(list(HAND_CARDS)))
+        table.close()
+
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=1024)
+        try:
+            with patched_engine() as lib:
+                second = FakeEnumerationEngine(lib, [], [], shared_table=table)
+                repeat = second.enumerate_from_hand(list(HAND_CARDS))
+            assert second.shared_states_pruned == 1
+        finally:
+            table.close()
+
+        score = lambda t: get_evaluator().evaluate_board(t.board_state, t.board_hash)["score"]  # noqa: E731
+        assert [t.termination_reason for t in repeat] == ["CACHED"]
+        assert repeat[0].board_hash in {t.board_hash for t in terminals}
+        assert score(repeat[0]) == max(score(t) for t in terminals if t.board_state)
+        assert repeat[0].depth == 0
+
+    def test_truncated_subtrees_not_recorded(self, cache_path):
+        table = PersistentTranspositionTable.open(cache_path, FP_A, capacity=1024)
+        try:
+            with patched_engine() as lib:
+                FakeEnumerationEngine(lib, [], [], shared_table=table, max_paths=3).enumerate_from_hand(
+                    list(HAND_CARDS))
+                second = FakeEnumerationEngine(lib, [], [], shared_table=table)
+                second.enumerate_from_hand(list(HAND_CARDS))
+            # The root was still open when the first run stopped
+            assert second.paths_explored > 1
+        finally:
+            table.close()
+
+
+class TestParallelCache:
+    """parallel_enumerate opens the cache as its shared table."""
+
+    def _config(self, cache_path):
+        return P.ParallelConfig(deck=[1, 2, 3, 4, 5], num_workers=1,
+                                tt_cache_path=cache_path, shared_table_entries=128)
+
+    def test_clean_only_when_run_completes(self, cache_path, monkeypatch):
+        monkeypatch.setattr(P, "library_fingerprint", lambda extra: FP_A)
+        config = self._config(cache_path)
+
+        with P._shared_table(config) as table:
+            assert isinstance(table, PersistentTranspositionTable)
+            assert P._shared_table_location(table) == (None, str(cache_path))
+            table.record(7, 1, 0.0)
+
+        with pytest.raises(RuntimeError):
+            with P._shared_table(config) as table:
+                assert table.warm_entries == 1
+                raise RuntimeError("worker pool failed")
+
+        with P._shared_table(config) as table:
+            assert table.invalidated == "previous run did not finish"
+
+    def test_shared_memory_location(self):
+        config = P.ParallelConfig(deck=[1, 2, 3, 4, 5], num_workers=1, shared_table_entries=16)
+        with P._shared_table(config) as table:
+            assert P._shared_table_location(table) == (table.name, None)
+        assert P._shared_table_location(None) == (None, None)
@@ -0,0 +1,109 @@
+"""
+Unit tests for EnumerationEngine replay modes.
+
+"prefix" replay hands each node's live duel to its first child; it must
+explore exactly the same tree and record exactly the same terminals as
+the original "path" replay, while replaying fewer actions.
+"""
+
+import pytest
+
+from src.ygo_combo.combo_enumeration import EnumerationEngine, REPLAY_MODES
+from fake_engine import HAND_CARDS, run_fake_enumeration, terminal_key
+
+
+class TestReplayModeEquivalence:
+    """prefix and path replay must be indistinguishable in their results."""
+
+    @pytest.mark.parametrize("dedupe_intermediate", [True, False])
+    def test_same_terminals(self, dedupe_intermediate):
+        path_engine, _, path_terms = run_fake_enumeration("path", dedupe_intermediate=dedupe_intermediate)
+        prefix_engine, _, prefix_terms = run_fake_enumeration("prefix", dedupe_intermediate=dedupe_intermediate)
+
+        assert len(path_terms) > 1
+        assert [terminal_key(t) for t in prefix_terms] == [terminal_key(t) for t in path_terms]
+        assert prefix_engine.paths_explored == path_engine.paths_explored
+        assert prefix_engine.intermediate_states_pruned == path_engine.intermediate_states_pruned
+        assert prefix_engine.duplicate_boards_skipped == path_engine.duplicate_boards_skipped
+
+    def test_prefix_replays_fewer_actions(self):
+        path_engine, _, _ = run_fake_enumeration("path", dedupe_intermediate=False)
+        prefix_engine, _, _ = run_fake_enumeration("prefix", dedupe_intermediate=False)
+
+        path_stats = path_engine.replay_stats()
+        prefix_stats = prefix_engine.replay_stats()
+
+        assert prefix_stats["actions_replayed"] < path_stats["actions_replayed"]
+        assert prefix_stats["duels_created"] < path_stats["duels_created"]
+        assert prefix_stats["replayed_actions_per_node"] < path_stats["replayed_actions_per_node"]
+
+    @pytest.mark.parametrize("replay_mode", REPLAY_MODES)
+    def test_every_duel_destroyed(self, replay_mode):
+        engine, lib, _ = run_fake_enumeration(replay_mode)
+
+        assert lib.duels_created == engine.duels_created
+        assert lib.duels_destroyed == lib.duels_created
+        assert engine._spine == []
+
+    def test_max_paths_releases_inherited_duels(self, monkeypatch):
+        from src.ygo_combo import combo_enumeration
+        monkeypatch.setattr(combo_enumeration, "MAX_PATHS", 5)
+
+        engine, lib, _ = run_fake_enumeration("prefix")
+
+        assert engine.paths_explored == 5
+        assert lib.duels_destroyed == lib.duels_created
+
+
+class TestReplayStats:
+    """Tests for replay counters and configuration."""
+
+    def test_stats_keys(self):
+        engine, _, _ = run_fake_enumeration("prefix")
+        stats = engine.replay_stats()
+
+        assert stats["replay_mode"] == "prefix"
+        assert stats["duels_created"] > 0
+        assert stats["replayed_actions_per_node"] == stats["actions_replayed"] / engine.paths_explored
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError, match="replay_mode"):
+            EnumerationEngine(None, [], [], replay_mode="snapshot")
+
+
+class TestTerminalCapture:
+    """Terminal boards come from live duels, not an extra replay."""
+
+    @pytest.mark.parametrize("replay_mode", REPLAY_MODES)
+    def test_terminal_boards_match_actions(self, replay_mode):
+        _, _, terminals = run_fake_enumeration(replay_mode, dedupe_intermediate=False, dedupe_boards=False)
+
+        for terminal in terminals:
+            used = {a.card_code for a in terminal.action_sequence if a.card_code}
+            board = terminal.board_state
+            assert set(board.get_monster_codes()) == used
+            # Captured from a duel built with the enumerated starting hand
+            assert {c.code for c in board.player0.hand} == set(HAND_CARDS) - used
+
+    @pytest.mark.parametrize("replay_mode", REPLAY_MODES)
+    def test_pass_terminals_create_no_duels(self, replay_mode):
+        engine, _, terminals = run_fake_enumeration(replay_mode, dedupe_intermediate=False)
+
+        assert all(t.termination_reason == "PASS" for t in terminals)
+        # Only node replays create duels: one per node in path mode, and one
+        # per non-first sibling (plus the root) in prefix mode
+        if replay_mode == "path":
+            assert engine.duels_created == engine.paths_explored
+        else:
+            assert engine.duels_created < engine.paths_explored
+
+    def test_max_depth_terminal_uses_inherited_duel(self, monkeypatch):
+        from src.ygo_combo import combo_enumeration
+        monkeypatch.setattr(combo_enumeration, "MAX_DEPTH", 2)
+
+        path_engine, _, path_terms = run_fake_enumeration("path", dedupe_intermediate=False)
+        prefix_engine, _, prefix_terms = run_fake_enumeration("prefix", dedupe_intermediate=False)
+
+        assert any(t.termination_reason == "MAX_DEPTH" for t in prefix_terms)
+        assert [terminal_key(t) for t in prefix_terms] == [terminal_key(t) for t in path_terms]
+        assert prefix_engine.duels_created < path_engine.duels_created
@@ -134,6 +134,21 @@ class TestHandComposition:
         comp2 = HandComposition(1, 2, 0, 1, 1, 0)
         assert comp1.stratum_key() == comp2.stratum_key()
 
+    def test_search_cost_brick_is_cheapest(self):
+        """Unplayable hands are predicted to be cheap to search."""
+        brick = HandComposition(0, 0, 2, 1, 2, 0)
+        starter = HandComposition(1, 0, 0, 0, 4, 0)
+        assert brick.search_cost() == 1.0
+        assert starter.search_cost() > brick.search_cost()
+
+    def test_search_cost_grows_with_engine_cards(self):
+        """More starters and extenders predict a larger search tree."""
+        one = HandComposition(1, 1, 0, 0, 3, 0)
+        two = HandComposition(2, 1, 0, 0, 2, 0)
+        more_extenders = HandComposition(1, 2, 0, 0, 2, 0)
+        assert two.search_cost() > one.search_cost()
+        assert more_extenders.search_cost() > one.search_cost()
+
 
 # =============================================================================
 # STRATUM TESTS
@@ -237,6 +252,11 @@ class TestStratifiedSampler:
         assert comp.payoffs == 1
         assert comp.total() == 3
 
+    def test_search_cost_uses_stratum(self, sampler):
+        """Sampler cost predictions match the hand's composition."""
+        assert sampler.search_cost((1, 2, 8)) == sampler._classify_hand((1, 2, 8)).search_cost()
+        assert sampler.search_cost((1, 2, 3)) > sampler.search_cost((6, 7, 8))
+
     def test_sample_returns_correct_count(self, sampler):
         """Sample should return requested number of hands."""
         config = SamplingConfig(total_samples=50, seed=42)
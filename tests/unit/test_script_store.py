@@ -0,0 +1,176 @@
+"""
+Unit tests for the in-memory Lua script store.
+
+Both backends must resolve script names exactly like the old per-call
+path search, and the engine loaders must be served without touching the
+script directory after it has been indexed.
+"""
+
+import pytest
+
+from src.ygo_combo.engine import interface
+from src.ygo_combo.engine.bindings import ffi
+from src.ygo_combo.engine.duel_factory import ENGRAVER, HOLACTIE
+from src.ygo_combo.engine.script_store import (
+    DirectoryScriptStore,
+    PackedScriptStore,
+    ScriptStore,
+    get_script_store,
+    library_card_codes,
+    pack_scripts,
+    set_script_store,
+)
+
+
+def _bytes(script):
+    data, size = script
+    return data if isinstance(data, bytes) else ffi.buffer(data, size)[:]
+
+
+class FakeLib:
+    """Records OCG_LoadScript calls."""
+
+    def __init__(self):
+        self.loaded = []
+
+    def OCG_LoadScript(self, duel, data, size, name):
+        name = name if isinstance(name, bytes) else ffi.string(name)
+        self.loaded.append((name.decode(), _bytes((data, size))))
+        return 1
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    root = tmp_path / "script"
+    (root / "official").mkdir(parents=True)
+    (root / "utility.lua").write_bytes(b"-- utility")
+    (root / "constant.lua").write_bytes(b"-- constant")
+    (root / "official" / "c101.lua").write_bytes(b"-- card 101")
+    (root / "official" / "c202.lua").write_bytes(b"-- card 202")
+    (root / "official" / "proc_test.lua").write_bytes(b"-- official proc")
+    (root / "proc_test.lua").write_bytes(b"-- root proc")
+    return root
+
+
+@pytest.fixture(params=["directory", "pack"])
+def store(request, scripts, tmp_path):
+    if request.param == "directory":
+        return DirectoryScriptStore(scripts)
+    pack = tmp_path / "scripts.pack"
+    pack_scripts(scripts, pack)
+    return PackedScriptStore(pack)
+
+
+@pytest.fixture
+def global_store():
+    yield
+    set_script_store(None)
+    interface.set_lib(None)
+
+
+class TestScriptStore:
+    """Name resolution and reads, for both backends."""
+
+    def test_index(self, store):
+        assert len(store) == 6
+        assert "official/c101.lua" in store
+        assert "c101.lua" not in store
+
+    def test_find_search_order(self, store):
+        assert _bytes(store.find("c101.lua")) == b"-- card 101"
+        assert _bytes(store.find("c202")) == b"-- card 202"
+        assert _bytes(store.find("utility.lua")) == b"-- utility"
+        assert _bytes(store.find("proc_test.lua")) == b"-- official proc"  # official/ first
+        assert store.find("c999.lua") is None
+        assert store.find("c999.lua") is None    # Cached miss
+
+    def test_read_exact_path(self, store):
+        assert _bytes(store.read("proc_test.lua")) == b"-- root proc"
+        assert store.read("missing.lua") is None
+
+
+class TestDirectoryStore:
+    """Directory backend reads each file once."""
+
+    def test_no_disk_access_after_first_read(self, scripts):
+        store = DirectoryScriptStore(scripts)
+        store.find("c101.lua")
+        (scripts / "official" / "c101.lua").unlink()
+        (scripts / "official" / "c303.lua").write_bytes(b"-- added later")
+
+        assert _bytes(store.find("c101.lua")) == b"-- card 101"
+        assert store.find("c303.lua") is None
+        assert store.cached_bytes == len(b"-- card 101")
+
+    def test_missing_directory(self, tmp_path):
+        assert len(DirectoryScriptStore(tmp_path / "nowhere")) == 0
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError, match="_load"):
+            ScriptStore()
+
+
+class TestPack:
+    """Pack building and validation."""
+
+    def test_library_only(self, scripts, tmp_path):
+        pack = tmp_path / "lib.pack"
+        assert pack_scripts(scripts, pack, card_codes=[101]) == 4
+        store = PackedScriptStore(pack)
+        assert store.names() == ["constant.lua", "official/c101.lua", "proc_test.lua", "utility.lua"]
+        assert store.read_bytes("official/c101.lua") == b"-- card 101"
+
+    def test_library_codes_include_fillers(self):
+        codes = library_card_codes()
+        assert {ENGRAVER, HOLACTIE} <= codes
+        assert len(codes) > 2
+
+    @pytest.mark.parametrize("content", [b"", b"not a pack at all"])
+    def test_rejects_other_files(self, tmp_path, content):
+        path = tmp_path / "bad.pack"
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="not a script pack"):
+            PackedScriptStore(path)
+
+    def test_rejects_truncated(self, scripts, tmp_path):
+        pack = tmp_path / "scripts.pack"
+        pack_scripts(scripts, pack)
+        pack.write_bytes(pack.read_bytes()[:-4])
+        with pytest.raises(ValueError, match="truncated"):
+            PackedScriptStore(pack)
+
+
+class TestEngineLoaders:
+    """py_script_reader and preload_utility_scripts use the process store."""
+
+    def test_env_selects_pack(self, scripts, tmp_path, monkeypatch, global_store):
+        pack = tmp_path / "scripts.pack"
+        pack_scripts(scripts, pack)
+        monkeypatch.setenv("YGOPRO_SCRIPTS_PACK", str(pack))
+        monkeypatch.delenv("YGOPRO_SCRIPTS_PATH", raising=False)
+        set_script_store(None)
+
+        assert isinstance(get_script_store(), PackedScriptStore)
+        assert get_script_store() is get_script_store()
+
+    def test_env_selects_directory(self, scripts, monkeypatch, global_store):
+        monkeypatch.delenv("YGOPRO_SCRIPTS_PACK", raising=False)
+        monkeypatch.setenv("YGOPRO_SCRIPTS_PATH", str(scripts))
+        set_script_store(None)
+
+        assert isinstance(get_script_store(), DirectoryScriptStore)
+
+    def test_loaders(self, store, global_store):
+        set_script_store(store)
+        lib = FakeLib()
+        interface.set_lib(lib)
+
+        assert interface.py_script_reader(ffi.NULL, ffi.NULL, ffi.new("char[]", b"c202.lua")) == 1
+        assert interface.py_script_reader(ffi.NULL, ffi.NULL, ffi.new("char[]", b"c999.lua")) == 0
+        assert interface.preload_utility_scripts(lib, ffi.NULL)
+
+        assert lib.loaded == [
+            ("c202.lua", b"-- card 202"),
+            ("constant.lua", b"-- constant"),
+            ("utility.lua", b"-- utility"),
+        ]
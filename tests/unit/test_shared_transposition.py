@@ -0,0 +1,163 @@
+"""
+Unit tests for the shared-memory transposition table.
+
+The table must behave like a bounded set shared between processes:
+probe() reports whether a state was seen before (by anyone) with at least
+the same depth budget and records it otherwise, torn or overwritten slots
+only ever produce misses, and memory never grows past the fixed capacity.
+"""
+
+import multiprocessing as mp
+import pickle
+
+import pytest
+
+from src.ygo_combo.search.shared_transposition import (
+    PROBE_LIMIT,
+    SharedTranspositionTable,
+    _HEADER_WORDS,
+    _SLOT_WORDS,
+)
+from fake_engine import HAND_CARDS, FakeEnumerationEngine, patched_engine
+
+
+@pytest.fixture
+def table():
+    table = SharedTranspositionTable.create(1024)
+    yield table
+    table.unlink()
+
+
+def _fill(name, start, count, remaining):
+    """Worker: attach and probe a range of keys."""
+    table = SharedTranspositionTable.attach(name)
+    try:
+        for key in range(start, start + count):
+            table.probe(key * 0x9E3779B97F4A7C15, remaining)
+        return table.hits, table.misses
+    finally:
+        table.close()
+
+
+class TestSharedTranspositionTable:
+    """Single-process behaviour."""
+
+    def test_probe_records_then_hits(self, table):
+        assert table.probe(0x1234, remaining=5) is False
+        assert table.probe(0x1234, remaining=3) is True
+        assert 0x1234 in table
+        assert 0x9999 not in table
+        assert table.stats()["hits"] == 1
+        assert table.stats()["misses"] == 1
+
+    def test_smaller_budget_does_not_cover_bigger_probe(self, table):
+        assert table.probe(0x1234, remaining=5) is False
+        # More actions left now: searched again, budget raised
+        assert table.probe(0x1234, remaining=22) is False
+        assert table.reexpanded == 1
+        assert table.probe(0x1234, remaining=22) is True
+        assert table.probe(0x1234, remaining=5) is True
+        assert len(table) == 1
+
+    def test_capacity_rounded_to_power_of_two(self):
+        table = SharedTranspositionTable.create(1000)
+        try:
+            assert table.capacity == 1024
+            assert table.nbytes == (_HEADER_WORDS + _SLOT_WORDS * 1024) * 8
+        finally:
+            table.unlink()
+
+    def test_zero_key_and_wide_ints(self, table):
+        assert table.probe(0, remaining=0) is False
+        assert table.probe(0, remaining=0) is True
+        assert table.probe(-1, remaining=1) is False
+        assert (1 << 64) - 1 in table
+
+    def test_string_hashes(self, table):
+        assert table.probe("abc123", remaining=2) is False
+        assert table.probe("abc123", remaining=2) is True
+        assert "abc124" not in table
+
+    def test_bounded_with_smallest_budget_replacement(self):
+        table = SharedTranspositionTable.create(8)
+        try:
+            # Every key maps to slot 0, so they all compete for one probe window
+            keys = [i * 8 for i in range(PROBE_LIMIT)]
+            for remaining, key in enumerate(keys, start=1):
+                table.probe(key, remaining)
+            assert len(table) == PROBE_LIMIT
+
+            table.probe(999 * 8, remaining=20)
+
+            assert len(table) == PROBE_LIMIT
+            assert table.replacements == 1
+            assert keys[0] not in table       # Smallest budget replaced
+            assert keys[-1] in table
+            assert 999 * 8 in table
+        finally:
+            table.unlink()
+
+    def test_torn_slot_reads_as_miss(self, table):
+        key = 0xABCDEF
+        table.probe(key, remaining=4)
+        slot = _HEADER_WORDS + _SLOT_WORDS * (key & (table.capacity - 1))
+        table._words[slot + 1] = 9  # Data word rewritten, check word stale
+
+        assert key not in table
+
+    def test_not_picklable(self, table):
+        with pytest.raises(TypeError, match="attach"):
+            pickle.dumps(table)
+
+
+class TestCrossProcess:
+    """Entries are visible to, and written by, other processes."""
+
+    def test_worker_sees_parent_entries(self, table):
+        for key in range(50):
+            table.probe(key * 0x9E3779B97F4A7C15, remaining=2)
+
+        with mp.get_context("fork").Pool(1) as pool:
+            hits, misses = pool.apply(_fill, (table.name, 0, 100, 1))
+
+        assert hits == 50
+        assert misses == 50
+
+    def test_concurrent_writers(self, table):
+        with mp.get_context("fork").Pool(4) as pool:
+            results = pool.starmap(_fill, [(table.name, 0, 200, d) for d in range(4)])
+
+        # Every key was recorded by someone; hits are lossy, never invented
+        assert sum(h + m for h, m in results) == 800
+        assert sum(m for _, m in results) >= 200
+        assert len(table) <= table.capacity
+        assert all(key * 0x9E3779B97F4A7C15 in table for key in range(200))
+
+
+class TestEngineIntegration:
+    """EnumerationEngine consults the shared table after local misses."""
+
+    def test_second_run_pruned_by_shared_table(self, table):
+        with patched_engine() as lib:
+            first = FakeEnumerationEngine(lib, [], [], shared_table=table)
+            terminals = list(first.enumerate_from_hand(list(HAND_CARDS)))
+
+            second = FakeEnumerationEngine(lib, [], [], shared_table=table)
+            repeat = second.enumerate_from_hand(list(HAND_CARDS))
+
+        assert terminals
+        assert first.shared_states_pruned == 0
+        assert repeat == []
+        assert second.shared_states_pruned == 1
+        assert second.intermediate_states_pruned == 1
+
+    def test_distinct_hands_not_pruned(self, table):
+        with patched_engine() as lib:
+            first = FakeEnumerationEngine(lib, [], [], shared_table=table)
+            first.enumerate_from_hand(list(HAND_CARDS))
+
+            other = FakeEnumerationEngine(lib, [], [], shared_table=table)
+            terminals = other.enumerate_from_hand(list(HAND_CARDS) + [999])
+
+        assert terminals
+        assert other.shared_states_pruned == 0
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Unit tests for Zobrist hashing module."""
 
+import os
+import subprocess
 import unittest
 import sys
 from pathlib import Path
@@ -8,9 +10,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "ygo_combo"))
 
 from utils.hashing import (
-    ZobristHasher, CardState, StateChange,
-    LOCATION_HAND, LOCATION_MZONE, LOCATION_GRAVE,
-    POS_FACEUP_ATTACK,
+    ZobristHasher, CardState, StateChange, board_card_state,
+    LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE,
+    LOCATION_OVERLAY, KEY_SLOTS, POS_FACEUP_ATTACK,
 )
 
 
@@ -107,6 +109,70 @@ class TestZobristHasher(unittest.TestCase):
         self.assertNotEqual(key1, key2)
 
 
+class TestKeyTables(unittest.TestCase):
+    """Keys come from stable digests and dense per-card rows."""
+
+    PROBE = (
+        "from src.ygo_combo.utils.hashing import ZobristHasher, CardState\n"
+        "h = ZobristHasher(seed=42)\n"
+        "print(h._get_card_key(CardState(60764609, 2, 0, 0, 0)),"
+        " h._get_action_key('ACTIVATE:60764609:2'),"
+        " h._get_resource_key('opt_60764609_0'))\n"
+    )
+
+    def probe(self, hash_seed):
+        env = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+        return subprocess.run(
+            [sys.executable, "-c", self.PROBE], env=env, check=True,
+            capture_output=True, text=True,
+            cwd=str(Path(__file__).parents[2]),
+        ).stdout
+
+    def test_keys_identical_across_processes(self):
+        """String hash randomization does not reach the keys."""
+        self.assertEqual(self.probe(1), self.probe(2))
+
+    def test_keys_pinned(self):
+        """Key derivation is part of the persisted format; changes must be deliberate."""
+        hasher = ZobristHasher(seed=42)
+        self.assertEqual(hasher._get_card_key(CardState(60764609, LOCATION_HAND, 0, 0, 0)),
+                         6140108772583491325)
+        self.assertEqual(hasher._get_action_key("ACTIVATE:60764609:2"), 8921077576252970614)
+        self.assertEqual(hasher._get_resource_key("normal_summon_used"), 16433681594158789638)
+
+    def test_registration_order_does_not_change_keys(self):
+        """Deck-local indices are storage only."""
+        a, b = ZobristHasher(seed=42), ZobristHasher(seed=42)
+        a.register_cards([111, 222])
+        b.register_cards([222, 111])
+        self.assertNotEqual(a.card_index, b.card_index)
+        for code in (111, 222):
+            state = CardState(code, LOCATION_MZONE, 3, POS_FACEUP_ATTACK, 1)
+            self.assertEqual(a._get_card_key(state), b._get_card_key(state))
+
+    def test_board_card_key_matches_card_state(self):
+        hasher = ZobristHasher(seed=42)
+        for location in (LOCATION_HAND, LOCATION_MZONE, LOCATION_SZONE, LOCATION_GRAVE):
+            self.assertEqual(hasher.board_card_key(60764609, location),
+                             hasher._get_card_key(board_card_state(60764609, location)))
+
+    def test_out_of_table_states_get_stable_keys(self):
+        """Combined location bits and deep slots fall back to digest keys."""
+        hasher = ZobristHasher(seed=42)
+        overlay = CardState(60764609, LOCATION_OVERLAY | LOCATION_MZONE, 0, 0, 0)
+        deep = CardState(60764609, LOCATION_GRAVE, KEY_SLOTS + 5, 0, 0)
+        keys = {hasher._get_card_key(s) for s in (overlay, deep)}
+        keys.add(hasher._get_card_key(CardState(60764609, LOCATION_GRAVE, KEY_SLOTS - 1, 0, 0)))
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(hasher._get_card_key(overlay), ZobristHasher(seed=42)._get_card_key(overlay))
+
+    def test_row_keys_distinct(self):
+        hasher = ZobristHasher(seed=42)
+        hasher.register_cards([60764609, 79559912])
+        keys = [key for row in hasher._card_rows for key in row]
+        self.assertEqual(len(set(keys)), len(keys))
+
+
 class TestStateChange(unittest.TestCase):
     """Test StateChange helper methods."""
 